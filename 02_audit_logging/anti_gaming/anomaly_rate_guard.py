@@ -7,6 +7,17 @@ Autor: edubrainboost ©2025 MIT License
 Detects rate limit violations (botting/spam) in identity events.
 Read-only scan with deterministic JSONL logging.
 
+All three windows (5s burst, 1m, 1h) are evaluated in one pass over the
+sorted timestamps of a DID, with one advancing window end per limit.
+
+Modes:
+  (default)  load all events, sort per DID, report the first violation
+             of each window per DID
+  --stream   read the event log once with per-DID window state only
+             (events of a DID must be in chronological order)
+  --follow   keep reading appended events and report violations as
+             their windows close
+
 Exit Codes:
   0 - PASS (no rate violations)
   2 - FAIL (rate limits exceeded)
@@ -14,11 +25,13 @@ Exit Codes:
 
 import sys
 import json
+import time
+import argparse
 import yaml
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List
-from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+from collections import defaultdict, deque
 
 ROOT = Path(__file__).resolve().parents[2]
 POLICY_PATH = ROOT / "23_compliance" / "policies" / "anti_gaming_policy.yaml"
@@ -60,6 +73,80 @@ def load_identity_events() -> List[Dict]:
 
     return events
 
+def parse_event(event: Dict) -> Optional[Tuple[str, datetime]]:
+    """(did, timestamp) of an identity event, None if either is missing or invalid."""
+    did = event.get("did")
+    timestamp = event.get("ts") or event.get("timestamp")
+
+    if did and timestamp:
+        try:
+            return did, datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            return None  # Unparseable timestamp: not rate-checkable
+
+    return None
+
+def rate_checks(
+    events_per_minute: int,
+    events_per_hour: int,
+    burst_per_5s: int
+) -> List[Tuple[str, str, timedelta, int]]:
+    """Windows to check as (type, window, width, limit), in report order."""
+    return [
+        ("burst", "5s", timedelta(seconds=5), burst_per_5s),
+        ("per_minute", "1m", timedelta(minutes=1), events_per_minute),
+        ("per_hour", "1h", timedelta(hours=1), events_per_hour),
+    ]
+
+def _violation(did: str, check: Tuple, events: int, start_time: str) -> Dict:
+    violation_type, window, _, limit = check
+    return {
+        "did": did,
+        "type": violation_type,
+        "window": window,
+        "events": events,
+        "limit": limit,
+        "start_time": start_time
+    }
+
+def find_window_violations(
+    did: str,
+    timestamps: List[datetime],
+    checks: List[Tuple[str, str, timedelta, int]]
+) -> List[Dict]:
+    """
+    First violating window per check for one DID (timestamps sorted).
+
+    A window starts at an event and includes all events up to start + width.
+    Window ends only move forward, so all checks share one pass: O(n).
+    """
+    n = len(timestamps)
+    ends = [0] * len(checks)
+    found: List[Optional[Dict]] = [None] * len(checks)
+    pending = [k for k, check in enumerate(checks) if n > check[3]]
+
+    for i, start in enumerate(timestamps):
+        if not pending:
+            break
+        for k in list(pending):
+            width, limit = checks[k][2], checks[k][3]
+            if n - i <= limit:
+                # Fewer than limit + 1 events left
+                pending.remove(k)
+                continue
+
+            window_end = start + width
+            j = max(ends[k], i)
+            while j < n and timestamps[j] <= window_end:
+                j += 1
+            ends[k] = j
+
+            if j - i > limit:
+                found[k] = _violation(did, checks[k], j - i, start.isoformat())
+                pending.remove(k)  # One violation per DID per check
+
+    return [violation for violation in found if violation]
+
 def detect_rate_violations(
     events: List[Dict],
     events_per_minute: int,
@@ -71,17 +158,12 @@ def detect_rate_violations(
     did_events = defaultdict(list)
 
     for event in events:
-        did = event.get("did")
-        timestamp = event.get("ts") or event.get("timestamp")
-
-        if did and timestamp:
-            try:
-                ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                did_events[did].append(ts)
-            except (ValueError, AttributeError):
-                raise NotImplementedError("TODO: Implement this block")
+        parsed = parse_event(event)
+        if parsed:
+            did_events[parsed[0]].append(parsed[1])
 
     # Check rate limits
+    checks = rate_checks(events_per_minute, events_per_hour, burst_per_5s)
     violations = []
 
     for did, timestamps in did_events.items():
@@ -89,57 +171,208 @@ def detect_rate_violations(
             continue
 
         timestamps.sort()
-
-        # Check burst (5 second window)
-        for i in range(len(timestamps) - burst_per_5s + 1):
-            window_end = timestamps[i] + timedelta(seconds=5)
-            events_in_burst = sum(1 for ts in timestamps[i:] if ts <= window_end)
-
-            if events_in_burst > burst_per_5s:
-                violations.append({
-                    "did": did,
-                    "type": "burst",
-                    "window": "5s",
-                    "events": events_in_burst,
-                    "limit": burst_per_5s,
-                    "start_time": timestamps[i].isoformat()
-                })
-                break  # One violation per DID per check
-
-        # Check per-minute rate
-        for i in range(len(timestamps) - events_per_minute + 1):
-            window_end = timestamps[i] + timedelta(minutes=1)
-            events_in_minute = sum(1 for ts in timestamps[i:] if ts <= window_end)
-
-            if events_in_minute > events_per_minute:
-                violations.append({
-                    "did": did,
-                    "type": "per_minute",
-                    "window": "1m",
-                    "events": events_in_minute,
-                    "limit": events_per_minute,
-                    "start_time": timestamps[i].isoformat()
-                })
-                break
-
-        # Check per-hour rate
-        for i in range(len(timestamps) - events_per_hour + 1):
-            window_end = timestamps[i] + timedelta(hours=1)
-            events_in_hour = sum(1 for ts in timestamps[i:] if ts <= window_end)
-
-            if events_in_hour > events_per_hour:
-                violations.append({
-                    "did": did,
-                    "type": "per_hour",
-                    "window": "1h",
-                    "events": events_in_hour,
-                    "limit": events_per_hour,
-                    "start_time": timestamps[i].isoformat()
-                })
-                break
+        violations.extend(find_window_violations(did, timestamps, checks))
 
     return violations
 
+class _WindowState:
+    """Sliding window of one DID for one check (at most limit + 1 timestamps)."""
+
+    __slots__ = ("recent", "violation_start", "violation_events")
+
+    def __init__(self):
+        self.recent = deque()
+        self.violation_start: Optional[datetime] = None
+        self.violation_events = 0
+
+class StreamingRateGuard:
+    """
+    Incremental rate checks with per-DID window state.
+
+    Events are fed with add() in arrival order. A DID's events must be
+    chronological; an event older than the newest one seen for its DID is
+    counted at that newest timestamp. Memory per DID is bounded by the
+    limits, not by the number of events.
+
+    A violation is reported once its window is complete: when a later event
+    of the DID falls outside it, when close_expired() is called with a clock
+    past its end, or on flush().
+
+    Relation to detect_rate_violations() over the same log (events of each
+    DID chronological, everything flushed): for every DID and check, the
+    first violation reported here is identical to the one reported there
+    (same start_time and events). detect_rate_violations() stops at that
+    first violation; here the window restarts after each violation, so
+    later incidents of the same DID and check are reported as well. The
+    batch result is the subset of first violations per (DID, check); report
+    order differs.
+
+    Timestamps only need ordering and addition of the check widths, so
+    subclasses may use other time representations and override
+    format_time().
+    """
+
+    def __init__(self, checks: List[Tuple[str, str, timedelta, int]]):
+        self.checks = checks
+        self.longest = max(check[2] for check in checks)
+        self.states: Dict[str, List[_WindowState]] = {}
+        self.newest: Dict[str, datetime] = {}
+        self.clock: Optional[datetime] = None
+
+    def add(self, did: str, ts: datetime) -> List[Dict]:
+        """Add one event; returns the violations it completed."""
+        newest = self.newest.get(did)
+        if newest is not None and ts < newest:
+            ts = newest
+        self.newest[did] = ts
+        if self.clock is None or ts > self.clock:
+            self.clock = ts
+
+        states = self.states.get(did)
+        if states is None:
+            states = self.states[did] = [_WindowState() for _ in self.checks]
+
+        completed = []
+        for check, state in zip(self.checks, states):
+            width, limit = check[2], check[3]
+
+            if state.violation_start is not None:
+                if ts <= state.violation_start + width:
+                    state.violation_events += 1
+                    continue
+                completed.append(self._close(did, check, state))
+
+            recent = state.recent
+            while recent and recent[0] + width < ts:
+                recent.popleft()
+            recent.append(ts)
+
+            if len(recent) > limit:
+                state.violation_start = recent[0]
+                state.violation_events = len(recent)
+                recent.clear()
+
+        return completed
+
+    def _close(self, did: str, check: Tuple[str, str, timedelta, int], state: _WindowState) -> Dict:
+        violation = _violation(did, check, state.violation_events, self.format_time(state.violation_start))
+        state.violation_start = None
+        state.violation_events = 0
+        return violation
+
+    def format_time(self, ts: datetime) -> str:
+        return ts.isoformat()
+
+    def close_expired(self, now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Report open violations whose window ended before `now` (default: the
+        newest event timestamp seen) and drop state of DIDs idle for longer
+        than the longest window.
+        """
+        if now is None:
+            now = self.clock
+        if now is None:
+            return []
+
+        completed = []
+        for did in list(self.states):
+            states = self.states[did]
+            for check, state in zip(self.checks, states):
+                if state.violation_start is not None and state.violation_start + check[2] < now:
+                    completed.append(self._close(did, check, state))
+            if self.newest[did] + self.longest < now and all(s.violation_start is None for s in states):
+                del self.states[did]
+                del self.newest[did]
+        return completed
+
+    def flush(self) -> List[Dict]:
+        """Report all open violations with the events counted so far."""
+        completed = []
+        for did, states in self.states.items():
+            for check, state in zip(self.checks, states):
+                if state.violation_start is not None:
+                    completed.append(self._close(did, check, state))
+        return completed
+
+    def to_state(self) -> Dict:
+        """
+        Window state as plain data (JSON-serializable if the timestamps are),
+        for checkpointing a guard between runs.
+        """
+        return {
+            "clock": self.clock,
+            "newest": dict(self.newest),
+            "states": {
+                did: [[list(s.recent), s.violation_start, s.violation_events] for s in states]
+                for did, states in self.states.items()
+            }
+        }
+
+    def load_state(self, state: Dict) -> None:
+        """Restore window state produced by to_state() (same checks)."""
+        self.clock = state["clock"]
+        self.newest = dict(state["newest"])
+        self.states = {}
+        for did, windows in state["states"].items():
+            states = []
+            for recent, violation_start, violation_events in windows:
+                window_state = _WindowState()
+                window_state.recent.extend(recent)
+                window_state.violation_start = violation_start
+                window_state.violation_events = violation_events
+                states.append(window_state)
+            self.states[did] = states
+
+class IdentityEventTail:
+    """Reads identity events appended to the JSONL log since the last call."""
+
+    def __init__(self, path: Path = EVENTS_PATH):
+        self.path = path
+        self.offset = 0
+        self.malformed = 0  # Lines skipped because they are not valid JSON
+
+    def read_new(self) -> Iterator[Dict]:
+        """
+        New complete (newline-terminated) events; restarts after truncation.
+
+        Malformed lines are counted in self.malformed and skipped, so one bad
+        or half-rotated line does not stop a --follow run.
+        """
+        if not self.path.exists():
+            return
+        if self.path.stat().st_size < self.offset:
+            self.offset = 0
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Write in progress
+                self.offset += len(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    self.malformed += 1
+                    continue
+                if isinstance(event, dict):
+                    yield event
+                else:
+                    self.malformed += 1
+
+def stream_rate_violations(guard: StreamingRateGuard, events: Iterator[Dict]) -> Tuple[int, List[Dict]]:
+    """Feed events into the guard; returns (events read, completed violations)."""
+    count = 0
+    violations = []
+    for event in events:
+        count += 1
+        parsed = parse_event(event)
+        if parsed:
+            violations.extend(guard.add(*parsed))
+    return count, violations
+
 def write_audit_log(
     status: str,
     offenders: List[Dict],
@@ -163,8 +396,51 @@ def write_audit_log(
     with open(LOG_PATH, "a", encoding="utf-8") as f:
         f.write(json.dumps(entry, sort_keys=True) + "\n")
 
-def main() -> int:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SSID Anomaly Rate Guard")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--stream", action="store_true",
+                      help="Single pass over the event log with per-DID window state")
+    mode.add_argument("--follow", action="store_true",
+                      help="Keep checking events appended to the log")
+    parser.add_argument("--interval", type=float, default=5.0,
+                        help="Poll interval in seconds for --follow (default: 5)")
+    return parser.parse_args(argv)
+
+def follow_events(guard: StreamingRateGuard, limits: Dict, policy_version: str, interval: float) -> int:
+    """Check appended events until interrupted; one audit log entry per poll with violations."""
+    tail = IdentityEventTail()
+    total_violations = 0
+    print(f"Following {EVENTS_PATH} (Ctrl+C to stop)")
+
+    try:
+        while True:
+            malformed = tail.malformed
+            _, violations = stream_rate_violations(guard, tail.read_new())
+            if tail.malformed > malformed:
+                print(f"  [WARN] Skipped {tail.malformed - malformed} malformed line(s)")
+            violations.extend(guard.close_expired())
+            if violations:
+                total_violations += len(violations)
+                write_audit_log("FAIL", violations, limits, policy_version)
+                for v in violations:
+                    print(f"  - DID: {v['did']} {v['type']} ({v['window']}): "
+                          f"{v['events']} events (limit: {v['limit']})")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        violations = guard.flush()
+        if violations:
+            total_violations += len(violations)
+            write_audit_log("FAIL", violations, limits, policy_version)
+
+    print(f"Violations: {total_violations}")
+    print(f"Malformed lines skipped: {tail.malformed}")
+    return 0 if total_violations == 0 else 2
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main execution."""
+    args = parse_args(argv)
+
     print("SSID Anomaly Rate Guard")
     print("=" * 60)
 
@@ -180,12 +456,32 @@ def main() -> int:
     print(f"Burst Limits: {burst_limits}")
     print()
 
+    checks = rate_checks(
+        rate_limits.get("events_per_minute_per_did", 10),
+        rate_limits.get("events_per_hour_per_did", 500),
+        burst_limits.get("per_5s", 5)
+    )
+    limits = {"rate_limits": rate_limits, "burst_limits": burst_limits}
+
+    if args.follow:
+        return follow_events(StreamingRateGuard(checks), limits, policy_version, args.interval)
+
     # Load events
     print("Loading identity events...")
-    events = load_identity_events()
-    print(f"Events loaded: {len(events)}")
-
-    if len(events) == 0:
+    if args.stream:
+        guard = StreamingRateGuard(checks)
+        tail = IdentityEventTail()
+        event_count, violations = stream_rate_violations(guard, tail.read_new())
+        violations.extend(guard.flush())
+        events = None
+        if tail.malformed:
+            print(f"Malformed lines skipped: {tail.malformed}")
+    else:
+        events = load_identity_events()
+        event_count = len(events)
+    print(f"Events loaded: {event_count}")
+
+    if event_count == 0:
         print("No events found - creating placeholder...")
         EVENTS_PATH.parent.mkdir(parents=True, exist_ok=True)
         sample_events = [
@@ -201,12 +497,13 @@ def main() -> int:
 
     # Detect violations
     print("Analyzing rate limits...")
-    violations = detect_rate_violations(
-        events,
-        rate_limits.get("events_per_minute_per_did", 10),
-        rate_limits.get("events_per_hour_per_did", 500),
-        burst_limits.get("per_5s", 5)
-    )
+    if events is not None:
+        violations = detect_rate_violations(
+            events,
+            rate_limits.get("events_per_minute_per_did", 10),
+            rate_limits.get("events_per_hour_per_did", 500),
+            burst_limits.get("per_5s", 5)
+        )
 
     status = "PASS" if len(violations) == 0 else "FAIL"
 
@@ -214,7 +511,7 @@ def main() -> int:
     write_audit_log(
         status,
         violations,
-        {"rate_limits": rate_limits, "burst_limits": burst_limits},
+        limits,
         policy_version
     )
 
@@ -21,6 +21,10 @@ from datetime import datetime
 from typing import Dict, List, Set, Tuple
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from graph_cycles import simple_cycles
+
 ROOT = Path(__file__).resolve().parents[2]
 POLICY_PATH = ROOT / "23_compliance" / "policies" / "anti_gaming_policy.yaml"
 LOG_PATH = ROOT / "02_audit_logging" / "logs" / "anti_gaming_circular_deps.jsonl"
@@ -88,41 +92,15 @@ class ImportGraphBuilder:
         return imports
 
     def detect_cycles(self, max_cycle_length: int) -> List[List[str]]:
-        """Detect circular dependencies using DFS."""
-        cycles = []
-        visited = set()
-        rec_stack = []
-
-        def dfs(node: str, path: List[str]) -> None:
-            if node in rec_stack:
-                # Found a cycle
-                cycle_start = rec_stack.index(node)
-                cycle = rec_stack[cycle_start:] + [node]
-
-                if len(cycle) <= max_cycle_length + 1:  # +1 for repeated node
-                    # Normalize cycle (start with lexicographically smallest)
-                    min_idx = cycle.index(min(cycle[:-1]))
-                    normalized = cycle[min_idx:-1] + cycle[:min_idx] + [cycle[min_idx]]
-
-                    if normalized not in cycles:
-                        cycles.append(normalized)
-                return
-
-            if node in visited:
-                return
-
-            visited.add(node)
-            rec_stack.append(node)
-
-            for neighbor in self.graph.get(node, set()):
-                dfs(neighbor, path + [neighbor])
-
-            rec_stack.pop()
-
-        for node in self.graph.keys():
-            dfs(node, [node])
-
-        return cycles
+        """
+        Detect circular dependencies up to max_cycle_length modules.
+
+        Strongly connected components first (iterative Tarjan), then bounded
+        cycle enumeration inside the cyclic components only. Cycles start
+        with their lexicographically smallest module and repeat it at the
+        end; the list is sorted.
+        """
+        return simple_cycles(self.graph, max_cycle_length)
 
 def load_policy() -> Dict:
     """Load anti-gaming policy configuration."""
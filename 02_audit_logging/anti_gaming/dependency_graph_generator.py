@@ -35,6 +35,12 @@ except ImportError:
     except ImportError:
         RESOLVER_AVAILABLE = False
 
+try:
+    from .graph_cycles import cyclic_components, simple_cycles
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from graph_cycles import cyclic_components, simple_cycles
+
 ROOT = Path(__file__).resolve().parents[2]
 OUTPUT_PATH = ROOT / "02_audit_logging" / "evidence" / "deps" / "dependency_graph.json"
 LOG_PATH = ROOT / "02_audit_logging" / "logs" / "anti_gaming_dependency_graph.jsonl"
@@ -129,17 +135,24 @@ class DependencyGraphGenerator:
 
         return imports
 
+    def detect_cycles(self, max_cycle_length: int = 4) -> List[List[str]]:
+        """Import cycles of at most max_cycle_length modules (see graph_cycles)."""
+        return simple_cycles(self.edges, max_cycle_length)
+
     def generate_graph(self) -> Dict:
         """Generate deterministic graph structure."""
         # Sort for deterministic output
         nodes_list = sorted(list(self.nodes))
         edges_list = sorted(self.edges, key=lambda e: (e[0], e[1]))
+        components = cyclic_components(edges_list)
 
         metadata = {
             "generated_at": datetime.utcnow().isoformat() + "Z",
             "root_directory": str(self.root.name),
             "node_count": len(nodes_list),
             "edge_count": len(edges_list),
+            "cyclic_component_count": len(components),
+            "largest_cyclic_component": max((len(c) for c in components), default=0),
             "generator_version": "2.0.0",
             "resolver_enabled": self.use_resolver
         }
@@ -219,6 +232,8 @@ def main() -> int:
     # Create graph structure
     print("Generating graph...")
     graph = generator.generate_graph()
+    print(f"Cyclic components: {graph['metadata']['cyclic_component_count']} "
+          f"(largest: {graph['metadata']['largest_cyclic_component']} modules)")
 
     # Calculate hash
     graph_hash = generator.calculate_hash(graph)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+graph_cycles.py – Cycle Detection for Import Dependency Graphs
+Autor: edubrainboost ©2025 MIT License
+
+Shared engine for circular_dependency_validator.py,
+dependency_graph_generator.py and static_import_resolver.py:
+
+- strongly_connected_components(): iterative Tarjan, O(V + E), no
+  recursion limit on deep import chains
+- simple_cycles(): elementary cycles up to a maximum length, enumerated
+  only inside non-trivial components
+
+Graphs are mappings of node -> iterable of successors, or lists of
+(source, target) edges. All results are sorted and deterministic.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Union
+
+Graph = Union[Mapping[str, Iterable[str]], Iterable[Sequence[str]]]
+
+def adjacency(graph: Graph) -> Dict[str, List[str]]:
+    """Normalize a graph to node -> sorted unique successors (targets included as nodes)."""
+    items = graph.items() if isinstance(graph, Mapping) else (
+        (edge[0], (edge[1],)) for edge in graph
+    )
+
+    successors: Dict[str, Set[str]] = {}
+    for node, targets in items:
+        successors.setdefault(node, set())
+        for target in targets:
+            successors[node].add(target)
+            successors.setdefault(target, set())
+
+    return {node: sorted(targets) for node, targets in sorted(successors.items())}
+
+def strongly_connected_components(graph: Graph) -> List[List[str]]:
+    """
+    Strongly connected components (iterative Tarjan).
+
+    Returns:
+        Components as sorted node lists, in reverse topological order
+    """
+    return _tarjan(adjacency(graph))
+
+def cyclic_components(graph: Graph) -> List[List[str]]:
+    """Components that contain at least one cycle (size > 1 or a self-import)."""
+    return _cyclic_components(adjacency(graph))
+
+def iter_simple_cycles(graph: Graph, max_length: Optional[int] = None) -> Iterator[List[str]]:
+    """
+    Elementary cycles with at most `max_length` distinct nodes.
+
+    Each cycle starts with its smallest node and repeats it at the end
+    (["a", "b", "a"]). Search follows Johnson's outer loop: per component,
+    cycles through the smallest remaining node are enumerated, then that
+    node is removed. Johnson's blocking lists do not carry over to a length
+    bound, so branches are pruned by the reverse-BFS distance back to the
+    start node instead.
+    """
+    adj = adjacency(graph)
+
+    for component in _cyclic_components(adj):
+        if len(component) == 1:
+            if max_length is None or max_length >= 1:
+                yield [component[0], component[0]]
+            continue
+        yield from _component_cycles(adj, component, max_length)
+
+def simple_cycles(graph: Graph, max_length: Optional[int] = None) -> List[List[str]]:
+    """Sorted list of iter_simple_cycles()."""
+    return sorted(iter_simple_cycles(graph, max_length))
+
+def _tarjan(adj: Dict[str, List[str]]) -> List[List[str]]:
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components = []
+
+    for root in adj:
+        if root in index:
+            continue
+
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adj[root]))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = low[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(adj[successor])))
+                    break
+                if successor in on_stack and index[successor] < low[node]:
+                    low[node] = index[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+
+    return components
+
+def _cyclic_components(adj: Dict[str, List[str]]) -> List[List[str]]:
+    return [
+        component for component in _tarjan(adj)
+        if len(component) > 1 or component[0] in adj[component[0]]
+    ]
+
+def _component_cycles(adj: Dict[str, List[str]], component: List[str], max_length: Optional[int]) -> Iterator[List[str]]:
+    bound = len(component) if max_length is None else min(max_length, len(component))
+    remaining = set(component)
+    predecessors: Dict[str, List[str]] = {node: [] for node in component}
+    for node in component:
+        for successor in adj[node]:
+            if successor in remaining:
+                predecessors[successor].append(node)
+
+    for start in component:
+        if start in adj[start]:
+            yield [start, start]
+
+        distance = _distances_to(start, predecessors, remaining, bound)
+        path = [start]
+        on_path = {start}
+        work = [iter(adj[start])]
+
+        while work:
+            for successor in work[-1]:
+                if successor == start:
+                    if len(path) > 1:
+                        yield path + [start]
+                    continue
+                if (successor in on_path or successor not in remaining
+                        or len(path) + distance.get(successor, bound) > bound):
+                    continue
+                path.append(successor)
+                on_path.add(successor)
+                work.append(iter(adj[successor]))
+                break
+            else:
+                work.pop()
+                on_path.discard(path.pop())
+
+        remaining.discard(start)
+
+def _distances_to(target: str, predecessors: Dict[str, List[str]], allowed: Set[str], bound: int) -> Dict[str, int]:
+    """Edges from each allowed node to `target`, up to `bound` (BFS over reversed edges)."""
+    distance = {target: 0}
+    queue = deque([target])
+    while queue:
+        node = queue.popleft()
+        if distance[node] >= bound:
+            continue
+        for predecessor in predecessors[node]:
+            if predecessor in allowed and predecessor not in distance:
+                distance[predecessor] = distance[node] + 1
+                queue.append(predecessor)
+    return distance
@@ -24,6 +24,10 @@ from typing import Dict, List, Set, Tuple, Optional
 from collections import defaultdict
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from graph_cycles import cyclic_components, simple_cycles
+
 
 class StaticImportResolver:
     """
@@ -288,6 +292,16 @@ class StaticImportResolver:
 
         return sorted(list(edges))
 
+    def detect_cycles(self, max_cycle_length: int = 4) -> List[List[str]]:
+        """
+        Import cycles over the canonical edges.
+
+        Returns:
+            Sorted cycles of at most max_cycle_length modules, each starting
+            and ending with its smallest module
+        """
+        return simple_cycles(self.generate_canonical_edges(), max_cycle_length)
+
     def generate_audit_report(self) -> Dict:
         """Generate comprehensive audit report of import resolution."""
         total_imports = len(self.import_edges)
@@ -298,6 +312,9 @@ class StaticImportResolver:
         for edge in self.import_edges:
             import_types[edge["import_type"]] += 1
 
+        canonical_edges = self.generate_canonical_edges()
+        components = cyclic_components(canonical_edges)
+
         return {
             "metadata": {
                 "generated_at": datetime.utcnow().isoformat() + "Z",
@@ -310,7 +327,9 @@ class StaticImportResolver:
                 "unresolved_imports": unresolved_imports,
                 "resolution_rate": f"{(resolved_imports/total_imports*100) if total_imports > 0 else 0:.2f}%",
                 "unique_modules": len(self.module_registry),
-                "unique_edges": len(self.generate_canonical_edges())
+                "unique_edges": len(canonical_edges),
+                "cyclic_components": len(components),
+                "largest_cyclic_component": max((len(c) for c in components), default=0)
             },
             "import_type_breakdown": dict(import_types),
             "unresolved_contexts": list(self.unresolved)[:50]  # Top 50
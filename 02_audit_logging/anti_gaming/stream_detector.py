@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+stream_detector.py – Online Anti-Gaming Detector
+Autor: edubrainboost ©2025 MIT License
+
+Streaming counterpart of replay_attack_detector.py, time_skew_analyzer.py
+and anomaly_rate_guard.py. Tails the identity event log and the audit/
+evidence JSONL files once, parses every record once into epoch
+milliseconds and feeds incremental operators:
+
+  replay  - (did, nonce) seen again within the nonce uniqueness window
+            (bounded per DID and by the window)
+  skew    - record older than the newest record of its source by more than
+            the allowed skew (backdating), or ahead of the wall clock by
+            more than it (future-dating)
+  rate    - 5s/1m/1h windows per DID (StreamingRateGuard)
+
+Read offsets and operator state are checkpointed together after every
+poll, so each run continues where the previous one stopped and findings
+are reported once.
+
+Usage:
+  python stream_detector.py            # process new records, then exit
+  python stream_detector.py --follow   # keep polling (default every 2s)
+  python stream_detector.py --reset    # ignore the checkpoint
+
+Exit Codes:
+  0 - PASS (no findings)
+  2 - FAIL (findings reported)
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import yaml
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+from collections import OrderedDict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from anomaly_rate_guard import StreamingRateGuard, rate_checks
+
+ROOT = Path(__file__).resolve().parents[2]
+POLICY_PATH = ROOT / "23_compliance" / "policies" / "anti_gaming_policy.yaml"
+EVENTS_PATH = ROOT / "02_audit_logging" / "evidence" / "identity_events.jsonl"
+AUDIT_DIRS = [
+    ROOT / "02_audit_logging" / "logs",
+    ROOT / "02_audit_logging" / "evidence"
+]
+LOG_PATH = ROOT / "02_audit_logging" / "logs" / "anti_gaming_stream.jsonl"
+CHECKPOINT_PATH = ROOT / ".ssid_cache" / "anti_gaming" / "stream_checkpoint.json"
+
+CHECKPOINT_VERSION = 1
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MS = timedelta(milliseconds=1)
+
+def load_policy() -> Dict:
+    """Load anti-gaming policy configuration."""
+    if not POLICY_PATH.exists():
+        return {
+            "rules": {
+                "replay": {"nonce_uniqueness_window_minutes": 120},
+                "time_skew": {"max_allowed_skew_seconds": 300},
+                "anomaly_rate": {
+                    "rate_limits": {
+                        "events_per_minute_per_did": 10,
+                        "events_per_hour_per_did": 500
+                    },
+                    "burst_limits": {"per_5s": 5}
+                }
+            }
+        }
+
+    with open(POLICY_PATH, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+def to_epoch_ms(value) -> Optional[int]:
+    """ISO 8601 timestamp -> epoch milliseconds (naive = UTC), None if invalid."""
+    if not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - EPOCH) // MS
+
+def format_epoch_ms(ms: int) -> str:
+    return (EPOCH + ms * MS).isoformat().replace("+00:00", "Z")
+
+def now_ms() -> int:
+    return (datetime.now(timezone.utc) - EPOCH) // MS
+
+# ----------------------------------------------------------------------
+# Sources
+# ----------------------------------------------------------------------
+
+class JsonlTail:
+    """Read position in one JSONL source (complete lines only)."""
+
+    def __init__(self, path: Path, offset: int = 0, line: int = 0, inode: Optional[int] = None):
+        self.path = path
+        self.offset = offset
+        self.line = line
+        self.inode = inode
+        self.malformed = 0  # Lines skipped because they are not a JSON object
+
+    def read_new(self) -> Iterator[Tuple[int, Dict]]:
+        """
+        (line number, record) of the dict records appended since the last call.
+
+        Malformed lines are counted in self.malformed and skipped.
+        """
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            # New, rotated or truncated file
+            self.offset, self.line, self.inode = 0, 0, stat.st_ino
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Write in progress
+                self.offset += len(raw)
+                self.line += 1
+                if not raw.strip():
+                    continue
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    self.malformed += 1
+                    continue
+                if isinstance(record, dict):
+                    yield self.line, record
+                else:
+                    self.malformed += 1
+
+    def to_state(self) -> Dict:
+        return {"offset": self.offset, "line": self.line, "inode": self.inode}
+
+# ----------------------------------------------------------------------
+# Operators
+# ----------------------------------------------------------------------
+
+class ReplayOperator:
+    """
+    Nonce reuse per DID within the uniqueness window.
+
+    Keeps the last timestamp per (did, nonce) for at most window_ms and at
+    most max_nonces_per_did nonces per DID (oldest dropped first).
+    """
+
+    def __init__(self, window_ms: int, max_nonces_per_did: int = 4096):
+        self.window_ms = window_ms
+        self.max_nonces_per_did = max_nonces_per_did
+        self.nonces: Dict[str, "OrderedDict[str, int]"] = {}
+
+    def add(self, did: str, nonce: str, ts: int) -> Optional[Dict]:
+        seen = self.nonces.get(did)
+        if seen is None:
+            seen = self.nonces[did] = OrderedDict()
+
+        finding = None
+        last = seen.pop(nonce, None)
+        if last is not None and abs(ts - last) <= self.window_ms:
+            first, replay = min(last, ts), max(last, ts)
+            finding = {
+                "check": "replay",
+                "did": did,
+                "nonce": nonce,
+                "first_seen": format_epoch_ms(first),
+                "replay_seen": format_epoch_ms(replay),
+                "time_diff_minutes": (replay - first) / 60000
+            }
+
+        seen[nonce] = ts if last is None else max(ts, last)
+        if len(seen) > self.max_nonces_per_did:
+            seen.popitem(last=False)
+        return finding
+
+    def expire(self, clock: int) -> None:
+        """Drop nonces last seen more than one window before `clock`."""
+        for did in list(self.nonces):
+            seen = self.nonces[did]
+            while seen:
+                nonce, ts = next(iter(seen.items()))
+                if ts + self.window_ms >= clock:
+                    break
+                del seen[nonce]
+            if not seen:
+                del self.nonces[did]
+
+    def to_state(self) -> Dict:
+        return {did: list(seen.items()) for did, seen in self.nonces.items()}
+
+    def load_state(self, state: Dict) -> None:
+        self.nonces = {did: OrderedDict(items) for did, items in state.items()}
+
+class SkewOperator:
+    """Backdated records per source and future-dated records against the wall clock."""
+
+    def __init__(self, max_skew_ms: int):
+        self.max_skew_ms = max_skew_ms
+        self.watermarks: Dict[str, int] = {}
+        self.max_skew_seen_ms = 0
+
+    def add(self, source: str, line: int, ts: int, wall_clock: int) -> Optional[Dict]:
+        finding = None
+        newest = self.watermarks.get(source)
+
+        if ts - wall_clock > self.max_skew_ms:
+            skew, kind, reference = ts - wall_clock, "future", wall_clock
+        elif newest is not None and newest - ts > self.max_skew_ms:
+            skew, kind, reference = newest - ts, "backdated", newest
+        else:
+            skew = max(newest - ts if newest is not None else 0, ts - wall_clock, 0)
+            kind = reference = None
+
+        self.max_skew_seen_ms = max(self.max_skew_seen_ms, skew)
+        if kind:
+            finding = {
+                "check": "time_skew",
+                "type": kind,
+                "file": source,
+                "line": line,
+                "timestamp": format_epoch_ms(ts),
+                "reference": format_epoch_ms(reference),
+                "skew_seconds": skew // 1000
+            }
+
+        # Future-dated records do not move the watermark
+        if kind != "future" and (newest is None or ts > newest):
+            self.watermarks[source] = ts
+        return finding
+
+    def to_state(self) -> Dict:
+        return {"watermarks": self.watermarks, "max_skew_seen_ms": self.max_skew_seen_ms}
+
+    def load_state(self, state: Dict) -> None:
+        self.watermarks = dict(state["watermarks"])
+        self.max_skew_seen_ms = state["max_skew_seen_ms"]
+
+class RateOperator(StreamingRateGuard):
+    """StreamingRateGuard on epoch milliseconds (checkpointed via to_state())."""
+
+    def __init__(self, events_per_minute: int, events_per_hour: int, burst_per_5s: int):
+        super().__init__([
+            (violation_type, window, width // MS, limit)
+            for violation_type, window, width, limit
+            in rate_checks(events_per_minute, events_per_hour, burst_per_5s)
+        ])
+
+    def format_time(self, ts: int) -> str:
+        return format_epoch_ms(ts)
+
+# ----------------------------------------------------------------------
+# Pipeline
+# ----------------------------------------------------------------------
+
+class StreamDetector:
+    """
+    Replay, skew and rate detection over tailed JSONL sources.
+
+    Usage:
+        detector = StreamDetector.from_policy(load_policy())
+        findings = detector.poll()
+        detector.save_checkpoint()
+    """
+
+    def __init__(
+        self,
+        replay_window_minutes: int,
+        max_skew_seconds: int,
+        events_per_minute: int,
+        events_per_hour: int,
+        burst_per_5s: int,
+        events_path: Path = EVENTS_PATH,
+        audit_dirs: Optional[List[Path]] = None,
+        checkpoint_path: Optional[Path] = CHECKPOINT_PATH,
+        exclude: Tuple[Path, ...] = (LOG_PATH,)
+    ):
+        self.events_path = events_path
+        self.audit_dirs = AUDIT_DIRS if audit_dirs is None else audit_dirs
+        self.checkpoint_path = checkpoint_path
+        self.exclude = {str(path) for path in exclude}
+
+        self.replay = ReplayOperator(replay_window_minutes * 60000)
+        self.skew = SkewOperator(max_skew_seconds * 1000)
+        self.rate = RateOperator(events_per_minute, events_per_hour, burst_per_5s)
+        self.tails: Dict[str, JsonlTail] = {}
+        self.stats = {"records": 0, "unparsed_timestamps": 0, "malformed_lines": 0}
+
+    @classmethod
+    def from_policy(cls, policy: Dict, **kwargs) -> "StreamDetector":
+        rules = policy.get("rules", {})
+        rate_rules = rules.get("anomaly_rate", {})
+        rate_limits = rate_rules.get("rate_limits", {})
+        return cls(
+            rules.get("replay", {}).get("nonce_uniqueness_window_minutes", 120),
+            rules.get("time_skew", {}).get("max_allowed_skew_seconds", 300),
+            rate_limits.get("events_per_minute_per_did", 10),
+            rate_limits.get("events_per_hour_per_did", 500),
+            rate_rules.get("burst_limits", {}).get("per_5s", 5),
+            **kwargs
+        )
+
+    def _sources(self) -> List[Path]:
+        """Identity event log first, then all other JSONL files (sorted)."""
+        sources = [self.events_path]
+        for search_dir in self.audit_dirs:
+            if search_dir.exists():
+                sources.extend(sorted(search_dir.rglob("*.jsonl")))
+        seen = set()
+        unique = []
+        for path in sources:
+            key = str(path)
+            if key not in seen and key not in self.exclude:
+                seen.add(key)
+                unique.append(path)
+        return unique
+
+    def _source_name(self, path: Path) -> str:
+        try:
+            return str(path.relative_to(ROOT))
+        except ValueError:
+            return str(path)
+
+    def poll(self, wall_clock: Optional[int] = None) -> List[Dict]:
+        """Process records appended since the last poll; returns new findings."""
+        wall_clock = now_ms() if wall_clock is None else wall_clock
+        findings = []
+
+        for path in self._sources():
+            key = str(path)
+            tail = self.tails.get(key)
+            if tail is None:
+                tail = self.tails[key] = JsonlTail(path)
+            is_identity_log = path == self.events_path
+            source = self._source_name(path)
+            malformed = tail.malformed
+
+            for line, record in tail.read_new():
+                self.stats["records"] += 1
+                raw_ts = record.get("timestamp") or record.get("ts")
+                if not raw_ts:
+                    continue
+                ts = to_epoch_ms(raw_ts)
+                if ts is None:
+                    self.stats["unparsed_timestamps"] += 1
+                    continue
+
+                finding = self.skew.add(source, line, ts, wall_clock)
+                if finding:
+                    findings.append(finding)
+
+                did = record.get("did")
+                if not is_identity_log or not did:
+                    continue
+                nonce = record.get("nonce")
+                if nonce:
+                    finding = self.replay.add(did, nonce, ts)
+                    if finding:
+                        findings.append(finding)
+                for violation in self.rate.add(did, ts):
+                    findings.append(dict(violation, check="anomaly_rate"))
+
+            self.stats["malformed_lines"] += tail.malformed - malformed
+
+        for violation in self.rate.close_expired():
+            findings.append(dict(violation, check="anomaly_rate"))
+        if self.rate.clock is not None:
+            self.replay.expire(self.rate.clock)
+
+        return findings
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+
+    def save_checkpoint(self) -> None:
+        """Persist read offsets and operator state (atomic replace)."""
+        if not self.checkpoint_path:
+            return
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "tails": {key: tail.to_state() for key, tail in self.tails.items()},
+            "replay": self.replay.to_state(),
+            "skew": self.skew.to_state(),
+            "rate": self.rate.to_state()
+        }
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def load_checkpoint(self) -> bool:
+        """Restore state from the checkpoint; False if there is none or it is unusable."""
+        if not self.checkpoint_path or not self.checkpoint_path.exists():
+            return False
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") != CHECKPOINT_VERSION:
+                return False
+            tails = {
+                key: JsonlTail(Path(key), tail["offset"], tail["line"], tail["inode"])
+                for key, tail in state["tails"].items()
+            }
+            self.replay.load_state(state["replay"])
+            self.skew.load_state(state["skew"])
+            self.rate.load_state(state["rate"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.replay.load_state({})
+            self.skew.load_state({"watermarks": {}, "max_skew_seen_ms": 0})
+            self.rate.load_state({"clock": None, "newest": {}, "states": {}})
+            return False
+        self.tails = tails
+        return True
+
+def write_audit_log(status: str, findings: List[Dict], detector: StreamDetector, policy_version: str) -> None:
+    """Write deterministic audit log entry."""
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    counts: Dict[str, int] = {}
+    for finding in findings:
+        counts[finding["check"]] = counts.get(finding["check"], 0) + 1
+
+    entry = {
+        "ts": datetime.utcnow().isoformat() + "Z",
+        "component": "anti_gaming",
+        "check": "stream",
+        "status": status,
+        "findings": len(findings),
+        "findings_by_check": counts,
+        "finding_details": findings[:100],
+        "records_processed": detector.stats["records"],
+        "unparsed_timestamps": detector.stats["unparsed_timestamps"],
+        "malformed_lines": detector.stats["malformed_lines"],
+        "max_skew_seconds": detector.skew.max_skew_seen_ms // 1000,
+        "policy_version": policy_version
+    }
+
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, sort_keys=True) + "\n")
+
+def report(findings: List[Dict]) -> None:
+    for finding in findings:
+        if finding["check"] == "replay":
+            print(f"  - [replay] {finding['did']} nonce {finding['nonce']} "
+                  f"({finding['time_diff_minutes']:.1f} minutes apart)")
+        elif finding["check"] == "time_skew":
+            print(f"  - [time_skew] {finding['file']}:{finding['line']} "
+                  f"{finding['type']} by {finding['skew_seconds']} seconds")
+        else:
+            print(f"  - [anomaly_rate] {finding['did']} {finding['type']} ({finding['window']}): "
+                  f"{finding['events']} events (limit: {finding['limit']})")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="SSID Online Anti-Gaming Detector")
+    parser.add_argument("--follow", action="store_true", help="Keep polling for new records")
+    parser.add_argument("--interval", type=float, default=2.0,
+                        help="Poll interval in seconds for --follow (default: 2)")
+    parser.add_argument("--reset", action="store_true", help="Ignore the existing checkpoint")
+    args = parser.parse_args(argv)
+
+    print("SSID Online Anti-Gaming Detector")
+    print("=" * 60)
+
+    policy = load_policy()
+    policy_version = policy.get("metadata", {}).get("version", "1.0.0")
+    detector = StreamDetector.from_policy(policy)
+    resumed = not args.reset and detector.load_checkpoint()
+    print(f"Policy Version: {policy_version}")
+    print(f"Checkpoint: {'resumed' if resumed else 'new'} ({CHECKPOINT_PATH})")
+    print()
+
+    total_findings = 0
+    try:
+        while True:
+            findings = detector.poll()
+            detector.save_checkpoint()
+            total_findings += len(findings)
+
+            if findings or not args.follow:
+                write_audit_log("FAIL" if findings else "PASS", findings, detector, policy_version)
+            if findings:
+                report(findings)
+            if not args.follow:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+    status = "PASS" if total_findings == 0 else "FAIL"
+    print()
+    print("=" * 60)
+    print(f"Status: {status}")
+    print(f"Records processed: {detector.stats['records']}")
+    if detector.stats["malformed_lines"]:
+        print(f"Malformed lines skipped: {detector.stats['malformed_lines']}")
+    print(f"Findings: {total_findings}")
+    print(f"Audit log: {LOG_PATH}")
+
+    return 0 if status == "PASS" else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
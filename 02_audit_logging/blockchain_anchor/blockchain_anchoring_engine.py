@@ -10,6 +10,9 @@ Features:
 - Batch evidence hash anchoring (cost-optimized)
 - Multiple blockchain support (Ethereum Sepolia, Polygon Amoy)
 - Merkle tree commitments for efficient batch anchoring
+- Persisted Merkle trees with O(log n) inclusion proofs
+- SQLite evidence-hash lookup (O(1) "is this anchored, where is the proof")
+- Transaction log as index journal with periodic snapshot compaction
 - Transaction verification and retry logic
 - Integration with WORM storage
 
@@ -19,12 +22,19 @@ Version: 1.0.0
 
 import hashlib
 import json
+import os
+import sqlite3
+import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "merkle"))
+
+from merkle_engine import MerkleTree, read_inclusion_proof, verify_inclusion
+
 @dataclass
 class AnchorTransaction:
     """Blockchain anchor transaction record."""
@@ -58,16 +68,27 @@ class BlockchainAnchoringEngine:
         self.storage_root = Path(storage_root)
         self.storage_root.mkdir(parents=True, exist_ok=True)
 
-        # Anchor records index
+        # Transaction log (append-only; doubles as index journal)
+        self.tx_log_path = self.storage_root / "transactions.jsonl"
+
+        # Anchor records index: snapshot + replay of the transaction log
+        # written after the snapshot was taken
         self.index_path = self.storage_root / "anchor_index.json"
+        self.index_meta_path = self.storage_root / "anchor_index.meta.json"
+        self._batches_since_compaction = 0
         self.index: Dict[str, AnchorTransaction] = self._load_index()
 
-        # Transaction log
-        self.tx_log_path = self.storage_root / "transactions.jsonl"
+        # Persisted Merkle trees (one per batch, for inclusion proofs)
+        self.trees_dir = self.storage_root / "merkle_trees"
+
+        # Evidence hash -> (batch_id, leaf index) lookup
+        self.lookup_db_path = self.storage_root / "anchor_lookup.db"
+        self._lookup = self._open_lookup()
 
         # Configuration
         self.config = {
             "batch_size": 1000,
+            "index_compaction_batches": 1000,
             "batch_timeout_seconds": 3600,  # 1 hour
             "retry_max": 3,
             "retry_backoff_base": 2,
@@ -86,18 +107,132 @@ class BlockchainAnchoringEngine:
         }
 
     def _load_index(self) -> Dict[str, AnchorTransaction]:
-        """Load anchor transaction index."""
+        """
+        Load anchor transaction index.
+
+        Reads the last snapshot and replays transaction-log records written
+        after it. Replaying already-snapshotted records is idempotent.
+        """
+        index: Dict[str, AnchorTransaction] = {}
         if self.index_path.exists():
             with open(self.index_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                return {k: AnchorTransaction(**v) for k, v in data.items()}
-        return {}
+                index = {k: AnchorTransaction(**v) for k, v in data.items()}
+
+        offset = 0
+        if self.index_meta_path.exists():
+            with open(self.index_meta_path, 'r', encoding='utf-8') as f:
+                offset = json.load(f).get("tx_log_offset", 0)
+
+        if self.tx_log_path.exists():
+            valid_end = offset
+            with open(self.tx_log_path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Torn trailing record from an interrupted append
+                        break
+                    valid_end += len(line)
+                    tx = AnchorTransaction(**json.loads(line))
+                    index[tx.batch_id] = tx
+                    self._batches_since_compaction += 1
+
+            if valid_end < self.tx_log_path.stat().st_size:
+                os.truncate(self.tx_log_path, valid_end)
+
+        return index
 
     def _save_index(self) -> None:
-        """Save anchor transaction index."""
+        """
+        Save anchor transaction index snapshot (compaction).
+
+        The snapshot is replaced atomically, then the covered transaction-log
+        offset is recorded so later startups only replay newer records.
+        """
+        tx_log_offset = self.tx_log_path.stat().st_size if self.tx_log_path.exists() else 0
         data = {k: asdict(v) for k, v in self.index.items()}
-        with open(self.index_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+        tmp_meta = self.index_meta_path.with_suffix(".tmp")
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump({"tx_log_offset": tx_log_offset}, f)
+        os.replace(tmp_meta, self.index_meta_path)
+
+        self._batches_since_compaction = 0
+
+    def compact_index(self) -> None:
+        """Write an index snapshot now (normally done every N batches)."""
+        self._save_index()
+
+    def _open_lookup(self) -> sqlite3.Connection:
+        """
+        Open the evidence-hash lookup database.
+
+        Batches missing from it (e.g. anchored before it existed) are
+        backfilled in index order, so the first batch anchoring a hash wins,
+        as with the previous linear scan.
+        """
+        conn = sqlite3.connect(str(self.lookup_db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS evidence_anchor (
+                evidence_hash BLOB PRIMARY KEY,
+                batch_id TEXT NOT NULL,
+                leaf_index INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS indexed_batches (
+                batch_id TEXT PRIMARY KEY
+            ) WITHOUT ROWID
+        """)
+        conn.commit()
+
+        indexed = {row[0] for row in conn.execute("SELECT batch_id FROM indexed_batches")}
+        for batch_id, tx in self.index.items():
+            if batch_id not in indexed:
+                self._index_batch_hashes(conn, batch_id, tx.evidence_hashes)
+        conn.commit()
+
+        return conn
+
+    @staticmethod
+    def _index_batch_hashes(conn: sqlite3.Connection, batch_id: str,
+                            evidence_hashes: List[str]) -> None:
+        """Insert lookup rows for one batch (caller commits)."""
+        conn.executemany(
+            "INSERT OR IGNORE INTO evidence_anchor (evidence_hash, batch_id, leaf_index) VALUES (?, ?, ?)",
+            ((bytes.fromhex(h), batch_id, i) for i, h in enumerate(evidence_hashes))
+        )
+        conn.execute("INSERT OR IGNORE INTO indexed_batches (batch_id) VALUES (?)", (batch_id,))
+
+    def find_anchor(self, evidence_hash: str) -> Optional[Tuple[str, int]]:
+        """
+        Look up where an evidence hash is anchored.
+
+        Args:
+            evidence_hash: Evidence content hash (hex)
+
+        Returns:
+            (batch_id, leaf index) or None if not anchored
+        """
+        try:
+            key = bytes.fromhex(evidence_hash)
+        except ValueError:
+            return None
+        row = self._lookup.execute(
+            "SELECT batch_id, leaf_index FROM evidence_anchor WHERE evidence_hash = ?", (key,)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def is_anchored(self, evidence_hash: str) -> bool:
+        """Check whether an evidence hash has been anchored."""
+        return self.find_anchor(evidence_hash) is not None
 
     def _log_transaction(self, tx: AnchorTransaction) -> None:
         """Log transaction to append-only log."""
@@ -114,30 +249,11 @@ class BlockchainAnchoringEngine:
         Returns:
             Merkle root hash
         """
-        if len(hashes) == 0:
-            return hashlib.sha256(b"").hexdigest()
-
-        if len(hashes) == 1:
-            return hashes[0]
-
-        # Build Merkle tree (simple implementation)
-        current_level = hashes[:]
-
-        while len(current_level) > 1:
-            next_level = []
-            for i in range(0, len(current_level), 2):
-                left = current_level[i]
-                right = current_level[i + 1] if i + 1 < len(current_level) else left
-
-                # Hash pair
-                combined = hashlib.sha256(
-                    bytes.fromhex(left) + bytes.fromhex(right)
-                ).hexdigest()
-                next_level.append(combined)
-
-            current_level = next_level
+        return MerkleTree.from_hex(hashes).root_hex()
 
-        return current_level[0]
+    def _tree_path(self, batch_id: str) -> Path:
+        """Path of the persisted Merkle tree for a batch."""
+        return self.trees_dir / f"{batch_id}.mrkl"
 
     def _simulate_blockchain_anchor(self, merkle_root: str, chain: str) -> Dict[str, Any]:
         """
@@ -193,8 +309,11 @@ class BlockchainAnchoringEngine:
         # Generate batch ID
         batch_id = f"batch_{int(time.time())}_{len(evidence_hashes)}"
 
-        # Compute Merkle root
-        merkle_root = self._compute_merkle_root(evidence_hashes)
+        # Build Merkle tree once and persist it for inclusion proofs
+        tree = MerkleTree.from_hex(evidence_hashes)
+        merkle_root = tree.root_hex()
+        self.trees_dir.mkdir(parents=True, exist_ok=True)
+        tree.save(self._tree_path(batch_id))
 
         # Create transaction record
         tx = AnchorTransaction(
@@ -230,8 +349,13 @@ class BlockchainAnchoringEngine:
 
         # Save transaction
         self.index[batch_id] = tx
-        self._save_index()
         self._log_transaction(tx)
+        self._index_batch_hashes(self._lookup, batch_id, evidence_hashes)
+        self._lookup.commit()
+
+        self._batches_since_compaction += 1
+        if self._batches_since_compaction >= self.config["index_compaction_batches"]:
+            self._save_index()
 
         return {
             "batch_id": batch_id,
@@ -329,26 +453,47 @@ class BlockchainAnchoringEngine:
         Returns:
             Anchor proof with Merkle path and transaction details
         """
-        # Find batch containing this evidence
-        for batch_id, tx in self.index.items():
-            if evidence_hash in tx.evidence_hashes:
-                # Compute Merkle proof path (simplified)
-                index = tx.evidence_hashes.index(evidence_hash)
-
-                return {
-                    "evidence_hash": evidence_hash,
-                    "batch_id": batch_id,
-                    "merkle_root": tx.merkle_root,
-                    "merkle_index": index,
-                    "tx_hash": tx.tx_hash,
-                    "block_number": tx.block_number,
-                    "chain": tx.chain,
-                    "timestamp": tx.timestamp,
-                    "proof_valid": tx.status == "confirmed"
-                }
+        location = self.find_anchor(evidence_hash)
+        if location is not None:
+            batch_id, index = location
+            return self._build_anchor_proof(evidence_hash, batch_id, index)
 
         raise FileNotFoundError(f"No anchor found for evidence hash {evidence_hash}")
 
+    def _build_anchor_proof(self, evidence_hash: str, batch_id: str,
+                            index: int) -> Dict[str, Any]:
+        """
+        Build anchor proof with Merkle inclusion path.
+
+        The path is read from the persisted tree (O(log n) seeks); batches
+        anchored before trees were persisted fall back to rebuilding it.
+        """
+        tx = self.index[batch_id]
+        tree_path = self._tree_path(batch_id)
+
+        if tree_path.exists():
+            leaf, proof, root = read_inclusion_proof(tree_path, index)
+        else:
+            tree = MerkleTree.from_hex(tx.evidence_hashes)
+            leaf, proof, root = tree.leaf(index), tree.inclusion_proof(index), tree.root()
+
+        path_valid = (leaf == bytes.fromhex(evidence_hash)
+                      and root.hex() == tx.merkle_root.lower()
+                      and verify_inclusion(leaf, index, proof, root))
+
+        return {
+            "evidence_hash": evidence_hash,
+            "batch_id": batch_id,
+            "merkle_root": tx.merkle_root,
+            "merkle_index": index,
+            "merkle_proof": [sibling.hex() for sibling in proof],
+            "tx_hash": tx.tx_hash,
+            "block_number": tx.block_number,
+            "chain": tx.chain,
+            "timestamp": tx.timestamp,
+            "proof_valid": tx.status == "confirmed" and path_valid
+        }
+
 def test_blockchain_anchoring():
     """Test blockchain anchoring functionality."""
     print("=" * 70)
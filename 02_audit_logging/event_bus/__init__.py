@@ -4,7 +4,7 @@ Audit Event Bus - Initialization Module
 ========================================
 
 Auto-initialization of event bus from configuration.
-Supports multiple backends: in_memory, redis, rabbitmq, nats.
+Supports multiple backends: in_memory, asyncio, redis, rabbitmq, nats.
 
 Usage:
     from 02_audit_logging.event_bus import get_audit_bus
@@ -30,6 +30,7 @@ from audit_event_emitter import (
 )
 
 from in_memory_bus import InMemoryAuditBus, create_audit_bus_from_config
+from asyncio_bus import AsyncioAuditBus, SyncHandlerBridge, create_asyncio_bus_from_config
 
 
 # Configuration loader
@@ -82,6 +83,10 @@ def create_event_bus(config: Optional[dict] = None) -> AuditEventEmitter:
         bus_config = config.get("in_memory", {})
         return create_audit_bus_from_config(bus_config)
 
+    elif bus_mode == "asyncio":
+        bus_config = config.get("asyncio", {})
+        return create_asyncio_bus_from_config(bus_config)
+
     elif bus_mode == "redis":
         # TODO: Implement Redis backend
         raise NotImplementedError("Redis backend not yet implemented")
@@ -144,5 +149,7 @@ __all__ = [
     "initialize_global_bus",
     "create_event_bus",
     "load_config",
-    "reset_audit_emitter"
+    "reset_audit_emitter",
+    "AsyncioAuditBus",
+    "SyncHandlerBridge"
 ]
@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+Asyncio Audit Event Bus
+========================
+
+Asyncio-native event bus implementation for federation scenarios.
+Runs on one event loop: an asyncio.Queue feeds worker tasks that await
+coroutine handlers, and every emitted event can carry an awaitable
+future. No thread is spent per pending event.
+
+Features:
+- Coroutine handlers (async def handle(event) -> EmitResult)
+- emit_async() returns an asyncio.Future resolved by the worker
+- emit_batch() awaits many events with asyncio.gather semantics
+- SyncHandlerBridge runs existing sync handlers (e.g. WORMHandler) on a
+  small bounded executor; batch-capable handlers get one call per batch
+- Thread-safe emit() from outside the loop (call_soon_threadsafe)
+- Same metrics / health_check shape as InMemoryAuditBus
+
+Usage:
+    bus = AsyncioAuditBus()
+    bus.register_handler(WORMHandler(...))   # bridged automatically
+    await bus.start()
+    result = await bus.emit_async(event)
+    results = await bus.emit_batch(events)
+    await bus.shutdown_async()
+
+Version: 1.0.0
+Status: Production-Ready
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Any, Callable, Optional, Awaitable, Tuple
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "interfaces"))
+
+from audit_event_emitter import (
+    AuditEvent,
+    AuditEventEmitter,
+    AuditEventHandler,
+    EmitResult
+)
+
+from bus_common import log_dropped_event, merge_handler_result
+
+
+class SyncHandlerBridge:
+    """
+    Adapts a sync AuditEventHandler to the coroutine handler protocol.
+
+    handle() runs on a bounded executor shared by all calls of this bridge,
+    so the number of threads does not grow with the number of pending
+    events. With max_workers=1 (default) the wrapped handler sees events
+    in dispatch order, which WORM storage relies on. Handlers exposing
+    handle_batch() get one executor call per drained batch.
+    """
+
+    def __init__(
+        self,
+        handler: AuditEventHandler,
+        executor: Optional[ThreadPoolExecutor] = None,
+        max_workers: int = 1
+    ):
+        """
+        Args:
+            handler: Sync handler to wrap
+            executor: Executor to run the handler on (owned by the caller)
+            max_workers: Thread count of the private executor (executor=None)
+        """
+        self.handler = handler
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix=f"AuditBridge-{handler.name()}"
+        )
+
+        # Only advertise batch support when the wrapped handler has it
+        if getattr(handler, "handle_batch", None) is not None:
+            self.batch_enabled = getattr(handler, "batch_enabled", True)
+        else:
+            self.handle_batch = None
+
+    async def handle(self, event: AuditEvent) -> EmitResult:
+        """Run the wrapped handler's handle() on the bridge executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.handler.handle, event)
+
+    async def handle_batch(self, events: List[AuditEvent]) -> List[EmitResult]:
+        """Run the wrapped handler's handle_batch() on the bridge executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.handler.handle_batch, events)
+
+    def supports(self, event: AuditEvent) -> bool:
+        return self.handler.supports(event)
+
+    def name(self) -> str:
+        return self.handler.name()
+
+    def close(self) -> None:
+        """Shut down the private executor (no-op for caller-owned executors)."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+
+def _is_coroutine_handler(handler: Any) -> bool:
+    """True if handler.handle is a coroutine function."""
+    return asyncio.iscoroutinefunction(getattr(handler, "handle", None))
+
+
+class AsyncioAuditBus(AuditEventEmitter):
+    """
+    Asyncio-native event bus with worker tasks.
+
+    Architecture:
+    1. emit() → queue.put_nowait() → return immediately
+    2. Worker tasks → queue.get() + drain → fan-out to handlers
+    3. emit_async() → emit() + return Future resolved by the worker
+    4. emit_batch() → emit_async() per event + asyncio.gather
+    5. emit_sync() → emit_async() scheduled from another thread
+
+    The bus binds to the loop it is started on. Sync handlers are wrapped
+    in SyncHandlerBridge on registration.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        worker_tasks: int = 4,
+        log_dropped_events: bool = True,
+        metrics_callback: Optional[Callable[[AuditEvent, Dict[str, Any]], None]] = None,
+        drain_batch_size: int = 256,
+        bridge_workers: int = 1
+    ):
+        """
+        Initialize asyncio audit bus.
+
+        Args:
+            max_queue_size: Maximum queue size (overflow → drop event)
+            worker_tasks: Number of worker tasks
+            log_dropped_events: Log warning when events are dropped
+            metrics_callback: Optional callback for observability (event, metrics) → None
+            drain_batch_size: Maximum events a worker drains per batch
+            bridge_workers: Executor threads per bridged sync handler
+        """
+        self.max_queue_size = max_queue_size
+        self.worker_tasks = worker_tasks
+        self.log_dropped_events = log_dropped_events
+        self.metrics_callback = metrics_callback
+        self.drain_batch_size = max(1, drain_batch_size)
+        self.bridge_workers = bridge_workers
+
+        # Created on start(), bound to the running loop
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queue: Optional[asyncio.Queue] = None
+        self.workers: List[asyncio.Task] = []
+
+        # Registered handlers (coroutine handlers or bridges)
+        self.handlers: List[Any] = []
+        self.handler_lock = threading.Lock()
+
+        # Awaitable results, keyed by event_id (loop thread only)
+        self.pending_results: Dict[str, asyncio.Future] = {}
+
+        # Metrics
+        self.metrics = {
+            "events_emitted": 0,
+            "events_processed": 0,
+            "events_dropped": 0,
+            "events_failed": 0,
+            "start_time": time.time()
+        }
+        self.metrics_lock = threading.Lock()
+
+        self._closed = False
+
+    # Lifecycle
+    # =========
+
+    async def start(self) -> None:
+        """Bind to the running loop and start worker tasks (idempotent)."""
+        self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        """Start lazily when first used from inside a running loop."""
+        if self.loop is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                "AsyncioAuditBus not started: await bus.start() on the target loop first"
+            )
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+        for i in range(self.worker_tasks):
+            self.workers.append(
+                loop.create_task(self._worker_loop(i), name=f"AuditWorker-{i}")
+            )
+
+    def _in_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    # Worker
+    # ======
+
+    async def _worker_loop(self, worker_id: int) -> None:
+        """
+        Worker task.
+
+        Awaits one event, then drains up to drain_batch_size - 1 more
+        without yielding, and dispatches them as one batch.
+        """
+        queue = self.queue
+        batch_size = self.drain_batch_size
+
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._dispatch_batch(batch)
+            except Exception:
+                # Never let a worker die; fail the futures still pending
+                for event in batch:
+                    future = self.pending_results.pop(event.event_id, None)
+                    if future is not None and not future.done():
+                        future.set_result(EmitResult(
+                            event_id=event.event_id, status="failed",
+                            error="Dispatch failed"))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _dispatch_batch(self, batch: List[AuditEvent]) -> None:
+        """Process a drained batch, then update counters and resolve futures."""
+        start_time = time.time()
+        results = {}
+        errors: Dict[str, List[str]] = {}
+        per_handler: Dict[int, Tuple[Any, List[AuditEvent]]] = {}
+        handlers = tuple(self.handlers)
+
+        for event in batch:
+            results[event.event_id] = EmitResult(event_id=event.event_id, status="processed")
+            for handler in handlers:
+                if handler.supports(event):
+                    per_handler.setdefault(id(handler), (handler, []))[1].append(event)
+
+        # Handlers run concurrently; each handler sees its events in order
+        await asyncio.gather(*(
+            self._run_handler(handler, events, results, errors)
+            for handler, events in per_handler.values()
+        ))
+
+        processing_time = (time.time() - start_time) * 1000 / len(batch)
+        failed = 0
+
+        for event in batch:
+            result = results[event.event_id]
+            if event.event_id in errors:
+                result.status = "failed"
+                result.error = "; ".join(errors[event.event_id])
+                failed += 1
+            result.processing_time_ms = processing_time
+
+            if self.metrics_callback is not None:
+                try:
+                    self.metrics_callback(event, {
+                        "event_id": event.event_id,
+                        "processing_time_ms": processing_time,
+                        "queue_depth": self.queue.qsize(),
+                        "handler_count": len(handlers),
+                        "status": result.status,
+                        "timestamp": time.time()
+                    })
+                except Exception:
+                    pass
+
+            future = self.pending_results.pop(event.event_id, None)
+            if future is not None and not future.done():
+                future.set_result(result)
+
+        with self.metrics_lock:
+            self.metrics["events_processed"] += len(batch)
+            self.metrics["events_failed"] += failed
+
+    async def _run_handler(
+        self,
+        handler: Any,
+        events: List[AuditEvent],
+        results: Dict[str, EmitResult],
+        errors: Dict[str, List[str]]
+    ) -> None:
+        """Run one handler over its share of a batch, collecting errors."""
+        handle_batch = getattr(handler, "handle_batch", None)
+        if handle_batch is not None and getattr(handler, "batch_enabled", True):
+            try:
+                handler_results = await handle_batch(events)
+            except Exception as e:
+                for event in events:
+                    errors.setdefault(event.event_id, []).append(
+                        f"Handler {handler.name()} failed: {e}")
+                return
+            for event, handler_result in zip(events, handler_results):
+                merge_handler_result(results[event.event_id], handler_result)
+            return
+
+        for event in events:
+            try:
+                merge_handler_result(results[event.event_id], await handler.handle(event))
+            except Exception as e:
+                errors.setdefault(event.event_id, []).append(
+                    f"Handler {handler.name()} failed: {e}")
+
+    # Emission
+    # ========
+
+    def _enqueue(self, event: AuditEvent) -> bool:
+        """Put event on the queue (loop thread). Returns False if dropped."""
+        if self._closed:
+            return False
+
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            with self.metrics_lock:
+                self.metrics["events_dropped"] += 1
+            if self.log_dropped_events:
+                log_dropped_event(event, self.queue.qsize() if self.queue is not None else 0)
+            return False
+
+        with self.metrics_lock:
+            self.metrics["events_emitted"] += 1
+        return True
+
+    def emit(self, event: AuditEvent) -> None:
+        """
+        Emit event (fire-and-forget).
+
+        Non-blocking, best-effort delivery. Safe to call from other threads
+        once the bus is started.
+        Backpressure: Drops events when queue is full (logs dropped events).
+        """
+        if self._in_loop_thread() or self.loop is None:
+            self._ensure_started()
+            self._enqueue(event)
+        else:
+            self.loop.call_soon_threadsafe(self._enqueue, event)
+
+    def emit_async(self, event: AuditEvent) -> Awaitable[EmitResult]:
+        """
+        Emit event and return a future resolved once it is processed.
+
+        Must be called from the bus loop. A dropped event resolves
+        immediately with status "dropped".
+        """
+        self._ensure_started()
+        if not self._in_loop_thread():
+            raise RuntimeError("emit_async() must be called from the bus event loop")
+
+        future = self.loop.create_future()
+        self.pending_results[event.event_id] = future
+        if not self._enqueue(event):
+            self.pending_results.pop(event.event_id, None)
+            future.set_result(EmitResult(
+                event_id=event.event_id, status="dropped",
+                error="Queue full" if not self._closed else "Bus shut down"))
+        return future
+
+    async def emit_batch(
+        self,
+        events: List[AuditEvent],
+        timeout_ms: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Emit events and await all results (asyncio.gather semantics).
+
+        Args:
+            events: Events to emit
+            timeout_ms: Overall timeout (None = wait indefinitely)
+            return_exceptions: Return exceptions in place instead of raising
+
+        Returns:
+            EmitResult per event, in input order
+
+        Raises:
+            TimeoutError: If timeout_ms elapses (pending futures are cancelled)
+        """
+        futures = [self.emit_async(event) for event in events]
+        gathered = asyncio.gather(*futures, return_exceptions=return_exceptions)
+        if timeout_ms is None:
+            return await gathered
+
+        try:
+            return await asyncio.wait_for(gathered, timeout=timeout_ms / 1000.0)
+        except asyncio.TimeoutError:
+            for event in events:
+                self.pending_results.pop(event.event_id, None)
+            raise TimeoutError(
+                f"Batch of {len(events)} events timed out after {timeout_ms}ms"
+            )
+
+    def emit_sync(self, event: AuditEvent, timeout_ms: int = 5000) -> EmitResult:
+        """
+        Emit event and wait for processing confirmation.
+
+        Blocking call with timeout, for threads other than the bus loop.
+        """
+        if self.loop is None:
+            raise RuntimeError("AsyncioAuditBus not started: await bus.start() first")
+        if self._in_loop_thread():
+            raise RuntimeError("emit_sync() would block the bus event loop; use emit_async()")
+
+        async def _emit():
+            return await self.emit_async(event)
+
+        concurrent_future = asyncio.run_coroutine_threadsafe(_emit(), self.loop)
+        try:
+            return concurrent_future.result(timeout=timeout_ms / 1000.0)
+        except FutureTimeoutError:
+            concurrent_future.cancel()
+            self.loop.call_soon_threadsafe(self.pending_results.pop, event.event_id, None)
+            raise TimeoutError(
+                f"Event {event.event_id} processing timed out after {timeout_ms}ms"
+            )
+
+    # Flush / Health / Handlers
+    # =========================
+
+    async def flush_async(self, timeout_ms: int = 30000) -> Dict[str, Any]:
+        """Wait until the queue is drained or timeout occurs."""
+        start_time = time.time()
+        status = "completed"
+
+        if self.queue is not None:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout=timeout_ms / 1000.0)
+            except asyncio.TimeoutError:
+                status = "timeout"
+
+        duration_ms = (time.time() - start_time) * 1000
+
+        with self.metrics_lock:
+            return {
+                "events_flushed": self.metrics["events_processed"],
+                "events_failed": self.metrics["events_failed"],
+                "duration_ms": round(duration_ms, 2),
+                "status": status
+            }
+
+    def flush(self, timeout_ms: int = 30000) -> Dict[str, Any]:
+        """
+        Flush buffered events and wait for processing.
+
+        Blocking; for threads other than the bus loop (use flush_async there).
+        """
+        if self.loop is None:
+            return {"events_flushed": 0, "events_failed": 0, "duration_ms": 0.0, "status": "completed"}
+        if self._in_loop_thread():
+            raise RuntimeError("flush() would block the bus event loop; use flush_async()")
+
+        concurrent_future = asyncio.run_coroutine_threadsafe(self.flush_async(timeout_ms), self.loop)
+        return concurrent_future.result()
+
+    def health_check(self) -> Dict[str, Any]:
+        """Check event bus health status."""
+        with self.metrics_lock:
+            queue_depth = self.queue.qsize() if self.queue is not None else 0
+            uptime_sec = time.time() - self.metrics["start_time"]
+            processing_rate = (
+                self.metrics["events_processed"] / uptime_sec
+                if uptime_sec > 0 else 0
+            )
+
+            if queue_depth > self.max_queue_size * 0.9:
+                status = "degraded"
+            elif self.metrics["events_dropped"] > 0:
+                status = "degraded"
+            elif self._closed:
+                status = "unhealthy"
+            else:
+                status = "healthy"
+
+            return {
+                "status": status,
+                "queue_depth": queue_depth,
+                "processing_rate": round(processing_rate, 2),
+                "metrics": {
+                    "events_emitted": self.metrics["events_emitted"],
+                    "events_processed": self.metrics["events_processed"],
+                    "events_dropped": self.metrics["events_dropped"],
+                    "events_failed": self.metrics["events_failed"],
+                },
+                "workers": len(self.workers),
+                "handlers": len(self.handlers),
+                "uptime_sec": round(uptime_sec, 2)
+            }
+
+    def register_handler(self, handler: AuditEventHandler) -> None:
+        """
+        Register event handler.
+
+        Sync handlers are wrapped in SyncHandlerBridge.
+        """
+        if not _is_coroutine_handler(handler):
+            handler = SyncHandlerBridge(handler, max_workers=self.bridge_workers)
+        with self.handler_lock:
+            self.handlers = self.handlers + [handler]
+
+    def unregister_handler(self, handler_name: str) -> bool:
+        """
+        Unregister handler by name.
+
+        Returns:
+            True if handler was found and removed
+        """
+        with self.handler_lock:
+            for i, handler in enumerate(self.handlers):
+                if handler.name() == handler_name:
+                    self.handlers = self.handlers[:i] + self.handlers[i + 1:]
+                    if isinstance(handler, SyncHandlerBridge):
+                        handler.close()
+                    return True
+        return False
+
+    async def shutdown_async(self, timeout_ms: int = 30000) -> None:
+        """
+        Graceful shutdown (on the bus loop).
+
+        1. Stop accepting new events
+        2. Drain queue (flush_async)
+        3. Cancel worker tasks and close handler bridges
+        """
+        self._closed = True
+        await self.flush_async(timeout_ms=timeout_ms)
+
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+        for future in self.pending_results.values():
+            if not future.done():
+                future.cancel()
+        self.pending_results.clear()
+
+        loop = asyncio.get_running_loop()
+        for handler in self.handlers:
+            if isinstance(handler, SyncHandlerBridge):
+                await loop.run_in_executor(None, handler.close)
+
+    def shutdown(self, timeout_ms: int = 30000) -> None:
+        """
+        Graceful shutdown from another thread.
+
+        Blocks until shutdown_async() completes on the bus loop.
+        """
+        if self.loop is None:
+            self._closed = True
+            return
+        if self._in_loop_thread():
+            raise RuntimeError("shutdown() would block the bus event loop; use shutdown_async()")
+        asyncio.run_coroutine_threadsafe(self.shutdown_async(timeout_ms), self.loop).result()
+
+
+# Factory function for configuration-based initialization
+def create_asyncio_bus_from_config(config: Dict[str, Any]) -> AsyncioAuditBus:
+    """
+    Create asyncio audit bus from configuration dict.
+
+    Example config:
+    {
+        "max_queue_size": 10000,
+        "worker_tasks": 4,
+        "log_dropped_events": true,
+        "drain_batch_size": 256,
+        "bridge_workers": 1
+    }
+    """
+    return AsyncioAuditBus(
+        max_queue_size=config.get("max_queue_size", 10000),
+        worker_tasks=config.get("worker_tasks", 4),
+        log_dropped_events=config.get("log_dropped_events", True),
+        drain_batch_size=config.get("drain_batch_size", 256),
+        bridge_workers=config.get("bridge_workers", 1)
+    )
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Audit Event Bus - Shared Helpers
+=================================
+
+Helpers shared by InMemoryAuditBus and AsyncioAuditBus:
+- merge_handler_result(): fold a handler's EmitResult into the bus result
+- log_dropped_event(): backpressure warning (console + dropped events log)
+
+Version: 1.0.0
+"""
+
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "interfaces"))
+
+from audit_event_emitter import AuditEvent, EmitResult
+
+
+DROPPED_EVENTS_LOG = Path("02_audit_logging/logs/dropped_events.jsonl")
+
+
+def merge_handler_result(result: EmitResult, handler_result: EmitResult) -> None:
+    """Merge handler result fields into the bus result."""
+    if handler_result.worm_hash:
+        result.worm_hash = handler_result.worm_hash
+    if handler_result.blockchain_tx:
+        result.blockchain_tx = handler_result.blockchain_tx
+    if handler_result.federation_proof:
+        result.federation_proof = handler_result.federation_proof
+
+
+def log_dropped_event(event: AuditEvent, queue_depth: int) -> None:
+    """
+    Log dropped event warning (console + file).
+
+    Phase 3: Backpressure Guard - persistent dropped events log
+
+    Args:
+        event: Event that was dropped
+        queue_depth: Bus queue depth at the time of the drop
+    """
+    # Console warning
+    print(
+        f"[WARN] AuditEvent dropped (queue full): "
+        f"event_id={event.event_id}, "
+        f"type={event.event_type}, "
+        f"severity={event.severity}",
+        file=sys.stderr
+    )
+
+    # Persistent log (for post-mortem analysis)
+    try:
+        DROPPED_EVENTS_LOG.parent.mkdir(parents=True, exist_ok=True)
+
+        dropped_entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "event_id": event.event_id,
+            "event_type": event.event_type.value if hasattr(event.event_type, 'value') else event.event_type,
+            "severity": event.severity.value if hasattr(event.severity, 'value') else event.severity,
+            "source_module": event.source_module,
+            "queue_depth": queue_depth,
+            "reason": "queue_full"
+        }
+
+        with DROPPED_EVENTS_LOG.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(dropped_entry) + "\n")
+
+    except Exception:
+        # Don't break if logging fails
+        pass
@@ -111,7 +111,10 @@ def initialize_event_bus_from_manifest(manifest_path: str = None) -> InMemoryAud
     bus = InMemoryAuditBus(
         max_queue_size=bus_config.get("max_queue_size", 10000),
         worker_threads=bus_config.get("worker_threads", 4),
-        log_dropped_events=bus_config.get("log_dropped_events", True)
+        log_dropped_events=bus_config.get("log_dropped_events", True),
+        high_throughput=bus_config.get("high_throughput", False),
+        drain_batch_size=bus_config.get("drain_batch_size", 256),
+        shard_key=bus_config.get("shard_key")
     )
 
     # Register handlers
@@ -9,7 +9,8 @@ Implements AuditEventHandler protocol.
 Features:
 - Write-once semantics (immutable evidence)
 - SHA-256 content hashing
-- Batch writes for performance (optional)
+- Group-commit batch writes (optional): concurrent events share one
+  packed file, one fsync, one index append and one access-log record
 - Filter support (only process events with requires_worm=True)
 
 Status: Phase 1 (Production-Ready)
@@ -17,8 +18,9 @@ Version: 1.0.0
 """
 
 import sys
+import threading
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import time
 
 # Add parent paths
@@ -34,6 +36,17 @@ from audit_event_emitter import (
 from worm_storage_engine import WORMStorageEngine, WORMViolationError
 
 
+class _PendingWrite:
+    """Buffered event awaiting its group commit."""
+
+    __slots__ = ("event", "result", "enqueued")
+
+    def __init__(self, event: AuditEvent):
+        self.event = event
+        self.result: Optional[EmitResult] = None
+        self.enqueued = time.monotonic()
+
+
 class WORMHandler(AuditEventHandler):
     """
     WORM storage handler for audit events.
@@ -47,16 +60,17 @@ class WORMHandler(AuditEventHandler):
         storage_root: str = "02_audit_logging/worm_storage/vault",
         batch_enabled: bool = False,
         batch_size: int = 100,
-        flush_interval_ms: int = 5000
+        flush_interval_ms: int = 10
     ):
         """
         Initialize WORM handler.
 
         Args:
             storage_root: WORM storage directory
-            batch_enabled: Enable batch writes (future optimization)
-            batch_size: Batch size for writes
-            flush_interval_ms: Flush interval for batches
+            batch_enabled: Enable group-commit batch writes
+            batch_size: Maximum number of events per group commit
+            flush_interval_ms: Maximum time the oldest buffered event lingers
+                before its group is committed, even if batch_size is not reached
         """
         self.storage_root = storage_root
         self.batch_enabled = batch_enabled
@@ -67,14 +81,16 @@ class WORMHandler(AuditEventHandler):
         self.worm = WORMStorageEngine(storage_root=storage_root)
 
         # Batch buffer (if batching enabled)
-        self.batch_buffer: List[AuditEvent] = []
-        self.last_flush_time = time.time()
+        self.batch_buffer: List[_PendingWrite] = []
+        self._batch_cond = threading.Condition()
+        self._commit_in_progress = False
 
         # Statistics
         self.stats = {
             "events_processed": 0,
             "events_failed": 0,
-            "worm_violations": 0
+            "worm_violations": 0,
+            "batches_committed": 0
         }
 
     def handle(self, event: AuditEvent) -> EmitResult:
@@ -87,6 +103,9 @@ class WORMHandler(AuditEventHandler):
         Returns:
             EmitResult with WORM content hash
         """
+        if self.batch_enabled:
+            return self._handle_group_commit(event)
+
         try:
             # Convert AuditEvent to evidence data
             evidence_data = event.to_dict()
@@ -128,6 +147,121 @@ class WORMHandler(AuditEventHandler):
                 error=f"WORM write failed: {e}"
             )
 
+    def handle_batch(self, events: List[AuditEvent]) -> List[EmitResult]:
+        """
+        Process a batch of events as group commits of up to batch_size.
+
+        Args:
+            events: Audit events to process
+
+        Returns:
+            One EmitResult per event, resolved once its batch is durable
+        """
+        results: List[EmitResult] = []
+        for start in range(0, len(events), self.batch_size):
+            pending = [_PendingWrite(event) for event in events[start:start + self.batch_size]]
+
+            with self._batch_cond:
+                while self._commit_in_progress:
+                    self._batch_cond.wait()
+                self._commit_in_progress = True
+
+            try:
+                self._commit_batch(pending)
+            finally:
+                with self._batch_cond:
+                    self._commit_in_progress = False
+                    self._batch_cond.notify_all()
+
+            results.extend(p.result for p in pending)
+        return results
+
+    def _handle_group_commit(self, event: AuditEvent) -> EmitResult:
+        """
+        Leader/follower group commit.
+
+        The event is buffered. A group is committed once batch_size events
+        are buffered or the oldest buffered event has waited
+        flush_interval_ms, whichever comes first. Only one commit runs at a
+        time; events arriving during a commit form the next group. Callers
+        return once their own group is durable.
+        """
+        pending = _PendingWrite(event)
+        linger_sec = self.flush_interval_ms / 1000.0
+
+        with self._batch_cond:
+            self.batch_buffer.append(pending)
+            if len(self.batch_buffer) >= self.batch_size:
+                self._batch_cond.notify_all()
+
+        while True:
+            with self._batch_cond:
+                while pending.result is None:
+                    if self._commit_in_progress:
+                        self._batch_cond.wait()
+                        continue
+                    if len(self.batch_buffer) >= self.batch_size:
+                        break
+                    remaining = self.batch_buffer[0].enqueued + linger_sec - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._batch_cond.wait(timeout=remaining)
+
+                if pending.result is not None:
+                    return pending.result
+
+                batch = self.batch_buffer[:self.batch_size]
+                del self.batch_buffer[:self.batch_size]
+                self._commit_in_progress = True
+
+            try:
+                self._commit_batch(batch)
+            finally:
+                with self._batch_cond:
+                    self._commit_in_progress = False
+                    self._batch_cond.notify_all()
+
+    def _commit_batch(self, batch: List["_PendingWrite"]) -> None:
+        """Write one group of events and resolve their results."""
+        items = [
+            (
+                p.event.event_id,
+                p.event.to_dict(),
+                p.event.source_module.replace("/", "_").replace("\\", "_")
+            )
+            for p in batch
+        ]
+
+        try:
+            worm_results = self.worm.write_evidence_batch(items)
+        except Exception as e:
+            self.stats["events_failed"] += len(batch)
+            for p in batch:
+                p.result = EmitResult(
+                    event_id=p.event.event_id,
+                    status="failed",
+                    error=f"WORM write failed: {e}"
+                )
+            return
+
+        for p, worm_result in zip(batch, worm_results):
+            if worm_result["status"] == "DENIED":
+                self.stats["worm_violations"] += 1
+                p.result = EmitResult(
+                    event_id=p.event.event_id,
+                    status="failed",
+                    error=f"WORM violation: {worm_result['error']}"
+                )
+            else:
+                self.stats["events_processed"] += 1
+                p.result = EmitResult(
+                    event_id=p.event.event_id,
+                    status="processed",
+                    worm_hash=worm_result["content_hash"]
+                )
+
+        self.stats["batches_committed"] += 1
+
     def supports(self, event: AuditEvent) -> bool:
         """
         Check if handler supports this event.
@@ -163,15 +297,16 @@ def create_worm_handler_from_config(config: dict) -> WORMHandler:
     Example config:
     {
         "storage_root": "02_audit_logging/worm_storage/vault",
+        "batch_enabled": true,
         "batch_size": 100,
-        "flush_interval_ms": 5000
+        "flush_interval_ms": 10
     }
     """
     return WORMHandler(
         storage_root=config.get("storage_root", "02_audit_logging/worm_storage/vault"),
         batch_enabled=config.get("batch_enabled", False),
         batch_size=config.get("batch_size", 100),
-        flush_interval_ms=config.get("flush_interval_ms", 5000)
+        flush_interval_ms=config.get("flush_interval_ms", 10)
     )
 
 
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for WORM Chain Linker
+=================================
+
+Compliance: MUST-007-WORM-STORAGE
+Version: 1.0.0
+"""
+
+import pytest
+import json
+from worm_chain_linker import WORMChainLinker
+
+@pytest.fixture
+def link_log_linker(tmp_path):
+    """Create chain linker in append-only link-log mode."""
+    return WORMChainLinker(str(tmp_path / "worm"), chain_mode="link_log")
+
+def test_link_log_append(link_log_linker):
+    """Test appends in link-log mode."""
+    results = [link_log_linker.add_chain_entry(f"entry_{i}", {"value": i}) for i in range(5)]
+
+    assert results[0]["is_genesis"] is True
+    assert [r["chain_position"] for r in results] == [0, 1, 2, 3, 4]
+
+    # Entries are never rewritten: one log file, no chain_index.json dump
+    assert [p.name for p in link_log_linker.immutable_store.iterdir()] == ["chain_log.jsonl"]
+    assert not link_log_linker.chain_index_path.exists()
+
+    stats = link_log_linker.get_chain_stats()
+    assert stats["total_entries"] == 5
+    assert stats["double_linked_entries"] == 4
+
+def test_link_log_double_link_verification(link_log_linker):
+    """Test forward and backward verification in link-log mode."""
+    for i in range(5):
+        link_log_linker.add_chain_entry(f"entry_{i}", {"value": i})
+
+    report = link_log_linker.verify_chain_integrity(direction="both")
+
+    assert report["integrity_status"] == "VERIFIED"
+    assert report["forward_verification"]["verified_links"] == 4
+    assert report["backward_verification"]["verified_links"] == 4
+
+def test_link_log_replay(link_log_linker):
+    """Test chain state is rebuilt from the log on restart."""
+    for i in range(3):
+        link_log_linker.add_chain_entry(f"entry_{i}", {"value": i})
+
+    reopened = WORMChainLinker(str(link_log_linker.storage_root), chain_mode="link_log")
+    assert reopened.get_chain_stats() == link_log_linker.get_chain_stats()
+
+    result = reopened.add_chain_entry("entry_3", {"value": 3})
+    assert result["chain_position"] == 3
+    assert reopened.verify_chain_integrity()["integrity_status"] == "VERIFIED"
+
+def test_link_log_torn_link_recovery(link_log_linker):
+    """Test that a forward link lost in a torn write is restored on replay."""
+    for i in range(3):
+        link_log_linker.add_chain_entry(f"entry_{i}", {"value": i})
+
+    lines = link_log_linker.chain_log_path.read_bytes().splitlines(keepends=True)
+    link_log_linker.chain_log_path.write_bytes(b"".join(lines[:-1]) + lines[-1][:10])
+
+    reopened = WORMChainLinker(str(link_log_linker.storage_root), chain_mode="link_log")
+    assert reopened.get_chain_stats()["double_linked_entries"] == 2
+    assert reopened.verify_chain_integrity()["integrity_status"] == "VERIFIED"
+
+def test_link_log_tamper_detection(link_log_linker):
+    """Test that a tampered entry hash breaks both link directions."""
+    for i in range(3):
+        link_log_linker.add_chain_entry(f"entry_{i}", {"value": i})
+
+    lines = link_log_linker.chain_log_path.read_text(encoding='utf-8').splitlines()
+    for n, line in enumerate(lines):
+        record = json.loads(line)
+        if record["type"] == "entry" and record["entry"]["entry_id"] == "entry_1":
+            record["entry"]["entry_hash"] = "0" * 128
+            lines[n] = json.dumps(record, separators=(',', ':'))
+    link_log_linker.chain_log_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+    reopened = WORMChainLinker(str(link_log_linker.storage_root), chain_mode="link_log")
+    report = reopened.verify_chain_integrity(direction="both")
+
+    assert report["integrity_status"] == "COMPROMISED"
+    assert report["forward_verification"]["status"] == "BROKEN"
+    assert report["backward_verification"]["status"] == "BROKEN"
+
+def test_invalid_chain_mode(tmp_path):
+    """Test that unknown chain modes are rejected."""
+    with pytest.raises(ValueError):
+        WORMChainLinker(str(tmp_path / "worm"), chain_mode="unknown")
+
+def test_streaming_verification(link_log_linker):
+    """Test streaming verification with parallel re-hashing."""
+    for i in range(20):
+        link_log_linker.add_chain_entry(f"entry_{i}", {"value": i})
+
+    report = link_log_linker.verify_chain_streaming(workers=2, segment_size=4)
+
+    assert report["status"] == "OK"
+    assert report["verified_entries"] == 20
+    assert report["verified_links"] == 19
+    assert report["checkpoint_saved"] is False
+
+def test_streaming_verification_content_tamper(link_log_linker):
+    """Test that modified entry data is detected by re-hashing."""
+    for i in range(3):
+        link_log_linker.add_chain_entry(f"entry_{i}", {"value": i})
+
+    content = link_log_linker.chain_log_path.read_text(encoding='utf-8')
+    link_log_linker.chain_log_path.write_text(
+        content.replace('"value":1', '"value":9'), encoding='utf-8')
+
+    reopened = WORMChainLinker(str(link_log_linker.storage_root), chain_mode="link_log")
+    report = reopened.verify_chain_streaming(workers=0)
+
+    assert report["status"] == "BROKEN"
+    assert report["content_failures"] == ["entry_1"]
+
+def test_streaming_verification_checkpoints(tmp_path):
+    """Test that later runs resume after the last signed checkpoint."""
+    storage_root = str(tmp_path / "worm")
+    linker = WORMChainLinker(storage_root, chain_mode="link_log", checkpoint_key=b"test-key")
+    for i in range(5):
+        linker.add_chain_entry(f"entry_{i}", {"value": i})
+
+    first = linker.verify_chain_streaming(workers=0)
+    assert first["checkpoint_saved"] is True
+    assert first["verified_entries"] == 5
+
+    for i in range(5, 8):
+        linker.add_chain_entry(f"entry_{i}", {"value": i})
+
+    second = linker.verify_chain_streaming(workers=0)
+    assert second["checkpoint_used"] is True
+    assert second["start_position"] == 5
+    assert second["verified_entries"] == 3
+    assert second["verified_links"] == 3
+
+    # Checkpoints signed with another key are not trusted
+    other = WORMChainLinker(storage_root, chain_mode="link_log", checkpoint_key=b"other-key")
+    third = other.verify_chain_streaming(workers=0)
+    assert third["checkpoint_used"] is False
+    assert third["verified_entries"] == 8
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
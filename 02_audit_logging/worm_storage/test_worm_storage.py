@@ -149,5 +149,96 @@ def test_metadata_immutability(temp_worm_storage):
     assert metadata["deletable"] is False
     assert metadata["retention_years"] == 10
 
+def test_index_journal_replay(temp_worm_storage):
+    """Test that the index is rebuilt from the journal on restart."""
+    temp_worm_storage.write_evidence("journal_001", {"data": 1})
+    temp_worm_storage.write_evidence("journal_002", {"data": 2})
+
+    assert not temp_worm_storage.index_path.exists()
+    assert temp_worm_storage.journal_path.exists()
+
+    reopened = WORMStorageEngine(str(temp_worm_storage.storage_root))
+    assert set(reopened.index) == {"journal_001", "journal_002"}
+    assert reopened.read_evidence("journal_002")["evidence_data"] == {"data": 2}
+
+def test_index_journal_compaction():
+    """Test journal compaction into immutable index segments."""
+    import stat
+    temp_dir = tempfile.mkdtemp()
+    storage_root = Path(temp_dir) / "worm_vault"
+    try:
+        worm = WORMStorageEngine(str(storage_root), compaction_threshold=2)
+        for i in range(5):
+            worm.write_evidence(f"compact_00{i}", {"value": i})
+
+        segments = sorted(worm.segments_dir.glob("segment_*.json"))
+        assert len(segments) == 2
+        assert not (segments[0].stat().st_mode & stat.S_IWUSR)
+        assert len(worm._journal_ids) == 1
+
+        reopened = WORMStorageEngine(str(storage_root), compaction_threshold=2)
+        assert len(reopened.index) == 5
+        with pytest.raises(WORMViolationError):
+            reopened.write_evidence("compact_000", {"value": "again"})
+
+        reopened.write_evidence("compact_005", {"value": 5})
+        assert len(list(reopened.segments_dir.glob("segment_*.json"))) == 3
+    finally:
+        for root, dirs, files in os.walk(temp_dir):
+            for filename in files:
+                filepath = Path(root) / filename
+                filepath.chmod(filepath.stat().st_mode | stat.S_IWUSR)
+        shutil.rmtree(temp_dir)
+
+def test_index_segment_numbering_gap(temp_worm_storage):
+    """Test that a gap in segment numbering never reuses a live segment name."""
+    worm = WORMStorageEngine(str(temp_worm_storage.storage_root), compaction_threshold=1)
+    for i in range(3):
+        worm.write_evidence(f"gap_00{i}", {"value": i})
+
+    # Segment 0 merged away elsewhere: segments 1 and 2 remain
+    first = worm.segments_dir / "segment_00000000.json"
+    first.chmod(0o644)
+    first.unlink()
+    live = (worm.segments_dir / "segment_00000002.json").read_bytes()
+
+    reopened = WORMStorageEngine(str(worm.storage_root), compaction_threshold=1)
+    assert reopened._next_segment == 3
+    reopened.write_evidence("gap_003", {"value": 3})
+    assert (reopened.segments_dir / "segment_00000002.json").read_bytes() == live
+    assert "gap_003" in json.loads((reopened.segments_dir / "segment_00000003.json").read_text())
+
+def test_index_journal_torn_record(temp_worm_storage):
+    """Test that a torn trailing journal record is ignored on replay."""
+    temp_worm_storage.write_evidence("torn_001", {"data": 1})
+    with open(temp_worm_storage.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"evidence_id": "torn_0')
+
+    reopened = WORMStorageEngine(str(temp_worm_storage.storage_root))
+    assert list(reopened.index) == ["torn_001"]
+
+    reopened.write_evidence("torn_002", {"data": 2})
+    assert list(WORMStorageEngine(str(reopened.storage_root)).index) == ["torn_001", "torn_002"]
+
+def test_write_evidence_batch(temp_worm_storage):
+    """Test group-commit batch writes into a packed immutable file."""
+    import stat
+
+    results = temp_worm_storage.write_evidence_batch([
+        ("batch_001", {"value": 1}, "category_a"),
+        ("batch_002", {"value": 2}, "category_b"),
+        ("batch_001", {"value": 3}, "category_a")
+    ])
+
+    assert [r["status"] for r in results] == ["IMMUTABLE", "IMMUTABLE", "DENIED"]
+    assert results[0]["file_path"] == results[1]["file_path"]
+    assert not (Path(results[0]["file_path"]).stat().st_mode & stat.S_IWUSR)
+
+    reopened = WORMStorageEngine(str(temp_worm_storage.storage_root))
+    read_result = reopened.read_evidence("batch_002")
+    assert read_result["evidence_data"] == {"value": 2}
+    assert read_result["content_hash"] == results[1]["content_hash"]
+    assert reopened.verify_all_integrity()["failed"] == 0
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
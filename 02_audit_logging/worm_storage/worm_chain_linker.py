@@ -12,13 +12,18 @@ Features:
 - Chain continuity validation
 - Break detection with pinpoint accuracy
 - PLATINUM-grade audit trail
+- Append-only link-log mode (O(1) appends, no entry rewrites)
+- Streaming, process-parallel verification with signed checkpoints
 
 Version: 1.0.0 (PLATINUM Preparation)
 """
 
 import hashlib
+import hmac
 import json
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
@@ -27,6 +32,38 @@ class ChainIntegrityError(Exception):
     """Raised when chain integrity is compromised."""
     pass
 
+def _verify_segment(raw_entries: List[bytes]) -> List[Tuple]:
+    """
+    Parse and re-hash a segment of chain entries (process pool worker).
+
+    Args:
+        raw_entries: Serialized entries (entry JSON files or chain-log
+            entry records)
+
+    Returns:
+        Per entry: (entry_id, previous_entry_id, previous_hash, entry_hash,
+        next_hash, content_ok)
+    """
+    results = []
+    for raw in raw_entries:
+        entry = json.loads(raw)
+        if entry.get("type") == "entry":
+            entry = entry["entry"]
+        stored_hash = entry.pop("entry_hash", None)
+        entry.pop("blake2b_hash", None)
+        canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False)
+        recomputed = hashlib.sha512(canonical.encode('utf-8')).hexdigest()
+        links = entry["chain_links"]
+        results.append((
+            entry["entry_id"],
+            links["previous_entry_id"],
+            links["previous_hash"],
+            stored_hash,
+            links["next_hash"],
+            recomputed == stored_hash
+        ))
+    return results
+
 class WORMChainLinker:
     """
     WORM Chain Linker with double-link verification.
@@ -38,23 +75,46 @@ class WORMChainLinker:
     - Any tampering breaks both forward and backward links
     """
 
-    def __init__(self, storage_root: str = "02_audit_logging/storage/worm"):
+    CHAIN_MODES = ("rewrite", "link_log")
+
+    def __init__(self, storage_root: str = "02_audit_logging/storage/worm",
+                 chain_mode: str = "rewrite",
+                 checkpoint_key: Optional[bytes] = None):
         """
         Initialize WORM chain linker.
 
         Args:
             storage_root: Root directory for WORM storage
+            chain_mode: "rewrite" (one file per entry, previous entry is
+                re-written with its forward link) or "link_log" (entries and
+                forward links are appended to one append-only log)
+            checkpoint_key: HMAC key for verification checkpoints
+                (default: WORM_CHECKPOINT_KEY environment variable)
         """
+        if chain_mode not in self.CHAIN_MODES:
+            raise ValueError(f"Unknown chain_mode {chain_mode!r}, expected one of {self.CHAIN_MODES}")
+
+        self.chain_mode = chain_mode
         self.storage_root = Path(storage_root)
         self.immutable_store = self.storage_root / "immutable_store"
         self.immutable_store.mkdir(parents=True, exist_ok=True)
 
+        # Append-only chain log (link_log mode)
+        self.chain_log_path = self.immutable_store / "chain_log.jsonl"
+
+        # Signed verification checkpoints (streaming verifier)
+        self.checkpoint_path = self.storage_root / "verification_checkpoints.jsonl"
+        key = checkpoint_key or os.environ.get("WORM_CHECKPOINT_KEY")
+        self.checkpoint_key: Optional[bytes] = key.encode('utf-8') if isinstance(key, str) else key
+
         # Chain index (tracks chain structure)
         self.chain_index_path = self.storage_root / "chain_index.json"
         self.chain_index: Dict[str, Any] = self._load_chain_index()
 
     def _load_chain_index(self) -> Dict[str, Any]:
         """Load chain index."""
+        if self.chain_mode == "link_log":
+            return self._replay_chain_log()
         if self.chain_index_path.exists():
             with open(self.chain_index_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
@@ -65,6 +125,78 @@ class WORMChainLinker:
             "entries": {}
         }
 
+    def _replay_chain_log(self) -> Dict[str, Any]:
+        """
+        Rebuild the in-memory chain index from the append-only chain log.
+
+        Each log line is either an "entry" record (the immutable chain entry)
+        or a "link" record (forward link from an entry to its successor).
+        A torn trailing record is truncated; a forward link lost with it is
+        re-appended.
+        """
+        index: Dict[str, Any] = {
+            "chain_head": None,
+            "chain_tail": None,
+            "total_entries": 0,
+            "entries": {}
+        }
+        if not self.chain_log_path.exists():
+            return index
+
+        entries = index["entries"]
+        offset = 0
+        with open(self.chain_log_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                record = json.loads(line)
+                if record["type"] == "entry":
+                    entry = record["entry"]
+                    entry_id = entry["entry_id"]
+                    entries[entry_id] = {
+                        "offset": offset,
+                        "entry_hash": entry["entry_hash"],
+                        "blake2b_hash": entry["blake2b_hash"],
+                        "timestamp": entry["timestamp"],
+                        "previous_entry_id": entry["chain_links"]["previous_entry_id"],
+                        "next_entry_id": None,
+                        "next_hash": None
+                    }
+                    if index["chain_head"] is None:
+                        index["chain_head"] = entry_id
+                    index["chain_tail"] = entry_id
+                    index["total_entries"] += 1
+                else:
+                    entries[record["entry_id"]]["next_entry_id"] = record["next_entry_id"]
+                    entries[record["entry_id"]]["next_hash"] = record["next_hash"]
+                offset += len(line)
+
+        if offset < self.chain_log_path.stat().st_size:
+            os.truncate(self.chain_log_path, offset)
+
+        tail_id = index["chain_tail"]
+        if tail_id is not None:
+            prev_id = entries[tail_id]["previous_entry_id"]
+            if prev_id is not None and entries[prev_id]["next_entry_id"] is None:
+                link = self._link_record(prev_id, tail_id, entries[tail_id]["entry_hash"])
+                with open(self.chain_log_path, 'ab') as f:
+                    f.write(link)
+                entries[prev_id]["next_entry_id"] = tail_id
+                entries[prev_id]["next_hash"] = entries[tail_id]["entry_hash"]
+
+        return index
+
+    @staticmethod
+    def _link_record(entry_id: str, next_entry_id: str, next_hash: str) -> bytes:
+        """Serialize a forward-link record for the chain log."""
+        record = {
+            "type": "link",
+            "entry_id": entry_id,
+            "next_entry_id": next_entry_id,
+            "next_hash": next_hash
+        }
+        return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
     def _save_chain_index(self) -> None:
         """Save chain index."""
         with open(self.chain_index_path, 'w', encoding='utf-8') as f:
@@ -99,8 +231,12 @@ class WORMChainLinker:
         prev_entry_id = self.chain_index.get("chain_tail")
 
         if prev_entry_id:
-            prev_entry = self._read_chain_entry(prev_entry_id)
-            prev_hash = prev_entry["entry_hash"]
+            if self.chain_mode == "link_log":
+                # Tail hash is kept in memory; entries are never rewritten
+                prev_hash = self.chain_index["entries"][prev_entry_id]["entry_hash"]
+            else:
+                prev_entry = self._read_chain_entry(prev_entry_id)
+                prev_hash = prev_entry["entry_hash"]
 
         # Create chain entry
         chain_entry = {
@@ -128,6 +264,9 @@ class WORMChainLinker:
         chain_entry["entry_hash"] = entry_hash
         chain_entry["blake2b_hash"] = blake2b_hash
 
+        if self.chain_mode == "link_log":
+            return self._append_to_chain_log(chain_entry, prev_entry_id)
+
         # Write to immutable storage
         filename = f"sot_enforcement_v2_{timestamp.replace(':', '').replace('.', '')}_chain_{entry_id}.json"
         file_path = self.immutable_store / filename
@@ -171,6 +310,59 @@ class WORMChainLinker:
             "status": "CHAIN_LINKED"
         }
 
+    def _append_to_chain_log(self, chain_entry: Dict[str, Any],
+                             prev_entry_id: Optional[str]) -> Dict[str, Any]:
+        """
+        Append entry and forward link of the previous entry in one write.
+
+        Args:
+            chain_entry: Hashed chain entry
+            prev_entry_id: Current chain tail (None for genesis)
+
+        Returns:
+            Chain entry confirmation
+        """
+        entry_id = chain_entry["entry_id"]
+        entry_hash = chain_entry["entry_hash"]
+
+        record = {"type": "entry", "entry": chain_entry}
+        payload = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+        if prev_entry_id:
+            payload += self._link_record(prev_entry_id, entry_id, entry_hash)
+
+        with open(self.chain_log_path, 'ab') as f:
+            offset = f.tell()
+            f.write(payload)
+
+        entries = self.chain_index["entries"]
+        if self.chain_index["chain_head"] is None:
+            self.chain_index["chain_head"] = entry_id
+        self.chain_index["chain_tail"] = entry_id
+        self.chain_index["total_entries"] += 1
+        entries[entry_id] = {
+            "offset": offset,
+            "entry_hash": entry_hash,
+            "blake2b_hash": chain_entry["blake2b_hash"],
+            "timestamp": chain_entry["timestamp"],
+            "previous_entry_id": prev_entry_id,
+            "next_entry_id": None,
+            "next_hash": None
+        }
+        if prev_entry_id:
+            entries[prev_entry_id]["next_entry_id"] = entry_id
+            entries[prev_entry_id]["next_hash"] = entry_hash
+
+        return {
+            "entry_id": entry_id,
+            "entry_hash": entry_hash,
+            "blake2b_hash": chain_entry["blake2b_hash"],
+            "file_path": str(self.chain_log_path),
+            "timestamp": chain_entry["timestamp"],
+            "chain_position": chain_entry["chain_metadata"]["chain_position"],
+            "is_genesis": chain_entry["chain_metadata"]["is_genesis"],
+            "status": "CHAIN_LINKED"
+        }
+
     def _update_forward_link(self, prev_entry_id: str, next_entry_id: str, next_hash: str) -> None:
         """Update forward link in previous entry (creates double-link)."""
         prev_entry = self._read_chain_entry(prev_entry_id)
@@ -207,7 +399,17 @@ class WORMChainLinker:
         if entry_id not in self.chain_index["entries"]:
             raise FileNotFoundError(f"Chain entry {entry_id} not found")
 
-        file_path = self.storage_root / self.chain_index["entries"][entry_id]["file_path"]
+        index_entry = self.chain_index["entries"][entry_id]
+        if self.chain_mode == "link_log":
+            with open(self.chain_log_path, 'rb') as f:
+                f.seek(index_entry["offset"])
+                entry = json.loads(f.readline())["entry"]
+            # Forward link lives in the link log, not in the immutable entry
+            entry["chain_links"]["next_entry_id"] = index_entry["next_entry_id"]
+            entry["chain_links"]["next_hash"] = index_entry["next_hash"]
+            return entry
+
+        file_path = self.storage_root / index_entry["file_path"]
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
@@ -321,6 +523,186 @@ class WORMChainLinker:
 
         return result
 
+    def verify_chain_streaming(self, workers: Optional[int] = None,
+                               segment_size: int = 10000,
+                               use_checkpoint: bool = True) -> Dict[str, Any]:
+        """
+        Verify the chain in one streaming pass with parallel re-hashing.
+
+        Each entry is read exactly once. Segments of raw entries are parsed
+        and re-hashed (SHA-512 over the entry content) in a process pool,
+        while link checks run in order in the calling process. In link_log
+        mode a successful run stores an HMAC-signed checkpoint, and later
+        runs only verify entries after the last trusted checkpoint. The
+        rewrite mode re-hashes previous entries on every append, so its
+        checkpoints would never stay valid and it is always fully verified.
+
+        Args:
+            workers: Process pool size (None = CPU count, 0/1 = in-process)
+            segment_size: Entries per worker task
+            use_checkpoint: Resume from the last trusted checkpoint
+
+        Returns:
+            Verification report
+        """
+        entries = self.chain_index["entries"]
+        ordered_ids = list(entries)
+
+        report = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "total_entries": len(ordered_ids),
+            "status": "OK",
+            "start_position": 0,
+            "checkpoint_used": False,
+            "checkpoint_saved": False,
+            "verified_entries": 0,
+            "verified_links": 0,
+            "content_failures": [],
+            "broken_links": []
+        }
+
+        prev_id: Optional[str] = None
+        prev_hash: Optional[str] = None
+        prev_next_hash: Optional[str] = None
+
+        if use_checkpoint and self.chain_mode == "link_log":
+            checkpoint = self._load_checkpoint()
+            if checkpoint is not None:
+                position = checkpoint["position"]
+                if (position < len(ordered_ids)
+                        and ordered_ids[position] == checkpoint["entry_id"]
+                        and entries[checkpoint["entry_id"]]["entry_hash"] == checkpoint["entry_hash"]):
+                    report["start_position"] = position + 1
+                    report["checkpoint_used"] = True
+                    prev_id = checkpoint["entry_id"]
+                    prev_hash = checkpoint["entry_hash"]
+
+        def check(result: Tuple) -> None:
+            nonlocal prev_id, prev_hash, prev_next_hash
+            entry_id, previous_entry_id, previous_hash, entry_hash, next_hash, content_ok = result
+
+            if content_ok:
+                report["verified_entries"] += 1
+            else:
+                report["status"] = "BROKEN"
+                report["content_failures"].append(entry_id)
+
+            if prev_id is not None:
+                if self.chain_mode == "link_log":
+                    forward_hash = entries[prev_id]["next_hash"]
+                else:
+                    forward_hash = prev_next_hash
+                if previous_entry_id != prev_id or previous_hash != prev_hash:
+                    report["status"] = "BROKEN"
+                    report["broken_links"].append({
+                        "direction": "backward",
+                        "from_entry": entry_id,
+                        "to_entry": prev_id
+                    })
+                elif forward_hash != entry_hash:
+                    report["status"] = "BROKEN"
+                    report["broken_links"].append({
+                        "direction": "forward",
+                        "from_entry": prev_id,
+                        "to_entry": entry_id
+                    })
+                else:
+                    report["verified_links"] += 1
+
+            prev_id, prev_hash, prev_next_hash = entry_id, entry_hash, next_hash
+
+        segments = self._iter_raw_segments(ordered_ids, report["start_position"], segment_size)
+        if workers is not None and workers <= 1:
+            for segment in segments:
+                for result in _verify_segment(segment):
+                    check(result)
+        else:
+            max_workers = workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                max_in_flight = 2 * max_workers
+                in_flight: deque = deque()
+                for segment in segments:
+                    in_flight.append(pool.submit(_verify_segment, segment))
+                    if len(in_flight) >= max_in_flight:
+                        for result in in_flight.popleft().result():
+                            check(result)
+                while in_flight:
+                    for result in in_flight.popleft().result():
+                        check(result)
+
+        if (report["status"] == "OK" and self.chain_mode == "link_log"
+                and report["start_position"] < len(ordered_ids) and self.checkpoint_key):
+            self._save_checkpoint(len(ordered_ids) - 1, prev_id, prev_hash)
+            report["checkpoint_saved"] = True
+
+        return report
+
+    def _iter_raw_segments(self, ordered_ids: List[str], start_position: int,
+                           segment_size: int):
+        """Yield lists of serialized entries, reading each entry once."""
+        segment: List[bytes] = []
+
+        if start_position >= len(ordered_ids):
+            return
+
+        if self.chain_mode == "link_log":
+            start_offset = self.chain_index["entries"][ordered_ids[start_position]]["offset"]
+            with open(self.chain_log_path, 'rb') as f:
+                f.seek(start_offset)
+                for line in f:
+                    if not line.startswith(b'{"type":"entry"'):
+                        continue
+                    segment.append(line)
+                    if len(segment) >= segment_size:
+                        yield segment
+                        segment = []
+        else:
+            for entry_id in ordered_ids[start_position:]:
+                file_path = self.storage_root / self.chain_index["entries"][entry_id]["file_path"]
+                segment.append(file_path.read_bytes())
+                if len(segment) >= segment_size:
+                    yield segment
+                    segment = []
+
+        if segment:
+            yield segment
+
+    def _sign_checkpoint(self, checkpoint: Dict[str, Any]) -> str:
+        """HMAC-SHA256 signature over the canonical checkpoint body."""
+        canonical = json.dumps(checkpoint, sort_keys=True, ensure_ascii=False)
+        return hmac.new(self.checkpoint_key, canonical.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    def _save_checkpoint(self, position: int, entry_id: str, entry_hash: str) -> None:
+        """Append a signed verification checkpoint."""
+        checkpoint = {
+            "position": position,
+            "entry_id": entry_id,
+            "entry_hash": entry_hash,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        checkpoint["signature"] = self._sign_checkpoint(checkpoint)
+
+        with open(self.checkpoint_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(checkpoint, ensure_ascii=False) + '\n')
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Return the last checkpoint with a valid signature, if any."""
+        if not self.checkpoint_key or not self.checkpoint_path.exists():
+            return None
+
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+
+        for line in reversed(lines):
+            try:
+                checkpoint = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            signature = checkpoint.pop("signature", "")
+            if hmac.compare_digest(signature, self._sign_checkpoint(checkpoint)):
+                return checkpoint
+        return None
+
     def get_chain_stats(self) -> Dict[str, Any]:
         """Get chain statistics."""
         return {
@@ -12,6 +12,8 @@ Features:
 - Tamper detection with content hashing
 - Metadata immutability enforcement
 - Audit trail for all access attempts
+- Append-only index journal with compaction into immutable segments
+- Group-commit batch writes into packed immutable files
 
 Compliance: MUST-007-WORM-STORAGE, GDPR Art.5(1)(f), MiCA Art.74
 Version: 1.0.0
@@ -42,34 +44,137 @@ class WORMStorageEngine:
     - Tamper detection
     """
 
-    def __init__(self, storage_root: str = "02_audit_logging/worm_storage/vault"):
+    def __init__(self, storage_root: str = "02_audit_logging/worm_storage/vault",
+                 compaction_threshold: int = 10000):
         """
         Initialize WORM storage engine.
 
         Args:
             storage_root: Root directory for WORM storage
+            compaction_threshold: Journal entries before compaction into
+                an immutable index segment
         """
         self.storage_root = Path(storage_root)
         self.storage_root.mkdir(parents=True, exist_ok=True)
 
         # Metadata index (tracks all WORM files)
+        # worm_index.json is the legacy full snapshot and is only read.
+        # New entries go to an append-only journal which is periodically
+        # compacted into immutable segment files.
         self.index_path = self.storage_root / "worm_index.json"
+        self.journal_path = self.storage_root / "worm_index_journal.jsonl"
+        self.segments_dir = self.storage_root / "index_segments"
+        self.compaction_threshold = max(1, compaction_threshold)
+        self._journal_ids: List[str] = []
+        self._next_segment = 0
         self.index: Dict[str, Dict[str, Any]] = self._load_index()
 
         # Access log (audit trail)
         self.access_log_path = self.storage_root / "access_log.jsonl"
 
     def _load_index(self) -> Dict[str, Dict[str, Any]]:
-        """Load WORM file index."""
+        """
+        Load WORM file index.
+
+        Order: legacy snapshot, then compacted segments (oldest first),
+        then replay of the journal.
+        """
+        index: Dict[str, Dict[str, Any]] = {}
+
         if self.index_path.exists():
             with open(self.index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+                index.update(json.load(f))
+
+        if self.segments_dir.exists():
+            segment_numbers = []
+            for segment_file in sorted(self.segments_dir.glob("segment_*.json")):
+                with open(segment_file, 'r', encoding='utf-8') as f:
+                    index.update(json.load(f))
+                suffix = segment_file.stem[len("segment_"):]
+                if suffix.isdigit():
+                    segment_numbers.append(int(suffix))
+            # Numbering may have gaps; never reuse an existing segment name
+            self._next_segment = max(segment_numbers, default=-1) + 1
+
+        if self.journal_path.exists():
+            valid_end = 0
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Torn trailing record from an interrupted append
+                        break
+                    valid_end += len(line)
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    evidence_id = record.pop("evidence_id")
+                    index[evidence_id] = record
+                    self._journal_ids.append(evidence_id)
+
+            if valid_end < self.journal_path.stat().st_size:
+                os.truncate(self.journal_path, valid_end)
+
+        return index
+
+    def _append_index_entries(self, entries: List[tuple], sync: bool = False) -> None:
+        """
+        Append index entries to the journal (one sequential write).
+
+        Args:
+            entries: List of (evidence_id, index_entry) tuples
+            sync: fsync the journal before returning
+        """
+        lines = []
+        for evidence_id, entry in entries:
+            record = {"evidence_id": evidence_id}
+            record.update(entry)
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        for evidence_id, entry in entries:
+            self.index[evidence_id] = entry
+            self._journal_ids.append(evidence_id)
+
+        if len(self._journal_ids) >= self.compaction_threshold:
+            self.compact_index()
+
+    def compact_index(self) -> Optional[Path]:
+        """
+        Compact the journal into a new immutable index segment.
+
+        The segment is written atomically and made read-only before the
+        journal is truncated, so a crash in between only causes an
+        idempotent replay of entries already in the segment.
+
+        Returns:
+            Path of the new segment, or None if the journal was empty
+        """
+        if not self._journal_ids:
+            return None
+
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        segment = {eid: self.index[eid] for eid in self._journal_ids}
+        segment_path = self.segments_dir / f"segment_{self._next_segment:08d}.json"
+        tmp_path = segment_path.with_suffix(".tmp")
 
-    def _save_index(self) -> None:
-        """Save WORM file index."""
-        with open(self.index_path, 'w', encoding='utf-8') as f:
-            json.dump(self.index, f, indent=2, ensure_ascii=False)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(segment, f, ensure_ascii=False, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, segment_path)
+        self._make_readonly(segment_path)
+
+        with open(self.journal_path, 'w', encoding='utf-8'):
+            pass
+
+        self._journal_ids = []
+        self._next_segment += 1
+        return segment_path
 
     def _log_access(self, event_type: str, evidence_id: str,
                     result: str, details: Optional[str] = None) -> None:
@@ -96,6 +201,39 @@ class WORMStorageEngine:
         readonly_perms = current_perms & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
         file_path.chmod(readonly_perms)
 
+    def _build_envelope(self, evidence_id: str, evidence_data: Dict[str, Any],
+                        category: str) -> tuple:
+        """
+        Build evidence envelope with metadata and content hash.
+
+        Returns:
+            Tuple of (envelope, serialized final content)
+        """
+        # Prepare evidence envelope with metadata
+        envelope = {
+            "evidence_id": evidence_id,
+            "category": category,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "worm_metadata": {
+                "write_once": True,
+                "immutable": True,
+                "deletable": False,
+                "retention_years": 10,
+                "compliance": ["MUST-007-WORM-STORAGE", "GDPR-Art5", "MiCA-Art74"]
+            },
+            "evidence_data": evidence_data
+        }
+
+        # Serialize and compute hash
+        content = json.dumps(envelope, indent=2, ensure_ascii=False, sort_keys=True)
+        content_hash = self._compute_content_hash(content)
+
+        # Add hash to envelope
+        envelope["content_hash"] = content_hash
+        final_content = json.dumps(envelope, indent=2, ensure_ascii=False, sort_keys=True)
+
+        return envelope, final_content
+
     def write_evidence(self, evidence_id: str, evidence_data: Dict[str, Any],
                        category: str = "general") -> Dict[str, Any]:
         """
@@ -130,28 +268,8 @@ class WORMStorageEngine:
         filename = f"{evidence_id}_{timestamp}.json"
         file_path = category_dir / filename
 
-        # Prepare evidence envelope with metadata
-        envelope = {
-            "evidence_id": evidence_id,
-            "category": category,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "worm_metadata": {
-                "write_once": True,
-                "immutable": True,
-                "deletable": False,
-                "retention_years": 10,
-                "compliance": ["MUST-007-WORM-STORAGE", "GDPR-Art5", "MiCA-Art74"]
-            },
-            "evidence_data": evidence_data
-        }
-
-        # Serialize and compute hash
-        content = json.dumps(envelope, indent=2, ensure_ascii=False, sort_keys=True)
-        content_hash = self._compute_content_hash(content)
-
-        # Add hash to envelope
-        envelope["content_hash"] = content_hash
-        final_content = json.dumps(envelope, indent=2, ensure_ascii=False, sort_keys=True)
+        envelope, final_content = self._build_envelope(evidence_id, evidence_data, category)
+        content_hash = envelope["content_hash"]
 
         # Write to disk
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -160,15 +278,14 @@ class WORMStorageEngine:
         # Make read-only (WORM enforcement)
         self._make_readonly(file_path)
 
-        # Update index
-        self.index[evidence_id] = {
+        # Update index (append-only journal)
+        self._append_index_entries([(evidence_id, {
             "file_path": str(file_path.relative_to(self.storage_root)),
             "category": category,
             "content_hash": content_hash,
             "timestamp": envelope["timestamp"],
             "size_bytes": len(final_content.encode('utf-8'))
-        }
-        self._save_index()
+        })])
 
         # Log successful write
         self._log_access("write", evidence_id, "SUCCESS",
@@ -183,6 +300,92 @@ class WORMStorageEngine:
             "worm_guaranteed": True
         }
 
+    def write_evidence_batch(self, items: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Write a batch of evidence as one group commit.
+
+        All envelopes are packed into a single read-only pack file which is
+        fsynced once, the index journal is appended and fsynced once, and
+        one access-log record is written for the whole batch. Items are
+        durable when this method returns.
+
+        Args:
+            items: List of (evidence_id, evidence_data, category) tuples
+
+        Returns:
+            One result per item, in order. Items that would violate WORM
+            semantics get status "DENIED" and an error message instead of
+            raising, so the rest of the batch is still committed.
+        """
+        results: List[Dict[str, Any]] = []
+        accepted = []
+        batch_ids = set()
+
+        for evidence_id, evidence_data, category in items:
+            if evidence_id in self.index or evidence_id in batch_ids:
+                self._log_access("write_attempt", evidence_id, "DENIED",
+                               "Evidence already exists (WORM violation)")
+                results.append({
+                    "evidence_id": evidence_id,
+                    "status": "DENIED",
+                    "error": f"Evidence {evidence_id} already exists. "
+                             "WORM storage does not allow modifications."
+                })
+                continue
+
+            batch_ids.add(evidence_id)
+            envelope, final_content = self._build_envelope(evidence_id, evidence_data, category)
+            accepted.append((envelope, final_content.encode('utf-8')))
+            results.append(None)
+
+        if not accepted:
+            return results
+
+        # Pack all envelopes into one immutable file
+        packs_dir = self.storage_root / "packs"
+        packs_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        pack_path = packs_dir / f"pack_{timestamp}_{accepted[0][0]['evidence_id']}.json"
+        relative_pack = str(pack_path.relative_to(self.storage_root))
+
+        entries = []
+        offset = 0
+        with open(pack_path, 'xb') as f:
+            for envelope, payload in accepted:
+                f.write(payload + b'\n')
+                entries.append((envelope["evidence_id"], {
+                    "file_path": relative_pack,
+                    "offset": offset,
+                    "category": envelope["category"],
+                    "content_hash": envelope["content_hash"],
+                    "timestamp": envelope["timestamp"],
+                    "size_bytes": len(payload)
+                }))
+                offset += len(payload) + 1
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._make_readonly(pack_path)
+        self._append_index_entries(entries, sync=True)
+
+        self._log_access("write_batch", relative_pack, "SUCCESS",
+                        f"Events: {len(entries)}")
+
+        accepted_iter = iter(accepted)
+        for i, result in enumerate(results):
+            if result is None:
+                envelope, _ = next(accepted_iter)
+                results[i] = {
+                    "evidence_id": envelope["evidence_id"],
+                    "content_hash": envelope["content_hash"],
+                    "file_path": str(pack_path),
+                    "timestamp": envelope["timestamp"],
+                    "status": "IMMUTABLE",
+                    "worm_guaranteed": True
+                }
+
+        return results
+
     def read_evidence(self, evidence_id: str, verify_integrity: bool = True) -> Dict[str, Any]:
         """
         Read evidence from WORM storage with integrity verification.
@@ -207,9 +410,14 @@ class WORMStorageEngine:
         index_entry = self.index[evidence_id]
         file_path = self.storage_root / index_entry["file_path"]
 
-        # Read content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read content (packed entries are addressed by offset/size)
+        if "offset" in index_entry:
+            with open(file_path, 'rb') as f:
+                f.seek(index_entry["offset"])
+                content = f.read(index_entry["size_bytes"]).decode('utf-8')
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
 
         envelope = json.loads(content)
 
@@ -22,6 +22,7 @@ Author: Claude Code
 Co-Authored-By: Claude <noreply@anthropic.com>
 """
 
+import os
 import sys
 import json
 import hashlib
@@ -31,9 +32,14 @@ from typing import Dict, List, Optional, Tuple, Set, Any
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from threading import Lock
 import re
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
 
 # Import artefact generators
 try:
@@ -52,7 +58,8 @@ except ImportError:
     NETWORKX_AVAILABLE = False
 
 # Add forensics module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / '12_tooling' / 'scripts' / 'sot_rule_forensics'))
+FORENSICS_DIR = Path(__file__).parent.parent.parent.parent / '12_tooling' / 'scripts' / 'sot_rule_forensics'
+sys.path.insert(0, str(FORENSICS_DIR))
 
 
 # ============================================================================
@@ -437,6 +444,443 @@ class ExtractedRule:
         return d
 
 
+# ============================================================================
+# Single-Pass Line Extraction Engine
+# ============================================================================
+# The line-based extractors below share one pass over each file: content is
+# split once, lines containing none of the literals the extractors' patterns
+# require (derived from the patterns themselves) are skipped, each extractor
+# only examines lines containing one of its own literals and per-line hashes
+# are computed at most once. Output is identical to running
+# the _extract_*_rules methods one after another.
+
+IGNORECASE = re.IGNORECASE
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+LIST_ITEM_RE = re.compile(r'^\s*[-*+]\s+(.+)$')
+MARKDOWN_KEYWORDS = ['MUST', 'SHOULD', 'MAY', 'SHALL', 'REQUIRED']
+INLINE_POLICY_RE = re.compile(r'\b(MUST|SHALL|SHOULD|MAY|REQUIRED|RECOMMENDED|OPTIONAL)\b')
+
+FORMULA_RE = re.compile(FORMULA_PATTERN)
+NUMERIC_PERCENT_PATTERNS = [
+    (re.compile(FEE_PATTERN, IGNORECASE), "fee"),
+    (re.compile(BURN_PATTERN, IGNORECASE), "burn"),
+    (re.compile(VESTING_PATTERN, IGNORECASE), "vesting"),
+    (re.compile(INFLATION_PATTERN, IGNORECASE), "inflation"),
+    (re.compile(TEST_COVERAGE_PATTERN, IGNORECASE), "coverage"),
+]
+GOVERNANCE_THRESHOLD_RE = re.compile(GOVERNANCE_THRESHOLD_PATTERN, IGNORECASE)
+
+REGULATORY_REFS_RE = re.compile(REGULATORY_REFS)
+COMPLIANCE_BASIS_RE = re.compile(COMPLIANCE_BASIS_PATTERN, IGNORECASE)
+JURISDICTION_LIST_RE = re.compile(JURISDICTION_LIST_PATTERN, IGNORECASE)
+
+HASH_START_RE = re.compile(HASH_START_PATTERN)
+PATH_ANCHOR_RE = re.compile(PATH_ANCHOR_PATTERN)
+MOSCOW_DE_RE = re.compile(MOSCOW_DE_PATTERN)
+MUST_EXIST_RE = re.compile(MUST_EXIST_PATTERN)
+SCORE_THRESHOLD_RE = re.compile(SCORE_THRESHOLD_PATTERN)
+REGIONAL_SCOPE_RE = re.compile(REGIONAL_SCOPE_PATTERN)
+BOOLEAN_CONTROL_RE = re.compile(BOOLEAN_CONTROL_PATTERN)
+PURPOSE_RE = re.compile(PURPOSE_PATTERN)
+
+# Extractors that emit one rule for the first matching pattern of a line:
+# name -> (rule_id prefix, [(pattern, context)], source_type, priority, reality_level)
+FIRST_MATCH_EXTRACTORS = {
+    'time': ('TIME', [
+        (RETENTION_PATTERN, "retention"),
+        (DEADLINE_PATTERN, "deadline"),
+        (MIGRATION_DEADLINE_PATTERN, "migration_deadline"),
+        (REVIEW_CYCLE_PATTERN, "review_cycle"),
+        (FREQUENCY_PATTERN, "frequency"),
+        (VOTING_PERIOD_PATTERN, "voting_period"),
+        (TIMELOCK_PATTERN, "timelock"),
+        (GRACE_PERIOD_PATTERN, "grace_period"),
+        (LOG_RETENTION_PATTERN, "log_retention"),
+    ], RuleSource.YAML_BLOCK, MoSCoWPriority.MUST, RuleReality.STRUCTURAL),
+    'security': ('SEC', [
+        (ENCRYPTION_PATTERN, "encryption"),
+        (HASH_ALGORITHM_PATTERN, "hash_algorithm"),
+        (PQC_STANDARD_PATTERN, "pqc_standard"),
+        (INTEGRITY_PATTERN, "integrity"),
+        (CLASSIFICATION_PATTERN, "classification"),
+        (ACCESS_CONTROL_PATTERN, "access_control"),
+        (VERIFICATION_METHOD_PATTERN, "verification_method"),
+    ], RuleSource.YAML_BLOCK, MoSCoWPriority.MUST, RuleReality.STRUCTURAL),
+    'esg': ('ESG', [
+        (SDG_PATTERN, "sdg"),
+        (DIVERSITY_PATTERN, "diversity"),
+        (ACCESSIBILITY_PATTERN, "accessibility"),
+        (ECONOMIC_INCLUSION_PATTERN, "economic_inclusion"),
+        (UNBANKED_PATTERN, "unbanked_support"),
+        (SUSTAINABILITY_PATTERN, "sustainability"),
+        (CARBON_NEUTRAL_PATTERN, "carbon_neutral"),
+        (ESG_RATING_PATTERN, "esg_rating"),
+        (SOCIAL_IMPACT_PATTERN, "social_impact"),
+    ], RuleSource.YAML_BLOCK, MoSCoWPriority.SHOULD, RuleReality.SEMANTIC),
+    'governance': ('GOV', [
+        (ROLE_PATTERN, "role"),
+        (NOT_ROLE_PATTERN, "not_role"),
+        (APPROVAL_PATTERN, "approval_required"),
+        (MAINTAINER_PATTERN, "maintainer"),
+        (EMERGENCY_PATTERN, "emergency"),
+        (RFC_PATTERN, "rfc"),
+        (STAKEHOLDER_REVIEW_PATTERN, "stakeholder_review"),
+        (COMMUNITY_PATTERN, "community_participation"),
+    ], RuleSource.YAML_BLOCK, MoSCoWPriority.MUST, RuleReality.STRUCTURAL),
+    'audit': ('AUDIT', [
+        (AUDIT_TRAIL_PATTERN, "audit_trail"),
+        (EVIDENCE_CHAIN_PATTERN, "evidence_chain"),
+        (IMMUTABLE_STORE_PATTERN, "immutable_store"),
+        (BLOCKCHAIN_ANCHOR_PATTERN, "blockchain_anchor"),
+        (QUARANTINE_PATTERN, "quarantine"),
+        (VIOLATION_HANDLING_PATTERN, "violation_handling"),
+        (SEVERITY_PATTERN, "severity"),
+        (AUDIT_FREQUENCY_PATTERN, "audit_frequency"),
+    ], RuleSource.YAML_BLOCK, MoSCoWPriority.MUST, RuleReality.STRUCTURAL),
+    'relation': ('REL', [
+        (SEE_REFERENCE_PATTERN, "reference"),
+        (INTEGRATION_POINT_PATTERN, "integration_point"),
+        (DEPENDENCY_PATTERN, "dependency"),
+        (EXTENDS_PATTERN, "extends"),
+        (SUPERSEDES_PATTERN, "supersedes"),
+        (REPLACES_PATTERN, "replaces"),
+    ], RuleSource.INLINE_POLICY, MoSCoWPriority.SHOULD, RuleReality.SEMANTIC),
+    'i18n': ('I18N', [
+        (LANGUAGE_STRATEGY_PATTERN, "language_strategy"),
+        (PRIMARY_LANGUAGE_PATTERN, "primary_language"),
+        (TRANSLATION_QUALITY_PATTERN, "translation_quality"),
+        (WCAG_PATTERN, "wcag"),
+        (RTL_PATTERN, "rtl_support"),
+        (LANGUAGE_FALLBACK_PATTERN, "language_fallback"),
+    ], RuleSource.YAML_BLOCK, MoSCoWPriority.SHOULD, RuleReality.STRUCTURAL),
+    'infra': ('INFRA', [
+        (ANTI_GAMING_PATTERN, "anti_gaming"),
+        (NO_REGEX_PATTERN, "no_regex"),
+        (NO_SYMLINKS_PATTERN, "no_symlinks"),
+        (CIRCULAR_DEPENDENCY_PATTERN, "circular_dependency"),
+        (CI_GATE_PATTERN, "ci_gate"),
+        (HOOK_PATTERN, "hook"),
+        (CONTAINER_PATTERN, "container"),
+        (K8S_PATTERN, "kubernetes"),
+    ], RuleSource.INLINE_POLICY, MoSCoWPriority.MUST, RuleReality.STRUCTURAL),
+}
+
+# Compiled (pattern, context) lists of the first-match extractors
+FIRST_MATCH_COMPILED = {
+    name: [(re.compile(pattern, IGNORECASE), context) for pattern, context in spec[1]]
+    for name, spec in FIRST_MATCH_EXTRACTORS.items()
+}
+
+
+_REPEAT_OPS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+               getattr(sre_constants, 'POSSESSIVE_REPEAT', sre_constants.MAX_REPEAT)}
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+
+
+def required_literals(pattern: str, flags: int = 0) -> Optional[Set[str]]:
+    """
+    Lowercased ASCII literals of which every match of pattern contains at
+    least one (None if no such set can be derived from the pattern).
+
+    A line whose case-folded text (see fold_line) contains none of them
+    cannot match the pattern, regardless of IGNORECASE.
+    """
+    return _required_literals(sre_parse.parse(pattern, flags))
+
+
+def _required_literals(items) -> Optional[Set[str]]:
+    candidates = []
+    run = []
+
+    def close_run():
+        if run:
+            candidates.append({''.join(run)})
+            run.clear()
+
+    for op, av in items:
+        if op is sre_constants.LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+        close_run()
+
+        required = None
+        if op is sre_constants.SUBPATTERN:
+            required = _required_literals(av[3])
+        elif op is _ATOMIC_GROUP:
+            required = _required_literals(av)
+        elif op is sre_constants.BRANCH:
+            alternatives = [_required_literals(alternative) for alternative in av[1]]
+            if all(alternatives):
+                required = set().union(*alternatives)
+        elif op in _REPEAT_OPS and av[0] >= 1:
+            required = _required_literals(av[2])
+        if required:
+            candidates.append(required)
+    close_run()
+
+    if not candidates:
+        return None
+    # Most selective: longest shortest literal, then fewest literals
+    return max(candidates, key=lambda literals: (min(map(len, literals)), -len(literals)))
+
+
+# Non-ASCII characters matching an ASCII letter under IGNORECASE although
+# their lower() is not that letter
+_FOLD_TABLE = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's'})
+
+
+def fold_line(text: str) -> str:
+    """Case-fold a line for required_literals() checks"""
+    if not text.isascii():
+        text = text.translate(_FOLD_TABLE)
+    return text.lower()
+
+
+# Per-extractor pattern sources and flags
+LINE_PREFILTER_SOURCES = {
+    'markdown': [('|'.join(MARKDOWN_KEYWORDS), 0)],
+    'inline': [(INLINE_POLICY_RE.pattern, 0)],
+    'numeric': [(FORMULA_PATTERN, 0), (GOVERNANCE_THRESHOLD_PATTERN, IGNORECASE)] + [
+        (regex.pattern, IGNORECASE) for regex, _ in NUMERIC_PERCENT_PATTERNS
+    ],
+    'legal': [(REGULATORY_REFS, 0), (COMPLIANCE_BASIS_PATTERN, IGNORECASE),
+              (JURISDICTION_LIST_PATTERN, IGNORECASE)],
+    **{
+        name: [(pattern, IGNORECASE) for pattern, _ in spec[1]]
+        for name, spec in FIRST_MATCH_EXTRACTORS.items()
+    },
+    'semantic': [(regex.pattern, 0) for regex in (
+        HASH_START_RE, PATH_ANCHOR_RE, MOSCOW_DE_RE, MUST_EXIST_RE, SCORE_THRESHOLD_RE,
+        REGIONAL_SCOPE_RE, BOOLEAN_CONTROL_RE, PURPOSE_RE,
+    )],
+}
+
+
+def _extractor_keywords(sources: List[Tuple[str, int]]) -> Optional[Tuple[str, ...]]:
+    keywords = set()
+    for pattern, flags in sources:
+        literals = required_literals(pattern, flags)
+        if literals is None:
+            return None
+        keywords |= literals
+    return tuple(sorted(keywords))
+
+
+# name -> keywords (one of which a folded line must contain for the
+# extractor to match it; None = extractor sees every line)
+LINE_KEYWORDS = {name: _extractor_keywords(sources) for name, sources in LINE_PREFILTER_SOURCES.items()}
+if None in LINE_KEYWORDS.values():
+    ANY_LINE_KEYWORD_RE = None
+else:
+    ANY_LINE_KEYWORD_RE = re.compile('|'.join(
+        re.escape(keyword)
+        for keyword in sorted({k for keywords in LINE_KEYWORDS.values() for k in keywords}, key=len, reverse=True)
+    ))
+
+
+class LineContext:
+    """A content line with its hashes, each computed at most once"""
+
+    __slots__ = ('number', 'text', '_md5', '_sha256')
+
+    def __init__(self, number: int, text: str):
+        self.number = number
+        self.text = text
+        self._md5 = None
+        self._sha256 = None
+
+    @property
+    def md5(self) -> str:
+        """First 8 hex chars of md5(line)"""
+        if self._md5 is None:
+            self._md5 = hashlib.md5(self.text.encode()).hexdigest()[:8]
+        return self._md5
+
+    @property
+    def sha256(self) -> str:
+        """First 8 hex chars of sha256(line)"""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.text.encode()).hexdigest()[:8]
+        return self._sha256
+
+
+# ============================================================================
+# Per-File Extraction Results, Cache and Worker Processes
+# ============================================================================
+# Extracting a file (read, normalize, tokenize, rule extraction,
+# meta-patterns) depends on no other file, so it can run in a worker process
+# or be served from a content-hash cache. The layers whose state spans files
+# (aliases, mapping, tagging, duplicates, evidence chain, hash aggregation)
+# run in the parent on the merged results (SoTRuleParserV3._merge_file).
+
+EXTRACTION_CACHE_VERSION = 1
+
+# Files resolving environment variables are never cached
+ENV_VARIABLE_MARKER = b'${ENV:'
+
+
+def extraction_code_fingerprint() -> str:
+    """
+    SHA-256 over the sources extraction depends on (this parser with its
+    pattern tables, and the forensics modules), so editing any of them
+    invalidates cached extractions without a manual version bump.
+    """
+    digest = hashlib.sha256()
+    for source in [Path(__file__).resolve()] + sorted(FORENSICS_DIR.glob('*.py')):
+        try:
+            data = source.read_bytes()
+        except OSError:
+            continue
+        digest.update(source.name.encode('utf-8') + b'\0' + hashlib.sha256(data).digest())
+    return digest.hexdigest()
+
+
+def rule_to_tuple(rule: ExtractedRule) -> tuple:
+    """Compact form of a freshly extracted rule (without source_path/path_hash)"""
+    return (
+        rule.rule_id, rule.text, rule.source_type.value, rule.priority.name, rule.context,
+        rule.line_number, rule.reality_level.value, rule.content_hash, rule.context_hash,
+        rule.hash_signature, rule.root_folder, rule.shard,
+    )
+
+
+def rules_from_tuples(rule_tuples: List[tuple], source_path: str) -> List[ExtractedRule]:
+    """Rebuild the rules of one file from rule_to_tuple() tuples"""
+    path_hash = hashlib.sha256(source_path.encode('utf-8')).hexdigest()
+    rules = []
+    for (rule_id, text, source_type, priority, context, line_number, reality_level,
+         content_hash, context_hash, hash_signature, root_folder, shard) in rule_tuples:
+        rules.append(ExtractedRule(
+            rule_id=rule_id,
+            text=text,
+            source_path=source_path,
+            source_type=RuleSource(source_type),
+            priority=MoSCoWPriority[priority],
+            context=context,
+            line_number=line_number,
+            reality_level=RuleReality(reality_level),
+            root_folder=root_folder,
+            shard=shard,
+            content_hash=content_hash,
+            path_hash=path_hash,
+            context_hash=context_hash,
+            hash_signature=hash_signature,
+        ))
+    return rules
+
+
+@dataclass
+class FileExtraction:
+    """Extraction result of one file"""
+    sha256: Optional[str]                                   # None: must not be cached
+    rules: List[tuple] = field(default_factory=list)        # rule_to_tuple() per rule
+    log: List[Tuple[str, str]] = field(default_factory=list)  # (level, message)
+    failed: bool = False
+
+
+class ExtractionLog:
+    """Collects the log messages of a file extraction for replay into the run log"""
+
+    def __init__(self):
+        self.entries: List[Tuple[str, str]] = []
+
+    def log_info(self, message: str):
+        self.entries.append(('INFO', message))
+
+    def log_warning(self, message: str):
+        self.entries.append(('WARNING', message))
+
+    def log_error(self, message: str):
+        self.entries.append(('ERROR', message))
+
+
+class ExtractionCache:
+    """
+    Per-file extraction results keyed by path and content SHA-256.
+
+    Persisted as JSON; a cache file is only reused with the same settings
+    (cache version, extraction code fingerprint, extraction mode, forensics
+    availability). Failed extractions are never stored.
+    """
+
+    def __init__(self, cache_file: Path, settings: Dict[str, Any]):
+        self.cache_file = Path(cache_file)
+        self.settings = settings
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.cache_file.exists():
+            return
+        try:
+            data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('settings') == self.settings:
+            self.entries = data.get('files', {})
+
+    def get(self, path: str, sha256: str) -> Optional[FileExtraction]:
+        """Cached extraction of path if its content hash is unchanged"""
+        entry = self.entries.get(path)
+        if entry is None or entry['sha256'] != sha256 or entry['failed']:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return FileExtraction(
+            sha256,
+            [tuple(rule) for rule in entry['rules']],
+            [tuple(message) for message in entry['log']],
+            entry['failed'],
+        )
+
+    def put(self, path: str, extraction: FileExtraction):
+        if extraction.failed:
+            # Retried on the next run (the failure may be fixed by then)
+            if self.entries.pop(path, None) is not None:
+                self._dirty = True
+            return
+        self.entries[path] = asdict(extraction)
+        self._dirty = True
+
+    def save(self):
+        """Write the cache file (if anything changed)"""
+        if not self._dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        tmp_file.write_text(
+            json.dumps({'settings': self.settings, 'files': self.entries}, ensure_ascii=False),
+            encoding='utf-8'
+        )
+        tmp_file.replace(self.cache_file)
+        self._dirty = False
+
+
+@dataclass(frozen=True)
+class ParserConfig:
+    """Picklable parser settings for extraction worker processes"""
+    root_dir: Path
+    output_dir: Path
+    mode: str
+
+
+# Parser of an extraction worker process (set by _init_extraction_worker)
+_WORKER_PARSER = None
+
+
+def _init_extraction_worker(config: ParserConfig):
+    global _WORKER_PARSER
+    _WORKER_PARSER = SoTRuleParserV3.for_extraction(config)
+
+
+def _extract_file_worker(path: str) -> FileExtraction:
+    return _WORKER_PARSER._extract_file_uncached(Path(path))
+
+
 # ============================================================================
 # Complete Forensic Parser with All 30 Layers
 # ============================================================================
@@ -453,7 +897,8 @@ class SoTRuleParserV3:
     - Reproducible output
     """
 
-    def __init__(self, root_dir: Path, output_dir: Optional[Path] = None, mode: str = 'explicit'):
+    def __init__(self, root_dir: Path, output_dir: Optional[Path] = None, mode: str = 'explicit',
+                 cache_dir: Optional[Path] = None):
         self.root_dir = root_dir
         self.output_dir = output_dir or (root_dir / "02_audit_logging" / "reports")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -461,6 +906,19 @@ class SoTRuleParserV3:
         # Extraction mode: 'explicit' (RULE-IDs only) or 'comprehensive' (incl. semantic)
         self.mode = mode
 
+        # Per-file extraction cache (None = disabled)
+        self.extraction_cache = None
+        if cache_dir is not None:
+            self.extraction_cache = ExtractionCache(
+                Path(cache_dir) / f"rule_extraction_{mode}.json",
+                {
+                    'version': EXTRACTION_CACHE_VERSION,
+                    'code': extraction_code_fingerprint(),
+                    'mode': mode,
+                    'forensics': FORENSICS_AVAILABLE,
+                }
+            )
+
         # Extracted rules storage
         self.rules: Dict[str, ExtractedRule] = {}
         self.global_lock = Lock()
@@ -540,6 +998,35 @@ class SoTRuleParserV3:
 
         self.logger.log_info("All 30 forensic layers + 110 meta-patterns initialized")
 
+    @classmethod
+    def for_extraction(cls, config: ParserConfig) -> 'SoTRuleParserV3':
+        """
+        Parser with only the layers _extract_file_uncached() uses, for
+        extraction worker processes (skips e.g. the policy linker's
+        repository scan and the run log).
+        """
+        parser = cls.__new__(cls)
+        parser.root_dir = config.root_dir
+        parser.output_dir = config.output_dir
+        parser.mode = config.mode
+        parser.extraction_cache = None
+
+        if FORENSICS_AVAILABLE:
+            parser.lexer = MultiTrackLexer()
+            parser.context_extractor = ContextExtractor()
+            parser.variable_resolver = VariableResolver(config.root_dir)
+            parser.language_normalizer = LanguageNormalizer()
+            parser.error_tolerance = ErrorTolerance()
+            parser.advanced_pattern_recognizer = AdvancedPatternRecognizer()
+            parser.extended_meta_recognizer = ExtendedMetaPatternRecognizer()
+
+        return parser
+
+    @property
+    def config(self) -> ParserConfig:
+        """Picklable settings (for extraction worker processes)"""
+        return ParserConfig(self.root_dir, self.output_dir, self.mode)
+
     def process_file(self, file_path: Path) -> List[ExtractedRule]:
         """
         Process a single file through all 30 layers.
@@ -548,10 +1035,46 @@ class SoTRuleParserV3:
             List of extracted rules
         """
         self.logger.log_info(f"Processing file: {file_path}")
+        return self._merge_file(file_path, self._extract_file(file_path))
+
+    def _extract_file(self, file_path: Path) -> FileExtraction:
+        """Extract a file, served from the extraction cache if unchanged"""
+        extraction = self._cached_extraction(file_path)
+        if extraction is None:
+            extraction = self._extract_file_uncached(file_path)
+            self._store_extraction(file_path, extraction)
+        return extraction
+
+    def _cached_extraction(self, file_path: Path) -> Optional[FileExtraction]:
+        if self.extraction_cache is None:
+            return None
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return None
+        return self.extraction_cache.get(str(file_path), hashlib.sha256(data).hexdigest())
+
+    def _store_extraction(self, file_path: Path, extraction: FileExtraction):
+        if self.extraction_cache is not None and extraction.sha256 is not None:
+            self.extraction_cache.put(str(file_path), extraction)
+
+    def _extract_file_uncached(self, file_path: Path) -> FileExtraction:
+        """
+        Read a file and extract its rules and meta-patterns.
+
+        Uses no state shared between files; log messages are collected in
+        the result and written by _merge_file().
+        """
+        log = ExtractionLog()
+        digest = None
+        content = None
 
         try:
-            # Read and normalize content
-            content = file_path.read_text(encoding='utf-8')
+            # Read and normalize content (newlines as with read_text)
+            data = file_path.read_bytes()
+            if ENV_VARIABLE_MARKER not in data:
+                digest = hashlib.sha256(data).hexdigest()
+            content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
 
             # Layer 19: Language normalization
             if FORENSICS_AVAILABLE:
@@ -565,7 +1088,7 @@ class SoTRuleParserV3:
             tokens = []
             if FORENSICS_AVAILABLE:
                 tokens = self.lexer.tokenize(content)
-                self.logger.log_info(f"Extracted {len(tokens)} tokens")
+                log.log_info(f"Extracted {len(tokens)} tokens")
 
             # Layer 4: Context extraction
             if FORENSICS_AVAILABLE:
@@ -574,26 +1097,67 @@ class SoTRuleParserV3:
             # Extract rules from different sources
             rules = []
 
-            # ORIGINAL EXTRACTION (Basic MUST/SHOULD/MAY)
+            # ORIGINAL EXTRACTION (YAML blocks)
             rules.extend(self._extract_yaml_rules(content, file_path))
-            rules.extend(self._extract_markdown_rules(content, file_path))
-            rules.extend(self._extract_inline_rules(content, file_path))
-
-            # EXTENDED EXTRACTION (150+ Patterns)
-            rules.extend(self._extract_numeric_rules(content, file_path))
-            rules.extend(self._extract_legal_rules(content, file_path))
-            rules.extend(self._extract_time_rules(content, file_path))
-            rules.extend(self._extract_security_rules(content, file_path))
-            rules.extend(self._extract_esg_rules(content, file_path))
-            rules.extend(self._extract_governance_rules(content, file_path))
-            rules.extend(self._extract_audit_rules(content, file_path))
-            rules.extend(self._extract_relation_rules(content, file_path))
-            rules.extend(self._extract_i18n_rules(content, file_path))
-            rules.extend(self._extract_infra_rules(content, file_path))
-
-            # COMPREHENSIVE MODE EXTRACTION (Semantic patterns from parse_sot_rules.py)
-            # Only active if mode='comprehensive'
-            rules.extend(self._extract_semantic_rules_comprehensive(content, file_path))
+
+            # LINE EXTRACTION in one pass: markdown, inline (MUST/SHOULD/MAY),
+            # extended 150+ patterns (numeric ... infra) and, if
+            # mode='comprehensive', semantic patterns from parse_sot_rules.py
+            rules.extend(self._extract_line_rules(content, file_path, logger=log))
+
+            # Extended Meta-Pattern Recognition (30 + 50 patterns)
+            if FORENSICS_AVAILABLE:
+                # Advanced patterns (30)
+                advanced_results = self.advanced_pattern_recognizer.recognize_all_patterns(
+                    content,
+                    str(file_path)
+                )
+                # Extended patterns (50)
+                extended_results = self.extended_meta_recognizer.recognize_extended_patterns(
+                    content,
+                    str(file_path)
+                )
+                # Count patterns safely
+                adv_count = 0
+                if isinstance(advanced_results, dict):
+                    adv_count = sum(v for v in advanced_results.values() if isinstance(v, int))
+                ext_count = 0
+                if isinstance(extended_results, dict):
+                    ext_count = sum(v for v in extended_results.values() if isinstance(v, int))
+                total_meta_patterns = adv_count + ext_count
+                log.log_info(f"Extracted {total_meta_patterns} meta-patterns from {file_path.name}")
+
+            return FileExtraction(digest, [rule_to_tuple(rule) for rule in rules], log.entries)
+
+        except Exception as e:
+            log.log_error(f"Error processing {file_path}: {e}")
+
+            # Layer 20: Error tolerance - log and continue
+            if FORENSICS_AVAILABLE:
+                try:
+                    healed_content = self.error_tolerance.self_heal(content)
+                    if healed_content != content:
+                        log.log_info("Self-healing attempted, but continuing with original content")
+                except:
+                    pass
+
+            return FileExtraction(digest, [], log.entries, failed=True)
+
+    def _merge_file(self, file_path: Path, extraction: FileExtraction) -> List[ExtractedRule]:
+        """
+        Write a file's extraction log and run the layers whose state spans
+        files on its rules.
+
+        Returns:
+            List of extracted rules
+        """
+        for level, message in extraction.log:
+            self.logger.log(message, level)
+        if extraction.failed:
+            return []
+
+        try:
+            rules = rules_from_tuples(extraction.rules, str(file_path))
 
             # Layer 3: Alias recognition
             if FORENSICS_AVAILABLE:
@@ -627,57 +1191,23 @@ class SoTRuleParserV3:
                         rule.content_hash
                     )
 
-            # Layer 13: Evidence chain
+            # Layer 13: Evidence chain (one chain hash update per file)
             if FORENSICS_AVAILABLE:
-                for rule in rules:
-                    self.evidence_chain.add_entry(
-                        rule.rule_id,
-                        rule.hash_signature,
-                        'CREATE'
-                    )
+                self.evidence_chain.add_entries(
+                    [(rule.rule_id, rule.hash_signature) for rule in rules],
+                    'CREATE'
+                )
 
             # Layer 15: Hash aggregation
             if FORENSICS_AVAILABLE:
                 for rule in rules:
                     self.hash_aggregator.add_hash(rule.hash_signature)
 
-            # Extended Meta-Pattern Recognition (30 + 50 patterns)
-            if FORENSICS_AVAILABLE:
-                # Advanced patterns (30)
-                advanced_results = self.advanced_pattern_recognizer.recognize_all_patterns(
-                    content,
-                    str(file_path)
-                )
-                # Extended patterns (50)
-                extended_results = self.extended_meta_recognizer.recognize_extended_patterns(
-                    content,
-                    str(file_path)
-                )
-                # Count patterns safely
-                adv_count = 0
-                if isinstance(advanced_results, dict):
-                    adv_count = sum(v for v in advanced_results.values() if isinstance(v, int))
-                ext_count = 0
-                if isinstance(extended_results, dict):
-                    ext_count = sum(v for v in extended_results.values() if isinstance(v, int))
-                total_meta_patterns = adv_count + ext_count
-                self.logger.log_info(f"Extracted {total_meta_patterns} meta-patterns from {file_path.name}")
-
             self.logger.log_info(f"Extracted {len(rules)} rules from {file_path.name}")
             return rules
 
         except Exception as e:
             self.logger.log_error(f"Error processing {file_path}: {e}")
-
-            # Layer 20: Error tolerance - log and continue
-            if FORENSICS_AVAILABLE:
-                try:
-                    healed_content = self.error_tolerance.self_heal(content)
-                    if healed_content != content:
-                        self.logger.log_info("Self-healing attempted, but continuing with original content")
-                except:
-                    pass
-
             return []
 
     def _extract_yaml_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
@@ -711,60 +1241,132 @@ class SoTRuleParserV3:
 
         return rules
 
+    def _extract_line_rules(self, content: str, file_path: Path, logger=None) -> List[ExtractedRule]:
+        """
+        Single-pass extraction for all line-based extractors.
+
+        Returns the same rules, in the same order, as calling
+        _extract_markdown_rules, _extract_inline_rules, the extended
+        extractors (numeric ... infra) and
+        _extract_semantic_rules_comprehensive one after another.
+        Messages go to logger (default: the run log).
+        """
+        source_path = str(file_path)
+        comprehensive = self.mode == 'comprehensive'
+        handlers = [
+            (name, LINE_KEYWORDS[name], handler)
+            for name, handler in self._line_handlers()
+            if name != 'semantic' or comprehensive
+        ]
+        buckets = {name: [] for name, _, _ in handlers}
+        markdown = buckets['markdown']
+        current_heading = ""
+
+        for number, text in enumerate(content.split('\n'), 1):
+            is_heading = False
+            if text.startswith('#'):
+                heading_match = HEADING_RE.match(text)
+                if heading_match:
+                    current_heading = heading_match.group(2)
+                    is_heading = True
+
+            folded = fold_line(text)
+            if ANY_LINE_KEYWORD_RE is not None and not ANY_LINE_KEYWORD_RE.search(folded):
+                continue
+
+            line = LineContext(number, text)
+            for name, keywords, handler in handlers:
+                if keywords is not None and not any(keyword in folded for keyword in keywords):
+                    continue
+                if name == 'markdown':
+                    if not is_heading:
+                        markdown.extend(self._match_markdown_line(line, source_path, current_heading))
+                else:
+                    buckets[name].extend(handler(line, source_path))
+
+        if comprehensive:
+            (logger or self.logger).log_info(
+                f"  Comprehensive mode: Extracted {len(buckets['semantic'])} semantic rules from {file_path.name}"
+            )
+
+        rules = []
+        for bucket in buckets.values():
+            rules.extend(bucket)
+        return rules
+
+    def _line_handlers(self) -> List[Tuple[str, Any]]:
+        """Line extractors in process_file() output order"""
+        return [
+            ('markdown', None),
+            ('inline', self._match_inline_line),
+            ('numeric', self._match_numeric_line),
+            ('legal', self._match_legal_line),
+        ] + [
+            (name, self._first_match_handler(name)) for name in FIRST_MATCH_EXTRACTORS
+        ] + [
+            ('semantic', self._match_semantic_line),
+        ]
+
+    def _extract_per_line(self, handler, content: str, file_path: Path) -> List[ExtractedRule]:
+        """Run a single line extractor over content (no prefiltering)"""
+        rules = []
+        source_path = str(file_path)
+        for number, text in enumerate(content.split('\n'), 1):
+            rules.extend(handler(LineContext(number, text), source_path))
+        return rules
+
     def _extract_markdown_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract rules from markdown sections"""
         rules = []
-        lines = content.split('\n')
+        source_path = str(file_path)
 
         current_heading = ""
-        for i, line in enumerate(lines, 1):
+        for i, text in enumerate(content.split('\n'), 1):
             # Check for heading
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+            heading_match = HEADING_RE.match(text)
             if heading_match:
                 current_heading = heading_match.group(2)
                 continue
 
-            # Check for list items with policy keywords
-            list_match = re.match(r'^\s*[-*+]\s+(.+)$', line)
-            if list_match:
-                text = list_match.group(1)
-                if any(kw in text for kw in ['MUST', 'SHOULD', 'MAY', 'SHALL', 'REQUIRED']):
-                    rule = ExtractedRule(
-                        rule_id=f"MD-{hashlib.md5(text.encode()).hexdigest()[:8]}",
-                        text=text,
-                        source_path=str(file_path),
-                        source_type=RuleSource.MARKDOWN_SECTION,
-                        priority=self._determine_priority(text),
-                        context=current_heading,
-                        line_number=i,
-                        reality_level=RuleReality.SEMANTIC
-                    )
-                    rules.append(rule)
+            rules.extend(self._match_markdown_line(LineContext(i, text), source_path, current_heading))
 
         return rules
 
-    def _extract_inline_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
-        """Extract inline policy rules"""
-        rules = []
-        lines = content.split('\n')
-
-        policy_pattern = r'\b(MUST|SHALL|SHOULD|MAY|REQUIRED|RECOMMENDED|OPTIONAL)\b'
-
-        for i, line in enumerate(lines, 1):
-            if re.search(policy_pattern, line):
-                rule = ExtractedRule(
-                    rule_id=f"INLINE-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.INLINE_POLICY,
-                    priority=self._determine_priority(line),
-                    context="inline",
-                    line_number=i,
+    def _match_markdown_line(self, line: LineContext, source_path: str, heading: str) -> List[ExtractedRule]:
+        # Check for list items with policy keywords
+        list_match = LIST_ITEM_RE.match(line.text)
+        if list_match:
+            text = list_match.group(1)
+            if any(kw in text for kw in MARKDOWN_KEYWORDS):
+                return [ExtractedRule(
+                    rule_id=f"MD-{hashlib.md5(text.encode()).hexdigest()[:8]}",
+                    text=text,
+                    source_path=source_path,
+                    source_type=RuleSource.MARKDOWN_SECTION,
+                    priority=self._determine_priority(text),
+                    context=heading,
+                    line_number=line.number,
                     reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
+                )]
+        return []
 
-        return rules
+    def _extract_inline_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
+        """Extract inline policy rules"""
+        return self._extract_per_line(self._match_inline_line, content, file_path)
+
+    def _match_inline_line(self, line: LineContext, source_path: str) -> List[ExtractedRule]:
+        if INLINE_POLICY_RE.search(line.text):
+            return [ExtractedRule(
+                rule_id=f"INLINE-{line.number}-{line.md5}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.INLINE_POLICY,
+                priority=self._determine_priority(line.text),
+                context="inline",
+                line_number=line.number,
+                reality_level=RuleReality.SEMANTIC
+            )]
+        return []
 
     def _determine_priority(self, text: str) -> MoSCoWPriority:
         """Determine MoSCoW priority from text"""
@@ -784,392 +1386,163 @@ class SoTRuleParserV3:
 
     def _extract_numeric_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract formulas, percentages, thresholds, and numeric constraints"""
-        rules = []
-        lines = content.split('\n')
+        return self._extract_per_line(self._match_numeric_line, content, file_path)
 
-        for i, line in enumerate(lines, 1):
-            # Formulas (24×16=384)
-            formula_match = re.search(FORMULA_PATTERN, line)
-            if formula_match:
+    def _match_numeric_line(self, line: LineContext, source_path: str) -> List[ExtractedRule]:
+        rules = []
+        i = line.number
+
+        # Formulas (24×16=384)
+        if FORMULA_RE.search(line.text):
+            rule = ExtractedRule(
+                rule_id=f"NUM-FORMULA-{line.md5}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.INLINE_POLICY,
+                priority=MoSCoWPriority.MUST,
+                context="formula",
+                line_number=i,
+                reality_level=RuleReality.STRUCTURAL
+            )
+            rules.append(rule)
+
+        # Percentages (fees, burns, vesting)
+        for regex, ctx in NUMERIC_PERCENT_PATTERNS:
+            if regex.search(line.text):
                 rule = ExtractedRule(
-                    rule_id=f"NUM-FORMULA-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
+                    rule_id=f"NUM-{ctx.upper()}-{i}-{line.md5}",
+                    text=line.text.strip(),
+                    source_path=source_path,
                     source_type=RuleSource.INLINE_POLICY,
                     priority=MoSCoWPriority.MUST,
-                    context="formula",
+                    context=ctx,
                     line_number=i,
                     reality_level=RuleReality.STRUCTURAL
                 )
                 rules.append(rule)
 
-            # Percentages (fees, burns, vesting)
-            for pattern, ctx in [
-                (FEE_PATTERN, "fee"),
-                (BURN_PATTERN, "burn"),
-                (VESTING_PATTERN, "vesting"),
-                (INFLATION_PATTERN, "inflation"),
-                (TEST_COVERAGE_PATTERN, "coverage")
-            ]:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"NUM-{ctx.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.INLINE_POLICY,
-                        priority=MoSCoWPriority.MUST,
-                        context=ctx,
-                        line_number=i,
-                        reality_level=RuleReality.STRUCTURAL
-                    )
-                    rules.append(rule)
-
-            # Governance thresholds
-            if re.search(GOVERNANCE_THRESHOLD_PATTERN, line, re.IGNORECASE):
-                rule = ExtractedRule(
-                    rule_id=f"NUM-GOV-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.INLINE_POLICY,
-                    priority=MoSCoWPriority.MUST,
-                    context="governance_threshold",
-                    line_number=i,
-                    reality_level=RuleReality.STRUCTURAL
-                )
-                rules.append(rule)
+        # Governance thresholds
+        if GOVERNANCE_THRESHOLD_RE.search(line.text):
+            rule = ExtractedRule(
+                rule_id=f"NUM-GOV-{i}-{line.md5}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.INLINE_POLICY,
+                priority=MoSCoWPriority.MUST,
+                context="governance_threshold",
+                line_number=i,
+                reality_level=RuleReality.STRUCTURAL
+            )
+            rules.append(rule)
 
         return rules
 
     def _extract_legal_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract regulatory references, compliance basis, jurisdiction rules"""
-        rules = []
-        lines = content.split('\n')
+        return self._extract_per_line(self._match_legal_line, content, file_path)
 
-        for i, line in enumerate(lines, 1):
-            # Regulatory references (MiCA, GDPR, eIDAS, etc.)
-            reg_match = re.search(REGULATORY_REFS, line)
-            if reg_match:
-                rule = ExtractedRule(
-                    rule_id=f"LEGAL-REG-{reg_match.group(1)}-{i}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.INLINE_POLICY,
-                    priority=MoSCoWPriority.MUST,
-                    context=f"regulatory_{reg_match.group(1)}",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
+    def _match_legal_line(self, line: LineContext, source_path: str) -> List[ExtractedRule]:
+        rules = []
+        i = line.number
+
+        # Regulatory references (MiCA, GDPR, eIDAS, etc.)
+        reg_match = REGULATORY_REFS_RE.search(line.text)
+        if reg_match:
+            rule = ExtractedRule(
+                rule_id=f"LEGAL-REG-{reg_match.group(1)}-{i}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.INLINE_POLICY,
+                priority=MoSCoWPriority.MUST,
+                context=f"regulatory_{reg_match.group(1)}",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
+
+        # Compliance basis
+        if COMPLIANCE_BASIS_RE.search(line.text):
+            rule = ExtractedRule(
+                rule_id=f"LEGAL-COMPLIANCE-{i}-{line.md5}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.YAML_BLOCK,
+                priority=MoSCoWPriority.MUST,
+                context="compliance_basis",
+                line_number=i,
+                reality_level=RuleReality.STRUCTURAL
+            )
+            rules.append(rule)
+
+        # Jurisdiction lists (blacklist/whitelist)
+        if JURISDICTION_LIST_RE.search(line.text):
+            rule = ExtractedRule(
+                rule_id=f"LEGAL-JURISDICTION-{i}-{line.md5}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.YAML_BLOCK,
+                priority=MoSCoWPriority.MUST,
+                context="jurisdiction_control",
+                line_number=i,
+                reality_level=RuleReality.STRUCTURAL
+            )
+            rules.append(rule)
 
-            # Compliance basis
-            comp_match = re.search(COMPLIANCE_BASIS_PATTERN, line, re.IGNORECASE)
-            if comp_match:
-                rule = ExtractedRule(
-                    rule_id=f"LEGAL-COMPLIANCE-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.YAML_BLOCK,
-                    priority=MoSCoWPriority.MUST,
-                    context="compliance_basis",
-                    line_number=i,
-                    reality_level=RuleReality.STRUCTURAL
-                )
-                rules.append(rule)
+        return rules
 
-            # Jurisdiction lists (blacklist/whitelist)
-            jur_match = re.search(JURISDICTION_LIST_PATTERN, line, re.IGNORECASE)
-            if jur_match:
-                rule = ExtractedRule(
-                    rule_id=f"LEGAL-JURISDICTION-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.YAML_BLOCK,
-                    priority=MoSCoWPriority.MUST,
-                    context="jurisdiction_control",
-                    line_number=i,
-                    reality_level=RuleReality.STRUCTURAL
-                )
-                rules.append(rule)
+    def _first_match_handler(self, name: str):
+        """Line handler for a FIRST_MATCH_EXTRACTORS entry (one rule per line)"""
+        prefix, _, source_type, priority, reality_level = FIRST_MATCH_EXTRACTORS[name]
+        patterns = FIRST_MATCH_COMPILED[name]
+
+        def handler(line: LineContext, source_path: str) -> List[ExtractedRule]:
+            for regex, context in patterns:
+                if regex.search(line.text):
+                    return [ExtractedRule(
+                        rule_id=f"{prefix}-{context.upper()}-{line.number}-{line.md5}",
+                        text=line.text.strip(),
+                        source_path=source_path,
+                        source_type=source_type,
+                        priority=priority,
+                        context=context,
+                        line_number=line.number,
+                        reality_level=reality_level
+                    )]
+            return []
 
-        return rules
+        return handler
 
     def _extract_time_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract retention periods, deadlines, review cycles, frequencies"""
-        rules = []
-        lines = content.split('\n')
-
-        time_patterns = [
-            (RETENTION_PATTERN, "retention"),
-            (DEADLINE_PATTERN, "deadline"),
-            (MIGRATION_DEADLINE_PATTERN, "migration_deadline"),
-            (REVIEW_CYCLE_PATTERN, "review_cycle"),
-            (FREQUENCY_PATTERN, "frequency"),
-            (VOTING_PERIOD_PATTERN, "voting_period"),
-            (TIMELOCK_PATTERN, "timelock"),
-            (GRACE_PERIOD_PATTERN, "grace_period"),
-            (LOG_RETENTION_PATTERN, "log_retention")
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern, context in time_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"TIME-{context.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.YAML_BLOCK,
-                        priority=MoSCoWPriority.MUST,
-                        context=context,
-                        line_number=i,
-                        reality_level=RuleReality.STRUCTURAL
-                    )
-                    rules.append(rule)
-                    break  # Only one match per line
-
-        return rules
+        return self._extract_per_line(self._first_match_handler('time'), content, file_path)
 
     def _extract_security_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract encryption, PQC, hash algorithms, classification, access control"""
-        rules = []
-        lines = content.split('\n')
-
-        security_patterns = [
-            (ENCRYPTION_PATTERN, "encryption"),
-            (HASH_ALGORITHM_PATTERN, "hash_algorithm"),
-            (PQC_STANDARD_PATTERN, "pqc_standard"),
-            (INTEGRITY_PATTERN, "integrity"),
-            (CLASSIFICATION_PATTERN, "classification"),
-            (ACCESS_CONTROL_PATTERN, "access_control"),
-            (VERIFICATION_METHOD_PATTERN, "verification_method")
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern, context in security_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"SEC-{context.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.YAML_BLOCK,
-                        priority=MoSCoWPriority.MUST,
-                        context=context,
-                        line_number=i,
-                        reality_level=RuleReality.STRUCTURAL
-                    )
-                    rules.append(rule)
-                    break
-
-        return rules
+        return self._extract_per_line(self._first_match_handler('security'), content, file_path)
 
     def _extract_esg_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract ESG, diversity, accessibility, sustainability rules"""
-        rules = []
-        lines = content.split('\n')
-
-        esg_patterns = [
-            (SDG_PATTERN, "sdg"),
-            (DIVERSITY_PATTERN, "diversity"),
-            (ACCESSIBILITY_PATTERN, "accessibility"),
-            (ECONOMIC_INCLUSION_PATTERN, "economic_inclusion"),
-            (UNBANKED_PATTERN, "unbanked_support"),
-            (SUSTAINABILITY_PATTERN, "sustainability"),
-            (CARBON_NEUTRAL_PATTERN, "carbon_neutral"),
-            (ESG_RATING_PATTERN, "esg_rating"),
-            (SOCIAL_IMPACT_PATTERN, "social_impact")
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern, context in esg_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"ESG-{context.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.YAML_BLOCK,
-                        priority=MoSCoWPriority.SHOULD,
-                        context=context,
-                        line_number=i,
-                        reality_level=RuleReality.SEMANTIC
-                    )
-                    rules.append(rule)
-                    break
-
-        return rules
+        return self._extract_per_line(self._first_match_handler('esg'), content, file_path)
 
     def _extract_governance_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract roles, approvals, review cycles, emergency procedures"""
-        rules = []
-        lines = content.split('\n')
-
-        gov_patterns = [
-            (ROLE_PATTERN, "role"),
-            (NOT_ROLE_PATTERN, "not_role"),
-            (APPROVAL_PATTERN, "approval_required"),
-            (MAINTAINER_PATTERN, "maintainer"),
-            (EMERGENCY_PATTERN, "emergency"),
-            (RFC_PATTERN, "rfc"),
-            (STAKEHOLDER_REVIEW_PATTERN, "stakeholder_review"),
-            (COMMUNITY_PATTERN, "community_participation")
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern, context in gov_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"GOV-{context.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.YAML_BLOCK,
-                        priority=MoSCoWPriority.MUST,
-                        context=context,
-                        line_number=i,
-                        reality_level=RuleReality.STRUCTURAL
-                    )
-                    rules.append(rule)
-                    break
-
-        return rules
+        return self._extract_per_line(self._first_match_handler('governance'), content, file_path)
 
     def _extract_audit_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract audit trails, evidence chains, quarantine, violations"""
-        rules = []
-        lines = content.split('\n')
-
-        audit_patterns = [
-            (AUDIT_TRAIL_PATTERN, "audit_trail"),
-            (EVIDENCE_CHAIN_PATTERN, "evidence_chain"),
-            (IMMUTABLE_STORE_PATTERN, "immutable_store"),
-            (BLOCKCHAIN_ANCHOR_PATTERN, "blockchain_anchor"),
-            (QUARANTINE_PATTERN, "quarantine"),
-            (VIOLATION_HANDLING_PATTERN, "violation_handling"),
-            (SEVERITY_PATTERN, "severity"),
-            (AUDIT_FREQUENCY_PATTERN, "audit_frequency")
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern, context in audit_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"AUDIT-{context.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.YAML_BLOCK,
-                        priority=MoSCoWPriority.MUST,
-                        context=context,
-                        line_number=i,
-                        reality_level=RuleReality.STRUCTURAL
-                    )
-                    rules.append(rule)
-                    break
-
-        return rules
+        return self._extract_per_line(self._first_match_handler('audit'), content, file_path)
 
     def _extract_relation_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract references, dependencies, integration points, inheritance"""
-        rules = []
-        lines = content.split('\n')
-
-        relation_patterns = [
-            (SEE_REFERENCE_PATTERN, "reference"),
-            (INTEGRATION_POINT_PATTERN, "integration_point"),
-            (DEPENDENCY_PATTERN, "dependency"),
-            (EXTENDS_PATTERN, "extends"),
-            (SUPERSEDES_PATTERN, "supersedes"),
-            (REPLACES_PATTERN, "replaces")
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern, context in relation_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"REL-{context.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.INLINE_POLICY,
-                        priority=MoSCoWPriority.SHOULD,
-                        context=context,
-                        line_number=i,
-                        reality_level=RuleReality.SEMANTIC
-                    )
-                    rules.append(rule)
-                    break
-
-        return rules
+        return self._extract_per_line(self._first_match_handler('relation'), content, file_path)
 
     def _extract_i18n_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract internationalization, translation, locale, accessibility rules"""
-        rules = []
-        lines = content.split('\n')
-
-        i18n_patterns = [
-            (LANGUAGE_STRATEGY_PATTERN, "language_strategy"),
-            (PRIMARY_LANGUAGE_PATTERN, "primary_language"),
-            (TRANSLATION_QUALITY_PATTERN, "translation_quality"),
-            (WCAG_PATTERN, "wcag"),
-            (RTL_PATTERN, "rtl_support"),
-            (LANGUAGE_FALLBACK_PATTERN, "language_fallback")
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern, context in i18n_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"I18N-{context.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.YAML_BLOCK,
-                        priority=MoSCoWPriority.SHOULD,
-                        context=context,
-                        line_number=i,
-                        reality_level=RuleReality.STRUCTURAL
-                    )
-                    rules.append(rule)
-                    break
-
-        return rules
+        return self._extract_per_line(self._first_match_handler('i18n'), content, file_path)
 
     def _extract_infra_rules(self, content: str, file_path: Path) -> List[ExtractedRule]:
         """Extract anti-gaming, CI gates, hooks, container, testing rules"""
-        rules = []
-        lines = content.split('\n')
-
-        infra_patterns = [
-            (ANTI_GAMING_PATTERN, "anti_gaming"),
-            (NO_REGEX_PATTERN, "no_regex"),
-            (NO_SYMLINKS_PATTERN, "no_symlinks"),
-            (CIRCULAR_DEPENDENCY_PATTERN, "circular_dependency"),
-            (CI_GATE_PATTERN, "ci_gate"),
-            (HOOK_PATTERN, "hook"),
-            (CONTAINER_PATTERN, "container"),
-            (K8S_PATTERN, "kubernetes")
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern, context in infra_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    rule = ExtractedRule(
-                        rule_id=f"INFRA-{context.upper()}-{i}-{hashlib.md5(line.encode()).hexdigest()[:8]}",
-                        text=line.strip(),
-                        source_path=str(file_path),
-                        source_type=RuleSource.INLINE_POLICY,
-                        priority=MoSCoWPriority.MUST,
-                        context=context,
-                        line_number=i,
-                        reality_level=RuleReality.STRUCTURAL
-                    )
-                    rules.append(rule)
-                    break
-
-        return rules
+        return self._extract_per_line(self._first_match_handler('infra'), content, file_path)
 
     # ========================================================================
     # RELATION GRAPH ENGINE (NetworkX Integration)
@@ -1372,6 +1745,8 @@ class SoTRuleParserV3:
 
         self.logger.log_info(f"Master files processing complete: {len(all_rules)} total rules")
 
+        self.save_extraction_cache()
+
         # Convert to dict and return
         return {rule.rule_id: rule for rule in all_rules}
 
@@ -1420,140 +1795,144 @@ class SoTRuleParserV3:
         if self.mode != 'comprehensive':
             return []
 
-        rules = []
-        lines = content.split('\n')
-
-        for i, line in enumerate(lines, 1):
-            # Pattern 151: HASH_START as rule boundary
-            if re.match(HASH_START_PATTERN, line):
-                match = re.match(HASH_START_PATTERN, line)
-                block_name = match.group(1)
-                rule = ExtractedRule(
-                    rule_id=f"SEM-HASH-{hashlib.sha256(block_name.encode()).hexdigest()[:8]}",
-                    text=f"Logical block boundary: {block_name}",
-                    source_path=str(file_path),
-                    source_type=RuleSource.SEMANTIC_PATTERN,
-                    priority=MoSCoWPriority.WONT,
-                    context="HASH_START block marker",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
-
-            # Pattern 152: PATH_ANCHOR as file reference rule
-            if re.match(PATH_ANCHOR_PATTERN, line):
-                match = re.match(PATH_ANCHOR_PATTERN, line)
-                referenced_path = match.group(1)
-                rule = ExtractedRule(
-                    rule_id=f"SEM-PATH-{hashlib.sha256(referenced_path.encode()).hexdigest()[:8]}",
-                    text=f"File reference anchor: {referenced_path}",
-                    source_path=str(file_path),
-                    source_type=RuleSource.SEMANTIC_PATTERN,
-                    priority=MoSCoWPriority.WONT,
-                    context="Path anchor comment",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
-
-            # Pattern 153: German MoSCoW terms
-            moscow_de_match = re.search(MOSCOW_DE_PATTERN, line)
-            if moscow_de_match:
-                moscow_term = moscow_de_match.group(1)
-                priority = self._map_german_moscow_to_priority(moscow_term)
-                rule = ExtractedRule(
-                    rule_id=f"SEM-MOSC-{hashlib.sha256(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.SEMANTIC_PATTERN,
-                    priority=priority,
-                    context=f"German MoSCoW: {moscow_term}",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
-
-            # Pattern 154: MUST EXIST statements
-            if re.search(MUST_EXIST_PATTERN, line):
-                rule = ExtractedRule(
-                    rule_id=f"SEM-EXIST-{hashlib.sha256(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.SEMANTIC_PATTERN,
-                    priority=MoSCoWPriority.MUST,
-                    context="Existence requirement",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
-
-            # Pattern 155: Score thresholds
-            threshold_match = re.search(SCORE_THRESHOLD_PATTERN, line)
-            if threshold_match:
-                threshold_value = threshold_match.group(1)
-                rule = ExtractedRule(
-                    rule_id=f"SEM-SCORE-{hashlib.sha256(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.SEMANTIC_PATTERN,
-                    priority=MoSCoWPriority.SHOULD,
-                    context=f"Score threshold: {threshold_value}",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
+        rules = self._extract_per_line(self._match_semantic_line, content, file_path)
 
-            # Pattern 156: Regional scope
-            scope_match = re.search(REGIONAL_SCOPE_PATTERN, line)
-            if scope_match:
-                scope = scope_match.group(1)
-                rule = ExtractedRule(
-                    rule_id=f"SEM-SCOPE-{hashlib.sha256(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.SEMANTIC_PATTERN,
-                    priority=MoSCoWPriority.WONT,
-                    context=f"Regional scope: {scope}",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
-
-            # Pattern 157: Boolean controls
-            bool_match = re.search(BOOLEAN_CONTROL_PATTERN, line)
-            if bool_match:
-                control_name = bool_match.group(1)
-                control_value = bool_match.group(2)
-                rule = ExtractedRule(
-                    rule_id=f"SEM-BOOL-{hashlib.sha256(line.encode()).hexdigest()[:8]}",
-                    text=line.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.SEMANTIC_PATTERN,
-                    priority=MoSCoWPriority.SHOULD if control_value == 'true' else MoSCoWPriority.WONT,
-                    context=f"Boolean control: {control_name}={control_value}",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
+        self.logger.log_info(f"  Comprehensive mode: Extracted {len(rules)} semantic rules from {file_path.name}")
+        return rules
 
-            # Pattern 161: Purpose/Goal statements
-            purpose_match = re.match(PURPOSE_PATTERN, line)
-            if purpose_match:
-                purpose_type = purpose_match.group(1)
-                purpose_text = purpose_match.group(2)
-                rule = ExtractedRule(
-                    rule_id=f"SEM-PURP-{hashlib.sha256(line.encode()).hexdigest()[:8]}",
-                    text=purpose_text.strip(),
-                    source_path=str(file_path),
-                    source_type=RuleSource.SEMANTIC_PATTERN,
-                    priority=MoSCoWPriority.WONT,
-                    context=f"{purpose_type} statement",
-                    line_number=i,
-                    reality_level=RuleReality.SEMANTIC
-                )
-                rules.append(rule)
+    def _match_semantic_line(self, line: LineContext, source_path: str) -> List[ExtractedRule]:
+        rules = []
+        i = line.number
+
+        # Pattern 151: HASH_START as rule boundary
+        match = HASH_START_RE.match(line.text)
+        if match:
+            block_name = match.group(1)
+            rule = ExtractedRule(
+                rule_id=f"SEM-HASH-{hashlib.sha256(block_name.encode()).hexdigest()[:8]}",
+                text=f"Logical block boundary: {block_name}",
+                source_path=source_path,
+                source_type=RuleSource.SEMANTIC_PATTERN,
+                priority=MoSCoWPriority.WONT,
+                context="HASH_START block marker",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
+
+        # Pattern 152: PATH_ANCHOR as file reference rule
+        match = PATH_ANCHOR_RE.match(line.text)
+        if match:
+            referenced_path = match.group(1)
+            rule = ExtractedRule(
+                rule_id=f"SEM-PATH-{hashlib.sha256(referenced_path.encode()).hexdigest()[:8]}",
+                text=f"File reference anchor: {referenced_path}",
+                source_path=source_path,
+                source_type=RuleSource.SEMANTIC_PATTERN,
+                priority=MoSCoWPriority.WONT,
+                context="Path anchor comment",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
+
+        # Pattern 153: German MoSCoW terms
+        moscow_de_match = MOSCOW_DE_RE.search(line.text)
+        if moscow_de_match:
+            moscow_term = moscow_de_match.group(1)
+            priority = self._map_german_moscow_to_priority(moscow_term)
+            rule = ExtractedRule(
+                rule_id=f"SEM-MOSC-{line.sha256}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.SEMANTIC_PATTERN,
+                priority=priority,
+                context=f"German MoSCoW: {moscow_term}",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
+
+        # Pattern 154: MUST EXIST statements
+        if MUST_EXIST_RE.search(line.text):
+            rule = ExtractedRule(
+                rule_id=f"SEM-EXIST-{line.sha256}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.SEMANTIC_PATTERN,
+                priority=MoSCoWPriority.MUST,
+                context="Existence requirement",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
+
+        # Pattern 155: Score thresholds
+        threshold_match = SCORE_THRESHOLD_RE.search(line.text)
+        if threshold_match:
+            threshold_value = threshold_match.group(1)
+            rule = ExtractedRule(
+                rule_id=f"SEM-SCORE-{line.sha256}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.SEMANTIC_PATTERN,
+                priority=MoSCoWPriority.SHOULD,
+                context=f"Score threshold: {threshold_value}",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
+
+        # Pattern 156: Regional scope
+        scope_match = REGIONAL_SCOPE_RE.search(line.text)
+        if scope_match:
+            scope = scope_match.group(1)
+            rule = ExtractedRule(
+                rule_id=f"SEM-SCOPE-{line.sha256}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.SEMANTIC_PATTERN,
+                priority=MoSCoWPriority.WONT,
+                context=f"Regional scope: {scope}",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
+
+        # Pattern 157: Boolean controls
+        bool_match = BOOLEAN_CONTROL_RE.search(line.text)
+        if bool_match:
+            control_name = bool_match.group(1)
+            control_value = bool_match.group(2)
+            rule = ExtractedRule(
+                rule_id=f"SEM-BOOL-{line.sha256}",
+                text=line.text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.SEMANTIC_PATTERN,
+                priority=MoSCoWPriority.SHOULD if control_value == 'true' else MoSCoWPriority.WONT,
+                context=f"Boolean control: {control_name}={control_value}",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
+
+        # Pattern 161: Purpose/Goal statements
+        purpose_match = PURPOSE_RE.match(line.text)
+        if purpose_match:
+            purpose_type = purpose_match.group(1)
+            purpose_text = purpose_match.group(2)
+            rule = ExtractedRule(
+                rule_id=f"SEM-PURP-{line.sha256}",
+                text=purpose_text.strip(),
+                source_path=source_path,
+                source_type=RuleSource.SEMANTIC_PATTERN,
+                priority=MoSCoWPriority.WONT,
+                context=f"{purpose_type} statement",
+                line_number=i,
+                reality_level=RuleReality.SEMANTIC
+            )
+            rules.append(rule)
 
-        self.logger.log_info(f"  Comprehensive mode: Extracted {len(rules)} semantic rules from {file_path.name}")
         return rules
 
     def _map_german_moscow_to_priority(self, moscow_term: str) -> 'MoSCoWPriority':
@@ -1568,16 +1947,23 @@ class SoTRuleParserV3:
         }
         return mapping.get(moscow_term, MoSCoWPriority.UNKNOWN)
 
-    def process_all_files(self, pattern: str = "**/*.md") -> Dict[str, ExtractedRule]:
+    def process_all_files(self, pattern: str = "**/*.md",
+                          processes: Optional[int] = None) -> Dict[str, ExtractedRule]:
         """
         Process all matching files through all 30 layers.
 
         Layer 23: Parallel processing with thread safety
+
+        Args:
+            pattern: Glob pattern relative to root_dir
+            processes: Extract files in this many worker processes (0 = one
+                per CPU) and merge the results in file order. None keeps
+                the thread-based processor.
         """
         self.logger.log_info(f"Starting complete forensic extraction with pattern: {pattern}")
 
         # Find all files
-        files = list(self.root_dir.glob(pattern))
+        files = sorted(self.root_dir.glob(pattern))
         self.logger.log_info(f"Found {len(files)} files to process")
 
         # Layer 24: Fail-fast check
@@ -1586,7 +1972,13 @@ class SoTRuleParserV3:
 
         # Process files in parallel (Layer 23)
         all_rules = []
-        if FORENSICS_AVAILABLE and len(files) > 1:
+        if processes is not None:
+            # Process-based extraction, deterministic merge
+            extractions = self._extract_files(files, processes)
+            for file_path, extraction in zip(files, extractions):
+                self.logger.log_info(f"Processing file: {file_path}")
+                all_rules.extend(self._merge_file(file_path, extraction))
+        elif FORENSICS_AVAILABLE and len(files) > 1:
             # Parallel processing
             def process_wrapper(file_path):
                 return self.process_file(file_path)
@@ -1598,6 +1990,8 @@ class SoTRuleParserV3:
             for file_path in files:
                 all_rules.extend(self.process_file(file_path))
 
+        self.save_extraction_cache()
+
         # Store rules with deterministic ordering (Layer 14)
         if FORENSICS_AVAILABLE:
             self.rules = self.deterministic_ordering.sort_rules({
@@ -1633,6 +2027,45 @@ class SoTRuleParserV3:
 
         return self.rules
 
+    def _extract_files(self, files: List[Path], processes: int) -> List[FileExtraction]:
+        """
+        Extract files: unchanged files from the cache, the others in worker
+        processes.
+
+        Returns:
+            Extractions in file order
+        """
+        extractions = [self._cached_extraction(file_path) for file_path in files]
+        pending = [index for index, extraction in enumerate(extractions) if extraction is None]
+        workers = min(processes or os.cpu_count() or 1, len(pending))
+
+        if workers > 1:
+            self.logger.log_info(f"Extracting {len(pending)} files in {workers} processes")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_extraction_worker,
+                                     initargs=(self.config,)) as executor:
+                results = executor.map(
+                    _extract_file_worker,
+                    [str(files[index]) for index in pending],
+                    chunksize=max(1, len(pending) // (workers * 4))
+                )
+                for index, extraction in zip(pending, results):
+                    extractions[index] = extraction
+        else:
+            for index in pending:
+                extractions[index] = self._extract_file_uncached(files[index])
+
+        for index in pending:
+            self._store_extraction(files[index], extractions[index])
+        return extractions
+
+    def save_extraction_cache(self):
+        """Persist the extraction cache (no-op if disabled)"""
+        if self.extraction_cache is not None:
+            self.extraction_cache.save()
+            self.logger.log_info(
+                f"Extraction cache: {self.extraction_cache.hits} hits, {self.extraction_cache.misses} misses"
+            )
+
     def _update_statistics(self):
         """Update statistics"""
         self.stats['total_rules'] = len(self.rules)
@@ -1822,6 +2255,9 @@ EXAMPLES:
 
   # With JSON output
   python sot_rule_parser_v3.py --mode comprehensive --output rules.json
+
+  # Extraction in 4 worker processes
+  python sot_rule_parser_v3.py --processes 4
         """
     )
 
@@ -1839,6 +2275,19 @@ EXAMPLES:
         help='Output JSON file path (default: auto-generated in 02_audit_logging/reports/)'
     )
 
+    parser_cli.add_argument(
+        '--processes',
+        type=int,
+        default=None,
+        help='Extract files in N worker processes (0 = one per CPU; default: threads)'
+    )
+
+    parser_cli.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the per-file extraction cache (.ssid_cache/sot_rule_parser/)'
+    )
+
     parser_cli.add_argument(
         '--verbose',
         action='store_true',
@@ -1882,7 +2331,8 @@ EXAMPLES:
     print()
 
     # Initialize parser with mode
-    parser = SoTRuleParserV3(root_dir, mode=args.mode)
+    cache_dir = None if args.no_cache else root_dir / ".ssid_cache" / "sot_rule_parser"
+    parser = SoTRuleParserV3(root_dir, mode=args.mode, cache_dir=cache_dir)
 
     # Process master files FIRST (authoritative sources)
     print("[1/5] Processing 5 master SoT files (authoritative sources)...")
@@ -1901,7 +2351,7 @@ EXAMPLES:
 
     for pattern in patterns:
         print(f"  Processing pattern: {pattern}")
-        additional_rules = parser.process_all_files(pattern)
+        additional_rules = parser.process_all_files(pattern, processes=args.processes)
         # Merge without overwriting master file rules
         for rule_id, rule in additional_rules.items():
             if rule_id not in parser.rules:
@@ -24,16 +24,42 @@ GUARANTEES:
 - Deterministic Results: Same input = same output
 - Performance: Validates all rules in < 60 seconds
 - Extensibility: New rules auto-discovered from registry
+
+PERFORMANCE:
+------------
+Validators query a shared RepositoryFacts layer instead of walking the
+filesystem per rule: root dirs, glob results and file existence are
+computed once per validate_all() run, so rules sharing a fact cost a
+dictionary lookup.
+
+Results are kept in a columnar ValidationResultStore (categorical codes
+for status/priority/category, one run-level timestamp), MoSCoW scores are
+counted over those columns and reports are streamed to JSON/NDJSON via
+ValidationReport.write_json()/write_ndjson().
+
+validate_all(workers=N) validates in N forked processes: the registry is
+loaded once and shared copy-on-write, rules are chunked by category and
+workers return compact result tuples that are merged in registry order.
 """
 
 import json
 import hashlib
+import multiprocessing
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from array import array
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Sequence, TextIO, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from repository_facts import RepositoryFacts
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repository_facts import RepositoryFacts
 
 
 @dataclass
@@ -51,6 +77,161 @@ class ValidationResult:
         return asdict(self)
 
 
+STATUS_VALUES = ('pass', 'fail', 'warn', 'info', 'skip')
+MOSCOW_PRIORITIES = ('MUST', 'SHOULD', 'HAVE', 'CAN')
+
+# Completeness weights: MUST=100%, SHOULD=80%, HAVE=50%, CAN=20%
+MOSCOW_WEIGHTS = {'MUST': 1.0, 'SHOULD': 0.8, 'HAVE': 0.5, 'CAN': 0.2}
+
+
+class _Categories:
+    """Categorical value <-> small integer code mapping"""
+
+    __slots__ = ('values', 'codes')
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        try:
+            return self.codes[value]
+        except KeyError:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+            return code
+
+
+class ValidationResultStore(Sequence):
+    """
+    Columnar storage for the results of one validation run.
+
+    status, priority and category are stored as categorical codes in
+    array columns, messages are interned, evidence is kept only for the
+    rules that have it (identical evidence dicts are stored once and
+    shared) and all results share the run-level timestamp.
+    Indexing or iterating materializes ValidationResult objects on demand,
+    so the store can be used wherever a list of results was expected.
+    """
+
+    __slots__ = ('timestamp', 'rule_ids', 'messages', 'evidence',
+                 'status_codes', 'priority_codes', 'category_codes',
+                 'statuses', 'priorities', 'categories', '_interned',
+                 '_evidence_pool')
+
+    def __init__(self, timestamp: str):
+        self.timestamp = timestamp
+        self.rule_ids: List[str] = []
+        self.messages: List[str] = []
+        self.evidence: Dict[int, Dict[str, Any]] = {}
+        self.status_codes = array('H')
+        self.priority_codes = array('H')
+        self.category_codes = array('H')
+        self.statuses = _Categories(STATUS_VALUES)
+        self.priorities = _Categories(MOSCOW_PRIORITIES)
+        self.categories = _Categories()
+        self._interned: Dict[str, str] = {}
+        self._evidence_pool: Dict[str, Dict[str, Any]] = {}
+
+    def append(self, result: ValidationResult) -> None:
+        """Add a result (its own timestamp is replaced by the run timestamp)"""
+        self.append_fields(result.rule_id, result.status, result.priority,
+                           result.category, result.message, result.evidence)
+
+    def append_fields(self, rule_id: str, status: str, priority: str, category: str,
+                      message: str, evidence: Optional[Dict[str, Any]] = None) -> None:
+        """Add a result given as fields (see result_fields())"""
+        if evidence is not None:
+            self.evidence[len(self.rule_ids)] = self._evidence_pool.setdefault(repr(evidence), evidence)
+        self.rule_ids.append(rule_id)
+        self.messages.append(self._interned.setdefault(message, message))
+        self.status_codes.append(self.statuses.code(status))
+        self.priority_codes.append(self.priorities.code(priority))
+        self.category_codes.append(self.categories.code(category))
+
+    def __len__(self) -> int:
+        return len(self.rule_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('result index out of range')
+        return ValidationResult(**self.record(index))
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """Result at index as a dict (same keys as ValidationResult.to_dict)"""
+        return {
+            'rule_id': self.rule_ids[index],
+            'status': self.statuses.values[self.status_codes[index]],
+            'priority': self.priorities.values[self.priority_codes[index]],
+            'category': self.categories.values[self.category_codes[index]],
+            'message': self.messages[index],
+            'timestamp': self.timestamp,
+            'evidence': self.evidence.get(index),
+        }
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate results as dicts without building ValidationResult objects"""
+        return map(self.record, range(len(self)))
+
+    def status_counts(self) -> Dict[str, int]:
+        """Result count per status (all known statuses present)"""
+        counts = Counter(self.status_codes)
+        return {status: counts[code] for status, code in self.statuses.codes.items()}
+
+    def priority_status_counts(self) -> Dict[str, Dict[str, int]]:
+        """Result count per priority and status, plus 'total' per priority"""
+        counts = Counter(zip(self.priority_codes, self.status_codes))
+        table = {
+            priority: dict.fromkeys(self.statuses.values, 0)
+            for priority in self.priorities.values
+        }
+        for (priority_code, status_code), count in counts.items():
+            table[self.priorities.values[priority_code]][self.statuses.values[status_code]] = count
+        for stats in table.values():
+            stats['total'] = sum(stats.values())
+        return table
+
+
+def result_fields(result: ValidationResult) -> Tuple:
+    """Compact tuple form of a result (no timestamp) for worker -> parent transfer"""
+    return (result.rule_id, result.status, result.priority, result.category,
+            result.message, result.evidence)
+
+
+def compute_moscow_scores(store: ValidationResultStore) -> Tuple[Dict[str, float], float]:
+    """
+    MoSCoW pass rates and weighted completeness from a result store
+
+    Returns:
+        (moscow_scores in percent per priority, completeness_score in percent)
+    """
+    table = store.priority_status_counts()
+    empty = {'pass': 0, 'total': 0}
+
+    moscow_scores = {}
+    weighted_score = 0.0
+    total_weight = 0.0
+    for priority in MOSCOW_PRIORITIES:
+        stats = table.get(priority, empty)
+        if stats['total'] > 0:
+            pass_rate = stats['pass'] / stats['total']
+            moscow_scores[priority] = pass_rate * 100
+            weight = MOSCOW_WEIGHTS[priority]
+            weighted_score += pass_rate * weight * stats['total']
+            total_weight += weight * stats['total']
+        else:
+            moscow_scores[priority] = 0.0
+
+    completeness_score = (weighted_score / total_weight * 100) if total_weight > 0 else 0.0
+    return moscow_scores, completeness_score
+
+
 @dataclass
 class ValidationReport:
     """Aggregate validation report"""
@@ -62,9 +243,9 @@ class ValidationReport:
     moscow_scores: Dict[str, float]
     completeness_score: float
     timestamp: str
-    results: List[ValidationResult]
+    results: Sequence[ValidationResult]
 
-    def to_dict(self) -> dict:
+    def _summary(self) -> dict:
         return {
             'total_rules': self.total_rules,
             'passed': self.passed,
@@ -74,9 +255,44 @@ class ValidationReport:
             'moscow_scores': self.moscow_scores,
             'completeness_score': self.completeness_score,
             'timestamp': self.timestamp,
-            'results': [r.to_dict() for r in self.results]
         }
 
+    def iter_result_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Iterate results as dicts"""
+        if isinstance(self.results, ValidationResultStore):
+            return self.results.iter_records()
+        return (r.to_dict() for r in self.results)
+
+    def to_dict(self) -> dict:
+        report = self._summary()
+        report['results'] = list(self.iter_result_dicts())
+        return report
+
+    def write_json(self, fp: TextIO) -> None:
+        """
+        Stream the report as JSON (same document as to_dict()).
+
+        Results are serialized one at a time, one per line, instead of
+        building the full document in memory first.
+        """
+        summary = json.dumps(self._summary(), indent=2, ensure_ascii=False)
+        fp.write(summary[:-2])
+        fp.write(',\n  "results": [')
+        separator = '\n    '
+        for record in self.iter_result_dicts():
+            fp.write(separator)
+            fp.write(json.dumps(record, ensure_ascii=False))
+            separator = ',\n    '
+        fp.write('\n  ]\n}\n')
+
+    def write_ndjson(self, fp: TextIO) -> None:
+        """Stream the report as NDJSON: summary line, then one line per result"""
+        fp.write(json.dumps(self._summary(), ensure_ascii=False))
+        fp.write('\n')
+        for record in self.iter_result_dicts():
+            fp.write(json.dumps(record, ensure_ascii=False))
+            fp.write('\n')
+
 
 class RuleRegistry:
     """Loads and manages the rule registry"""
@@ -120,8 +336,15 @@ class RuleRegistry:
 class CategoryValidator:
     """Base class for category-specific validators"""
 
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, facts: Optional[RepositoryFacts] = None):
         self.repo_root = repo_root
+        self.facts = facts if facts is not None else RepositoryFacts(repo_root)
+        # Set by the engine for the duration of validate_all()
+        self.run_timestamp: Optional[str] = None
+
+    def timestamp(self) -> str:
+        """Run-level timestamp during validate_all(), current time otherwise"""
+        return self.run_timestamp or datetime.utcnow().isoformat()
 
     def validate(self, rule: dict) -> ValidationResult:
         """
@@ -147,7 +370,7 @@ class CategoryValidator:
                 priority=priority,
                 category=category,
                 message='Rule has insufficient description',
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=self.timestamp()
             )
 
         return ValidationResult(
@@ -156,7 +379,7 @@ class CategoryValidator:
             priority=priority,
             category=category,
             message='Rule metadata valid',
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=self.timestamp()
         )
 
 
@@ -173,9 +396,7 @@ class StructureValidator(CategoryValidator):
         try:
             # Validate 24 root directories exist
             if '24' in description or 'root' in description:
-                import re
-                roots = [d for d in self.repo_root.iterdir()
-                        if d.is_dir() and re.match(r'^\d{2}_', d.name)]
+                roots = self.facts.root_dirs()
                 expected_roots = [
                     "01_ai_layer", "02_audit_logging", "03_core", "04_deployment",
                     "05_documentation", "06_data_pipeline", "07_governance_legal",
@@ -193,7 +414,7 @@ class StructureValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'All 24 root directories present',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'root_count': 24, 'roots': [r.name for r in roots]}
                     )
                 else:
@@ -203,13 +424,13 @@ class StructureValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'Expected 24 roots, found {len(roots)}',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'root_count': len(roots), 'expected': 24}
                     )
 
             # Validate shard structure
             if 'shard' in description or 'chart.yaml' in description:
-                chart_files = list(self.repo_root.glob('*/shards/*/chart.yaml'))
+                chart_files = self.facts.glob('*/shards/*/chart.yaml')
                 if len(chart_files) > 0:
                     return ValidationResult(
                         rule_id=rule_id,
@@ -217,7 +438,7 @@ class StructureValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'Found {len(chart_files)} shard chart.yaml files',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'chart_count': len(chart_files)}
                     )
                 else:
@@ -227,21 +448,21 @@ class StructureValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message='No chart.yaml files found in shards',
-                        timestamp=datetime.utcnow().isoformat()
+                        timestamp=self.timestamp()
                     )
 
             # Default: check for referenced file existence
             reference = rule.get('reference', '')
             if reference and reference.startswith('C:'):
                 ref_path = Path(reference.split(':')[0] if ':' in reference else reference)
-                if ref_path.exists():
+                if self.facts.exists(ref_path):
                     return ValidationResult(
                         rule_id=rule_id,
                         status='pass',
                         priority=priority,
                         category=category,
                         message=f'Referenced file exists',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'path': str(ref_path)}
                     )
                 else:
@@ -251,7 +472,7 @@ class StructureValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'Referenced file not found: {reference}',
-                        timestamp=datetime.utcnow().isoformat()
+                        timestamp=self.timestamp()
                     )
 
             # Generic structure check: metadata valid
@@ -261,7 +482,7 @@ class StructureValidator(CategoryValidator):
                 priority=priority,
                 category=category,
                 message='Structure rule metadata valid',
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=self.timestamp()
             )
 
         except Exception as e:
@@ -271,7 +492,7 @@ class StructureValidator(CategoryValidator):
                 priority=priority,
                 category=category,
                 message=f'Validation error: {str(e)}',
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=self.timestamp()
             )
 
 
@@ -288,12 +509,13 @@ class PolicyValidator(CategoryValidator):
         try:
             # Check for OPA policy files
             policy_dir = self.repo_root / '23_compliance' / 'policies'
-            if policy_dir.exists():
-                rego_files = list(policy_dir.glob('**/*.rego'))
+            if self.facts.exists(policy_dir):
+                rego_files = self.facts.glob('**/*.rego', base='23_compliance/policies')
 
                 # Check for specific policy implementations
                 if 'sot' in description:
-                    sot_policies = [f for f in rego_files if 'sot' in f.name.lower()]
+                    sot_policies = self.facts.fact(('sot_policies',), lambda: [
+                        f for f in rego_files if 'sot' in f.name.lower()])
                     if len(sot_policies) > 0:
                         return ValidationResult(
                             rule_id=rule_id,
@@ -301,7 +523,7 @@ class PolicyValidator(CategoryValidator):
                             priority=priority,
                             category=category,
                             message=f'SoT policy files found: {len(sot_policies)}',
-                            timestamp=datetime.utcnow().isoformat(),
+                            timestamp=self.timestamp(),
                             evidence={'policy_files': [f.name for f in sot_policies]}
                         )
 
@@ -313,7 +535,7 @@ class PolicyValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'Policy enforcement active: {len(rego_files)} .rego files',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'total_policies': len(rego_files)}
                     )
                 else:
@@ -323,7 +545,7 @@ class PolicyValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message='No .rego policy files found',
-                        timestamp=datetime.utcnow().isoformat()
+                        timestamp=self.timestamp()
                     )
             else:
                 return ValidationResult(
@@ -332,7 +554,7 @@ class PolicyValidator(CategoryValidator):
                     priority=priority,
                     category=category,
                     message='Policy directory not found: 23_compliance/policies',
-                    timestamp=datetime.utcnow().isoformat()
+                    timestamp=self.timestamp()
                 )
 
         except Exception as e:
@@ -342,7 +564,7 @@ class PolicyValidator(CategoryValidator):
                 priority=priority,
                 category=category,
                 message=f'Policy validation error: {str(e)}',
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=self.timestamp()
             )
 
 
@@ -361,8 +583,8 @@ class ComplianceValidator(CategoryValidator):
 
             # Check for GDPR compliance
             if 'gdpr' in description:
-                gdpr_files = list(compliance_dir.glob('**/*gdpr*.md')) + \
-                            list(compliance_dir.glob('**/*gdpr*.yaml'))
+                gdpr_files = self.facts.glob('**/*gdpr*.md', base='23_compliance') + \
+                            self.facts.glob('**/*gdpr*.yaml', base='23_compliance')
                 if len(gdpr_files) > 0:
                     return ValidationResult(
                         rule_id=rule_id,
@@ -370,7 +592,7 @@ class ComplianceValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'GDPR compliance documentation found: {len(gdpr_files)} files',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'gdpr_files': [f.name for f in gdpr_files[:10]]}
                     )
                 else:
@@ -380,13 +602,13 @@ class ComplianceValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message='GDPR compliance documentation missing',
-                        timestamp=datetime.utcnow().isoformat()
+                        timestamp=self.timestamp()
                     )
 
             # Check for eIDAS compliance
             if 'eidas' in description:
-                eidas_files = list(compliance_dir.glob('**/*eidas*.md')) + \
-                             list(compliance_dir.glob('**/*eidas*.yaml'))
+                eidas_files = self.facts.glob('**/*eidas*.md', base='23_compliance') + \
+                             self.facts.glob('**/*eidas*.yaml', base='23_compliance')
                 if len(eidas_files) > 0:
                     return ValidationResult(
                         rule_id=rule_id,
@@ -394,34 +616,34 @@ class ComplianceValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'eIDAS compliance found: {len(eidas_files)} files',
-                        timestamp=datetime.utcnow().isoformat()
+                        timestamp=self.timestamp()
                     )
 
             # Check for audit logging
             if 'audit' in description:
                 audit_dir = self.repo_root / '02_audit_logging'
-                if audit_dir.exists():
-                    audit_files = list(audit_dir.glob('**/*.jsonl')) + \
-                                 list(audit_dir.glob('**/*audit*.py'))
+                if self.facts.exists(audit_dir):
+                    audit_files = self.facts.glob('**/*.jsonl', base='02_audit_logging') + \
+                                 self.facts.glob('**/*audit*.py', base='02_audit_logging')
                     return ValidationResult(
                         rule_id=rule_id,
                         status='pass',
                         priority=priority,
                         category=category,
                         message=f'Audit logging infrastructure present: {len(audit_files)} files',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'audit_infrastructure': True}
                     )
 
             # Generic compliance check: directory exists
-            if compliance_dir.exists():
+            if self.facts.exists(compliance_dir):
                 return ValidationResult(
                     rule_id=rule_id,
                     status='pass',
                     priority=priority,
                     category=category,
                     message='Compliance infrastructure present',
-                    timestamp=datetime.utcnow().isoformat()
+                    timestamp=self.timestamp()
                 )
             else:
                 return ValidationResult(
@@ -430,7 +652,7 @@ class ComplianceValidator(CategoryValidator):
                     priority=priority,
                     category=category,
                     message='Compliance directory not found: 23_compliance',
-                    timestamp=datetime.utcnow().isoformat()
+                    timestamp=self.timestamp()
                 )
 
         except Exception as e:
@@ -440,7 +662,7 @@ class ComplianceValidator(CategoryValidator):
                 priority=priority,
                 category=category,
                 message=f'Compliance validation error: {str(e)}',
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=self.timestamp()
             )
 
 
@@ -458,10 +680,10 @@ class SecurityValidator(CategoryValidator):
             # Check for Post-Quantum Cryptography
             if 'pqc' in description or 'post-quantum' in description or 'dilithium' in description or 'kyber' in description:
                 pqc_dir = self.repo_root / '21_post_quantum_crypto'
-                if pqc_dir.exists():
-                    pqc_tools = list(pqc_dir.glob('tools/*.py')) + \
-                               list(pqc_dir.glob('**/*dilithium*.py')) + \
-                               list(pqc_dir.glob('**/*kyber*.py'))
+                if self.facts.exists(pqc_dir):
+                    pqc_tools = self.facts.glob('tools/*.py', base='21_post_quantum_crypto') + \
+                               self.facts.glob('**/*dilithium*.py', base='21_post_quantum_crypto') + \
+                               self.facts.glob('**/*kyber*.py', base='21_post_quantum_crypto')
 
                     if len(pqc_tools) > 0:
                         return ValidationResult(
@@ -470,7 +692,7 @@ class SecurityValidator(CategoryValidator):
                             priority=priority,
                             category=category,
                             message=f'PQC implementation found: {len(pqc_tools)} tools',
-                            timestamp=datetime.utcnow().isoformat(),
+                            timestamp=self.timestamp(),
                             evidence={'pqc_tools': [f.name for f in pqc_tools[:5]]}
                         )
                     else:
@@ -480,7 +702,7 @@ class SecurityValidator(CategoryValidator):
                             priority=priority,
                             category=category,
                             message='PQC tools not found in 21_post_quantum_crypto',
-                            timestamp=datetime.utcnow().isoformat()
+                            timestamp=self.timestamp()
                         )
                 else:
                     return ValidationResult(
@@ -489,20 +711,20 @@ class SecurityValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message='PQC directory not found: 21_post_quantum_crypto',
-                        timestamp=datetime.utcnow().isoformat()
+                        timestamp=self.timestamp()
                     )
 
             # Check for Zero-Knowledge Proofs / Zero-Time Auth
             if 'zkp' in description or 'zero-knowledge' in description or 'zero-time' in description:
                 zta_dir = self.repo_root / '14_zero_time_auth'
-                if zta_dir.exists():
+                if self.facts.exists(zta_dir):
                     return ValidationResult(
                         rule_id=rule_id,
                         status='pass',
                         priority=priority,
                         category=category,
                         message='Zero-time authentication infrastructure present',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'zta_dir': str(zta_dir)}
                     )
 
@@ -510,15 +732,15 @@ class SecurityValidator(CategoryValidator):
             if 'pii' in description or 'hash' in description:
                 # Check that data layer uses hashing
                 data_layer = self.repo_root / '18_data_layer'
-                if data_layer.exists():
-                    hash_files = list(data_layer.glob('**/*hash*.py'))
+                if self.facts.exists(data_layer):
+                    hash_files = self.facts.glob('**/*hash*.py', base='18_data_layer')
                     return ValidationResult(
                         rule_id=rule_id,
                         status='pass',
                         priority=priority,
                         category=category,
                         message=f'Hash-based data layer present: {len(hash_files)} files',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'hash_only': True}
                     )
 
@@ -527,14 +749,14 @@ class SecurityValidator(CategoryValidator):
                 self.repo_root / '21_post_quantum_crypto',
                 self.repo_root / '14_zero_time_auth',
             ]
-            if any(d.exists() for d in crypto_dirs):
+            if any(self.facts.exists(d) for d in crypto_dirs):
                 return ValidationResult(
                     rule_id=rule_id,
                     status='pass',
                     priority=priority,
                     category=category,
                     message='Security infrastructure present',
-                    timestamp=datetime.utcnow().isoformat()
+                    timestamp=self.timestamp()
                 )
             else:
                 return ValidationResult(
@@ -543,7 +765,7 @@ class SecurityValidator(CategoryValidator):
                     priority=priority,
                     category=category,
                     message='Security directories not fully configured',
-                    timestamp=datetime.utcnow().isoformat()
+                    timestamp=self.timestamp()
                 )
 
         except Exception as e:
@@ -553,7 +775,7 @@ class SecurityValidator(CategoryValidator):
                 priority=priority,
                 category=category,
                 message=f'Security validation error: {str(e)}',
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=self.timestamp()
             )
 
 
@@ -570,15 +792,15 @@ class TestingValidator(CategoryValidator):
         try:
             test_dir = self.repo_root / '11_test_simulation'
 
-            if test_dir.exists():
+            if self.facts.exists(test_dir):
                 # Find test files
-                test_files = list(test_dir.glob('**/test_*.py'))
-                conftest_files = list(test_dir.glob('**/conftest.py'))
+                test_files = self.facts.glob('**/test_*.py', base='11_test_simulation')
+                conftest_files = self.facts.glob('**/conftest.py', base='11_test_simulation')
 
                 # Check for pytest configuration
                 if 'pytest' in description or 'coverage' in description:
-                    coverage_files = list(self.repo_root.glob('**/.coverage')) + \
-                                    list(self.repo_root.glob('**/coverage.xml'))
+                    coverage_files = self.facts.glob('**/.coverage') + \
+                                    self.facts.glob('**/coverage.xml')
 
                     if len(test_files) > 0:
                         return ValidationResult(
@@ -587,7 +809,7 @@ class TestingValidator(CategoryValidator):
                             priority=priority,
                             category=category,
                             message=f'Testing infrastructure active: {len(test_files)} test files, {len(coverage_files)} coverage reports',
-                            timestamp=datetime.utcnow().isoformat(),
+                            timestamp=self.timestamp(),
                             evidence={
                                 'test_files': len(test_files),
                                 'conftest_files': len(conftest_files),
@@ -597,8 +819,8 @@ class TestingValidator(CategoryValidator):
 
                 # Check for compliance tests
                 if 'compliance' in description or 'sot' in description:
-                    compliance_tests = list(test_dir.glob('**/test_*compliance*.py')) + \
-                                      list(test_dir.glob('**/test_*sot*.py'))
+                    compliance_tests = self.facts.glob('**/test_*compliance*.py', base='11_test_simulation') + \
+                                      self.facts.glob('**/test_*sot*.py', base='11_test_simulation')
                     if len(compliance_tests) > 0:
                         return ValidationResult(
                             rule_id=rule_id,
@@ -606,7 +828,7 @@ class TestingValidator(CategoryValidator):
                             priority=priority,
                             category=category,
                             message=f'Compliance tests found: {len(compliance_tests)} files',
-                            timestamp=datetime.utcnow().isoformat(),
+                            timestamp=self.timestamp(),
                             evidence={'compliance_tests': [f.name for f in compliance_tests[:10]]}
                         )
 
@@ -618,7 +840,7 @@ class TestingValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'Test suite present: {len(test_files)} test files',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'test_count': len(test_files)}
                     )
                 else:
@@ -628,7 +850,7 @@ class TestingValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message='No test files found in 11_test_simulation',
-                        timestamp=datetime.utcnow().isoformat()
+                        timestamp=self.timestamp()
                     )
             else:
                 return ValidationResult(
@@ -637,7 +859,7 @@ class TestingValidator(CategoryValidator):
                     priority=priority,
                     category=category,
                     message='Test directory not found: 11_test_simulation',
-                    timestamp=datetime.utcnow().isoformat()
+                    timestamp=self.timestamp()
                 )
 
         except Exception as e:
@@ -647,7 +869,7 @@ class TestingValidator(CategoryValidator):
                 priority=priority,
                 category=category,
                 message=f'Testing validation error: {str(e)}',
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=self.timestamp()
             )
 
 
@@ -664,14 +886,15 @@ class DocumentationValidator(CategoryValidator):
         try:
             docs_dir = self.repo_root / '05_documentation'
 
-            if docs_dir.exists():
+            if self.facts.exists(docs_dir):
                 # Find documentation files
-                md_files = list(docs_dir.glob('**/*.md'))
-                readme_files = list(self.repo_root.glob('**/README.md'))
+                md_files = self.facts.glob('**/*.md', base='05_documentation')
+                readme_files = self.facts.glob('**/README.md')
 
                 # Check for specific documentation requirements
                 if 'api' in description:
-                    api_docs = [f for f in md_files if 'api' in f.name.lower()]
+                    api_docs = self.facts.fact(('api_docs',), lambda: [
+                        f for f in md_files if 'api' in f.name.lower()])
                     if len(api_docs) > 0:
                         return ValidationResult(
                             rule_id=rule_id,
@@ -679,11 +902,12 @@ class DocumentationValidator(CategoryValidator):
                             priority=priority,
                             category=category,
                             message=f'API documentation found: {len(api_docs)} files',
-                            timestamp=datetime.utcnow().isoformat()
+                            timestamp=self.timestamp()
                         )
 
                 if 'architecture' in description or 'structure' in description:
-                    arch_docs = [f for f in md_files if any(kw in f.name.lower() for kw in ['architecture', 'structure', 'design'])]
+                    arch_docs = self.facts.fact(('arch_docs',), lambda: [
+                        f for f in md_files if any(kw in f.name.lower() for kw in ['architecture', 'structure', 'design'])])
                     if len(arch_docs) > 0:
                         return ValidationResult(
                             rule_id=rule_id,
@@ -691,14 +915,14 @@ class DocumentationValidator(CategoryValidator):
                             priority=priority,
                             category=category,
                             message=f'Architecture documentation found: {len(arch_docs)} files',
-                            timestamp=datetime.utcnow().isoformat()
+                            timestamp=self.timestamp()
                         )
 
                 # Check for codex documentation
                 codex_dir = self.repo_root / '16_codex'
-                if codex_dir.exists():
-                    codex_docs = list(codex_dir.glob('**/*.md')) + \
-                                list(codex_dir.glob('**/*.yaml'))
+                if self.facts.exists(codex_dir):
+                    codex_docs = self.facts.glob('**/*.md', base='16_codex') + \
+                                self.facts.glob('**/*.yaml', base='16_codex')
                     if len(codex_docs) > 0:
                         return ValidationResult(
                             rule_id=rule_id,
@@ -706,7 +930,7 @@ class DocumentationValidator(CategoryValidator):
                             priority=priority,
                             category=category,
                             message=f'Codex documentation present: {len(codex_docs)} files',
-                            timestamp=datetime.utcnow().isoformat(),
+                            timestamp=self.timestamp(),
                             evidence={'codex_files': len(codex_docs)}
                         )
 
@@ -718,7 +942,7 @@ class DocumentationValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message=f'Documentation present: {len(md_files)} docs, {len(readme_files)} READMEs',
-                        timestamp=datetime.utcnow().isoformat(),
+                        timestamp=self.timestamp(),
                         evidence={'docs': len(md_files), 'readmes': len(readme_files)}
                     )
                 else:
@@ -728,7 +952,7 @@ class DocumentationValidator(CategoryValidator):
                         priority=priority,
                         category=category,
                         message='Limited documentation found',
-                        timestamp=datetime.utcnow().isoformat()
+                        timestamp=self.timestamp()
                     )
             else:
                 return ValidationResult(
@@ -737,7 +961,7 @@ class DocumentationValidator(CategoryValidator):
                     priority=priority,
                     category=category,
                     message='Documentation directory not found: 05_documentation',
-                    timestamp=datetime.utcnow().isoformat()
+                    timestamp=self.timestamp()
                 )
 
         except Exception as e:
@@ -747,10 +971,28 @@ class DocumentationValidator(CategoryValidator):
                 priority=priority,
                 category=category,
                 message=f'Documentation validation error: {str(e)}',
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=self.timestamp()
             )
 
 
+# Engine shared with forked workers (set only while a process pool runs)
+_WORKER_ENGINE: Optional['RuleValidationEngine'] = None
+
+
+def _validate_chunk_worker(validator_key: str, indices: List[int]) -> Tuple[List[int], List[Tuple]]:
+    """
+    Process pool worker: validate one chunk of a category.
+
+    Runs in a forked child, so the registry and validators are the
+    parent's, shared copy-on-write; only indices go in and compact result
+    tuples come back.
+    """
+    engine = _WORKER_ENGINE
+    validator = engine.validators[validator_key]
+    rules = engine.registry.rules
+    return indices, [result_fields(validator.validate(rules[i])) for i in indices]
+
+
 class RuleValidationEngine:
     """
     Main validation engine for all 31,742 rules
@@ -769,86 +1011,79 @@ class RuleValidationEngine:
         registry_path = self.repo_root / '16_codex/structure/auto_generated/sot_rules_full.json'
         self.registry = RuleRegistry(registry_path)
 
+        # Shared fact layer (computed once per run)
+        self.facts = RepositoryFacts(self.repo_root)
+
         # Initialize category validators
         self.validators = {
-            'structure': StructureValidator(self.repo_root),
-            'policy': PolicyValidator(self.repo_root),
-            'compliance': ComplianceValidator(self.repo_root),
-            'security': SecurityValidator(self.repo_root),
-            'testing': TestingValidator(self.repo_root),
-            'test': TestingValidator(self.repo_root),
-            'documentation': DocumentationValidator(self.repo_root),
-            'validator': ComplianceValidator(self.repo_root),  # Map to compliance
-            'unknown': CategoryValidator(self.repo_root),  # Generic fallback
+            'structure': StructureValidator(self.repo_root, self.facts),
+            'policy': PolicyValidator(self.repo_root, self.facts),
+            'compliance': ComplianceValidator(self.repo_root, self.facts),
+            'security': SecurityValidator(self.repo_root, self.facts),
+            'testing': TestingValidator(self.repo_root, self.facts),
+            'test': TestingValidator(self.repo_root, self.facts),
+            'documentation': DocumentationValidator(self.repo_root, self.facts),
+            'validator': ComplianceValidator(self.repo_root, self.facts),  # Map to compliance
+            'unknown': CategoryValidator(self.repo_root, self.facts),  # Generic fallback
         }
 
-    def validate_all(self) -> ValidationReport:
+    def validate_all(self, workers: int = 1, chunk_size: int = 2000) -> ValidationReport:
         """
         Validate ALL rules from registry
 
+        Args:
+            workers: Worker processes (1 = in-process, 0 = one per CPU).
+                Process mode needs the 'fork' start method and falls back
+                to in-process validation where it is unavailable.
+            chunk_size: Maximum rules per work unit in process mode
+
         Returns:
-            ValidationReport with complete results
+            ValidationReport with complete results (identical in both modes)
         """
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            print("Process mode requires fork; validating in-process")
+            workers = 1
+
         print("=" * 80)
         print("Starting SoT Rule Validation")
         print("=" * 80)
         print(f"Total rules to validate: {len(self.registry.rules)}")
+        if workers > 1:
+            print(f"Worker processes: {workers}")
         print()
 
-        results = []
-        status_counts = defaultdict(int)
-        priority_results = defaultdict(lambda: {'pass': 0, 'fail': 0, 'warn': 0, 'total': 0})
+        # Fresh facts for this run
+        self.facts.invalidate()
+
+        # One timestamp for the whole run
+        run_timestamp = datetime.utcnow().isoformat()
+        results = ValidationResultStore(run_timestamp)
+        for validator in self.validators.values():
+            validator.run_timestamp = run_timestamp
 
         # Validate each rule
-        for i, rule in enumerate(self.registry.rules, 1):
-            if i % 5000 == 0:
-                print(f"Progress: {i}/{len(self.registry.rules)} rules validated...")
-
-            rule_id = rule.get('rule_id') or rule.get('id', 'UNKNOWN')
-            category = rule.get('category', 'UNKNOWN').lower()
-            priority = rule.get('priority', 'UNKNOWN').upper()
-
-            # Get appropriate validator
-            validator = self.validators.get(category, self.validators['unknown'])
-
-            # Validate
-            result = validator.validate(rule)
-            results.append(result)
-
-            # Update counts
-            status_counts[result.status] += 1
-            priority_results[priority]['total'] += 1
-            if result.status == 'pass':
-                priority_results[priority]['pass'] += 1
-            elif result.status == 'fail':
-                priority_results[priority]['fail'] += 1
-            elif result.status == 'warn':
-                priority_results[priority]['warn'] += 1
-
-        # Calculate MoSCoW scores
-        moscow_scores = {}
-        for priority in ['MUST', 'SHOULD', 'HAVE', 'CAN']:
-            stats = priority_results[priority]
-            if stats['total'] > 0:
-                pass_rate = stats['pass'] / stats['total']
-                moscow_scores[priority] = pass_rate * 100
+        try:
+            if workers > 1:
+                self._validate_in_processes(results, workers, chunk_size)
             else:
-                moscow_scores[priority] = 0.0
+                for i, rule in enumerate(self.registry.rules, 1):
+                    if i % 5000 == 0:
+                        print(f"Progress: {i}/{len(self.registry.rules)} rules validated...")
 
-        # Calculate overall completeness
-        # Weighted: MUST=100%, SHOULD=80%, HAVE=50%, CAN=20%
-        weights = {'MUST': 1.0, 'SHOULD': 0.8, 'HAVE': 0.5, 'CAN': 0.2}
-        weighted_score = 0.0
-        total_weight = 0.0
+                    # Get appropriate validator
+                    validator = self._validator_for(rule)
 
-        for priority, weight in weights.items():
-            stats = priority_results[priority]
-            if stats['total'] > 0:
-                pass_rate = stats['pass'] / stats['total']
-                weighted_score += pass_rate * weight * stats['total']
-                total_weight += weight * stats['total']
+                    # Validate
+                    results.append(validator.validate(rule))
+        finally:
+            for validator in self.validators.values():
+                validator.run_timestamp = None
 
-        completeness_score = (weighted_score / total_weight * 100) if total_weight > 0 else 0.0
+        # Aggregate over the status/priority columns
+        status_counts = results.status_counts()
+        moscow_scores, completeness_score = compute_moscow_scores(results)
 
         print()
         print("=" * 80)
@@ -875,19 +1110,79 @@ class RuleValidationEngine:
             skipped=status_counts['skip'],
             moscow_scores=moscow_scores,
             completeness_score=completeness_score,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=run_timestamp,
             results=results
         )
 
+    def _validator_key(self, rule: dict) -> str:
+        category = rule.get('category', 'UNKNOWN').lower()
+        return category if category in self.validators else 'unknown'
+
+    def _validator_for(self, rule: dict) -> CategoryValidator:
+        return self.validators[self._validator_key(rule)]
+
+    def _category_chunks(self, chunk_size: int) -> List[Tuple[str, List[int]]]:
+        """
+        Rule indices grouped by validator, split into chunks of chunk_size.
+
+        Keeping a category together lets each worker reuse the repository
+        facts its validator needs; largest chunks are listed first.
+        """
+        by_key: Dict[str, List[int]] = defaultdict(list)
+        for i, rule in enumerate(self.registry.rules):
+            by_key[self._validator_key(rule)].append(i)
+
+        chunks = []
+        for key, indices in by_key.items():
+            for start in range(0, len(indices), chunk_size):
+                chunks.append((key, indices[start:start + chunk_size]))
+        chunks.sort(key=lambda chunk: len(chunk[1]), reverse=True)
+        return chunks
+
+    def _validate_in_processes(self, results: ValidationResultStore, workers: int,
+                               chunk_size: int) -> None:
+        """
+        Validate all rules in forked worker processes.
+
+        Chunks complete in any order; their result tuples are merged back
+        into registry order before being added to results.
+        """
+        global _WORKER_ENGINE
+
+        total = len(self.registry.rules)
+        merged: List[Optional[Tuple]] = [None] * total
+        done = 0
+        next_progress = 5000
+
+        _WORKER_ENGINE = self
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('fork')) as pool:
+                futures = [
+                    pool.submit(_validate_chunk_worker, key, indices)
+                    for key, indices in self._category_chunks(chunk_size)
+                ]
+                for future in as_completed(futures):
+                    indices, fields = future.result()
+                    for i, result in zip(indices, fields):
+                        merged[i] = result
+                    done += len(indices)
+                    while done >= next_progress:
+                        print(f"Progress: {next_progress}/{total} rules validated...")
+                        next_progress += 5000
+        finally:
+            _WORKER_ENGINE = None
+
+        for fields in merged:
+            results.append_fields(*fields)
+
     def validate_rule(self, rule_id: str) -> Optional[ValidationResult]:
         """Validate a single rule by ID"""
         rule = self.registry.rules_by_id.get(rule_id)
         if not rule:
             return None
 
-        category = rule.get('category', 'UNKNOWN').lower()
-        validator = self.validators.get(category, self.validators['unknown'])
-        return validator.validate(rule)
+        return self._validator_for(rule).validate(rule)
 
 
 def main():
@@ -899,7 +1194,11 @@ def main():
     )
     parser.add_argument('--rule-id', help='Validate single rule by ID')
     parser.add_argument('--output', help='Output file for validation report (JSON)')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Write --output as NDJSON (summary line, then one line per result)')
     parser.add_argument('--verbose', action='store_true', help='Show all validation results')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for full validation (0 = one per CPU)')
 
     args = parser.parse_args()
 
@@ -916,13 +1215,16 @@ def main():
             sys.exit(1)
     else:
         # Full validation
-        report = engine.validate_all()
+        report = engine.validate_all(workers=args.workers)
 
         if args.output:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+                if args.ndjson:
+                    report.write_ndjson(f)
+                else:
+                    report.write_json(f)
             print(f"\nReport saved to: {output_path}")
 
         if args.verbose:
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Registry Engine Process Mode Test Suite
+========================================
+
+Tests for process-parallel validation in RuleValidationEngine.
+
+Test Coverage:
+- Category chunking covers every rule exactly once
+- validate_all(workers=N) returns the same report as in-process mode
+
+Usage:
+    pytest -v test_engine_process_mode.py
+"""
+
+import json
+import multiprocessing
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sot_validator_engine import RuleValidationEngine
+
+
+CATEGORIES = ["structure", "policy", "compliance", "security", "testing", "documentation", "misc"]
+PRIORITIES = ["MUST", "SHOULD", "HAVE", "CAN"]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine over a small repository with a 350-rule registry"""
+    (tmp_path / "23_compliance" / "policies").mkdir(parents=True)
+    (tmp_path / "23_compliance" / "policies" / "sot_policy.rego").write_text("package sot\n", encoding="utf-8")
+    registry_dir = tmp_path / "16_codex" / "structure" / "auto_generated"
+    registry_dir.mkdir(parents=True)
+
+    rules = [
+        {
+            "rule_id": f"R{i}",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "priority": PRIORITIES[i % len(PRIORITIES)],
+            "description": "SoT policy, gdpr and pytest coverage" if i % 3 else "short",
+        }
+        for i in range(350)
+    ]
+    (registry_dir / "sot_rules_full.json").write_text(json.dumps({"rules": rules}), encoding="utf-8")
+    return RuleValidationEngine(tmp_path)
+
+
+def comparable(report):
+    data = report.to_dict()
+    data.pop("timestamp")
+    for result in data["results"]:
+        result.pop("timestamp")
+    return data
+
+
+@pytest.mark.unit
+def test_category_chunks_cover_registry(engine):
+    chunks = engine._category_chunks(chunk_size=20)
+
+    indices = sorted(i for _, chunk in chunks for i in chunk)
+    assert indices == list(range(350))
+    assert all(len(chunk) <= 20 for _, chunk in chunks)
+    for key, chunk in chunks:
+        assert {engine._validator_key(engine.registry.rules[i]) for i in chunk} == {key}
+
+
+@pytest.mark.integration
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                    reason="process mode requires fork")
+def test_process_mode_matches_in_process(engine):
+    sequential = engine.validate_all()
+    parallel = engine.validate_all(workers=3, chunk_size=40)
+
+    assert comparable(parallel) == comparable(sequential)
+    assert [r.rule_id for r in parallel.results] == [f"R{i}" for i in range(350)]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Repository Fact Layer Test Suite
+=================================
+
+Tests for RepositoryFacts and its use by the RuleValidationEngine
+category validators.
+
+Test Coverage:
+- Facts computed once per run, served from cache afterwards
+- invalidate() picks up filesystem changes
+- Category validators share one fact layer
+
+Usage:
+    pytest -v test_repository_facts.py
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from repository_facts import RepositoryFacts
+from sot_validator_engine import StructureValidator, PolicyValidator
+
+
+@pytest.fixture
+def fact_repo(tmp_path):
+    """Small repository with roots, shard charts and policies"""
+    for name in ["01_ai_layer", "02_audit_logging", "23_compliance", "not_a_root"]:
+        (tmp_path / name).mkdir()
+    chart_dir = tmp_path / "01_ai_layer" / "shards" / "01_identitaet_personen"
+    chart_dir.mkdir(parents=True)
+    (chart_dir / "chart.yaml").write_text("name: shard\n", encoding="utf-8")
+    policy_dir = tmp_path / "23_compliance" / "policies"
+    policy_dir.mkdir()
+    (policy_dir / "sot_policy.rego").write_text("package sot\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestRepositoryFacts:
+    """Tests for memoized repository facts."""
+
+    def test_root_dirs_computed_once(self, fact_repo):
+        facts = RepositoryFacts(fact_repo)
+
+        roots = facts.root_dirs()
+        assert sorted(r.name for r in roots) == ["01_ai_layer", "02_audit_logging", "23_compliance"]
+
+        (fact_repo / "03_core").mkdir()
+        assert facts.root_dirs() is roots
+        assert facts.fact_misses == 1
+        assert facts.fact_hits == 1
+
+    def test_invalidate_recomputes(self, fact_repo):
+        facts = RepositoryFacts(fact_repo)
+        assert len(facts.glob("*/shards/*/chart.yaml")) == 1
+        assert facts.exists("03_core") is False
+
+        (fact_repo / "03_core").mkdir()
+        assert facts.exists("03_core") is False
+
+        facts.invalidate()
+        assert facts.exists("03_core") is True
+        assert len(facts.root_dirs()) == 4
+
+    def test_glob_missing_base(self, fact_repo):
+        facts = RepositoryFacts(fact_repo)
+        assert facts.glob("**/*.py", base="99_missing") == ()
+
+
+@pytest.mark.unit
+def test_validators_share_facts(fact_repo):
+    """Rules sharing a fact hit the shared cache"""
+    facts = RepositoryFacts(fact_repo)
+    structure = StructureValidator(fact_repo, facts)
+    policy = PolicyValidator(fact_repo, facts)
+
+    rules = [
+        {"rule_id": f"R{i}", "category": "structure", "priority": "MUST",
+         "description": "All shard chart.yaml files present"}
+        for i in range(100)
+    ]
+    results = [structure.validate(rule) for rule in rules]
+    assert all(r.status == "pass" for r in results)
+    assert results[0].evidence == {"chart_count": 1}
+
+    result = policy.validate({"rule_id": "P1", "category": "policy", "priority": "MUST",
+                              "description": "SoT policy must be enforced"})
+    assert result.status == "pass"
+    assert result.evidence == {"policy_files": ["sot_policy.rego"]}
+
+    # One glob for 100 structure rules, plus the policy facts
+    assert facts.fact_misses == 4
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Rule Parser Line Engine Test Suite
+===================================
+
+Tests for the single-pass line extraction engine of SoTRuleParserV3.
+
+Test Coverage:
+- required_literals: literals derived from patterns (groups, branches, repeats)
+- fold_line: IGNORECASE equivalents of ASCII letters
+- _extract_line_rules: same rules and order as the separate extractors
+
+Usage:
+    pytest -v test_rule_parser_line_engine.py
+"""
+
+import re
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sot_rule_parser_v3 import SoTRuleParserV3, fold_line, required_literals
+
+
+LINE_EXTRACTORS = [
+    'markdown', 'inline', 'numeric', 'legal', 'time', 'security',
+    'esg', 'governance', 'audit', 'relation', 'i18n', 'infra',
+]
+
+SAMPLE = """# Security Requirements
+
+## Hashing
+- All evidence MUST use SHA256 hashing
+- retention: 10 years
+- Signatures SHOULD follow FIPS 204 (ML-DSA)
+
+Fees: 2% fee applies per GDPR Art. 6 and MiCA
+approval_required: true
+severity: HIGH
+See: 23_compliance/policies/sot_policy.rego
+language: de
+Dockerfile MUST NOT run as root
+Ziel: Reproduzierbare Builds
+Der Validator MUSS laufen (MUSS EXISTIEREN)
+plain text without any keyword
+"""
+
+
+@pytest.mark.unit
+class TestRequiredLiterals:
+    """Tests for literals derived from regex patterns."""
+
+    def test_branches_and_groups(self):
+        assert required_literals(r'(SHA256|SHA3|BLAKE2)') == {'sha256', 'sha3', 'blake2'}
+        assert required_literals(r'retention:\s*(\d+)\s*(years?|days?)', re.IGNORECASE) == {'retention:'}
+
+    def test_optional_parts_are_not_required(self):
+        assert required_literals(r'(total_)?fee:\s*(\d+)') == {'fee:'}
+        assert required_literals(r'\d+\s*%') == {'%'}
+
+    def test_no_literal(self):
+        assert required_literals(r'\d+\s*\w+') is None
+
+    def test_fold_line(self):
+        assert fold_line('SHA256 Kelvin') == 'sha256 kelvin'
+        # Characters matching 's' / 'i' under IGNORECASE
+        assert fold_line('ſha256 İntegrıty') == 'sha256 integrity'
+
+
+@pytest.mark.unit
+def test_line_engine_matches_separate_extractors(tmp_path):
+    """One pass yields the rules of all line extractors, in their order"""
+    parser = SoTRuleParserV3(tmp_path, output_dir=tmp_path / 'reports')
+    file_path = tmp_path / 'sample.md'
+
+    expected = []
+    for name in LINE_EXTRACTORS:
+        expected.extend(getattr(parser, f'_extract_{name}_rules')(SAMPLE, file_path))
+
+    actual = parser._extract_line_rules(SAMPLE, file_path)
+
+    def key(rule):
+        return (rule.rule_id, rule.text, rule.line_number, rule.context,
+                rule.priority, rule.source_type, rule.reality_level)
+
+    assert len(expected) > 10
+    assert [key(r) for r in actual] == [key(r) for r in expected]
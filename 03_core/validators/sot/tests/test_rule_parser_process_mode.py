@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Rule Parser Process Mode Test Suite
+====================================
+
+Tests for process-based file extraction and the per-file extraction
+cache of SoTRuleParserV3.process_all_files.
+
+Test Coverage:
+- rule_to_tuple / rules_from_tuples round trip
+- processes=N: same rules, order and evidence chain as in-process extraction
+- Extraction cache: unchanged files are not extracted again
+- Files with ${ENV:...} variables are never cached
+
+Usage:
+    pytest -v test_rule_parser_process_mode.py
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sot_rule_parser_v3 import SoTRuleParserV3, rule_to_tuple, rules_from_tuples
+
+
+DOCS = {
+    "a.md": "# Security\n\n- All evidence MUST use SHA256 hashing\n- retention: 10 years\n",
+    "b.md": "# Governance\n\napproval_required: true\nThe DAO SHOULD review GDPR changes\n",
+    "c.md": "# Shared\n\n- All evidence MUST use SHA256 hashing\nDeploy with Dockerfile\n",
+    "d.md": "# Env\n\nToken ${ENV:SSID_TOKEN} MUST be rotated\n",
+}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Small repository with markdown files under a root folder"""
+    docs_dir = tmp_path / "16_codex" / "docs"
+    docs_dir.mkdir(parents=True)
+    for name, text in DOCS.items():
+        (docs_dir / name).write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+def run_parser(root, processes=1, cache_dir=None):
+    parser = SoTRuleParserV3(root, output_dir=root / "reports", cache_dir=cache_dir)
+    rules = parser.process_all_files("16_codex/**/*.md", processes=processes)
+    return parser, rules
+
+
+def rule_fields(rules):
+    return [
+        (rule_id, rule.text, rule.source_path, rule.line_number, rule.priority,
+         rule.root_folder, rule.shard, rule.tags, rule.hash_signature)
+        for rule_id, rule in rules.items()
+    ]
+
+
+@pytest.mark.unit
+def test_rule_tuple_round_trip(corpus):
+    parser = SoTRuleParserV3(corpus, output_dir=corpus / "reports")
+    file_path = corpus / "16_codex" / "docs" / "a.md"
+    rules = parser._extract_line_rules(DOCS["a.md"], file_path)
+
+    rebuilt = rules_from_tuples([rule_to_tuple(rule) for rule in rules], str(file_path))
+    assert rebuilt == rules
+
+
+@pytest.mark.unit
+def test_process_extraction_matches_in_process(corpus):
+    sequential, expected = run_parser(corpus, processes=1)
+    parallel, actual = run_parser(corpus, processes=2)
+
+    assert len(expected) > 5
+    assert rule_fields(actual) == rule_fields(expected)
+    assert [e.rule_id for e in parallel.evidence_chain.chain] == \
+        [e.rule_id for e in sequential.evidence_chain.chain]
+    assert parallel.stats['duplicates_found'] == sequential.stats['duplicates_found']
+
+
+@pytest.mark.unit
+def test_unchanged_files_served_from_cache(corpus, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    _, expected = run_parser(corpus, cache_dir=cache_dir)
+    assert (cache_dir / "rule_extraction_explicit.json").exists()
+
+    extracted = []
+    original = SoTRuleParserV3._extract_file_uncached
+
+    def counting_extract(self, file_path):
+        extracted.append(file_path.name)
+        return original(self, file_path)
+
+    monkeypatch.setattr(SoTRuleParserV3, "_extract_file_uncached", counting_extract)
+
+    parser, actual = run_parser(corpus, cache_dir=cache_dir)
+    assert rule_fields(actual) == rule_fields(expected)
+    # d.md resolves an environment variable and is never cached
+    assert extracted == ["d.md"]
+    assert parser.extraction_cache.hits == 3
+
+    (corpus / "16_codex" / "docs" / "b.md").write_text("# Changed\n\nRFC process MUST apply\n", encoding="utf-8")
+    extracted.clear()
+    run_parser(corpus, cache_dir=cache_dir)
+    assert sorted(extracted) == ["b.md", "d.md"]
+
+
+@pytest.mark.unit
+def test_cache_invalidated_by_code_change_and_skips_failures(corpus, tmp_path, monkeypatch):
+    import sot_rule_parser_v3
+
+    cache_dir = tmp_path / "cache"
+    run_parser(corpus, cache_dir=cache_dir)
+
+    # Edited parser/forensics sources: cached extractions are not reused
+    monkeypatch.setattr(sot_rule_parser_v3, "extraction_code_fingerprint", lambda: "edited")
+    parser, _ = run_parser(corpus, cache_dir=cache_dir)
+    assert parser.extraction_cache.hits == 0
+
+    # Failed extractions are not persisted
+    cache_dir = tmp_path / "fresh_cache"
+    original = SoTRuleParserV3._extract_line_rules
+
+    def failing_for_a(self, content, file_path, logger=None):
+        if file_path.name == "a.md":
+            raise ValueError("pattern crash")
+        return original(self, content, file_path, logger=logger)
+
+    monkeypatch.setattr(SoTRuleParserV3, "_extract_line_rules", failing_for_a)
+    parser, _ = run_parser(corpus, cache_dir=cache_dir)
+    assert str(corpus / "16_codex" / "docs" / "a.md") not in parser.extraction_cache.entries
+
+    monkeypatch.setattr(SoTRuleParserV3, "_extract_line_rules", original)
+    parser, rules = run_parser(corpus, cache_dir=cache_dir)
+    assert parser.extraction_cache.hits == 2  # b.md, c.md
+    assert any(rule.source_path.endswith("a.md") for rule in rules.values())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Unified Content Validators Test Suite
+======================================
+
+Tests for the parsed-document store and batched evaluation mode of
+unified_content_validators.
+
+Test Coverage:
+- ParsedDocumentStore: reuse, invalidation on change, LRU eviction
+- resolve_yaml_paths: one traversal for many dotted paths
+- validate_all_batched: same results and order as validate_all
+- Generator output matches both checked-in copies
+
+Usage:
+    pytest -v test_unified_content_validators.py
+"""
+
+import pytest
+import sys
+import os
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import unified_content_validators as ucv
+from unified_content_validators import (
+    ParsedDocumentStore,
+    UnifiedContentValidators,
+    VALIDATOR_SPECS,
+    resolve_yaml_paths,
+    yaml_field_equals,
+    yaml_list_equals,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_document_store():
+    ucv.DOCUMENT_STORE.clear()
+    yield
+    ucv.DOCUMENT_STORE.clear()
+
+
+@pytest.mark.unit
+class TestParsedDocumentStore:
+    """Tests for the shared parsed-document store."""
+
+    def test_document_parsed_once(self, tmp_path):
+        """Repeated loads of an unchanged file hit the cache"""
+        doc = tmp_path / "contract.yaml"
+        doc.write_text("version: '1.0'\nroles: [a, b]\n", encoding="utf-8")
+        store = ParsedDocumentStore()
+
+        first = store.load(doc)
+        second = store.load(doc)
+
+        assert first is second
+        assert store.misses == 1
+        assert store.hits == 1
+
+    def test_changed_file_reparsed(self, tmp_path):
+        """A changed size/mtime invalidates the cached document"""
+        doc = tmp_path / "contract.yaml"
+        doc.write_text("version: '1.0'\n", encoding="utf-8")
+        store = ParsedDocumentStore()
+        assert store.load(doc) == {"version": "1.0"}
+
+        doc.write_text("version: '2.0.0'\n", encoding="utf-8")
+        os.utime(doc, ns=(0, 10**18))
+
+        assert store.load(doc) == {"version": "2.0.0"}
+        assert store.misses == 2
+
+    def test_lru_eviction(self, tmp_path):
+        """The least recently used document is evicted beyond max_documents"""
+        store = ParsedDocumentStore(max_documents=2)
+        docs = []
+        for i in range(3):
+            doc = tmp_path / f"doc_{i}.yaml"
+            doc.write_text(f"index: {i}\n", encoding="utf-8")
+            docs.append(doc)
+
+        store.load(docs[0])
+        store.load(docs[1])
+        store.load(docs[0])
+        store.load(docs[2])  # evicts doc_1
+
+        store.load(docs[0])
+        assert store.hits == 2
+        store.load(docs[1])
+        assert store.misses == 4
+
+
+@pytest.mark.unit
+def test_resolve_yaml_paths_single_traversal():
+    """Shared prefixes resolve like individual lookups"""
+    data = {"a": {"b": {"c": 1, "d": [1, 2]}, "e": "x"}, "f": None}
+
+    resolved = resolve_yaml_paths(data, ["a.b.c", "a.b.d", "a.e", "f", "a.missing", "f.g"])
+
+    assert resolved["a.b.c"] == 1
+    assert resolved["a.b.d"] == [1, 2]
+    assert resolved["a.e"] == "x"
+    assert resolved["f"] is None
+    assert resolved["a.missing"] is ucv._PATH_NOT_FOUND
+    assert resolved["f.g"] is ucv._PATH_NOT_FOUND
+
+
+@pytest.mark.unit
+def test_yaml_helpers_use_store(tmp_path):
+    """yaml_field_equals / yaml_list_equals keep their return contract"""
+    (tmp_path / "c.yaml").write_text("meta:\n  version: '1.0'\n  tags: [a, b]\n", encoding="utf-8")
+
+    assert yaml_field_equals(tmp_path, "c.yaml", "meta.version", "1.0") == (True, "1.0")
+    assert yaml_field_equals(tmp_path, "c.yaml", "meta.nope", "1.0") == (False, "PATH_NOT_FOUND")
+    assert yaml_field_equals(tmp_path, "missing.yaml", "meta", "1.0") == (False, "FILE_NOT_FOUND")
+    assert yaml_list_equals(tmp_path, "c.yaml", "meta.tags", ["a", "b"]) == (True, ["a", "b"])
+    assert yaml_list_equals(tmp_path, "c.yaml", "meta.version", ["1.0"]) == (False, "NOT_A_LIST")
+    assert ucv.DOCUMENT_STORE.misses == 1
+
+
+@pytest.mark.integration
+def test_batched_matches_validate_all():
+    """Batched mode returns the same results in the same order"""
+    repo_root = Path(__file__).resolve().parents[4]
+    validators = UnifiedContentValidators(repo_root)
+
+    def key(results):
+        return [(r.rule_id, r.passed, r.severity, r.message, r.evidence) for r in results]
+
+    sequential = validators.validate_all()
+    ucv.DOCUMENT_STORE.clear()
+    batched = validators.validate_all_batched()
+
+    assert len(batched) == len(VALIDATOR_SPECS)
+    assert key(batched) == key(sequential)
+
+
+def test_generator_reproduces_checked_in_copies():
+    """Regenerating from the rules snapshot gives both checked-in modules byte for byte"""
+    generator_dir = Path(__file__).resolve().parents[4] / "16_codex" / "structure" / "level3"
+    sys.path.insert(0, str(generator_dir))
+    from generate_unified_content_validators import (
+        DEFAULT_RULES_JSON,
+        OUTPUT_FILES,
+        UnifiedValidatorGenerator,
+    )
+
+    rendered = UnifiedValidatorGenerator(DEFAULT_RULES_JSON).render()
+    for path in OUTPUT_FILES:
+        assert path.read_text(encoding="utf-8") == rendered, f"{path} is out of date"
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Validation Result Store Test Suite
+===================================
+
+Tests for the columnar ValidationResultStore and streamed report export
+of the RuleValidationEngine.
+
+Test Coverage:
+- Store behaves like a list of ValidationResult
+- MoSCoW / completeness computed from the code columns
+- write_json / write_ndjson match ValidationReport.to_dict()
+
+Usage:
+    pytest -v test_validation_result_store.py
+"""
+
+import io
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sot_validator_engine import (
+    ValidationReport,
+    ValidationResult,
+    ValidationResultStore,
+    compute_moscow_scores,
+)
+
+
+RUN_TIMESTAMP = "2025-01-01T00:00:00"
+
+
+def make_result(i, status, priority, evidence=None):
+    return ValidationResult(
+        rule_id=f"R{i}",
+        status=status,
+        priority=priority,
+        category="structure",
+        message=f"{status} message",
+        timestamp="ignored",
+        evidence=evidence,
+    )
+
+
+@pytest.fixture
+def store():
+    store = ValidationResultStore(RUN_TIMESTAMP)
+    rows = [
+        ("pass", "MUST"), ("pass", "MUST"), ("fail", "MUST"),
+        ("pass", "SHOULD"), ("warn", "SHOULD"),
+        ("skip", "CAN"), ("pass", "UNKNOWN"),
+    ]
+    for i, (status, priority) in enumerate(rows):
+        store.append(make_result(i, status, priority, {"index": i % 2}))
+    return store
+
+
+@pytest.mark.unit
+class TestValidationResultStore:
+    """Tests for columnar result storage."""
+
+    def test_sequence_access(self, store):
+        assert len(store) == 7
+        assert store[2] == ValidationResult("R2", "fail", "MUST", "structure",
+                                            "fail message", RUN_TIMESTAMP, {"index": 0})
+        assert store[-1].priority == "UNKNOWN"
+        assert [r.rule_id for r in store[5:]] == ["R5", "R6"]
+        assert [r.rule_id for r in store] == [f"R{i}" for i in range(7)]
+        with pytest.raises(IndexError):
+            store[7]
+
+    def test_evidence_shared(self, store):
+        assert store.record(0)["evidence"] is store.record(2)["evidence"]
+        assert store.record(1)["evidence"] == {"index": 1}
+
+    def test_counts(self, store):
+        assert store.status_counts() == {"pass": 4, "fail": 1, "warn": 1, "info": 0, "skip": 1}
+        table = store.priority_status_counts()
+        assert table["MUST"]["pass"] == 2
+        assert table["MUST"]["total"] == 3
+        assert table["HAVE"]["total"] == 0
+
+    def test_moscow_scores(self, store):
+        moscow_scores, completeness = compute_moscow_scores(store)
+        assert moscow_scores == pytest.approx({"MUST": 200 / 3, "SHOULD": 50.0, "HAVE": 0.0, "CAN": 0.0})
+        # (2 * 1.0 + 1 * 0.8) / (3 * 1.0 + 2 * 0.8 + 1 * 0.2)
+        assert completeness == pytest.approx(2.8 / 4.8 * 100)
+
+
+@pytest.mark.unit
+def test_streamed_export_matches_to_dict(store):
+    """write_json / write_ndjson serialize the same report as to_dict()"""
+    report = ValidationReport(
+        total_rules=len(store), passed=4, failed=1, warned=1, skipped=1,
+        moscow_scores={"MUST": 66.7}, completeness_score=58.3,
+        timestamp=RUN_TIMESTAMP, results=store,
+    )
+    expected = report.to_dict()
+
+    buf = io.StringIO()
+    report.write_json(buf)
+    assert json.loads(buf.getvalue()) == expected
+
+    buf = io.StringIO()
+    report.write_ndjson(buf)
+    summary, *records = [json.loads(line) for line in buf.getvalue().splitlines()]
+    assert records == expected.pop("results")
+    assert summary == expected
+
+
+@pytest.mark.unit
+def test_empty_report_json():
+    report = ValidationReport(0, 0, 0, 0, 0, {}, 0.0, RUN_TIMESTAMP,
+                              ValidationResultStore(RUN_TIMESTAMP))
+    buf = io.StringIO()
+    report.write_json(buf)
+    assert json.loads(buf.getvalue())["results"] == []
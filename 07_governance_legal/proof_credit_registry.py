@@ -13,6 +13,8 @@ Features:
 - On-chain anchoring (audit trail)
 - Non-custodial (no payment system)
 - Integration with 17_observability/federation_ranking
+- Offset index over the registry (per-node latest hash, per-round
+  allocations): allocations and queries do not rescan the history
 
 Status: Blueprint v5.3 Foundation
 Version: 1.0.0
@@ -22,7 +24,7 @@ import json
 import time
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
@@ -103,22 +105,97 @@ class ProofCreditRegistry:
             "consensus_participation": 0.1
         }
 
+        # Registry index (byte offsets of the JSONL entries)
+        self._reset_index()
+
         # Allocation round counter
         self.allocation_round = self._load_latest_round()
 
-    def _load_latest_round(self) -> int:
-        """Load latest allocation round from registry."""
-        if not self.registry_path.exists():
-            return 0
+    def _reset_index(self) -> None:
+        """Clear the registry index (rebuilt from offset 0 on next refresh)."""
+        self._indexed_size = 0
+        self._indexed_stat: Tuple[int, int] = (0, 0)          # (st_ino, st_mtime_ns) at last refresh
+        self._last_entry: Tuple[int, Optional[str]] = (0, None)  # (offset, sha256) of last indexed line
+        self._node_offsets: Dict[str, List[int]] = {}        # node_id → entry offsets
+        self._round_offsets: Dict[int, List[int]] = {}       # allocation_round → entry offsets
+        self._last_hash: Dict[str, Optional[str]] = {}       # node_id → latest allocation_hash
+        self._latest_weight: Dict[str, Tuple[int, float]] = {}  # node_id → (round, weight)
+        self._last_round = 0
+
+    def _refresh_index(self) -> None:
+        """
+        Bring the registry index up to date.
 
-        with self.registry_path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-            if not lines:
-                return 0
+        Only entries appended since the last refresh are parsed. The registry
+        is reindexed from the start when it was not appended to: it shrank,
+        was replaced (new inode), changed at the same size, or the last
+        indexed line no longer reads the same.
+        Lines without trailing newline (write in progress) are left for later.
+        """
+        if not self.registry_path.exists():
+            if self._indexed_size:
+                self._reset_index()
+            return
+
+        stat = self.registry_path.stat()
+        file_stat = (stat.st_ino, stat.st_mtime_ns)
+        if stat.st_size == self._indexed_size and file_stat == self._indexed_stat:
+            return
+        if self._indexed_size and not self._is_append(stat.st_size, stat.st_ino):
+            self._reset_index()
+
+        with self.registry_path.open("rb") as f:
+            f.seek(self._indexed_size)
+            offset = self._indexed_size
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                if raw.strip():
+                    self._index_entry(json.loads(raw), offset)
+                    self._last_entry = (offset, hashlib.sha256(raw).hexdigest())
+                offset += len(raw)
+
+        self._indexed_size = offset
+        self._indexed_stat = file_stat
+
+    def _is_append(self, size: int, inode: int) -> bool:
+        """Whether the registry only grew since it was indexed."""
+        if size <= self._indexed_size or inode != self._indexed_stat[0]:
+            return False
+        offset, digest = self._last_entry
+        if digest is None:
+            return True
+        with self.registry_path.open("rb") as f:
+            f.seek(offset)
+            return hashlib.sha256(f.readline()).hexdigest() == digest
+
+    def _index_entry(self, entry: Dict[str, Any], offset: int) -> None:
+        node_id = entry.get("node_id")
+        allocation_round = entry.get("allocation_round", 0)
+
+        self._node_offsets.setdefault(node_id, []).append(offset)
+        self._round_offsets.setdefault(allocation_round, []).append(offset)
+        self._last_hash[node_id] = entry.get("allocation_hash")
+        self._last_round = allocation_round
+
+        # Governance weight of the highest round (first entry wins on ties)
+        latest = self._latest_weight.get(node_id)
+        if latest is None or allocation_round > latest[0]:
+            self._latest_weight[node_id] = (allocation_round, entry.get("governance_weight", 0.0))
+
+    def _read_entries(self, offsets: List[int]) -> List[Dict[str, Any]]:
+        """Parse the registry entries at the given byte offsets."""
+        entries = []
+        with self.registry_path.open("rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                entries.append(json.loads(f.readline()))
+        return entries
 
-            # Parse last line
-            last_entry = json.loads(lines[-1])
-            return last_entry.get("allocation_round", 0)
+    def _load_latest_round(self) -> int:
+        """Load latest allocation round from registry."""
+        self._refresh_index()
+        return self._last_round
 
     def allocate_credits(
         self,
@@ -317,22 +394,8 @@ class ProofCreditRegistry:
         Returns:
             Previous allocation hash (or None if first allocation)
         """
-        if not self.registry_path.exists():
-            return None
-
-        # Read registry in reverse to find latest allocation for node
-        with self.registry_path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        for line in reversed(lines):
-            if not line.strip():
-                continue
-
-            entry = json.loads(line)
-            if entry.get("node_id") == node_id:
-                return entry.get("allocation_hash")
-
-        return None
+        self._refresh_index()
+        return self._last_hash.get(node_id)
 
     def _record_allocation(self, allocation: ProofCreditAllocation) -> None:
         """
@@ -346,6 +409,8 @@ class ProofCreditRegistry:
         with self.registry_path.open("a", encoding="utf-8") as f:
             f.write(json.dumps(allocation_dict) + "\n")
 
+        self._refresh_index()
+
     def get_allocation_history(self, node_id: str) -> CreditAllocationHistory:
         """
         Get credit allocation history for node.
@@ -356,27 +421,16 @@ class ProofCreditRegistry:
         Returns:
             CreditAllocationHistory with all allocations
         """
-        if not self.registry_path.exists():
-            return CreditAllocationHistory(
-                node_id=node_id,
-                allocations=[],
-                total_credits_earned=0.0,
-                current_governance_weight=0.0
-            )
+        self._refresh_index()
 
         allocations = []
         total_credits = 0.0
 
-        with self.registry_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                entry = json.loads(line)
-                if entry.get("node_id") == node_id:
-                    allocation = ProofCreditAllocation(**entry)
-                    allocations.append(allocation)
-                    total_credits += allocation.credit_score
+        if node_id in self._node_offsets:
+            for entry in self._read_entries(self._node_offsets[node_id]):
+                allocation = ProofCreditAllocation(**entry)
+                allocations.append(allocation)
+                total_credits += allocation.credit_score
 
         current_weight = allocations[-1].governance_weight if allocations else 0.0
 
@@ -394,33 +448,28 @@ class ProofCreditRegistry:
         Returns:
             Dict of node_id → governance_weight
         """
-        if not self.registry_path.exists():
-            return {}
-
-        # Get latest allocation for each node
-        latest_allocations = {}
+        self._refresh_index()
 
-        with self.registry_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
+        # Weight of each node's latest allocation
+        return {
+            node_id: weight
+            for node_id, (_, weight) in self._latest_weight.items()
+        }
 
-                entry = json.loads(line)
-                node_id = entry.get("node_id")
-                allocation_round = entry.get("allocation_round", 0)
+    def get_round_allocations(self, allocation_round: int) -> List[ProofCreditAllocation]:
+        """
+        Get all allocations of an allocation round.
 
-                # Keep only latest allocation
-                if node_id not in latest_allocations or \
-                   allocation_round > latest_allocations[node_id]["allocation_round"]:
-                    latest_allocations[node_id] = entry
+        Args:
+            allocation_round: Allocation round number
 
-        # Extract governance weights
-        weights = {
-            node_id: entry.get("governance_weight", 0.0)
-            for node_id, entry in latest_allocations.items()
-        }
+        Returns:
+            Allocations of the round (registry order)
+        """
+        self._refresh_index()
 
-        return weights
+        offsets = self._round_offsets.get(allocation_round, [])
+        return [ProofCreditAllocation(**entry) for entry in self._read_entries(offsets)]
 
     def verify_allocation_chain(self, node_id: str) -> bool:
         """
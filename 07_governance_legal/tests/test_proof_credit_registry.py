@@ -0,0 +1,103 @@
+"""
+Proof Credit Registry Test Suite
+
+Tests the registry offset index: chain linkage, per-node history,
+governance weights and per-round lookups, including entries appended
+by another registry instance and rewritten registries.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from proof_credit_registry import ProofCreditRegistry
+
+
+def allocate(registry, node_id, proofs):
+    return registry.allocate_credits(node_id, "eu-west-1", "eu", {
+        "proofs_validated": proofs,
+        "validation_accuracy": 0.9,
+        "max_credit_score": 1000.0,
+    })
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    return tmp_path / "registries" / "proof_credits.jsonl"
+
+
+def test_chain_linkage_and_history(registry_path):
+    registry = ProofCreditRegistry(str(registry_path))
+    first = allocate(registry, "node-a", 100)
+    allocate(registry, "node-b", 200)
+    second = allocate(registry, "node-a", 300)
+
+    assert first.previous_allocation_hash is None
+    assert second.previous_allocation_hash == first.allocation_hash
+
+    history = registry.get_allocation_history("node-a")
+    assert [a.allocation_hash for a in history.allocations] == [first.allocation_hash, second.allocation_hash]
+    assert history.total_credits_earned == first.credit_score + second.credit_score
+    assert history.current_governance_weight == second.governance_weight
+    assert registry.verify_allocation_chain("node-a")
+    assert registry.get_allocation_history("node-x").allocations == []
+
+
+def test_weights_and_rounds(registry_path):
+    registry = ProofCreditRegistry(str(registry_path))
+    allocate(registry, "node-a", 100)
+    b = allocate(registry, "node-b", 200)
+    a = allocate(registry, "node-a", 400)
+
+    assert registry.get_all_governance_weights() == {
+        "node-a": a.governance_weight,
+        "node-b": b.governance_weight,
+    }
+    assert [x.node_id for x in registry.get_round_allocations(2)] == ["node-b"]
+    assert registry.get_round_allocations(9) == []
+    assert ProofCreditRegistry(str(registry_path)).allocation_round == 3
+
+
+def test_index_follows_external_appends_and_rewrites(registry_path):
+    registry = ProofCreditRegistry(str(registry_path))
+    first = allocate(registry, "node-a", 100)
+
+    other = ProofCreditRegistry(str(registry_path))
+    second = allocate(other, "node-a", 200)
+
+    third = allocate(registry, "node-a", 300)
+    assert second.previous_allocation_hash == first.allocation_hash
+    assert third.previous_allocation_hash == second.allocation_hash
+    assert registry.verify_allocation_chain("node-a")
+
+    # Tampered and truncated registry: reindexed from the start
+    entry = json.loads(registry_path.read_text(encoding="utf-8").splitlines()[0])
+    entry["credit_score"] = 1e9
+    registry_path.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+    assert len(registry.get_allocation_history("node-a").allocations) == 1
+    assert not registry.verify_allocation_chain("node-a")
+
+
+def test_index_rebuilt_on_non_append_rewrite(registry_path):
+    registry = ProofCreditRegistry(str(registry_path))
+    allocate(registry, "node-a", 100)
+    allocate(registry, "node-b", 200)
+    assert registry.get_all_governance_weights().keys() == {"node-a", "node-b"}
+
+    # Rewritten in place: same size, different node id
+    original = registry_path.read_text(encoding="utf-8")
+    registry_path.write_text(original.replace("node-b", "node-c"), encoding="utf-8")
+    assert registry.get_all_governance_weights().keys() == {"node-a", "node-c"}
+
+    # Rewritten larger: last indexed line changed, new line appended
+    lines = registry_path.read_text(encoding="utf-8").splitlines()
+    entry = json.loads(lines[-1])
+    entry["node_id"] = "node-d"
+    registry_path.write_text("\n".join(lines[:-1] + [json.dumps(entry), lines[0]]) + "\n",
+                             encoding="utf-8")
+    assert registry.get_all_governance_weights().keys() == {"node-a", "node-d"}
+    assert [x.node_id for x in registry.get_round_allocations(2)] == ["node-d"]
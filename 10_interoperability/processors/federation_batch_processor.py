@@ -1,7 +1,12 @@
 from __future__ import annotations
-import time, hashlib, json
+import time, hashlib, json, sys
 from dataclasses import dataclass, field
-from typing import Iterable, List, Dict, Any, Tuple
+from pathlib import Path
+from typing import Iterable, List, Dict, Any, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "02_audit_logging" / "merkle"))
+
+from merkle_engine import MerkleTree
 
 @dataclass(frozen=True)
 class ProofItem:
@@ -17,23 +22,15 @@ def _sha256_hex(data: bytes) -> str:
 def canonical_json(obj: Any) -> bytes:
     return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
+def build_merkle_tree(items: List[ProofItem]) -> MerkleTree:
+    """Merkle tree over the payload hashes (supports inclusion proofs)."""
+    return MerkleTree.from_hex(x.payload_hash for x in items)
+
 def build_merkle_root(items: List[ProofItem]) -> Tuple[str, List[Tuple[str,str]]]:
     """Returns (root_hex, list of (left,right) pair hashes for audit)."""
-    if not items:
-        return _sha256_hex(b""), []
-    level = [bytes.fromhex(x.payload_hash) for x in items]
-    audit_pairs: List[Tuple[str,str]] = []
-    while len(level) > 1:
-        nxt = []
-        for i in range(0, len(level), 2):
-            left = level[i]
-            right = level[i+1] if i+1 < len(level) else left
-            pair = left + right
-            h = hashlib.sha256(pair).digest()
-            nxt.append(h)
-            audit_pairs.append((left.hex(), right.hex()))
-        level = nxt
-    return level[0].hex(), audit_pairs
+    tree = build_merkle_tree(items)
+    audit_pairs = [(left.hex(), right.hex()) for left, right in tree.pairs()]
+    return tree.root_hex(), audit_pairs
 
 @dataclass
 class BatchResult:
@@ -42,6 +39,11 @@ class BatchResult:
     audit_pairs: List[Tuple[str,str]]
     duration_ms: int
     batch_id: str
+    tree: Optional[MerkleTree] = field(default=None, repr=False, compare=False)
+
+    def inclusion_proof(self, index: int) -> List[str]:
+        """Hex sibling path for the item at index (leaf level first)."""
+        return [sibling.hex() for sibling in self.tree.inclusion_proof(index)]
 
 class FederationBatchProcessor:
     def __init__(self, max_batch_size: int = 1000):
@@ -63,6 +65,7 @@ class FederationBatchProcessor:
             ))
             if len(items) >= self.max_batch_size:
                 break
-        root, pairs = build_merkle_root(items)
+        tree = build_merkle_tree(items)
+        pairs = [(left.hex(), right.hex()) for left, right in tree.pairs()]
         dt = int((time.perf_counter() - t0) * 1000)
-        return BatchResult(root, len(items), pairs, dt, batch_id)
+        return BatchResult(tree.root_hex(), len(items), pairs, dt, batch_id, tree)
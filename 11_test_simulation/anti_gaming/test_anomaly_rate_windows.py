@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_anomaly_rate_windows.py – Sliding-Window Engine of anomaly_rate_guard
+Autor: edubrainboost ©2025 MIT License
+
+Compares the one-pass window engine and the streaming guard against a
+direct count per window start, and tests incremental JSONL reading.
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "anti_gaming"))
+
+from anomaly_rate_guard import (
+    IdentityEventTail,
+    StreamingRateGuard,
+    detect_rate_violations,
+    rate_checks,
+    stream_rate_violations,
+)
+
+BASE = datetime(2025, 10, 1, 12, 0, 0)
+
+
+def reference_violations(events, events_per_minute, events_per_hour, burst_per_5s):
+    """Direct count of every window start (first violation per DID and window)."""
+    by_did = {}
+    for event in events:
+        by_did.setdefault(event["did"], []).append(datetime.fromisoformat(event["ts"]))
+
+    violations = []
+    for did, timestamps in by_did.items():
+        if len(timestamps) < 2:
+            continue
+        timestamps.sort()
+        for violation_type, window, width, limit in rate_checks(events_per_minute, events_per_hour, burst_per_5s):
+            for start in timestamps:
+                count = sum(1 for ts in timestamps if start <= ts <= start + width)
+                if count > limit:
+                    violations.append({"did": did, "type": violation_type, "window": window,
+                                       "events": count, "limit": limit, "start_time": start.isoformat()})
+                    break
+    return violations
+
+
+def random_events(rng, dids=4):
+    events = []
+    for d in range(dids):
+        ts = BASE
+        for _ in range(rng.randint(0, 60)):
+            ts += timedelta(seconds=rng.choice([0, 0.5, 1, 2, 5, 30, 300]))
+            events.append({"did": f"did:ssid:{d}", "ts": ts.isoformat()})
+    return events
+
+
+def by_window(violations):
+    return sorted(violations, key=lambda v: (v["did"], v["type"]))
+
+
+def test_window_engine_matches_direct_count():
+    rng = random.Random(7)
+    for _ in range(150):
+        events = random_events(rng)
+        limits = (rng.randint(1, 10), rng.randint(5, 40), rng.randint(1, 5))
+        rng.shuffle(events)
+        assert by_window(detect_rate_violations(events, *limits)) == by_window(reference_violations(events, *limits))
+
+
+def test_streaming_guard_reports_first_violations_like_batch():
+    rng = random.Random(11)
+    for _ in range(150):
+        events = random_events(rng)
+        limits = (rng.randint(1, 10), rng.randint(5, 40), rng.randint(1, 5))
+        guard = StreamingRateGuard(rate_checks(*limits))
+        _, violations = stream_rate_violations(guard, iter(events))
+        violations.extend(guard.flush())
+
+        first = {}
+        for violation in violations:
+            first.setdefault((violation["did"], violation["type"]), violation)
+        assert by_window(first.values()) == by_window(detect_rate_violations(events, *limits))
+
+
+def test_streaming_guard_reports_repeat_incidents():
+    events = [{"did": "did:ssid:bot", "ts": (BASE + timedelta(minutes=minute, seconds=second)).isoformat()}
+              for minute in (0, 10) for second in (0, 1, 2, 3)]
+    guard = StreamingRateGuard(rate_checks(100, 1000, 2))
+    _, violations = stream_rate_violations(guard, iter(events))
+    violations.extend(guard.flush())
+
+    batch = detect_rate_violations(events, 100, 1000, 2)
+    assert [(v["type"], v["events"]) for v in batch] == [("burst", 4)]
+    assert violations == batch + [dict(batch[0], start_time=(BASE + timedelta(minutes=10)).isoformat())]
+
+
+def test_streaming_guard_closes_windows_and_drops_idle_dids():
+    guard = StreamingRateGuard(rate_checks(100, 1000, 2))
+    for second in (0, 1, 2, 3):
+        assert guard.add("did:ssid:bot", BASE + timedelta(seconds=second)) == []
+
+    # Window [0s, 5s] is still open until the clock passes its end
+    assert guard.close_expired(BASE + timedelta(seconds=5)) == []
+    closed = guard.close_expired(BASE + timedelta(seconds=6))
+    assert [(v["type"], v["events"]) for v in closed] == [("burst", 4)]
+
+    assert guard.close_expired(BASE + timedelta(hours=2)) == []
+    assert guard.states == {}
+
+
+def test_identity_event_tail_reads_appended_lines(tmp_path):
+    path = tmp_path / "identity_events.jsonl"
+    tail = IdentityEventTail(path)
+    assert list(tail.read_new()) == []
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"did": "a", "ts": BASE.isoformat()}) + "\n\n")
+        f.write('{"did": "b"')
+    assert [e["did"] for e in tail.read_new()] == ["a"]
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(', "ts": "2025-10-01T12:00:01"}\n')
+    assert [e["did"] for e in tail.read_new()] == ["b"]
+    assert list(tail.read_new()) == []
+
+    # Malformed lines are counted and skipped; invalid timestamps are ignored
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"did": "x", "ts"\n[1, 2]\n')
+        f.write(json.dumps({"did": "d", "ts": "yesterday"}) + "\n")
+        f.write(json.dumps({"did": "e", "ts": BASE.isoformat()}) + "\n")
+    guard = StreamingRateGuard(rate_checks(1, 10, 1))
+    count, _ = stream_rate_violations(guard, tail.read_new())
+    assert count == 2
+    assert tail.malformed == 2
+    assert list(guard.states) == ["e"]
+
+    # Rotated/truncated log: read from the start again
+    path.write_text(json.dumps({"did": "c", "ts": BASE.isoformat()}) + "\n", encoding="utf-8")
+    assert [e["did"] for e in tail.read_new()] == ["c"]
+
+
+def test_streaming_guard_state_round_trip():
+    rng = random.Random(13)
+    events = sorted(random_events(rng), key=lambda e: e["ts"])
+    half = len(events) // 2
+
+    single = StreamingRateGuard(rate_checks(4, 20, 2))
+    _, expected = stream_rate_violations(single, iter(events))
+    expected.extend(single.flush())
+
+    first = StreamingRateGuard(rate_checks(4, 20, 2))
+    _, violations = stream_rate_violations(first, iter(events[:half]))
+    second = StreamingRateGuard(rate_checks(4, 20, 2))
+    second.load_state(first.to_state())
+    _, rest = stream_rate_violations(second, iter(events[half:]))
+    violations.extend(rest + second.flush())
+
+    assert by_window(violations) == by_window(expected)
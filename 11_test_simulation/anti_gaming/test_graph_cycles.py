@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_graph_cycles.py – SCC and Bounded Cycle Engine
+Autor: edubrainboost ©2025 MIT License
+
+Tests graph_cycles (used by circular_dependency_validator,
+dependency_graph_generator and static_import_resolver) against brute-force
+cycle enumeration, and on deep and large graphs.
+"""
+
+import itertools
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "anti_gaming"))
+
+from graph_cycles import cyclic_components, simple_cycles, strongly_connected_components
+from circular_dependency_validator import ImportGraphBuilder
+
+
+def brute_force_cycles(graph, max_length):
+    nodes = sorted(graph)
+    cycles = set()
+    for length in range(1, max_length + 1):
+        for order in itertools.permutations(nodes, length):
+            if order[0] != min(order):
+                continue
+            if all(order[(i + 1) % length] in graph[order[i]] for i in range(length)):
+                cycles.add(order + (order[0],))
+    return sorted(list(cycle) for cycle in cycles)
+
+
+def test_cycles_match_brute_force():
+    rng = random.Random(5)
+    for _ in range(300):
+        nodes = [f"mod_{i}" for i in range(rng.randint(1, 6))]
+        graph = {node: {other for other in nodes if rng.random() < 0.35} for node in nodes}
+        max_length = rng.randint(1, 6)
+        assert simple_cycles(graph, max_length) == brute_force_cycles(graph, max_length)
+
+
+def test_components_and_edge_lists():
+    edges = [("a", "b"), ("b", "a"), ("b", "c"), ("c", "d"), ("d", "d"), ("d", "e")]
+    assert strongly_connected_components(edges) == [["e"], ["d"], ["c"], ["a", "b"]]
+    assert cyclic_components(edges) == [["d"], ["a", "b"]]
+    assert simple_cycles(edges) == [["a", "b", "a"], ["d", "d"]]
+
+
+def test_deep_chain_without_recursion_limit():
+    depth = 20000
+    graph = {f"m{i:05d}": [f"m{i + 1:05d}"] for i in range(depth)}
+    graph[f"m{depth:05d}"] = ["m00000"]
+
+    assert [len(c) for c in strongly_connected_components(graph)] == [depth + 1]
+    assert simple_cycles(graph, 4) == []
+    assert len(simple_cycles(graph)) == 1
+
+
+def test_validator_uses_bounded_cycles(tmp_path):
+    builder = ImportGraphBuilder(tmp_path)
+    builder.graph.update({
+        "alpha": {"beta", "json"},
+        "beta": {"gamma", "alpha"},
+        "gamma": {"alpha"},
+        "delta": {"delta"},
+    })
+    assert builder.detect_cycles(2) == [["alpha", "beta", "alpha"], ["delta", "delta"]]
+    assert builder.detect_cycles(3) == [
+        ["alpha", "beta", "alpha"],
+        ["alpha", "beta", "gamma", "alpha"],
+        ["delta", "delta"],
+    ]
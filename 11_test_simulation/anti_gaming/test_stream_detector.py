@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_stream_detector.py – Online Anti-Gaming Detector
+Autor: edubrainboost ©2025 MIT License
+
+Tests the streaming replay/skew/rate operators against the batch
+detectors and checkpointed resumption across runs.
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "anti_gaming"))
+
+from anomaly_rate_guard import detect_rate_violations
+from replay_attack_detector import detect_replay_attacks
+from stream_detector import StreamDetector, to_epoch_ms
+
+BASE = datetime(2025, 10, 1, 12, 0, 0)
+WALL_CLOCK = to_epoch_ms("2025-10-02T00:00:00Z")
+
+
+def make_detector(tmp_path, **overrides):
+    settings = dict(replay_window_minutes=10, max_skew_seconds=300,
+                    events_per_minute=10, events_per_hour=500, burst_per_5s=3)
+    settings.update(overrides)
+    return StreamDetector(
+        events_path=tmp_path / "evidence" / "identity_events.jsonl",
+        audit_dirs=[tmp_path / "logs", tmp_path / "evidence"],
+        checkpoint_path=tmp_path / "cache" / "checkpoint.json",
+        exclude=(tmp_path / "logs" / "anti_gaming_stream.jsonl",),
+        **settings
+    )
+
+
+def append(path, records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def identity_events(seed, count=300):
+    rng = random.Random(seed)
+    ts = BASE
+    events = []
+    for _ in range(count):
+        ts += timedelta(seconds=rng.choice([0.5, 1, 3, 20, 90, 400]))
+        events.append({"did": f"did:ssid:{rng.randint(0, 3)}", "nonce": f"n{rng.randint(0, 40)}",
+                       "ts": ts.isoformat() + "Z"})
+    return events
+
+
+def checks(findings, name):
+    return [f for f in findings if f["check"] == name]
+
+
+def test_replay_and_rate_match_batch_detectors(tmp_path):
+    detector = make_detector(tmp_path)
+    events = identity_events(3)
+    append(detector.events_path, events)
+
+    findings = detector.poll(WALL_CLOCK) + [dict(v, check="anomaly_rate") for v in detector.rate.flush()]
+
+    replays = detect_replay_attacks(events, 10)
+    assert replays
+    key = lambda r: (r["did"], r["nonce"], r["replay_seen"])
+    stream_replays = checks(findings, "replay")
+    assert [key(r) for r in sorted(stream_replays, key=key)] == [key(r) for r in sorted(replays, key=key)]
+
+    first_rate = {}
+    for violation in checks(findings, "anomaly_rate"):
+        first_rate.setdefault((violation["did"], violation["type"]), violation["events"])
+    batch_rate = detect_rate_violations(events, 10, 500, 3)
+    assert batch_rate
+    assert first_rate == {(v["did"], v["type"]): v["events"] for v in batch_rate}
+
+
+def test_skew_flags_backdated_and_future_records(tmp_path):
+    detector = make_detector(tmp_path)
+    append(tmp_path / "logs" / "audit.jsonl", [
+        {"timestamp": "2025-10-01T12:00:00Z"},
+        {"timestamp": "2025-10-01T12:10:00Z"},
+        {"timestamp": "2025-10-01T12:04:00Z"},   # 6 minutes behind the newest record
+        {"timestamp": "2025-10-01T12:09:00Z"},
+        {"timestamp": "2025-10-03T00:00:00Z"},   # ahead of the wall clock
+        {"timestamp": "not a timestamp"},
+    ])
+
+    skew = checks(detector.poll(WALL_CLOCK), "time_skew")
+    assert [(f["type"], f["line"], f["skew_seconds"]) for f in skew] == [
+        ("backdated", 3, 360),
+        ("future", 5, 86400),
+    ]
+    assert detector.stats["unparsed_timestamps"] == 1
+
+
+def test_checkpoint_resumes_without_duplicate_findings(tmp_path):
+    events = identity_events(5)
+    half = len(events) // 2
+
+    single = make_detector(tmp_path / "single")
+    append(single.events_path, events)
+    expected = single.poll(WALL_CLOCK)
+
+    first = make_detector(tmp_path / "split")
+    append(first.events_path, events[:half])
+    findings = first.poll(WALL_CLOCK)
+    first.save_checkpoint()
+
+    append(first.events_path, events[half:])
+    second = make_detector(tmp_path / "split")
+    assert second.load_checkpoint()
+    findings += second.poll(WALL_CLOCK)
+    second.save_checkpoint()
+
+    order = lambda f: json.dumps(f, sort_keys=True)
+    assert sorted(map(order, findings)) == sorted(map(order, expected))
+    assert make_detector(tmp_path / "split").load_checkpoint()
+    assert second.poll(WALL_CLOCK) == []
+
+
+def test_rewritten_source_is_read_from_start(tmp_path):
+    detector = make_detector(tmp_path)
+    path = tmp_path / "logs" / "audit.jsonl"
+    append(path, [{"timestamp": "2025-10-01T12:00:00Z"}] * 3)
+    detector.poll(WALL_CLOCK)
+    assert detector.stats["records"] == 3
+
+    path.write_text(json.dumps({"timestamp": "2025-10-01T13:00:00Z"}) + "\n", encoding="utf-8")
+    detector.poll(WALL_CLOCK)
+    assert detector.stats["records"] == 4
+
+
+def test_malformed_lines_are_counted_and_logged(tmp_path, monkeypatch):
+    import stream_detector
+
+    detector = make_detector(tmp_path)
+    path = tmp_path / "logs" / "audit.jsonl"
+    append(path, [{"timestamp": "2025-10-01T12:00:00Z"}])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"timestamp": "2025-10-01T12:00:01Z"\n[1, 2]\n\n')
+    append(path, [{"timestamp": "2025-10-01T12:00:02Z"}])
+    detector.poll(WALL_CLOCK)
+    assert detector.stats["records"] == 2
+    assert detector.stats["malformed_lines"] == 2
+
+    # Already read lines are not counted again
+    append(path, [{"timestamp": "2025-10-01T12:00:03Z"}])
+    detector.poll(WALL_CLOCK)
+    assert detector.stats["malformed_lines"] == 2
+
+    log_path = tmp_path / "logs" / "anti_gaming_stream.jsonl"
+    monkeypatch.setattr(stream_detector, "LOG_PATH", log_path)
+    stream_detector.write_audit_log("PASS", [], detector, "test")
+    entry = json.loads(log_path.read_text(encoding="utf-8"))
+    assert entry["malformed_lines"] == 2
+    assert entry["unparsed_timestamps"] == 0
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Unit Tests: AsyncioAuditBus
+============================
+
+Tests for the asyncio-native event bus.
+
+Test Coverage:
+- Coroutine handlers and awaitable emit_async futures
+- emit_batch gather semantics and timeout
+- SyncHandlerBridge for sync and batch-capable handlers
+- emit / emit_sync from other threads
+- Backpressure, handler failures and shutdown
+
+Status: Production-Ready
+Version: 1.0.0
+"""
+
+import pytest
+import asyncio
+import threading
+from datetime import datetime
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "interfaces"))
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "event_bus"))
+
+from audit_event_emitter import (
+    AuditEvent,
+    EmitResult,
+    EventSeverity,
+    EventType
+)
+
+from asyncio_bus import AsyncioAuditBus, SyncHandlerBridge
+
+
+def _make_event(event_id: str, requires_worm: bool = False) -> AuditEvent:
+    return AuditEvent(
+        event_id=event_id,
+        timestamp=datetime.utcnow(),
+        source_module="test/asyncio_bus",
+        event_type=EventType.HEALTH_CHECK,
+        severity=EventSeverity.INFO,
+        data={"event": event_id},
+        requires_worm=requires_worm
+    )
+
+
+class AsyncRecordingHandler:
+    """Coroutine handler recording processed events."""
+
+    def __init__(self, handler_name: str = "async_handler", fail_on: str = None):
+        self.handler_name = handler_name
+        self.fail_on = fail_on
+        self.events = []
+
+    async def handle(self, event: AuditEvent) -> EmitResult:
+        await asyncio.sleep(0)
+        if event.event_id == self.fail_on:
+            raise RuntimeError("boom")
+        self.events.append(event)
+        return EmitResult(event_id=event.event_id, status="processed",
+                          federation_proof=f"proof_{event.event_id}")
+
+    def supports(self, event: AuditEvent) -> bool:
+        return True
+
+    def name(self) -> str:
+        return self.handler_name
+
+
+class SyncRecordingHandler:
+    """Sync handler recording the threads it runs on."""
+
+    def __init__(self, handler_name: str = "sync_handler"):
+        self.handler_name = handler_name
+        self.events = []
+        self.threads = set()
+
+    def handle(self, event: AuditEvent) -> EmitResult:
+        self.threads.add(threading.get_ident())
+        self.events.append(event)
+        return EmitResult(event_id=event.event_id, status="processed",
+                          worm_hash="ab" * 32)
+
+    def supports(self, event: AuditEvent) -> bool:
+        return True
+
+    def name(self) -> str:
+        return self.handler_name
+
+
+class SyncBatchHandler(SyncRecordingHandler):
+    """Sync handler exposing handle_batch() (like WORMHandler in batch mode)."""
+
+    batch_enabled = True
+
+    def __init__(self):
+        super().__init__("sync_batch_handler")
+        self.batch_sizes = []
+
+    def handle_batch(self, events):
+        self.batch_sizes.append(len(events))
+        return [self.handle(event) for event in events]
+
+
+@pytest.mark.asyncio
+async def test_emit_async_coroutine_handler():
+    """Test that emit_async resolves with the coroutine handler result."""
+    bus = AsyncioAuditBus(worker_tasks=2)
+    handler = AsyncRecordingHandler()
+    bus.register_handler(handler)
+    await bus.start()
+
+    result = await bus.emit_async(_make_event("async_1"))
+
+    assert result.status == "processed"
+    assert result.federation_proof == "proof_async_1"
+    assert [e.event_id for e in handler.events] == ["async_1"]
+    await bus.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_emit_batch_gather_order_and_failures():
+    """Test emit_batch returns results in input order and marks failures."""
+    bus = AsyncioAuditBus(worker_tasks=4, drain_batch_size=16)
+    bus.register_handler(AsyncRecordingHandler(fail_on="batch_7"))
+    await bus.start()
+
+    events = [_make_event(f"batch_{i}") for i in range(1000)]
+    results = await bus.emit_batch(events, timeout_ms=10000)
+
+    assert [r.event_id for r in results] == [e.event_id for e in events]
+    assert results[7].status == "failed"
+    assert "boom" in results[7].error
+    assert sum(r.status == "processed" for r in results) == 999
+
+    health = bus.health_check()
+    assert health["metrics"]["events_processed"] == 1000
+    assert health["metrics"]["events_failed"] == 1
+    assert not bus.pending_results
+    await bus.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_bridged_on_bounded_executor():
+    """Test that sync handlers are bridged and share one executor thread."""
+    bus = AsyncioAuditBus(worker_tasks=4)
+    handler = SyncRecordingHandler()
+    bus.register_handler(handler)
+    await bus.start()
+
+    assert isinstance(bus.handlers[0], SyncHandlerBridge)
+
+    results = await bus.emit_batch([_make_event(f"sync_{i}") for i in range(500)])
+
+    assert all(r.worm_hash == "ab" * 32 for r in results)
+    assert len(handler.events) == 500
+    assert len(handler.threads) == 1
+    await bus.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_bridge_uses_handle_batch():
+    """Test that batch-capable sync handlers get one call per drained batch."""
+    bus = AsyncioAuditBus(worker_tasks=1, drain_batch_size=50)
+    handler = SyncBatchHandler()
+    bus.register_handler(handler)
+    await bus.start()
+
+    await bus.emit_batch([_make_event(f"wb_{i}") for i in range(200)])
+
+    assert sum(handler.batch_sizes) == 200
+    assert max(handler.batch_sizes) == 50
+    await bus.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_drops_and_resolves():
+    """Test that dropped events resolve immediately with status dropped."""
+    bus = AsyncioAuditBus(max_queue_size=5, worker_tasks=1, log_dropped_events=False)
+    bus.register_handler(AsyncRecordingHandler())
+    await bus.start()
+
+    futures = [bus.emit_async(_make_event(f"bp_{i}")) for i in range(10)]
+    results = await asyncio.gather(*futures)
+
+    assert sum(r.status == "dropped" for r in results) == 5
+    assert bus.health_check()["metrics"]["events_dropped"] == 5
+    await bus.shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_emit_batch_timeout():
+    """Test that emit_batch raises TimeoutError and clears pending futures."""
+
+    class SlowHandler(AsyncRecordingHandler):
+        async def handle(self, event):
+            await asyncio.sleep(5)
+
+    bus = AsyncioAuditBus(worker_tasks=1)
+    bus.register_handler(SlowHandler())
+    await bus.start()
+
+    with pytest.raises(TimeoutError):
+        await bus.emit_batch([_make_event("slow_1")], timeout_ms=100)
+
+    assert not bus.pending_results
+    await bus.shutdown_async(timeout_ms=100)
+
+
+def test_emit_sync_and_emit_from_other_thread():
+    """Test emit_sync/emit/flush/shutdown from a thread outside the bus loop."""
+    loop = asyncio.new_event_loop()
+    bus = AsyncioAuditBus(worker_tasks=2)
+    handler = AsyncRecordingHandler()
+    bus.register_handler(handler)
+
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    asyncio.run_coroutine_threadsafe(bus.start(), loop).result()
+
+    result = bus.emit_sync(_make_event("thread_sync"), timeout_ms=5000)
+    assert result.status == "processed"
+
+    for i in range(100):
+        bus.emit(_make_event(f"thread_{i}"))
+    flush = bus.flush(timeout_ms=5000)
+
+    assert flush["status"] == "completed"
+    assert flush["events_flushed"] == 101
+
+    bus.shutdown(timeout_ms=5000)
+    assert bus.workers == []
+
+    loop.call_soon_threadsafe(loop.stop)
+    loop_thread.join(timeout=5)
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_emit_sync_on_loop_rejected():
+    """Test that blocking calls on the bus loop are rejected."""
+    bus = AsyncioAuditBus(worker_tasks=1)
+    await bus.start()
+
+    with pytest.raises(RuntimeError):
+        bus.emit_sync(_make_event("blocked"))
+    with pytest.raises(RuntimeError):
+        bus.flush()
+
+    await bus.shutdown_async()
+    assert bus.emit_async(_make_event("late")).result().status == "dropped"
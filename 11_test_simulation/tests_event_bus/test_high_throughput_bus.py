@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Unit Tests: High-Throughput InMemoryAuditBus
+=============================================
+
+Tests for the sharded batch-drain mode of InMemoryAuditBus.
+
+Test Coverage:
+- Batch drain delivers every event exactly once
+- Per-key ordering with shard_key
+- Routing cache invalidation on (un)registration
+- Batch-capable handlers receive drained batches
+- Handler failures, backpressure and shutdown drain
+
+Status: Production-Ready
+Version: 1.0.0
+"""
+
+import pytest
+import threading
+from datetime import datetime
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "interfaces"))
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "event_bus"))
+
+from audit_event_emitter import (
+    AuditEvent,
+    EmitResult,
+    EventSeverity,
+    EventType
+)
+
+from in_memory_bus import InMemoryAuditBus
+
+
+def _make_event(event_id: str, source_module: str = "test/high_throughput",
+                requires_worm: bool = False) -> AuditEvent:
+    return AuditEvent(
+        event_id=event_id,
+        timestamp=datetime.utcnow(),
+        source_module=source_module,
+        event_type=EventType.HEALTH_CHECK,
+        severity=EventSeverity.INFO,
+        data={"event": event_id},
+        requires_worm=requires_worm
+    )
+
+
+class RecordingHandler:
+    """Handler recording processed events (thread-safe)."""
+
+    def __init__(self, handler_name: str = "recording_handler", worm_only: bool = False):
+        self.handler_name = handler_name
+        self.worm_only = worm_only
+        self.events = []
+        self.lock = threading.Lock()
+
+    def handle(self, event: AuditEvent) -> EmitResult:
+        with self.lock:
+            self.events.append(event)
+        return EmitResult(event_id=event.event_id, status="processed")
+
+    def supports(self, event: AuditEvent) -> bool:
+        return event.requires_worm or not self.worm_only
+
+    def name(self) -> str:
+        return self.handler_name
+
+
+class BatchRecordingHandler(RecordingHandler):
+    """Handler exposing handle_batch()."""
+
+    batch_enabled = True
+
+    def __init__(self):
+        super().__init__("batch_recording_handler")
+        self.batch_sizes = []
+
+    def handle_batch(self, events):
+        with self.lock:
+            self.batch_sizes.append(len(events))
+            self.events.extend(events)
+        return [
+            EmitResult(event_id=event.event_id, status="processed", worm_hash="ab" * 32)
+            for event in events
+        ]
+
+
+@pytest.fixture
+def bus():
+    """Create high-throughput event bus."""
+    bus = InMemoryAuditBus(
+        max_queue_size=10000,
+        worker_threads=4,
+        high_throughput=True,
+        drain_batch_size=64
+    )
+    yield bus
+    bus.shutdown(timeout_ms=5000)
+
+
+def test_all_events_delivered_once(bus):
+    """Test that batch drain delivers every event exactly once."""
+    handler = RecordingHandler()
+    bus.register_handler(handler)
+
+    for i in range(2000):
+        bus.emit(_make_event(f"ht_{i}"))
+
+    flush = bus.flush(timeout_ms=10000)
+
+    assert flush["status"] == "completed"
+    assert flush["events_flushed"] == 2000
+    assert sorted(e.event_id for e in handler.events) == sorted(f"ht_{i}" for i in range(2000))
+
+    health = bus.health_check()
+    assert health["queue_depth"] == 0
+    assert health["metrics"]["events_processed"] == 2000
+
+
+def test_shard_key_preserves_per_key_order():
+    """Test that events sharing a shard key are processed in emit order."""
+    bus = InMemoryAuditBus(worker_threads=4, high_throughput=True,
+                           drain_batch_size=8, shard_key="source_module")
+    handler = RecordingHandler()
+    bus.register_handler(handler)
+
+    for i in range(500):
+        bus.emit(_make_event(f"order_{i}", source_module=f"module_{i % 5}"))
+    bus.flush(timeout_ms=10000)
+    bus.shutdown()
+
+    for m in range(5):
+        ids = [int(e.event_id.split("_")[1]) for e in handler.events
+               if e.source_module == f"module_{m}"]
+        assert ids == sorted(ids)
+        assert len(ids) == 100
+
+
+def test_emit_sync_and_routing_cache(bus):
+    """Test emit_sync results and routing cache invalidation."""
+    worm_handler = RecordingHandler("worm_only", worm_only=True)
+    bus.register_handler(worm_handler)
+
+    result = bus.emit_sync(_make_event("route_1"), timeout_ms=5000)
+    assert result.status == "processed"
+    assert worm_handler.events == []
+
+    bus.emit_sync(_make_event("route_2", requires_worm=True), timeout_ms=5000)
+    assert [e.event_id for e in worm_handler.events] == ["route_2"]
+
+    # Newly registered handler must be picked up for a cached route
+    late_handler = RecordingHandler("late")
+    bus.register_handler(late_handler)
+    bus.emit_sync(_make_event("route_3"), timeout_ms=5000)
+    assert [e.event_id for e in late_handler.events] == ["route_3"]
+
+    assert bus.unregister_handler("late")
+    bus.emit_sync(_make_event("route_4"), timeout_ms=5000)
+    assert len(late_handler.events) == 1
+
+
+def test_batch_handler_receives_batches(bus):
+    """Test that batch-capable handlers get one call per drained batch."""
+    handler = BatchRecordingHandler()
+    bus.register_handler(handler)
+
+    result = bus.emit_sync(_make_event("batch_sync"), timeout_ms=5000)
+    assert result.worm_hash == "ab" * 32
+
+    for i in range(1000):
+        bus.emit(_make_event(f"batch_{i}"))
+    bus.flush(timeout_ms=10000)
+
+    assert len(handler.events) == 1001
+    assert max(handler.batch_sizes) <= 64
+    assert len(handler.batch_sizes) < 1001
+
+
+def test_handler_failure_marks_failed(bus):
+    """Test that a failing handler marks only its events as failed."""
+    class FailingHandler:
+        def handle(self, event):
+            raise ValueError("Simulated failure")
+
+        def supports(self, event):
+            return event.requires_worm
+
+        def name(self):
+            return "failing_handler"
+
+    bus.register_handler(RecordingHandler())
+    bus.register_handler(FailingHandler())
+
+    failed = bus.emit_sync(_make_event("fail_1", requires_worm=True), timeout_ms=5000)
+    assert failed.status == "failed"
+    assert "Simulated failure" in failed.error
+
+    ok = bus.emit_sync(_make_event("fail_2"), timeout_ms=5000)
+    assert ok.status == "processed"
+
+    assert bus.health_check()["metrics"]["events_failed"] == 1
+
+
+def test_backpressure_and_shutdown_drain():
+    """Test shard capacity drops and that shutdown drains queued events."""
+    release = threading.Event()
+
+    class BlockingHandler(RecordingHandler):
+        def handle(self, event):
+            release.wait(timeout=5)
+            return super().handle(event)
+
+    bus = InMemoryAuditBus(max_queue_size=10, worker_threads=1, high_throughput=True,
+                           drain_batch_size=1, log_dropped_events=False)
+    handler = BlockingHandler()
+    bus.register_handler(handler)
+
+    for i in range(30):
+        bus.emit(_make_event(f"bp_{i}"))
+
+    dropped = bus.health_check()["metrics"]["events_dropped"]
+    assert dropped > 0
+
+    release.set()
+    bus.shutdown(timeout_ms=5000)
+    assert len(handler.events) == 30 - dropped
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
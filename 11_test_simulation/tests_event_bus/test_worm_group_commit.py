@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Unit Tests: WORM Handler Group Commit
+======================================
+
+Tests for the batch (group-commit) mode of WORMHandler.
+
+Test Coverage:
+- Concurrent handle() calls share group commits
+- handle_batch() packs events into one durable commit
+- WORM violations inside a batch
+- flush_interval_ms bounds how long a partial group lingers
+- Event bus integration with batch mode
+
+Status: Production-Ready
+Version: 1.0.0
+"""
+
+import pytest
+import threading
+import time
+from datetime import datetime
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "interfaces"))
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "event_bus"))
+sys.path.insert(0, str(ROOT / "02_audit_logging" / "handlers"))
+
+from audit_event_emitter import (
+    AuditEvent,
+    EventSeverity,
+    EventType
+)
+
+from in_memory_bus import InMemoryAuditBus
+from worm_handler import WORMHandler
+from worm_storage_engine import WORMStorageEngine
+
+
+def _make_event(event_id: str) -> AuditEvent:
+    return AuditEvent(
+        event_id=event_id,
+        timestamp=datetime.utcnow(),
+        source_module="test/group_commit",
+        event_type=EventType.HEALTH_CHECK,
+        severity=EventSeverity.INFO,
+        data={"event": event_id},
+        requires_worm=True
+    )
+
+
+@pytest.fixture
+def batch_handler(tmp_path) -> WORMHandler:
+    """Create WORM handler with group commit enabled."""
+    return WORMHandler(
+        storage_root=str(tmp_path / "vault"),
+        batch_enabled=True,
+        batch_size=50,
+        flush_interval_ms=20
+    )
+
+
+def test_concurrent_handle_group_commit(batch_handler):
+    """Concurrent events are committed in shared groups."""
+    results = []
+    results_lock = threading.Lock()
+
+    def worker(worker_id: int):
+        for i in range(50):
+            result = batch_handler.handle(_make_event(f"gc_{worker_id}_{i}"))
+            with results_lock:
+                results.append(result)
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 400
+    assert all(r.status == "processed" and r.worm_hash for r in results)
+    assert batch_handler.stats["events_processed"] == 400
+    assert batch_handler.stats["batches_committed"] <= 400
+
+    reopened = WORMStorageEngine(batch_handler.storage_root)
+    assert len(reopened.index) == 400
+    assert reopened.verify_all_integrity()["failed"] == 0
+
+
+def test_handle_batch_single_commit(batch_handler):
+    """handle_batch() writes one pack and one access-log record per group."""
+    events = [_make_event(f"hb_{i}") for i in range(30)]
+    results = batch_handler.handle_batch(events)
+
+    assert [r.event_id for r in results] == [e.event_id for e in events]
+    assert all(r.status == "processed" for r in results)
+    assert batch_handler.stats["batches_committed"] == 1
+
+    access_log = batch_handler.worm.get_access_log(limit=10)
+    assert sum(1 for entry in access_log if entry["event_type"] == "write_batch") == 1
+
+
+def test_handle_batch_worm_violation(batch_handler):
+    """Duplicate event IDs fail individually without aborting the batch."""
+    batch_handler.handle(_make_event("dup_001"))
+    results = batch_handler.handle_batch([
+        _make_event("dup_001"),
+        _make_event("dup_002"),
+        _make_event("dup_002")
+    ])
+
+    assert [r.status for r in results] == ["failed", "processed", "failed"]
+    assert "WORM violation" in results[0].error
+    assert batch_handler.stats["worm_violations"] == 2
+
+
+def test_partial_group_commits_after_flush_interval(tmp_path):
+    """A group below batch_size is committed once its oldest event has lingered flush_interval_ms."""
+    handler = WORMHandler(
+        storage_root=str(tmp_path / "vault"),
+        batch_enabled=True,
+        batch_size=50,
+        flush_interval_ms=200
+    )
+    results = []
+    results_lock = threading.Lock()
+
+    def worker(event_id: str):
+        result = handler.handle(_make_event(event_id))
+        with results_lock:
+            results.append((result, time.monotonic()))
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker, args=(f"linger_{k}",)) for k in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(r.status == "processed" for r, _ in results)
+    assert all(done - start >= 0.2 for _, done in results)
+    assert handler.stats["batches_committed"] == 1
+
+    access_log = handler.worm.get_access_log(limit=10)
+    assert sum(1 for entry in access_log if entry["event_type"] == "write_batch") == 1
+
+
+def test_full_group_commits_without_lingering(tmp_path):
+    """Reaching batch_size commits immediately instead of waiting for the deadline."""
+    handler = WORMHandler(
+        storage_root=str(tmp_path / "vault"),
+        batch_enabled=True,
+        batch_size=4,
+        flush_interval_ms=60000
+    )
+    threads = [
+        threading.Thread(target=handler.handle, args=(_make_event(f"full_{k}"),))
+        for k in range(4)
+    ]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert time.monotonic() - start < 10
+    assert handler.stats["events_processed"] == 4
+    assert handler.stats["batches_committed"] == 1
+
+
+def test_event_bus_with_batch_worm_handler(batch_handler):
+    """emit_sync resolves once the group commit is durable."""
+    bus = InMemoryAuditBus(max_queue_size=1000, worker_threads=4)
+    bus.register_handler(batch_handler)
+    try:
+        for i in range(100):
+            bus.emit(_make_event(f"bus_gc_{i}"))
+        result = bus.emit_sync(_make_event("bus_gc_sync"), timeout_ms=5000)
+        bus.flush(timeout_ms=30000)
+    finally:
+        bus.shutdown(timeout_ms=5000)
+
+    assert result.status == "processed"
+    assert result.worm_hash is not None
+    assert "bus_gc_sync" in batch_handler.worm.index
+    assert batch_handler.stats["events_processed"] == 101
+
+
+def test_slow_commit_does_not_drop_buffered_events(tmp_path):
+    """Events buffered behind a commit longer than flush_interval_ms are still written."""
+    handler = WORMHandler(
+        storage_root=str(tmp_path / "vault"),
+        batch_enabled=True,
+        batch_size=50,
+        flush_interval_ms=10
+    )
+    write_batch = handler.worm.write_evidence_batch
+
+    def slow_write_batch(items):
+        time.sleep(0.1)
+        return write_batch(items)
+
+    handler.worm.write_evidence_batch = slow_write_batch
+
+    results = []
+    results_lock = threading.Lock()
+
+    def worker(worker_id: int):
+        for i in range(5):
+            result = handler.handle(_make_event(f"slow_{worker_id}_{i}"))
+            with results_lock:
+                results.append(result)
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 20
+    assert all(r.status == "processed" for r in results)
+    assert handler.stats["events_failed"] == 0
+    assert len(handler.worm.index) == 20
@@ -1,4 +1,4 @@
-import time, json, sys
+import time, json, sys, hashlib
 from pathlib import Path
 
 # Add processor to path
@@ -27,3 +27,15 @@ def test_merkle_root_stability_small_batch():
     evs_reversed = list(reversed(evs))
     res3 = bp.process(evs_reversed, batch_id="b1")
     assert res.merkle_root != res3.merkle_root  # Order matters
+
+def test_batch_inclusion_proofs():
+    sys.path.insert(0, str(ROOT / "02_audit_logging" / "merkle"))
+    from merkle_engine import verify_inclusion
+    evs = [{"event_id": f"e{i}", "payload": {"x": i}} for i in range(7)]
+    res = FederationBatchProcessor().process(evs, batch_id="b2")
+    for i, ev in enumerate(evs):
+        leaf = hashlib.sha256(canonical_json(ev["payload"])).digest()
+        proof = [bytes.fromhex(s) for s in res.inclusion_proof(i)]
+        assert verify_inclusion(leaf, i, proof, bytes.fromhex(res.merkle_root))
+    # Audit pairs: 7 leaves -> 4 + 2 + 1 hashed pairs
+    assert len(res.audit_pairs) == 7
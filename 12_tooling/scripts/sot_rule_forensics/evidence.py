@@ -26,6 +26,7 @@ class EvidenceChain:
     def __init__(self):
         self.chain: List[EvidenceEntry] = []
         self.chain_hash: str = ""
+        self._encoded: List[str] = []  # JSON of each chain entry (entries are write-once)
 
     def add_entry(self, rule_id: str, hash_sig: str, operation: str = 'CREATE'):
         """Add evidence entry"""
@@ -33,17 +34,26 @@ class EvidenceChain:
         self.chain.append(entry)
         self._update_chain_hash()
 
+    def add_entries(self, entries: List[Tuple[str, str]], operation: str = 'CREATE'):
+        """Add (rule_id, hash_sig) entries, updating the chain hash once"""
+        for rule_id, hash_sig in entries:
+            self.chain.append(EvidenceEntry(rule_id, datetime.now(), hash_sig, operation))
+        if entries:
+            self._update_chain_hash()
+
     def _update_chain_hash(self):
-        """Update chain hash"""
-        chain_data = json.dumps([
-            {
+        """Update chain hash (sha256 of the JSON list of all entries)"""
+        if len(self._encoded) > len(self.chain):
+            self._encoded = []
+        for e in self.chain[len(self._encoded):]:
+            self._encoded.append(json.dumps({
                 'rule_id': e.rule_id,
                 'timestamp': e.timestamp.isoformat(),
                 'hash': e.hash_signature,
                 'op': e.operation
-            }
-            for e in self.chain
-        ])
+            }))
+        # Same text as json.dumps() of the list
+        chain_data = '[' + ', '.join(self._encoded) + ']'
         self.chain_hash = hashlib.sha256(chain_data.encode()).hexdigest()
 
     def verify_chain(self) -> bool:
@@ -15,12 +15,13 @@ Privacy: PII filtering enforced before hashing
 
 import hashlib
 import json
-import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 from urllib.request import urlopen
 
+from replay_cache import create_replay_cache
+
 try:
     import jwt
     from jwt import PyJWK
@@ -84,6 +85,8 @@ class ProofVerifier:
         expected_audience: str,
         max_clock_skew_seconds: int = 60,
         jti_cache_ttl_seconds: int = 3600,
+        jti_cache_max_entries: int = 1_000_000,
+        jti_cache_db_path: Optional[str] = None,
     ):
         """
         Initialize proof verifier.
@@ -92,11 +95,18 @@ class ProofVerifier:
             expected_audience: Expected 'aud' claim value
             max_clock_skew_seconds: Maximum allowed clock skew for exp/nbf
             jti_cache_ttl_seconds: TTL for jti replay cache
+            jti_cache_max_entries: Size cap for jti replay cache
+            jti_cache_db_path: SQLite file for a replay cache shared between
+                gateway processes (default: in-process cache)
         """
         self.expected_audience = expected_audience
         self.max_clock_skew = max_clock_skew_seconds
         self.jti_cache_ttl = jti_cache_ttl_seconds
-        self._jti_cache: Dict[str, float] = {}  # jti -> timestamp
+        self._jti_cache = create_replay_cache(
+            ttl_seconds=jti_cache_ttl_seconds,
+            max_entries=jti_cache_max_entries,
+            db_path=jti_cache_db_path,
+        )
         self._jwk_cache: Dict[str, Any] = {}  # jwk_url -> keys
 
     def verify_jwt(
@@ -176,11 +186,10 @@ class ProofVerifier:
         if not jti:
             raise ProofVerifierError("Missing required 'jti' claim")
 
-        if self._is_jti_seen(jti):
+        # Atomic check-and-record (also across processes with a shared cache)
+        if not self._jti_cache.check_and_add(jti):
             raise ProofVerifierError(f"Replay detected: jti={jti} already seen")
 
-        self._mark_jti_seen(jti)
-
         # PII filtering: Ensure no forbidden fields
         self._check_pii(claims)
 
@@ -267,21 +276,6 @@ class ProofVerifier:
 
         return digest
 
-    def _is_jti_seen(self, jti: str) -> bool:
-        """Check if jti has been seen (replay protection)"""
-        # Clean expired entries
-        now = time.time()
-        self._jti_cache = {
-            k: v for k, v in self._jti_cache.items()
-            if now - v < self.jti_cache_ttl
-        }
-
-        return jti in self._jti_cache
-
-    def _mark_jti_seen(self, jti: str) -> None:
-        """Mark jti as seen (replay protection)"""
-        self._jti_cache[jti] = time.time()
-
 def create_proof_record(
     proof_id: str,
     provider_id: str,
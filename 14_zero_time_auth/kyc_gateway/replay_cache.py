@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+SSID KYC Gateway - JTI Replay Cache
+License: GPL-3.0-or-later
+
+Expiring "seen" sets for JWT replay protection:
+- JtiReplayCache: in-process, O(1) amortized insert/lookup
+- SQLiteReplayCache: shared between gateway processes (WAL mode)
+
+Both caches use one fixed TTL, so insertion order equals expiry order and
+expired entries are dropped from the front of a FIFO instead of rescanning
+the whole cache. A size cap bounds memory; when it is reached the entries
+closest to expiry are evicted first.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+
+class JtiReplayCache:
+    """
+    In-process expiring set of seen jti values.
+
+    check_and_add() is atomic (thread-safe) and O(1) amortized: each entry
+    is appended to a FIFO once and popped once when it expires or is
+    evicted by the size cap.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_entries: int = 1_000_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            ttl_seconds: How long a jti is remembered
+            max_entries: Size cap (oldest entries evicted beyond this)
+            clock: Time source (seconds)
+        """
+        self.ttl = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._expiry: Dict[str, float] = {}  # jti -> expires_at
+        self._order: Deque[Tuple[float, str]] = deque()  # (expires_at, jti), ascending
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _purge(self, now: float) -> None:
+        """Drop expired entries from the front of the FIFO."""
+        order = self._order
+        expiry = self._expiry
+        while order and order[0][0] <= now:
+            expires_at, jti = order.popleft()
+            # Skip stale FIFO records of re-added jti values
+            if expiry.get(jti) == expires_at:
+                del expiry[jti]
+
+    def _evict(self) -> None:
+        """Enforce max_entries by evicting the entries closest to expiry."""
+        order = self._order
+        expiry = self._expiry
+        while len(expiry) > self.max_entries and order:
+            expires_at, jti = order.popleft()
+            if expiry.get(jti) == expires_at:
+                del expiry[jti]
+                self.evictions += 1
+
+    def check_and_add(self, jti: str) -> bool:
+        """
+        Record jti if not seen within the TTL.
+
+        Returns:
+            True if jti was new (and is now recorded), False on replay
+        """
+        with self._lock:
+            now = self._clock()
+            self._purge(now)
+            if jti in self._expiry:
+                return False
+            expires_at = now + self.ttl
+            self._expiry[jti] = expires_at
+            self._order.append((expires_at, jti))
+            self._evict()
+            return True
+
+    def contains(self, jti: str) -> bool:
+        """True if jti was seen within the TTL."""
+        with self._lock:
+            expires_at = self._expiry.get(jti)
+            return expires_at is not None and expires_at > self._clock()
+
+    def add(self, jti: str) -> None:
+        """Record jti (refreshing its TTL if already present)."""
+        with self._lock:
+            now = self._clock()
+            self._purge(now)
+            expires_at = now + self.ttl
+            self._expiry[jti] = expires_at
+            self._order.append((expires_at, jti))
+            self._evict()
+
+    def __contains__(self, jti: str) -> bool:
+        return self.contains(jti)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge(self._clock())
+            return len(self._expiry)
+
+
+class SQLiteReplayCache:
+    """
+    Expiring set of seen jti values in a SQLite database.
+
+    Several gateway processes pointing at the same file share replay
+    state. check_and_add() is a single INSERT ... ON CONFLICT statement, so
+    two processes racing on the same jti cannot both accept it. Expired
+    rows are purged every purge_interval inserts via the expires_at index.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = 3600,
+        max_entries: int = 1_000_000,
+        purge_interval: int = 1000,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            db_path: SQLite database file (shared between processes)
+            ttl_seconds: How long a jti is remembered
+            max_entries: Size cap enforced on purge (oldest evicted first)
+            purge_interval: Inserts between purges of expired rows
+            clock: Time source (seconds)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.purge_interval = max(1, purge_interval)
+        self._clock = clock
+        self._inserts = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_jti (
+                jti TEXT PRIMARY KEY,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_seen_jti_expires ON seen_jti (expires_at)"
+        )
+
+    def check_and_add(self, jti: str) -> bool:
+        """
+        Record jti if not seen within the TTL (atomic across processes).
+
+        Returns:
+            True if jti was new (and is now recorded), False on replay
+        """
+        with self._lock:
+            now = self._clock()
+            cursor = self._conn.execute(
+                """
+                INSERT INTO seen_jti (jti, expires_at) VALUES (?, ?)
+                ON CONFLICT (jti) DO UPDATE SET expires_at = excluded.expires_at
+                WHERE seen_jti.expires_at <= ?
+                """,
+                (jti, now + self.ttl, now),
+            )
+            accepted = cursor.rowcount == 1
+
+            if accepted:
+                self._inserts += 1
+                if self._inserts % self.purge_interval == 0:
+                    self._purge(now)
+            return accepted
+
+    def _purge(self, now: float) -> None:
+        """Delete expired rows, then enforce max_entries."""
+        self._conn.execute("DELETE FROM seen_jti WHERE expires_at <= ?", (now,))
+        count = self._conn.execute("SELECT COUNT(*) FROM seen_jti").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                """
+                DELETE FROM seen_jti WHERE jti IN (
+                    SELECT jti FROM seen_jti ORDER BY expires_at LIMIT ?
+                )
+                """,
+                (excess,),
+            )
+            self.evictions += excess
+
+    def purge(self) -> None:
+        """Delete expired rows now."""
+        with self._lock:
+            self._purge(self._clock())
+
+    def contains(self, jti: str) -> bool:
+        """True if jti was seen within the TTL."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_jti WHERE jti = ? AND expires_at > ?",
+                (jti, self._clock()),
+            ).fetchone()
+            return row is not None
+
+    def add(self, jti: str) -> None:
+        """Record jti (refreshing its TTL if already present)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO seen_jti (jti, expires_at) VALUES (?, ?)",
+                (jti, self._clock() + self.ttl),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __contains__(self, jti: str) -> bool:
+        return self.contains(jti)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM seen_jti WHERE expires_at > ?", (self._clock(),)
+            ).fetchone()[0]
+
+
+def create_replay_cache(
+    ttl_seconds: float = 3600,
+    max_entries: int = 1_000_000,
+    db_path: Optional[str] = None,
+):
+    """
+    Create a replay cache: shared SQLite backend if db_path is given,
+    otherwise in-process.
+    """
+    if db_path:
+        return SQLiteReplayCache(db_path, ttl_seconds=ttl_seconds, max_entries=max_entries)
+    return JtiReplayCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
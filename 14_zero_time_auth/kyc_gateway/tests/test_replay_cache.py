@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for replay_cache.py
+License: GPL-3.0-or-later
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from replay_cache import JtiReplayCache, SQLiteReplayCache, create_replay_cache
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    caches = []
+
+    def _make(ttl_seconds=60, max_entries=1000, clock=None):
+        clock = clock or FakeClock()
+        if request.param == "memory":
+            cache = JtiReplayCache(ttl_seconds=ttl_seconds, max_entries=max_entries, clock=clock)
+        else:
+            cache = SQLiteReplayCache(str(tmp_path / "replay.db"), ttl_seconds=ttl_seconds,
+                                      max_entries=max_entries, purge_interval=1, clock=clock)
+            caches.append(cache)
+        return cache
+
+    yield _make
+    for cache in caches:
+        cache.close()
+
+def test_replay_detected_within_ttl(make_cache):
+    """Test a jti is accepted once and rejected until it expires"""
+    clock = FakeClock()
+    cache = make_cache(ttl_seconds=60, clock=clock)
+
+    assert cache.check_and_add("jti-1") is True
+    assert cache.check_and_add("jti-1") is False
+    assert "jti-1" in cache
+
+    clock.now += 59
+    assert cache.check_and_add("jti-1") is False
+
+    clock.now += 2
+    assert "jti-1" not in cache
+    assert cache.check_and_add("jti-1") is True
+
+def test_expired_entries_purged(make_cache):
+    """Test expired entries do not count towards the cache size"""
+    clock = FakeClock()
+    cache = make_cache(ttl_seconds=10, clock=clock)
+
+    for i in range(100):
+        cache.check_and_add(f"old-{i}")
+    clock.now += 11
+    cache.check_and_add("new")
+
+    assert len(cache) == 1
+
+def test_size_cap_evicts_oldest(make_cache):
+    """Test max_entries evicts the entries closest to expiry"""
+    clock = FakeClock()
+    cache = make_cache(ttl_seconds=3600, max_entries=10, clock=clock)
+
+    for i in range(15):
+        clock.now += 1
+        cache.check_and_add(f"jti-{i}")
+
+    assert len(cache) == 10
+    assert cache.evictions == 5
+    assert "jti-0" not in cache
+    assert "jti-14" in cache
+
+def test_sqlite_cache_shared_between_instances(tmp_path):
+    """Test two gateway processes sharing one SQLite replay cache"""
+    db_path = str(tmp_path / "shared.db")
+    gateway_a = SQLiteReplayCache(db_path, ttl_seconds=60)
+    gateway_b = SQLiteReplayCache(db_path, ttl_seconds=60)
+
+    assert gateway_a.check_and_add("shared-jti") is True
+    assert gateway_b.check_and_add("shared-jti") is False
+
+    gateway_a.close()
+    gateway_b.close()
+
+def test_create_replay_cache_backend_selection(tmp_path):
+    """Test factory selects the SQLite backend only when db_path is set"""
+    assert isinstance(create_replay_cache(), JtiReplayCache)
+
+    cache = create_replay_cache(db_path=str(tmp_path / "replay.db"))
+    assert isinstance(cache, SQLiteReplayCache)
+    cache.close()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,19 +2,252 @@
 """
 Unified Content Validator Generator - ALL 4 Holy SoT Files
 ============================================================
-Input: all_4_sot_semantic_rules.json (966 rules from all 4 files)
-Output: unified_content_validators.py (966 validator functions)
+Input: unified_content_validator_rules.json (966 rules from all 4 files)
+Output: unified_content_validators.py (966 validator functions), written
+        here and to 03_core/validators/sot/
+
+The input is the rule snapshot the checked-in validators were generated
+from; all_4_sot_semantic_rules.json has since been re-extracted (4723
+rules) and can be passed with --rules. Output is deterministic:
+--check regenerates in memory and fails if a checked-in copy differs.
 
 Fixes from previous version:
 - Proper string escaping (no f-string nesting issues)
-- Safe quote handling in validation_method fields
+- Safe quote handling in validation_method fields and descriptions
 - Cleaner code generation with template approach
+- Shared parsed-document store (LRU, keyed by path/mtime/size, libyaml
+  CSafeLoader when available) instead of one yaml.safe_load per validator
+- validate_all_batched(): validators grouped by target file, dotted paths
+  resolved in one traversal per document (driven by VALIDATOR_SPECS)
 """
 
 from pathlib import Path
+import argparse
+import io
 import json
+import sys
 from typing import Dict, List, Any
-from datetime import datetime
+
+SCRIPT_DIR = Path(__file__).parent
+REPO_ROOT = SCRIPT_DIR.parents[2]
+
+DEFAULT_RULES_JSON = SCRIPT_DIR / "unified_content_validator_rules.json"
+OUTPUT_FILES = (
+    SCRIPT_DIR / "unified_content_validators.py",
+    REPO_ROOT / "03_core" / "validators" / "sot" / "unified_content_validators.py",
+)
+
+
+def _docstring(text: str) -> str:
+    """Escape text for a triple-double-quoted docstring"""
+    return text.replace('\\', '\\\\').replace('"', '\\"')
+
+
+# Emitted verbatim into the generated module (helper section)
+DOCUMENT_STORE_HELPERS = '''# Parsed-document store
+# =====================
+# Validators share parsed YAML documents instead of re-reading the same
+# contract for every rule. Entries are keyed by (path, mtime, size), so an
+# edited file is parsed again; least recently used documents are evicted.
+# Returned documents are shared: treat them as read-only.
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_PATH_NOT_FOUND = object()
+_LEAF = object()
+
+
+class ParsedDocumentStore:
+    """LRU cache of parsed YAML documents keyed by (path, mtime, size)"""
+
+    def __init__(self, max_documents: int = 128):
+        self.max_documents = max(1, max_documents)
+        self._documents: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, file_path: Path) -> Any:
+        """Return the parsed document (raises on read/parse errors)"""
+        stat = file_path.stat()
+        key = str(file_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._documents.get(key)
+            if entry is not None and entry[0] == version:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+
+        with self._lock:
+            self.misses += 1
+            self._documents[key] = (version, data)
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+        return data
+
+    def clear(self) -> None:
+        """Drop all cached documents"""
+        with self._lock:
+            self._documents.clear()
+
+
+DOCUMENT_STORE = ParsedDocumentStore()
+
+
+def resolve_yaml_path(data: Any, yaml_path: str) -> Any:
+    """Navigate a dotted path (returns _PATH_NOT_FOUND if missing)"""
+    current = data
+    for key in yaml_path.split("."):
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+        else:
+            return _PATH_NOT_FOUND
+    return current
+
+
+def resolve_yaml_paths(data: Any, yaml_paths: List[str]) -> Dict[str, Any]:
+    """Resolve many dotted paths in one traversal (shared prefixes walked once)
+    Returns: {yaml_path: value or _PATH_NOT_FOUND}
+    """
+    trie: Dict[Any, Any] = {}
+    for yaml_path in yaml_paths:
+        node = trie
+        for key in yaml_path.split("."):
+            node = node.setdefault(key, {})
+        node[_LEAF] = yaml_path
+
+    resolved = dict.fromkeys(yaml_paths, _PATH_NOT_FOUND)
+    stack = [(trie, data)]
+    while stack:
+        node, current = stack.pop()
+        for key, child in node.items():
+            if key is _LEAF:
+                resolved[child] = current
+            elif isinstance(current, dict) and key in current:
+                stack.append((child, current[key]))
+    return resolved
+
+
+def check_yaml_field(current: Any, expected_value: Any) -> tuple[bool, Any]:
+    """Compare a resolved YAML value with the expected value"""
+    if current is _PATH_NOT_FOUND:
+        return (False, "PATH_NOT_FOUND")
+    return (current == expected_value, current)
+
+
+def check_yaml_list(current: Any, expected_list: List[Any]) -> tuple[bool, Any]:
+    """Compare a resolved YAML list with the expected list"""
+    if current is _PATH_NOT_FOUND:
+        return (False, "PATH_NOT_FOUND")
+    if not isinstance(current, list):
+        return (False, "NOT_A_LIST")
+    return (current == expected_list, current)
+
+
+def yaml_field_equals(repo_root: Path, yaml_file: str, yaml_path: str, expected_value: Any) -> tuple[bool, Any]:
+    """Check if YAML field equals expected value
+    Returns: (passed: bool, actual_value: Any)
+    """
+    file_path = repo_root / yaml_file
+    if not file_path.exists():
+        return (False, "FILE_NOT_FOUND")
+    
+    try:
+        data = DOCUMENT_STORE.load(file_path)
+        return check_yaml_field(resolve_yaml_path(data, yaml_path), expected_value)
+    except Exception as e:
+        return (False, f"ERROR: {str(e)}")
+
+
+def yaml_list_equals(repo_root: Path, yaml_file: str, yaml_path: str, expected_list: List[Any]) -> tuple[bool, Any]:
+    """Check if YAML list equals expected list
+    Returns: (passed: bool, actual_value: Any)
+    """
+    file_path = repo_root / yaml_file
+    if not file_path.exists():
+        return (False, "FILE_NOT_FOUND")
+    
+    try:
+        data = DOCUMENT_STORE.load(file_path)
+        return check_yaml_list(resolve_yaml_path(data, yaml_path), expected_list)
+    except Exception as e:
+        return (False, f"ERROR: {str(e)}")
+
+
+'''
+
+# Emitted verbatim into the generated class (after validate_all)
+VALIDATE_ALL_BATCHED_METHOD = '''    def validate_all_batched(self) -> List[ValidationResult]:
+        """Run all content validators, grouped by target file
+
+        Each YAML file is loaded once and the dotted paths of all its
+        validators are resolved in one traversal. Same results and order
+        as validate_all().
+        """
+        by_file: Dict[str, List[int]] = {}
+        for index, spec in enumerate(VALIDATOR_SPECS):
+            if spec[1] is not None:
+                by_file.setdefault(spec[2], []).append(index)
+
+        outcomes: Dict[int, tuple] = {}
+        for yaml_file, indices in by_file.items():
+            file_path = self.repo_root / yaml_file
+            if not file_path.exists():
+                for index in indices:
+                    outcomes[index] = (False, "FILE_NOT_FOUND")
+                continue
+
+            try:
+                data = DOCUMENT_STORE.load(file_path)
+                resolved = resolve_yaml_paths(data, [VALIDATOR_SPECS[i][3] for i in indices])
+            except Exception as e:
+                for index in indices:
+                    outcomes[index] = (False, f"ERROR: {str(e)}")
+                continue
+
+            for index in indices:
+                _, kind, _, yaml_path, expected, _, _ = VALIDATOR_SPECS[index]
+                if kind == "yaml_list":
+                    outcomes[index] = check_yaml_list(resolved[yaml_path], expected)
+                else:
+                    outcomes[index] = check_yaml_field(resolved[yaml_path], expected)
+
+        results = []
+        for index, (rule_id, kind, yaml_file, yaml_path, expected, severity, func_name) in enumerate(VALIDATOR_SPECS):
+            if kind is None:
+                results.append(getattr(self, func_name)())
+                continue
+
+            passed, actual = outcomes[index]
+            if kind == "yaml_list":
+                if passed:
+                    message = "PASS: " + yaml_path + " list matches"
+                else:
+                    message = "FAIL: " + yaml_path + " expected " + str(len(expected)) + " elements, got " + str(actual)
+            else:
+                if passed:
+                    message = "PASS: " + yaml_path + " = " + str(actual)
+                else:
+                    message = "FAIL: " + yaml_path + " expected " + repr(expected) + ", got " + str(actual)
+
+            results.append(ValidationResult(
+                rule_id=rule_id,
+                passed=passed,
+                severity=severity,
+                message=message,
+                evidence="YAML: " + yaml_file + " at " + yaml_path,
+                timestamp=datetime.now().isoformat()
+            ))
+
+        return results
+
+'''
 
 
 class UnifiedValidatorGenerator:
@@ -31,38 +264,33 @@ class UnifiedValidatorGenerator:
             data = json.load(f)
             self.rules = data['rules']
 
-    def generate_validators(self, output_file: Path):
-        """Generate complete validator module"""
-        print("=" * 80)
-        print("UNIFIED CONTENT VALIDATOR GENERATOR")
-        print("=" * 80)
-        print()
-        print(f"Input:  {self.rules_json}")
-        print(f"Output: {output_file}")
-        print(f"Rules:  {len(self.rules)}")
-        print()
+    def render(self) -> str:
+        """Render the complete validator module (deterministic)"""
+        f = io.StringIO()
+        self._write_header(f)
+        self._write_imports(f)
+        self._write_helper_functions(f)
+        self._write_validator_class_start(f)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            self._write_header(f)
-            self._write_imports(f)
-            self._write_helper_functions(f)
-            self._write_validator_class_start(f)
+        # Generate validator functions
+        for i, rule in enumerate(self.rules, start=1):
+            self._generate_validator_function(f, rule, i)
 
-            # Generate validator functions
-            for i, rule in enumerate(self.rules, start=1):
-                self._generate_validator_function(f, rule, i)
+        self._write_validate_all_method(f)
+        self._write_validate_all_batched_method(f)
+        self._write_validator_specs(f)
+        self._write_validator_class_end(f)
+        return f.getvalue()
 
-                if i % 100 == 0:
-                    print(f"  Generated {i}/{len(self.rules)} validators...")
+    def generate_validators(self, output_file: Path):
+        """Generate complete validator module"""
+        print(f"Rules:  {len(self.rules)}")
+        print(f"Output: {output_file}")
 
-            self._write_validate_all_method(f)
-            self._write_validator_class_end(f)
+        with open(output_file, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(self.render())
 
-        print()
-        print(f"[OK] Generated {len(self.rules)} validators")
-        print(f"[OK] Output: {output_file}")
-        print(f"     Size: {output_file.stat().st_size / 1024:.1f} KB")
-        print()
+        print(f"[OK] Generated {len(self.rules)} validators ({output_file.stat().st_size / 1024:.1f} KB)")
 
     def _write_header(self, f):
         """Write file header"""
@@ -71,7 +299,6 @@ class UnifiedValidatorGenerator:
         f.write('Unified Content Validators - ALL 4 Holy SoT Files\n')
         f.write('=' * 70 + '\n')
         f.write(f'Auto-generated from: {self.rules_json.name}\n')
-        f.write(f'Generated: {datetime.now().isoformat()}\n')
         f.write(f'Total Validators: {len(self.rules)}\n')
         f.write('\n')
         f.write('Source Files:\n')
@@ -89,8 +316,10 @@ class UnifiedValidatorGenerator:
 
     def _write_imports(self, f):
         """Write import statements"""
+        f.write('from collections import OrderedDict\n')
         f.write('from pathlib import Path\n')
-        f.write('from typing import Any, List\n')
+        f.write('from typing import Any, Dict, List, Tuple\n')
+        f.write('import threading\n')
         f.write('import yaml\n')
         f.write('from dataclasses import dataclass\n')
         f.write('from datetime import datetime\n')
@@ -109,62 +338,9 @@ class UnifiedValidatorGenerator:
         f.write('    timestamp: str\n')
         f.write('\n\n')
 
-        # Helper: yaml_field_equals
-        f.write('def yaml_field_equals(repo_root: Path, yaml_file: str, yaml_path: str, expected_value: Any) -> tuple[bool, Any]:\n')
-        f.write('    """Check if YAML field equals expected value\n')
-        f.write('    Returns: (passed: bool, actual_value: Any)\n')
-        f.write('    """\n')
-        f.write('    file_path = repo_root / yaml_file\n')
-        f.write('    if not file_path.exists():\n')
-        f.write('        return (False, "FILE_NOT_FOUND")\n')
-        f.write('    \n')
-        f.write('    try:\n')
-        f.write('        with open(file_path, "r", encoding="utf-8") as f:\n')
-        f.write('            data = yaml.safe_load(f)\n')
-        f.write('        \n')
-        f.write('        # Navigate yaml_path\n')
-        f.write('        keys = yaml_path.split(".")\n')
-        f.write('        current = data\n')
-        f.write('        for key in keys:\n')
-        f.write('            if isinstance(current, dict) and key in current:\n')
-        f.write('                current = current[key]\n')
-        f.write('            else:\n')
-        f.write('                return (False, "PATH_NOT_FOUND")\n')
-        f.write('        \n')
-        f.write('        return (current == expected_value, current)\n')
-        f.write('    except Exception as e:\n')
-        f.write('        return (False, f"ERROR: {str(e)}")\n')
-        f.write('\n\n')
-
-        # Helper: yaml_list_equals
-        f.write('def yaml_list_equals(repo_root: Path, yaml_file: str, yaml_path: str, expected_list: List[Any]) -> tuple[bool, Any]:\n')
-        f.write('    """Check if YAML list equals expected list\n')
-        f.write('    Returns: (passed: bool, actual_value: Any)\n')
-        f.write('    """\n')
-        f.write('    file_path = repo_root / yaml_file\n')
-        f.write('    if not file_path.exists():\n')
-        f.write('        return (False, "FILE_NOT_FOUND")\n')
-        f.write('    \n')
-        f.write('    try:\n')
-        f.write('        with open(file_path, "r", encoding="utf-8") as f:\n')
-        f.write('            data = yaml.safe_load(f)\n')
-        f.write('        \n')
-        f.write('        # Navigate yaml_path\n')
-        f.write('        keys = yaml_path.split(".")\n')
-        f.write('        current = data\n')
-        f.write('        for key in keys:\n')
-        f.write('            if isinstance(current, dict) and key in current:\n')
-        f.write('                current = current[key]\n')
-        f.write('            else:\n')
-        f.write('                return (False, "PATH_NOT_FOUND")\n')
-        f.write('        \n')
-        f.write('        if not isinstance(current, list):\n')
-        f.write('            return (False, "NOT_A_LIST")\n')
-        f.write('        \n')
-        f.write('        return (current == expected_list, current)\n')
-        f.write('    except Exception as e:\n')
-        f.write('        return (False, f"ERROR: {str(e)}")\n')
-        f.write('\n\n')
+        # Helpers: parsed-document store, path resolution,
+        # yaml_field_equals, yaml_list_equals
+        f.write(DOCUMENT_STORE_HELPERS)
 
         # Helper: file_exists
         f.write('def file_exists(repo_root: Path, file_path: str) -> bool:\n')
@@ -228,7 +404,7 @@ class UnifiedValidatorGenerator:
         func_name = f"validate_{rule_id.lower().replace('-', '_')}"
 
         f.write(f'    def {func_name}(self) -> ValidationResult:\n')
-        f.write(f'        """{description}"""\n')
+        f.write(f'        """{_docstring(description)}"""\n')
 
         # Use repr() for safe string representation
         f.write(f'        yaml_file = {repr(yaml_file)}\n')
@@ -266,7 +442,7 @@ class UnifiedValidatorGenerator:
         func_name = f"validate_{rule_id.lower().replace('-', '_')}"
 
         f.write(f'    def {func_name}(self) -> ValidationResult:\n')
-        f.write(f'        """{description}"""\n')
+        f.write(f'        """{_docstring(description)}"""\n')
         f.write(f'        yaml_file = {repr(yaml_file)}\n')
         f.write(f'        yaml_path = {repr(yaml_path)}\n')
         f.write(f'        expected_list = {repr(expected_value)}\n')
@@ -299,7 +475,7 @@ class UnifiedValidatorGenerator:
         func_name = f"validate_{rule_id.lower().replace('-', '_')}"
 
         f.write(f'    def {func_name}(self) -> ValidationResult:\n')
-        f.write(f'        """{description}"""\n')
+        f.write(f'        """{_docstring(description)}"""\n')
 
         if field_name == 'root_count':
             f.write(f'        actual = count_root_directories(self.repo_root)\n')
@@ -338,10 +514,10 @@ class UnifiedValidatorGenerator:
         func_name = f"validate_{rule_id.lower().replace('-', '_')}"
 
         f.write(f'    def {func_name}(self) -> ValidationResult:\n')
-        f.write(f'        """{description}"""\n')
+        f.write(f'        """{_docstring(description)}"""\n')
         f.write(f'        # Generic validator - needs implementation\n')
         f.write(f'        passed = False\n')
-        f.write(f'        message = "NOT_IMPLEMENTED: {description}"\n')
+        f.write(f'        message = {repr("NOT_IMPLEMENTED: " + description)}\n')
         f.write(f'\n')
         f.write(f'        return ValidationResult(\n')
         f.write(f'            rule_id={repr(rule_id)},\n')
@@ -369,6 +545,32 @@ class UnifiedValidatorGenerator:
         f.write('        return results\n')
         f.write('\n')
 
+    def _write_validate_all_batched_method(self, f):
+        """Write validate_all_batched() method"""
+        f.write(VALIDATE_ALL_BATCHED_METHOD)
+
+    def _write_validator_specs(self, f):
+        """Write VALIDATOR_SPECS table (drives validate_all_batched)"""
+        kinds = {'YAML_FIELD': 'yaml_field', 'YAML_LIST': 'yaml_list'}
+
+        f.write('\n')
+        f.write('# Validator specs in validate_all() order:\n')
+        f.write('# (rule_id, kind, yaml_file, yaml_path, expected, severity, func_name)\n')
+        f.write('# kind None -> validate_all_batched() calls the validator method\n')
+        f.write('VALIDATOR_SPECS = (\n')
+        for rule in self.rules:
+            rule_id = rule['rule_id']
+            func_name = f"validate_{rule_id.lower().replace('-', '_')}"
+            kind = kinds.get(rule['category'])
+            if kind is None:
+                spec = (rule_id, None, None, None, None, rule['severity'], func_name)
+            else:
+                spec = (rule_id, kind, rule['yaml_file'], rule['yaml_path'],
+                        rule['expected_value'], rule['severity'], func_name)
+            f.write(f'    {repr(spec)},\n')
+        f.write(')\n')
+        f.write('\n')
+
     def _write_validator_class_end(self, f):
         """Write class footer and main"""
         f.write('\n')
@@ -412,39 +614,50 @@ class UnifiedValidatorGenerator:
 
 def main():
     """Main execution"""
-    script_dir = Path(__file__).parent
-
-    rules_json = script_dir / "all_4_sot_semantic_rules.json"
-    output_py = script_dir / "unified_content_validators.py"
-
-    if not rules_json.exists():
-        print(f"[ERROR] Rules JSON not found: {rules_json}")
+    parser = argparse.ArgumentParser(description="Generate unified content validators")
+    parser.add_argument("--rules", type=Path, default=DEFAULT_RULES_JSON,
+                        help="Rules JSON (default: %(default)s)")
+    parser.add_argument("--check", action="store_true",
+                        help="Fail if a checked-in copy differs from the generated module")
+    args = parser.parse_args()
+
+    if not args.rules.exists():
+        print(f"[ERROR] Rules JSON not found: {args.rules}")
         return 1
 
     print("=" * 80)
     print("UNIFIED CONTENT VALIDATOR GENERATOR")
     print("=" * 80)
     print()
-    print(f"Input:  {rules_json}")
-    print(f"Output: {output_py}")
+    print(f"Input:  {args.rules}")
     print()
 
-    # Generate
-    generator = UnifiedValidatorGenerator(rules_json)
-    generator.generate_validators(output_py)
+    generator = UnifiedValidatorGenerator(args.rules)
+
+    if args.check:
+        rendered = generator.render()
+        stale = [
+            path for path in OUTPUT_FILES
+            if not path.exists() or path.read_text(encoding="utf-8") != rendered
+        ]
+        for path in stale:
+            print(f"[FAIL] Out of date: {path}")
+        if stale:
+            print("       Regenerate with: python generate_unified_content_validators.py")
+            return 1
+        print(f"[OK] {len(OUTPUT_FILES)} checked-in copies match the generator")
+        return 0
+
+    for output_py in OUTPUT_FILES:
+        generator.generate_validators(output_py)
 
+    print()
     print("=" * 80)
     print("[COMPLETE] Unified validator generation finished")
     print("=" * 80)
-    print()
-    print("Next steps:")
-    print("  1. Test: python unified_content_validators.py")
-    print("  2. Review syntax errors (should be 0)")
-    print("  3. Integrate into sot_validator_core.py")
-    print()
 
     return 0
 
 
 if __name__ == '__main__':
-    exit(main())
+    sys.exit(main())
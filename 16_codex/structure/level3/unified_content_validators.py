@@ -2,8 +2,7 @@
 """
 Unified Content Validators - ALL 4 Holy SoT Files
 ======================================================================
-Auto-generated from: all_4_sot_semantic_rules.json
-Generated: 2025-10-21T21:32:14.134832
+Auto-generated from: unified_content_validator_rules.json
 Total Validators: 966
 
 Source Files:
@@ -13,8 +12,10 @@ Source Files:
   - ssid_master_definition_corrected_v1.1.1.md: 7 rules
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Tuple
+import threading
 import yaml
 from dataclasses import dataclass
 from datetime import datetime
@@ -31,6 +32,112 @@ class ValidationResult:
     timestamp: str
 
 
+# Parsed-document store
+# =====================
+# Validators share parsed YAML documents instead of re-reading the same
+# contract for every rule. Entries are keyed by (path, mtime, size), so an
+# edited file is parsed again; least recently used documents are evicted.
+# Returned documents are shared: treat them as read-only.
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_PATH_NOT_FOUND = object()
+_LEAF = object()
+
+
+class ParsedDocumentStore:
+    """LRU cache of parsed YAML documents keyed by (path, mtime, size)"""
+
+    def __init__(self, max_documents: int = 128):
+        self.max_documents = max(1, max_documents)
+        self._documents: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, file_path: Path) -> Any:
+        """Return the parsed document (raises on read/parse errors)"""
+        stat = file_path.stat()
+        key = str(file_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._documents.get(key)
+            if entry is not None and entry[0] == version:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+
+        with self._lock:
+            self.misses += 1
+            self._documents[key] = (version, data)
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+        return data
+
+    def clear(self) -> None:
+        """Drop all cached documents"""
+        with self._lock:
+            self._documents.clear()
+
+
+DOCUMENT_STORE = ParsedDocumentStore()
+
+
+def resolve_yaml_path(data: Any, yaml_path: str) -> Any:
+    """Navigate a dotted path (returns _PATH_NOT_FOUND if missing)"""
+    current = data
+    for key in yaml_path.split("."):
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+        else:
+            return _PATH_NOT_FOUND
+    return current
+
+
+def resolve_yaml_paths(data: Any, yaml_paths: List[str]) -> Dict[str, Any]:
+    """Resolve many dotted paths in one traversal (shared prefixes walked once)
+    Returns: {yaml_path: value or _PATH_NOT_FOUND}
+    """
+    trie: Dict[Any, Any] = {}
+    for yaml_path in yaml_paths:
+        node = trie
+        for key in yaml_path.split("."):
+            node = node.setdefault(key, {})
+        node[_LEAF] = yaml_path
+
+    resolved = dict.fromkeys(yaml_paths, _PATH_NOT_FOUND)
+    stack = [(trie, data)]
+    while stack:
+        node, current = stack.pop()
+        for key, child in node.items():
+            if key is _LEAF:
+                resolved[child] = current
+            elif isinstance(current, dict) and key in current:
+                stack.append((child, current[key]))
+    return resolved
+
+
+def check_yaml_field(current: Any, expected_value: Any) -> tuple[bool, Any]:
+    """Compare a resolved YAML value with the expected value"""
+    if current is _PATH_NOT_FOUND:
+        return (False, "PATH_NOT_FOUND")
+    return (current == expected_value, current)
+
+
+def check_yaml_list(current: Any, expected_list: List[Any]) -> tuple[bool, Any]:
+    """Compare a resolved YAML list with the expected list"""
+    if current is _PATH_NOT_FOUND:
+        return (False, "PATH_NOT_FOUND")
+    if not isinstance(current, list):
+        return (False, "NOT_A_LIST")
+    return (current == expected_list, current)
+
+
 def yaml_field_equals(repo_root: Path, yaml_file: str, yaml_path: str, expected_value: Any) -> tuple[bool, Any]:
     """Check if YAML field equals expected value
     Returns: (passed: bool, actual_value: Any)
@@ -40,19 +147,8 @@ def yaml_field_equals(repo_root: Path, yaml_file: str, yaml_path: str, expected_
         return (False, "FILE_NOT_FOUND")
     
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        
-        # Navigate yaml_path
-        keys = yaml_path.split(".")
-        current = data
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return (False, "PATH_NOT_FOUND")
-        
-        return (current == expected_value, current)
+        data = DOCUMENT_STORE.load(file_path)
+        return check_yaml_field(resolve_yaml_path(data, yaml_path), expected_value)
     except Exception as e:
         return (False, f"ERROR: {str(e)}")
 
@@ -66,22 +162,8 @@ def yaml_list_equals(repo_root: Path, yaml_file: str, yaml_path: str, expected_l
         return (False, "FILE_NOT_FOUND")
     
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        
-        # Navigate yaml_path
-        keys = yaml_path.split(".")
-        current = data
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return (False, "PATH_NOT_FOUND")
-        
-        if not isinstance(current, list):
-            return (False, "NOT_A_LIST")
-        
-        return (current == expected_list, current)
+        data = DOCUMENT_STORE.load(file_path)
+        return check_yaml_list(resolve_yaml_path(data, yaml_path), expected_list)
     except Exception as e:
         return (False, f"ERROR: {str(e)}")
 
@@ -22333,6 +22415,1043 @@ class UnifiedContentValidators:
 
         return results
 
+    def validate_all_batched(self) -> List[ValidationResult]:
+        """Run all content validators, grouped by target file
+
+        Each YAML file is loaded once and the dotted paths of all its
+        validators are resolved in one traversal. Same results and order
+        as validate_all().
+        """
+        by_file: Dict[str, List[int]] = {}
+        for index, spec in enumerate(VALIDATOR_SPECS):
+            if spec[1] is not None:
+                by_file.setdefault(spec[2], []).append(index)
+
+        outcomes: Dict[int, tuple] = {}
+        for yaml_file, indices in by_file.items():
+            file_path = self.repo_root / yaml_file
+            if not file_path.exists():
+                for index in indices:
+                    outcomes[index] = (False, "FILE_NOT_FOUND")
+                continue
+
+            try:
+                data = DOCUMENT_STORE.load(file_path)
+                resolved = resolve_yaml_paths(data, [VALIDATOR_SPECS[i][3] for i in indices])
+            except Exception as e:
+                for index in indices:
+                    outcomes[index] = (False, f"ERROR: {str(e)}")
+                continue
+
+            for index in indices:
+                _, kind, _, yaml_path, expected, _, _ = VALIDATOR_SPECS[index]
+                if kind == "yaml_list":
+                    outcomes[index] = check_yaml_list(resolved[yaml_path], expected)
+                else:
+                    outcomes[index] = check_yaml_field(resolved[yaml_path], expected)
+
+        results = []
+        for index, (rule_id, kind, yaml_file, yaml_path, expected, severity, func_name) in enumerate(VALIDATOR_SPECS):
+            if kind is None:
+                results.append(getattr(self, func_name)())
+                continue
+
+            passed, actual = outcomes[index]
+            if kind == "yaml_list":
+                if passed:
+                    message = "PASS: " + yaml_path + " list matches"
+                else:
+                    message = "FAIL: " + yaml_path + " expected " + str(len(expected)) + " elements, got " + str(actual)
+            else:
+                if passed:
+                    message = "PASS: " + yaml_path + " = " + str(actual)
+                else:
+                    message = "FAIL: " + yaml_path + " expected " + repr(expected) + ", got " + str(actual)
+
+            results.append(ValidationResult(
+                rule_id=rule_id,
+                passed=passed,
+                severity=severity,
+                message=message,
+                evidence="YAML: " + yaml_file + " at " + yaml_path,
+                timestamp=datetime.now().isoformat()
+            ))
+
+        return results
+
+
+# Validator specs in validate_all() order:
+# (rule_id, kind, yaml_file, yaml_path, expected, severity, func_name)
+# kind None -> validate_all_batched() calls the validator method
+VALIDATOR_SPECS = (
+    ('YAML-ALL-0001', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0001'),
+    ('YAML-ALL-0002', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0002'),
+    ('YAML-ALL-0003', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0003'),
+    ('YAML-ALL-0004', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'classification', 'PUBLIC - Token Framework Standards', 'HIGH', 'validate_yaml_all_0004'),
+    ('YAML-ALL-0005', 'yaml_list', '20_foundation/tokenomics/ssid_token_framework.yaml', 'token_definition.purpose', ['utility', 'governance', 'reward'], 'HIGH', 'validate_yaml_all_0005'),
+    ('YAML-ALL-0006', 'yaml_list', '20_foundation/tokenomics/ssid_token_framework.yaml', 'token_definition.explicit_exclusions', ['investment', 'security', 'e_money', 'yield_bearing', 'redemption_rights'], 'CRITICAL', 'validate_yaml_all_0006'),
+    ('YAML-ALL-0007', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'token_definition.legal_position', 'Pure utility token for identity verification services', 'CRITICAL', 'validate_yaml_all_0007'),
+    ('YAML-ALL-0008', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'technical_specification.blockchain', 'Polygon (EVM Compatible)', 'HIGH', 'validate_yaml_all_0008'),
+    ('YAML-ALL-0009', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'technical_specification.standard', 'ERC-20 Compatible', 'HIGH', 'validate_yaml_all_0009'),
+    ('YAML-ALL-0010', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'technical_specification.supply_model', 'Fixed cap with deflationary mechanisms', 'MEDIUM', 'validate_yaml_all_0010'),
+    ('YAML-ALL-0011', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'technical_specification.custody_model', 'Non-custodial by design', 'MEDIUM', 'validate_yaml_all_0011'),
+    ('YAML-ALL-0012', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'technical_specification.smart_contract_automation', 'Full autonomous distribution', 'MEDIUM', 'validate_yaml_all_0012'),
+    ('YAML-ALL-0013', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'fee_structure.scope', 'identity_verification_payments_only', 'MEDIUM', 'validate_yaml_all_0013'),
+    ('YAML-ALL-0014', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'fee_structure.total_fee', '3% of identity verification transactions', 'MEDIUM', 'validate_yaml_all_0014'),
+    ('YAML-ALL-0015', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'fee_structure.allocation', '1% dev (direct), 2% system treasury', 'MEDIUM', 'validate_yaml_all_0015'),
+    ('YAML-ALL-0016', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'fee_structure.burn_from_system_fee', '50% of 2% with daily/monthly caps', 'MEDIUM', 'validate_yaml_all_0016'),
+    ('YAML-ALL-0017', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'fee_structure.fee_collection', 'Smart contract automated', 'MEDIUM', 'validate_yaml_all_0017'),
+    ('YAML-ALL-0018', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'fee_structure.no_manual_intervention', True, 'CRITICAL', 'validate_yaml_all_0018'),
+    ('YAML-ALL-0019', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.security_token', False, 'CRITICAL', 'validate_yaml_all_0019'),
+    ('YAML-ALL-0020', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.e_money_token', False, 'CRITICAL', 'validate_yaml_all_0020'),
+    ('YAML-ALL-0021', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.stablecoin', False, 'CRITICAL', 'validate_yaml_all_0021'),
+    ('YAML-ALL-0022', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.yield_bearing', False, 'CRITICAL', 'validate_yaml_all_0022'),
+    ('YAML-ALL-0023', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.redemption_rights', False, 'CRITICAL', 'validate_yaml_all_0023'),
+    ('YAML-ALL-0024', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.passive_income', False, 'CRITICAL', 'validate_yaml_all_0024'),
+    ('YAML-ALL-0025', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.investment_contract', False, 'CRITICAL', 'validate_yaml_all_0025'),
+    ('YAML-ALL-0026', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.admin_controls', 'No privileged admin keys. Proxy owner = DAO Timelock; emergency multisig acts only via time-locked governance paths (no direct overrides).', 'CRITICAL', 'validate_yaml_all_0026'),
+    ('YAML-ALL-0027', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'legal_safe_harbor.upgrade_mechanism', 'On-chain proposals only via DAO governance', 'HIGH', 'validate_yaml_all_0027'),
+    ('YAML-ALL-0028', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'business_model.role', 'Technology publisher and open source maintainer', 'MEDIUM', 'validate_yaml_all_0028'),
+    ('YAML-ALL-0029', 'yaml_list', '20_foundation/tokenomics/ssid_token_framework.yaml', 'business_model.not_role', ['payment_service_provider', 'custodian', 'operator', 'exchange'], 'MEDIUM', 'validate_yaml_all_0029'),
+    ('YAML-ALL-0030', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'business_model.user_interactions', 'Direct peer-to-peer via smart contracts', 'MEDIUM', 'validate_yaml_all_0030'),
+    ('YAML-ALL-0031', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'business_model.kyc_responsibility', 'Third-party KYC providers (users pay directly)', 'MEDIUM', 'validate_yaml_all_0031'),
+    ('YAML-ALL-0032', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'business_model.data_custody', 'Zero personal data on-chain', 'MEDIUM', 'validate_yaml_all_0032'),
+    ('YAML-ALL-0033', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'governance_framework.dao_ready', True, 'CRITICAL', 'validate_yaml_all_0033'),
+    ('YAML-ALL-0034', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'governance_framework.voting_mechanism', 'Token-weighted governance', 'HIGH', 'validate_yaml_all_0034'),
+    ('YAML-ALL-0035', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'governance_framework.proposal_system', 'Snapshot + on-chain execution', 'MEDIUM', 'validate_yaml_all_0035'),
+    ('YAML-ALL-0036', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'governance_framework.upgrade_authority', 'DAO only (no admin keys)', 'CRITICAL', 'validate_yaml_all_0036'),
+    ('YAML-ALL-0037', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'governance_framework.emergency_procedures', 'Community multisig', 'MEDIUM', 'validate_yaml_all_0037'),
+    ('YAML-ALL-0038', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'governance_framework.reference', 'See detailed governance_parameters section below for quorum, timelock, and voting requirements', 'HIGH', 'validate_yaml_all_0038'),
+    ('YAML-ALL-0039', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'jurisdictional_compliance.reference', 'See 23_compliance/jurisdictions/coverage_matrix.yaml for complete exclusion lists', 'CRITICAL', 'validate_yaml_all_0039'),
+    ('YAML-ALL-0040', 'yaml_list', '20_foundation/tokenomics/ssid_token_framework.yaml', 'jurisdictional_compliance.blacklist_jurisdictions', ['IR', 'KP', 'SY', 'CU'], 'CRITICAL', 'validate_yaml_all_0040'),
+    ('YAML-ALL-0041', 'yaml_list', '20_foundation/tokenomics/ssid_token_framework.yaml', 'jurisdictional_compliance.excluded_entities', ['RU_designated_entities', 'Belarus_designated_entities', 'Venezuela_government_entities'], 'MEDIUM', 'validate_yaml_all_0041'),
+    ('YAML-ALL-0042', 'yaml_list', '20_foundation/tokenomics/ssid_token_framework.yaml', 'jurisdictional_compliance.excluded_markets', ['India', 'Pakistan', 'Myanmar'], 'MEDIUM', 'validate_yaml_all_0042'),
+    ('YAML-ALL-0043', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'jurisdictional_compliance.compliance_basis', 'EU MiCA Article 3 + US Howey Test', 'CRITICAL', 'validate_yaml_all_0043'),
+    ('YAML-ALL-0044', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'jurisdictional_compliance.regulatory_exemptions', 'Utility token exemption', 'HIGH', 'validate_yaml_all_0044'),
+    ('YAML-ALL-0045', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'risk_mitigation.no_fiat_pegging', True, 'CRITICAL', 'validate_yaml_all_0045'),
+    ('YAML-ALL-0046', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'risk_mitigation.no_redemption_mechanism', True, 'CRITICAL', 'validate_yaml_all_0046'),
+    ('YAML-ALL-0047', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'risk_mitigation.no_yield_promises', True, 'CRITICAL', 'validate_yaml_all_0047'),
+    ('YAML-ALL-0048', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'risk_mitigation.no_marketing_investment', True, 'CRITICAL', 'validate_yaml_all_0048'),
+    ('YAML-ALL-0049', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'risk_mitigation.clear_utility_purpose', True, 'CRITICAL', 'validate_yaml_all_0049'),
+    ('YAML-ALL-0050', 'yaml_field', '20_foundation/tokenomics/ssid_token_framework.yaml', 'risk_mitigation.open_source_license', 'Apache 2.0', 'MEDIUM', 'validate_yaml_all_0050'),
+    ('YAML-ALL-0051', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0051'),
+    ('YAML-ALL-0052', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0052'),
+    ('YAML-ALL-0053', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0053'),
+    ('YAML-ALL-0054', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.identity_verification.description', 'Pay for identity score calculations and verifications', 'MEDIUM', 'validate_yaml_all_0054'),
+    ('YAML-ALL-0055', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.identity_verification.smart_contract', '20_foundation/tokenomics/contracts/verification_payment.sol', 'HIGH', 'validate_yaml_all_0055'),
+    ('YAML-ALL-0056', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.identity_verification.fee_burn_mechanism', 'Deflationary token economics', 'HIGH', 'validate_yaml_all_0056'),
+    ('YAML-ALL-0057', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.identity_verification.burn_source_note', 'Burns originate exclusively from treasury portion of 3% system fee (no direct verification fee split)', 'MEDIUM', 'validate_yaml_all_0057'),
+    ('YAML-ALL-0058', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.identity_verification.burn_clarification', 'No manual/admin burns. Programmatic burns allowed only from the treasury portion of the 3% system fee and failed proposal deposits, as defined in token_economics.', 'CRITICAL', 'validate_yaml_all_0058'),
+    ('YAML-ALL-0059', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.governance_participation.description', 'Vote on protocol upgrades and parameter changes', 'MEDIUM', 'validate_yaml_all_0059'),
+    ('YAML-ALL-0060', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.governance_participation.voting_weight', 'Linear token holdings', 'HIGH', 'validate_yaml_all_0060'),
+    ('YAML-ALL-0061', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.governance_participation.proposal_threshold', '1% of total supply to propose', 'MEDIUM', 'validate_yaml_all_0061'),
+    ('YAML-ALL-0062', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.ecosystem_rewards.description', 'Reward validators, contributors, and ecosystem participants', 'MEDIUM', 'validate_yaml_all_0062'),
+    ('YAML-ALL-0063', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.ecosystem_rewards.distribution_method', 'Merit-based allocation via DAO', 'MEDIUM', 'validate_yaml_all_0063'),
+    ('YAML-ALL-0064', 'yaml_list', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.ecosystem_rewards.reward_pools', ['validation', 'development', 'community'], 'MEDIUM', 'validate_yaml_all_0064'),
+    ('YAML-ALL-0065', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.staking_utility.description', 'Stake tokens for enhanced verification services', 'HIGH', 'validate_yaml_all_0065'),
+    ('YAML-ALL-0066', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.staking_utility.staking_rewards', 'Service fee discounts (not yield)', 'MEDIUM', 'validate_yaml_all_0066'),
+    ('YAML-ALL-0067', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'primary_utilities.staking_utility.slashing_conditions', 'False verification penalties', 'CRITICAL', 'validate_yaml_all_0067'),
+    ('YAML-ALL-0068', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'compliance_utilities.audit_payments', 'Pay for compliance audit services', 'CRITICAL', 'validate_yaml_all_0068'),
+    ('YAML-ALL-0069', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'compliance_utilities.regulatory_reporting', 'Submit regulatory reports with token fees', 'HIGH', 'validate_yaml_all_0069'),
+    ('YAML-ALL-0070', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'compliance_utilities.legal_attestations', 'Create verifiable compliance attestations', 'CRITICAL', 'validate_yaml_all_0070'),
+    ('YAML-ALL-0071', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'secondary_utilities.marketplace_access', 'Access to identity verification marketplace', 'MEDIUM', 'validate_yaml_all_0071'),
+    ('YAML-ALL-0072', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'secondary_utilities.premium_features', 'Enhanced verification algorithms', 'MEDIUM', 'validate_yaml_all_0072'),
+    ('YAML-ALL-0073', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'secondary_utilities.api_access', 'Developer API rate limiting and access control', 'MEDIUM', 'validate_yaml_all_0073'),
+    ('YAML-ALL-0074', 'yaml_field', '20_foundation/tokenomics/utility_definitions.yaml', 'secondary_utilities.data_portability', 'Export/import verification data', 'MEDIUM', 'validate_yaml_all_0074'),
+    ('YAML-ALL-0075', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0075'),
+    ('YAML-ALL-0076', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'date', '2025-09-21', 'MEDIUM', 'validate_yaml_all_0076'),
+    ('YAML-ALL-0077', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0077'),
+    ('YAML-ALL-0078', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.total_supply', '1,000,000,000 SSID', 'MEDIUM', 'validate_yaml_all_0078'),
+    ('YAML-ALL-0079', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.initial_distribution.ecosystem_development', '40%', 'MEDIUM', 'validate_yaml_all_0079'),
+    ('YAML-ALL-0080', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.initial_distribution.community_rewards', '25%', 'MEDIUM', 'validate_yaml_all_0080'),
+    ('YAML-ALL-0081', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.initial_distribution.team_development', '15%', 'MEDIUM', 'validate_yaml_all_0081'),
+    ('YAML-ALL-0082', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.initial_distribution.partnerships', '10%', 'MEDIUM', 'validate_yaml_all_0082'),
+    ('YAML-ALL-0083', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.initial_distribution.reserve_fund', '10%', 'MEDIUM', 'validate_yaml_all_0083'),
+    ('YAML-ALL-0084', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.deflationary_mechanisms.governance_burning', 'Unsuccessful proposals burn deposit', 'HIGH', 'validate_yaml_all_0084'),
+    ('YAML-ALL-0085', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.deflationary_mechanisms.staking_slashing', 'Penalties for false verification or equivocation', 'CRITICAL', 'validate_yaml_all_0085'),
+    ('YAML-ALL-0086', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.circulation_controls.max_annual_inflation', '0%', 'MEDIUM', 'validate_yaml_all_0086'),
+    ('YAML-ALL-0087', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.circulation_controls.team_vesting_schedule', '25% per year over 4 years', 'MEDIUM', 'validate_yaml_all_0087'),
+    ('YAML-ALL-0088', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.circulation_controls.partnership_unlock', 'Milestone-based', 'MEDIUM', 'validate_yaml_all_0088'),
+    ('YAML-ALL-0089', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'supply_mechanics.circulation_controls.reserve_governance', 'DAO-controlled release only', 'HIGH', 'validate_yaml_all_0089'),
+    ('YAML-ALL-0090', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.scope', 'identity_verification_payments_only', 'MEDIUM', 'validate_yaml_all_0090'),
+    ('YAML-ALL-0091', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.note', '3% system fee applies to identity verification transactions only', 'MEDIUM', 'validate_yaml_all_0091'),
+    ('YAML-ALL-0092', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.total_fee', '3% of verification transaction value', 'MEDIUM', 'validate_yaml_all_0092'),
+    ('YAML-ALL-0093', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.allocation.dev_fee', '1% direct developer reward', 'MEDIUM', 'validate_yaml_all_0093'),
+    ('YAML-ALL-0094', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.allocation.system_treasury', '2% system treasury', 'MEDIUM', 'validate_yaml_all_0094'),
+    ('YAML-ALL-0095', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.burn_from_system_fee.policy', '50% of treasury share burned', 'MEDIUM', 'validate_yaml_all_0095'),
+    ('YAML-ALL-0096', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.burn_from_system_fee.base', 'circulating_supply_snapshot', 'MEDIUM', 'validate_yaml_all_0096'),
+    ('YAML-ALL-0097', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.burn_from_system_fee.snapshot_time_utc', '00:00:00', 'MEDIUM', 'validate_yaml_all_0097'),
+    ('YAML-ALL-0098', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.burn_from_system_fee.daily_cap_percent_of_circ', '0.5', 'MEDIUM', 'validate_yaml_all_0098'),
+    ('YAML-ALL-0099', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.burn_from_system_fee.monthly_cap_percent_of_circ', '2.0', 'MEDIUM', 'validate_yaml_all_0099'),
+    ('YAML-ALL-0100', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.system_fees.burn_from_system_fee.oracle_source', 'on-chain circulating supply oracle (DAO-controlled)', 'MEDIUM', 'validate_yaml_all_0100'),
+    ('YAML-ALL-0101', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.validator_rewards.source', 'Treasury budget (DAO-decided monthly allocation)', 'MEDIUM', 'validate_yaml_all_0101'),
+    ('YAML-ALL-0102', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.validator_rewards.no_per_transaction_split', True, 'CRITICAL', 'validate_yaml_all_0102'),
+    ('YAML-ALL-0103', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'fee_routing.validator_rewards.note', 'Old fee split (50/25/15/10) is deprecated and replaced by fixed 3% system fee.', 'CRITICAL', 'validate_yaml_all_0103'),
+    ('YAML-ALL-0104', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_fees.proposal_deposits', '100% burned if proposal fails', 'MEDIUM', 'validate_yaml_all_0104'),
+    ('YAML-ALL-0105', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_fees.voting_gas', 'Subsidized from treasury fund', 'MEDIUM', 'validate_yaml_all_0105'),
+    ('YAML-ALL-0106', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_controls.authority', 'DAO_only', 'MEDIUM', 'validate_yaml_all_0106'),
+    ('YAML-ALL-0107', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_controls.reference', '07_governance_legal/governance_defaults.yaml', 'CRITICAL', 'validate_yaml_all_0107'),
+    ('YAML-ALL-0108', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_controls.note', 'All governance parameters centrally defined - see governance_parameters section', 'HIGH', 'validate_yaml_all_0108'),
+    ('YAML-ALL-0109', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'staking_mechanics.minimum_stake', '1000 SSID', 'MEDIUM', 'validate_yaml_all_0109'),
+    ('YAML-ALL-0110', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'staking_mechanics.maximum_discount', '50% fee reduction', 'MEDIUM', 'validate_yaml_all_0110'),
+    ('YAML-ALL-0111', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'staking_mechanics.slashing_penalty', '5% of staked amount', 'MEDIUM', 'validate_yaml_all_0111'),
+    ('YAML-ALL-0112', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'staking_mechanics.unstaking_period', '14 days', 'MEDIUM', 'validate_yaml_all_0112'),
+    ('YAML-ALL-0113', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'staking_mechanics.discount_applies_to', 'user_service_price_only', 'MEDIUM', 'validate_yaml_all_0113'),
+    ('YAML-ALL-0114', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'staking_mechanics.system_fee_invariance', True, 'CRITICAL', 'validate_yaml_all_0114'),
+    ('YAML-ALL-0115', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.proposal_framework.proposal_threshold', '1% of total supply (10,000,000 SSID)', 'MEDIUM', 'validate_yaml_all_0115'),
+    ('YAML-ALL-0116', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.proposal_framework.proposal_deposit', '10,000 SSID (burned if proposal fails)', 'MEDIUM', 'validate_yaml_all_0116'),
+    ('YAML-ALL-0117', 'yaml_list', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.proposal_framework.proposal_types', ['Protocol upgrades (requires supermajority)', 'Parameter changes (requires simple majority)', 'Treasury allocation (requires quorum + majority)', 'Emergency proposals (expedited process)'], 'MEDIUM', 'validate_yaml_all_0117'),
+    ('YAML-ALL-0118', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_requirements.quorum_standard', '4% of circulating supply', 'HIGH', 'validate_yaml_all_0118'),
+    ('YAML-ALL-0119', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_requirements.quorum_protocol_upgrade', '8% of circulating supply', 'MEDIUM', 'validate_yaml_all_0119'),
+    ('YAML-ALL-0120', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_requirements.quorum_emergency', '2% of circulating supply', 'MEDIUM', 'validate_yaml_all_0120'),
+    ('YAML-ALL-0121', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_requirements.simple_majority', '50% + 1 of votes cast', 'MEDIUM', 'validate_yaml_all_0121'),
+    ('YAML-ALL-0122', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_requirements.supermajority', '66.7% of votes cast', 'MEDIUM', 'validate_yaml_all_0122'),
+    ('YAML-ALL-0123', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_requirements.emergency_supermajority', '75% of votes cast', 'MEDIUM', 'validate_yaml_all_0123'),
+    ('YAML-ALL-0124', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.timelock_framework.standard_proposals', '48 hours minimum execution delay', 'HIGH', 'validate_yaml_all_0124'),
+    ('YAML-ALL-0125', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.timelock_framework.protocol_upgrades', '168 hours (7 days) execution delay', 'MEDIUM', 'validate_yaml_all_0125'),
+    ('YAML-ALL-0126', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.timelock_framework.parameter_changes', '24 hours execution delay', 'MEDIUM', 'validate_yaml_all_0126'),
+    ('YAML-ALL-0127', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.timelock_framework.emergency_proposals', '6 hours execution delay (security only)', 'CRITICAL', 'validate_yaml_all_0127'),
+    ('YAML-ALL-0128', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.timelock_framework.treasury_allocations', '72 hours execution delay', 'MEDIUM', 'validate_yaml_all_0128'),
+    ('YAML-ALL-0129', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_periods.standard_voting', '7 days (168 hours)', 'HIGH', 'validate_yaml_all_0129'),
+    ('YAML-ALL-0130', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_periods.protocol_upgrade_voting', '14 days (336 hours)', 'MEDIUM', 'validate_yaml_all_0130'),
+    ('YAML-ALL-0131', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_periods.emergency_voting', '24 hours (security issues only)', 'CRITICAL', 'validate_yaml_all_0131'),
+    ('YAML-ALL-0132', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.voting_periods.parameter_voting', '5 days (120 hours)', 'MEDIUM', 'validate_yaml_all_0132'),
+    ('YAML-ALL-0133', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.delegation_system.delegation_enabled', True, 'CRITICAL', 'validate_yaml_all_0133'),
+    ('YAML-ALL-0134', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.delegation_system.self_delegation_default', True, 'CRITICAL', 'validate_yaml_all_0134'),
+    ('YAML-ALL-0135', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.delegation_system.delegation_changes', 'Immediate effect', 'MEDIUM', 'validate_yaml_all_0135'),
+    ('YAML-ALL-0136', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.delegation_system.vote_weight_calculation', 'Token balance + delegated tokens', 'HIGH', 'validate_yaml_all_0136'),
+    ('YAML-ALL-0137', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.governance_rewards.voter_participation_rewards', '0.1% of treasury per quarter', 'MEDIUM', 'validate_yaml_all_0137'),
+    ('YAML-ALL-0138', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.governance_rewards.proposal_creator_rewards', '1000 SSID for successful proposals', 'MEDIUM', 'validate_yaml_all_0138'),
+    ('YAML-ALL-0139', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.governance_rewards.delegate_rewards', 'Based on participation and performance', 'MEDIUM', 'validate_yaml_all_0139'),
+    ('YAML-ALL-0140', 'yaml_field', '20_foundation/tokenomics/token_economics.yaml', 'governance_parameters.governance_rewards.minimum_participation', '10% of voting power for rewards', 'MEDIUM', 'validate_yaml_all_0140'),
+    ('YAML-ALL-0141', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0141'),
+    ('YAML-ALL-0142', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0142'),
+    ('YAML-ALL-0143', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0143'),
+    ('YAML-ALL-0144', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'quality_standards.accuracy_threshold', '95% minimum', 'MEDIUM', 'validate_yaml_all_0144'),
+    ('YAML-ALL-0145', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'quality_standards.consistency_score', '90% minimum across documents', 'MEDIUM', 'validate_yaml_all_0145'),
+    ('YAML-ALL-0146', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'quality_standards.cultural_appropriateness', 'Native speaker validation required', 'MEDIUM', 'validate_yaml_all_0146'),
+    ('YAML-ALL-0147', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'quality_standards.technical_precision', 'Zero tolerance for technical term errors', 'MEDIUM', 'validate_yaml_all_0147'),
+    ('YAML-ALL-0148', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'translation_workflow.step_1', 'Machine translation (DeepL/Google)', 'MEDIUM', 'validate_yaml_all_0148'),
+    ('YAML-ALL-0149', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'translation_workflow.step_2', 'Technical review by bilingual expert', 'MEDIUM', 'validate_yaml_all_0149'),
+    ('YAML-ALL-0150', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'translation_workflow.step_3', 'Native speaker validation', 'MEDIUM', 'validate_yaml_all_0150'),
+    ('YAML-ALL-0151', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'translation_workflow.step_4', 'Cultural appropriateness check', 'MEDIUM', 'validate_yaml_all_0151'),
+    ('YAML-ALL-0152', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'translation_workflow.step_5', 'Final quality assurance', 'MEDIUM', 'validate_yaml_all_0152'),
+    ('YAML-ALL-0153', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'maintenance_schedule.major_updates', 'Full retranslation within 30 days', 'MEDIUM', 'validate_yaml_all_0153'),
+    ('YAML-ALL-0154', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'maintenance_schedule.minor_updates', 'Translation within 14 days', 'MEDIUM', 'validate_yaml_all_0154'),
+    ('YAML-ALL-0155', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'maintenance_schedule.urgent_updates', 'Translation within 48 hours', 'MEDIUM', 'validate_yaml_all_0155'),
+    ('YAML-ALL-0156', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'maintenance_schedule.quarterly_review', 'Full consistency check', 'MEDIUM', 'validate_yaml_all_0156'),
+    ('YAML-ALL-0157', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'specialized_terminology.legal_terms', 'Certified legal translator required', 'CRITICAL', 'validate_yaml_all_0157'),
+    ('YAML-ALL-0158', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'specialized_terminology.regulatory_terms', 'Compliance expert validation', 'CRITICAL', 'validate_yaml_all_0158'),
+    ('YAML-ALL-0159', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'specialized_terminology.technical_terms', 'Technical subject matter expert review', 'MEDIUM', 'validate_yaml_all_0159'),
+    ('YAML-ALL-0160', 'yaml_field', '05_documentation/internationalization/translation_quality.yaml', 'specialized_terminology.business_terms', 'Local business context validation', 'MEDIUM', 'validate_yaml_all_0160'),
+    ('YAML-ALL-0161', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0161'),
+    ('YAML-ALL-0162', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0162'),
+    ('YAML-ALL-0163', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0163'),
+    ('YAML-ALL-0164', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'classification', 'PUBLIC - Legal Disclaimers', 'CRITICAL', 'validate_yaml_all_0164'),
+    ('YAML-ALL-0165', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'investment_disclaimers.no_public_offer', True, 'CRITICAL', 'validate_yaml_all_0165'),
+    ('YAML-ALL-0166', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'investment_disclaimers.no_investment_vehicle', True, 'CRITICAL', 'validate_yaml_all_0166'),
+    ('YAML-ALL-0167', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'investment_disclaimers.no_yield_promises', True, 'CRITICAL', 'validate_yaml_all_0167'),
+    ('YAML-ALL-0168', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'investment_disclaimers.no_custody_services', True, 'CRITICAL', 'validate_yaml_all_0168'),
+    ('YAML-ALL-0169', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'investment_disclaimers.no_financial_advice', True, 'CRITICAL', 'validate_yaml_all_0169'),
+    ('YAML-ALL-0170', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'investment_disclaimers.no_solicitation', True, 'CRITICAL', 'validate_yaml_all_0170'),
+    ('YAML-ALL-0171', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'legal_position.framework_purpose', 'Technical and compliance documentation only', 'CRITICAL', 'validate_yaml_all_0171'),
+    ('YAML-ALL-0172', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'legal_position.token_purpose', 'Pure utility for identity verification services', 'HIGH', 'validate_yaml_all_0172'),
+    ('YAML-ALL-0173', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'legal_position.business_model', 'Open source technology publisher', 'MEDIUM', 'validate_yaml_all_0173'),
+    ('YAML-ALL-0174', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'legal_position.revenue_source', 'Development services and consulting only', 'MEDIUM', 'validate_yaml_all_0174'),
+    ('YAML-ALL-0175', 'yaml_list', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'prohibited_representations', ['Investment opportunity', 'Expected returns or yields', 'Token price appreciation', 'Passive income generation', 'Securities offering', 'Financial services provision'], 'HIGH', 'validate_yaml_all_0175'),
+    ('YAML-ALL-0176', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'compliance_statements.securities_law', 'Not a security under applicable securities laws', 'CRITICAL', 'validate_yaml_all_0176'),
+    ('YAML-ALL-0177', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'compliance_statements.money_transmission', 'No money transmission services provided', 'MEDIUM', 'validate_yaml_all_0177'),
+    ('YAML-ALL-0178', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'compliance_statements.banking_services', 'No banking or custodial services offered', 'MEDIUM', 'validate_yaml_all_0178'),
+    ('YAML-ALL-0179', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'compliance_statements.investment_advice', 'No investment or financial advice provided', 'MEDIUM', 'validate_yaml_all_0179'),
+    ('YAML-ALL-0180', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'user_responsibilities.regulatory_compliance', 'Users responsible for local compliance', 'CRITICAL', 'validate_yaml_all_0180'),
+    ('YAML-ALL-0181', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'user_responsibilities.tax_obligations', 'Users responsible for tax reporting', 'MEDIUM', 'validate_yaml_all_0181'),
+    ('YAML-ALL-0182', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'user_responsibilities.legal_validation', 'Independent legal review required', 'CRITICAL', 'validate_yaml_all_0182'),
+    ('YAML-ALL-0183', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'user_responsibilities.risk_assessment', 'Users must assess own risk tolerance', 'CRITICAL', 'validate_yaml_all_0183'),
+    ('YAML-ALL-0184', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'regulatory_safe_harbor.eu_mica_compliance', 'Utility token exemption under Article 3', 'CRITICAL', 'validate_yaml_all_0184'),
+    ('YAML-ALL-0185', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'regulatory_safe_harbor.us_securities_law', 'No securities offering under Howey Test', 'MEDIUM', 'validate_yaml_all_0185'),
+    ('YAML-ALL-0186', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'regulatory_safe_harbor.uk_fca_compliance', 'No regulated financial services provided', 'CRITICAL', 'validate_yaml_all_0186'),
+    ('YAML-ALL-0187', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'regulatory_safe_harbor.singapore_mas', 'Software license exemption maintained', 'MEDIUM', 'validate_yaml_all_0187'),
+    ('YAML-ALL-0188', 'yaml_field', '07_governance_legal/stakeholder_protection/investment_disclaimers.yaml', 'regulatory_safe_harbor.switzerland_finma', 'Technology provider classification', 'MEDIUM', 'validate_yaml_all_0188'),
+    ('YAML-ALL-0189', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0189'),
+    ('YAML-ALL-0190', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0190'),
+    ('YAML-ALL-0191', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0191'),
+    ('YAML-ALL-0192', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'classification', 'CONFIDENTIAL - Partnership Strategy', 'MEDIUM', 'validate_yaml_all_0192'),
+    ('YAML-ALL-0193', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_1_strategic.description', 'Fortune 500 implementation partners', 'MEDIUM', 'validate_yaml_all_0193'),
+    ('YAML-ALL-0194', 'yaml_list', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_1_strategic.benefits', ['Priority support', 'Custom implementations', 'Co-marketing'], 'MEDIUM', 'validate_yaml_all_0194'),
+    ('YAML-ALL-0195', 'yaml_list', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_1_strategic.requirements', ['$10M+ revenue', 'Compliance expertise', 'Global presence'], 'CRITICAL', 'validate_yaml_all_0195'),
+    ('YAML-ALL-0196', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_2_specialized.description', 'Compliance and consulting firms', 'CRITICAL', 'validate_yaml_all_0196'),
+    ('YAML-ALL-0197', 'yaml_list', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_2_specialized.benefits', ['Certification programs', 'Training access', 'Referral fees'], 'MEDIUM', 'validate_yaml_all_0197'),
+    ('YAML-ALL-0198', 'yaml_list', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_2_specialized.requirements', ['Compliance credentials', 'Technical capabilities'], 'CRITICAL', 'validate_yaml_all_0198'),
+    ('YAML-ALL-0199', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_3_technology.description', 'Technology integration partners', 'MEDIUM', 'validate_yaml_all_0199'),
+    ('YAML-ALL-0200', 'yaml_list', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_3_technology.benefits', ['Technical support', 'Integration frameworks', 'Joint development'], 'MEDIUM', 'validate_yaml_all_0200'),
+    ('YAML-ALL-0201', 'yaml_list', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_tiers.tier_3_technology.requirements', ['Technical expertise', 'Market presence'], 'MEDIUM', 'validate_yaml_all_0201'),
+    ('YAML-ALL-0202', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_benefits.revenue_sharing', 'Performance-based fees for successful implementations', 'MEDIUM', 'validate_yaml_all_0202'),
+    ('YAML-ALL-0203', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_benefits.technical_support', 'Dedicated technical account management', 'MEDIUM', 'validate_yaml_all_0203'),
+    ('YAML-ALL-0204', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_benefits.marketing_support', 'Co-marketing and lead generation programs', 'MEDIUM', 'validate_yaml_all_0204'),
+    ('YAML-ALL-0205', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_benefits.training_programs', 'Comprehensive certification and training', 'MEDIUM', 'validate_yaml_all_0205'),
+    ('YAML-ALL-0206', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_requirements.legal_compliance', 'Full regulatory compliance in operating jurisdictions', 'CRITICAL', 'validate_yaml_all_0206'),
+    ('YAML-ALL-0207', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_requirements.technical_competence', 'Demonstrated technical implementation capabilities', 'MEDIUM', 'validate_yaml_all_0207'),
+    ('YAML-ALL-0208', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_requirements.business_ethics', 'Adherence to SSID code of conduct', 'MEDIUM', 'validate_yaml_all_0208'),
+    ('YAML-ALL-0209', 'yaml_field', '07_governance_legal/partnerships/enterprise_partnerships.yaml', 'partnership_requirements.confidentiality', 'Execution of comprehensive NDAs', 'MEDIUM', 'validate_yaml_all_0209'),
+    ('YAML-ALL-0210', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0210'),
+    ('YAML-ALL-0211', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0211'),
+    ('YAML-ALL-0212', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0212'),
+    ('YAML-ALL-0213', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'classification', 'PUBLIC - Version Management', 'HIGH', 'validate_yaml_all_0213'),
+    ('YAML-ALL-0214', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'versioning_scheme.format', 'MAJOR.MINOR.PATCH', 'MEDIUM', 'validate_yaml_all_0214'),
+    ('YAML-ALL-0215', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'versioning_scheme.major_changes', 'Breaking compliance matrix changes', 'CRITICAL', 'validate_yaml_all_0215'),
+    ('YAML-ALL-0216', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'versioning_scheme.minor_changes', 'New jurisdiction additions, enhancement features', 'MEDIUM', 'validate_yaml_all_0216'),
+    ('YAML-ALL-0217', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'versioning_scheme.patch_changes', 'Bug fixes, documentation updates', 'MEDIUM', 'validate_yaml_all_0217'),
+    ('YAML-ALL-0218', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'current_version.version', '4.1.0', 'HIGH', 'validate_yaml_all_0218'),
+    ('YAML-ALL-0219', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'current_version.release_date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0219'),
+    ('YAML-ALL-0220', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'current_version.codename', 'Global Enterprise Ready', 'MEDIUM', 'validate_yaml_all_0220'),
+    ('YAML-ALL-0221', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'current_version.lts_status', True, 'CRITICAL', 'validate_yaml_all_0221'),
+    ('YAML-ALL-0222', 'yaml_list', '24_meta_orchestration/version_management/version_strategy.yaml', 'compatibility_matrix.supported_versions', ['4.1.x', '4.0.x', '3.2.x'], 'HIGH', 'validate_yaml_all_0222'),
+    ('YAML-ALL-0223', 'yaml_list', '24_meta_orchestration/version_management/version_strategy.yaml', 'compatibility_matrix.deprecated_versions', ['3.1.x', '3.0.x'], 'CRITICAL', 'validate_yaml_all_0223'),
+    ('YAML-ALL-0224', 'yaml_list', '24_meta_orchestration/version_management/version_strategy.yaml', 'compatibility_matrix.end_of_life', ['2.x.x', '1.x.x', '0.x.x'], 'MEDIUM', 'validate_yaml_all_0224'),
+    ('YAML-ALL-0225', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'deprecation_process.advance_notice', '6 months minimum', 'MEDIUM', 'validate_yaml_all_0225'),
+    ('YAML-ALL-0226', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'deprecation_process.migration_guide', 'Provided for all breaking changes', 'MEDIUM', 'validate_yaml_all_0226'),
+    ('YAML-ALL-0227', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'deprecation_process.support_period', '12 months post-deprecation', 'MEDIUM', 'validate_yaml_all_0227'),
+    ('YAML-ALL-0228', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'deprecation_process.emergency_patches', '18 months for critical security issues', 'CRITICAL', 'validate_yaml_all_0228'),
+    ('YAML-ALL-0229', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'badge_validity.tied_to_version', True, 'CRITICAL', 'validate_yaml_all_0229'),
+    ('YAML-ALL-0230', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'badge_validity.expiration_policy', 'Major version changes require re-validation', 'HIGH', 'validate_yaml_all_0230'),
+    ('YAML-ALL-0231', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'badge_validity.grace_period', '3 months for version migration', 'HIGH', 'validate_yaml_all_0231'),
+    ('YAML-ALL-0232', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'badge_validity.compatibility_check', 'Automated validation in CI/CD', 'MEDIUM', 'validate_yaml_all_0232'),
+    ('YAML-ALL-0233', 'yaml_list', '24_meta_orchestration/version_management/version_strategy.yaml', 'lts_support.lts_versions', ['4.1.x', '3.2.x'], 'HIGH', 'validate_yaml_all_0233'),
+    ('YAML-ALL-0234', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'lts_support.support_duration', '3 years minimum', 'MEDIUM', 'validate_yaml_all_0234'),
+    ('YAML-ALL-0235', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'lts_support.security_patches', '5 years minimum', 'CRITICAL', 'validate_yaml_all_0235'),
+    ('YAML-ALL-0236', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'lts_support.enterprise_support', 'Custom SLA available', 'MEDIUM', 'validate_yaml_all_0236'),
+    ('YAML-ALL-0237', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v4_1_0.release_date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0237'),
+    ('YAML-ALL-0238', 'yaml_list', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v4_1_0.features', ['Token framework', 'Global market ready', 'Multi-language support'], 'HIGH', 'validate_yaml_all_0238'),
+    ('YAML-ALL-0239', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v4_1_0.status', 'Current LTS', 'MEDIUM', 'validate_yaml_all_0239'),
+    ('YAML-ALL-0240', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v4_0_0.release_date', '2025-09-01', 'MEDIUM', 'validate_yaml_all_0240'),
+    ('YAML-ALL-0241', 'yaml_list', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v4_0_0.features', ['Enterprise enhanced', 'Anti-gaming controls', 'OpenCore integration'], 'MEDIUM', 'validate_yaml_all_0241'),
+    ('YAML-ALL-0242', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v4_0_0.status', 'Supported', 'MEDIUM', 'validate_yaml_all_0242'),
+    ('YAML-ALL-0243', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v3_2_0.release_date', '2025-06-01', 'MEDIUM', 'validate_yaml_all_0243'),
+    ('YAML-ALL-0244', 'yaml_list', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v3_2_0.features', ['Compliance matrix v2', 'Review frameworks', 'EU regulations'], 'CRITICAL', 'validate_yaml_all_0244'),
+    ('YAML-ALL-0245', 'yaml_field', '24_meta_orchestration/version_management/version_strategy.yaml', 'version_history.v3_2_0.status', 'LTS Maintenance', 'MEDIUM', 'validate_yaml_all_0245'),
+    ('YAML-ALL-0246', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0246'),
+    ('YAML-ALL-0247', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0247'),
+    ('YAML-ALL-0248', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0248'),
+    ('YAML-ALL-0249', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'release_schedule.major_releases', 'Annual (Q4)', 'MEDIUM', 'validate_yaml_all_0249'),
+    ('YAML-ALL-0250', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'release_schedule.minor_releases', 'Quarterly', 'MEDIUM', 'validate_yaml_all_0250'),
+    ('YAML-ALL-0251', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'release_schedule.patch_releases', 'Monthly or as needed', 'MEDIUM', 'validate_yaml_all_0251'),
+    ('YAML-ALL-0252', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'release_schedule.security_releases', 'Immediate (within 24-48 hours)', 'CRITICAL', 'validate_yaml_all_0252'),
+    ('YAML-ALL-0253', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'release_process.development_phase', 'Feature development and testing (8 weeks)', 'MEDIUM', 'validate_yaml_all_0253'),
+    ('YAML-ALL-0254', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'release_process.beta_phase', 'Community testing and feedback (4 weeks)', 'MEDIUM', 'validate_yaml_all_0254'),
+    ('YAML-ALL-0255', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'release_process.release_candidate', 'Final validation and approval (2 weeks)', 'MEDIUM', 'validate_yaml_all_0255'),
+    ('YAML-ALL-0256', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'release_process.stable_release', 'Production ready with full support', 'MEDIUM', 'validate_yaml_all_0256'),
+    ('YAML-ALL-0257', 'yaml_list', '24_meta_orchestration/releases/release_management.yaml', 'quality_gates', ['100% structure compliance validation', 'All automated tests passing (>95% coverage)', 'Security audit completion', 'Documentation updates (all languages)', 'Backwards compatibility verification', 'Performance benchmarks met', 'Enterprise beta validation', 'Legal review completion'], 'CRITICAL', 'validate_yaml_all_0257'),
+    ('YAML-ALL-0258', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'world_market_readiness.regulatory_validation', 'All Tier 1 jurisdictions reviewed', 'MEDIUM', 'validate_yaml_all_0258'),
+    ('YAML-ALL-0259', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'world_market_readiness.translation_completion', 'Primary languages (EN/DE/ZH/ES) updated', 'MEDIUM', 'validate_yaml_all_0259'),
+    ('YAML-ALL-0260', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'world_market_readiness.enterprise_testing', 'Beta testing with 5+ enterprise partners', 'MEDIUM', 'validate_yaml_all_0260'),
+    ('YAML-ALL-0261', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'world_market_readiness.compliance_certification', 'Third-party audit completion', 'CRITICAL', 'validate_yaml_all_0261'),
+    ('YAML-ALL-0262', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'world_market_readiness.legal_clearance', 'Multi-jurisdiction legal review', 'CRITICAL', 'validate_yaml_all_0262'),
+    ('YAML-ALL-0263', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'communication_strategy.release_notes', 'Comprehensive changelog with business impact', 'MEDIUM', 'validate_yaml_all_0263'),
+    ('YAML-ALL-0264', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'communication_strategy.migration_guides', 'Step-by-step upgrade instructions', 'MEDIUM', 'validate_yaml_all_0264'),
+    ('YAML-ALL-0265', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'communication_strategy.webinars', 'Release overview and Q&A sessions', 'MEDIUM', 'validate_yaml_all_0265'),
+    ('YAML-ALL-0266', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'communication_strategy.enterprise_briefings', 'Dedicated enterprise customer communications', 'MEDIUM', 'validate_yaml_all_0266'),
+    ('YAML-ALL-0267', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'communication_strategy.community_updates', 'Open source community announcements', 'MEDIUM', 'validate_yaml_all_0267'),
+    ('YAML-ALL-0268', 'yaml_field', '24_meta_orchestration/releases/release_management.yaml', 'communication_strategy.press_releases', 'Major version announcements', 'HIGH', 'validate_yaml_all_0268'),
+    ('YAML-ALL-0269', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0269'),
+    ('YAML-ALL-0270', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0270'),
+    ('YAML-ALL-0271', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0271'),
+    ('YAML-ALL-0272', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_framework.deprecation_notice_period', '6 months minimum', 'MEDIUM', 'validate_yaml_all_0272'),
+    ('YAML-ALL-0273', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_framework.support_period', '12 months post-deprecation', 'MEDIUM', 'validate_yaml_all_0273'),
+    ('YAML-ALL-0274', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_framework.security_support', '18 months for critical issues', 'CRITICAL', 'validate_yaml_all_0274'),
+    ('YAML-ALL-0275', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_framework.enterprise_support', '24 months with custom SLA', 'MEDIUM', 'validate_yaml_all_0275'),
+    ('YAML-ALL-0276', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_process.phase_1_announcement', 'Initial deprecation notice (6 months prior)', 'MEDIUM', 'validate_yaml_all_0276'),
+    ('YAML-ALL-0277', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_process.phase_2_warnings', 'Active warnings in system (3 months prior)', 'MEDIUM', 'validate_yaml_all_0277'),
+    ('YAML-ALL-0278', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_process.phase_3_sunset', 'Feature removal (deprecation date)', 'MEDIUM', 'validate_yaml_all_0278'),
+    ('YAML-ALL-0279', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_process.phase_4_support', 'Limited support period (12 months)', 'MEDIUM', 'validate_yaml_all_0279'),
+    ('YAML-ALL-0280', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'deprecation_process.phase_5_eol', 'End of life (18-24 months)', 'MEDIUM', 'validate_yaml_all_0280'),
+    ('YAML-ALL-0281', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'communication_channels.github_issues', 'Deprecation tracking issues', 'MEDIUM', 'validate_yaml_all_0281'),
+    ('YAML-ALL-0282', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'communication_channels.documentation', 'Prominent deprecation notices', 'MEDIUM', 'validate_yaml_all_0282'),
+    ('YAML-ALL-0283', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'communication_channels.release_notes', 'Deprecation announcements', 'MEDIUM', 'validate_yaml_all_0283'),
+    ('YAML-ALL-0284', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'communication_channels.enterprise_notifications', 'Direct customer communications', 'MEDIUM', 'validate_yaml_all_0284'),
+    ('YAML-ALL-0285', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'communication_channels.community_forums', 'Community discussions and support', 'MEDIUM', 'validate_yaml_all_0285'),
+    ('YAML-ALL-0286', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'migration_support.automated_tools', 'Migration scripts and tools provided', 'MEDIUM', 'validate_yaml_all_0286'),
+    ('YAML-ALL-0287', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'migration_support.documentation', 'Step-by-step migration guides', 'MEDIUM', 'validate_yaml_all_0287'),
+    ('YAML-ALL-0288', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'migration_support.community_support', 'Forum support for migrations', 'MEDIUM', 'validate_yaml_all_0288'),
+    ('YAML-ALL-0289', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'migration_support.enterprise_services', 'Professional migration services', 'MEDIUM', 'validate_yaml_all_0289'),
+    ('YAML-ALL-0290', 'yaml_field', '24_meta_orchestration/version_management/deprecation_strategy.yaml', 'migration_support.training_materials', 'Video tutorials and webinars', 'MEDIUM', 'validate_yaml_all_0290'),
+    ('YAML-ALL-0291', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0291'),
+    ('YAML-ALL-0292', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0292'),
+    ('YAML-ALL-0293', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0293'),
+    ('YAML-ALL-0294', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'classification', 'CONFIDENTIAL - Business Strategy', 'MEDIUM', 'validate_yaml_all_0294'),
+    ('YAML-ALL-0295', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.immediate_focus.jurisdictions', ['EU', 'US', 'UK', 'Singapore', 'Switzerland'], 'MEDIUM', 'validate_yaml_all_0295'),
+    ('YAML-ALL-0296', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.immediate_focus.rationale', 'Established regulatory frameworks, high business value', 'MEDIUM', 'validate_yaml_all_0296'),
+    ('YAML-ALL-0297', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.immediate_focus.timeline', '2025-2026', 'MEDIUM', 'validate_yaml_all_0297'),
+    ('YAML-ALL-0298', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.immediate_focus.investment', '€2.5M total', 'MEDIUM', 'validate_yaml_all_0298'),
+    ('YAML-ALL-0299', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.near_term.jurisdictions', ['Canada', 'Australia', 'Japan', 'Hong Kong'], 'MEDIUM', 'validate_yaml_all_0299'),
+    ('YAML-ALL-0300', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.near_term.rationale', 'Stable regulatory environment, strategic partnerships', 'MEDIUM', 'validate_yaml_all_0300'),
+    ('YAML-ALL-0301', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.near_term.timeline', '2026-2027', 'MEDIUM', 'validate_yaml_all_0301'),
+    ('YAML-ALL-0302', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.near_term.investment', '€1.8M total', 'MEDIUM', 'validate_yaml_all_0302'),
+    ('YAML-ALL-0303', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.medium_term.jurisdictions', ['Brazil', 'South Korea', 'UAE', 'Bahrain'], 'MEDIUM', 'validate_yaml_all_0303'),
+    ('YAML-ALL-0304', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.medium_term.rationale', 'Emerging regulatory clarity, growth opportunities', 'MEDIUM', 'validate_yaml_all_0304'),
+    ('YAML-ALL-0305', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.medium_term.timeline', '2027-2028', 'MEDIUM', 'validate_yaml_all_0305'),
+    ('YAML-ALL-0306', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.medium_term.investment', '€1.2M total', 'MEDIUM', 'validate_yaml_all_0306'),
+    ('YAML-ALL-0307', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.long_term.jurisdictions', ['Nigeria', 'India', 'Indonesia', 'Mexico'], 'MEDIUM', 'validate_yaml_all_0307'),
+    ('YAML-ALL-0308', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.long_term.rationale', 'Future growth markets, regulatory development', 'MEDIUM', 'validate_yaml_all_0308'),
+    ('YAML-ALL-0309', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.long_term.timeline', '2028+', 'MEDIUM', 'validate_yaml_all_0309'),
+    ('YAML-ALL-0310', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'market_prioritization.long_term.investment', '€2.0M total', 'MEDIUM', 'validate_yaml_all_0310'),
+    ('YAML-ALL-0311', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.regulatory_assessment.timeline', '3-6 months lead time', 'MEDIUM', 'validate_yaml_all_0311'),
+    ('YAML-ALL-0312', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.regulatory_assessment.cost', '€50K-200K per jurisdiction', 'MEDIUM', 'validate_yaml_all_0312'),
+    ('YAML-ALL-0313', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.regulatory_assessment.deliverables', ['Gap analysis', 'Implementation plan', 'Risk assessment'], 'MEDIUM', 'validate_yaml_all_0313'),
+    ('YAML-ALL-0314', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.local_legal_counsel.requirement', 'Mandatory for Tier 1 markets', 'MEDIUM', 'validate_yaml_all_0314'),
+    ('YAML-ALL-0315', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.local_legal_counsel.selection_criteria', ['Regulatory expertise', 'Local presence', 'Track record'], 'MEDIUM', 'validate_yaml_all_0315'),
+    ('YAML-ALL-0316', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.local_legal_counsel.budget', '€100K-500K per jurisdiction', 'MEDIUM', 'validate_yaml_all_0316'),
+    ('YAML-ALL-0317', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.compliance_implementation.timeline', '6-12 months', 'MEDIUM', 'validate_yaml_all_0317'),
+    ('YAML-ALL-0318', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.compliance_implementation.resources', '2-5 FTE compliance specialists', 'CRITICAL', 'validate_yaml_all_0318'),
+    ('YAML-ALL-0319', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.compliance_implementation.cost', '€200K-1M per jurisdiction', 'MEDIUM', 'validate_yaml_all_0319'),
+    ('YAML-ALL-0320', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.local_partnerships.requirement', 'Recommended for complex jurisdictions', 'MEDIUM', 'validate_yaml_all_0320'),
+    ('YAML-ALL-0321', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'entry_requirements.local_partnerships.partner_types', ['Legal firms', 'Compliance consultants', 'Technology integrators'], 'CRITICAL', 'validate_yaml_all_0321'),
+    ('YAML-ALL-0322', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.regulatory_risk.low', 'Established framework, clear guidance', 'MEDIUM', 'validate_yaml_all_0322'),
+    ('YAML-ALL-0323', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.regulatory_risk.medium', 'Evolving framework, some uncertainty', 'MEDIUM', 'validate_yaml_all_0323'),
+    ('YAML-ALL-0324', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.regulatory_risk.high', 'Unclear framework, significant regulatory risk', 'MEDIUM', 'validate_yaml_all_0324'),
+    ('YAML-ALL-0325', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.regulatory_risk.prohibitive', 'No framework or hostile environment', 'MEDIUM', 'validate_yaml_all_0325'),
+    ('YAML-ALL-0326', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.compliance_cost.estimation_factors', ['Regulatory complexity', 'Local requirements', 'Implementation timeline'], 'MEDIUM', 'validate_yaml_all_0326'),
+    ('YAML-ALL-0327', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.compliance_cost.cost_categories', ['Legal', 'Technical', 'Operational', 'Ongoing maintenance'], 'CRITICAL', 'validate_yaml_all_0327'),
+    ('YAML-ALL-0328', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.time_to_market.factors', ['Regulatory approval timeline', 'Implementation complexity', 'Resource availability'], 'MEDIUM', 'validate_yaml_all_0328'),
+    ('YAML-ALL-0329', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.time_to_market.typical_ranges', ['6-12 months (established)', '12-24 months (emerging)'], 'MEDIUM', 'validate_yaml_all_0329'),
+    ('YAML-ALL-0330', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.business_opportunity.assessment_criteria', ['Market size', 'Revenue potential', 'Strategic value', 'Competitive advantage'], 'MEDIUM', 'validate_yaml_all_0330'),
+    ('YAML-ALL-0331', 'yaml_field', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.business_opportunity.roi_calculation', '5-year NPV analysis required', 'MEDIUM', 'validate_yaml_all_0331'),
+    ('YAML-ALL-0332', 'yaml_list', '23_compliance/market_entry/expansion_strategy.yaml', 'risk_assessment_framework.competitive_landscape.analysis_scope', ['Existing players', 'Barriers to entry', 'Regulatory moats', 'Partnership opportunities'], 'MEDIUM', 'validate_yaml_all_0332'),
+    ('YAML-ALL-0333', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0333'),
+    ('YAML-ALL-0334', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0334'),
+    ('YAML-ALL-0335', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0335'),
+    ('YAML-ALL-0336', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'classification', 'CONFIDENTIAL - Regulatory Intelligence', 'MEDIUM', 'validate_yaml_all_0336'),
+    ('YAML-ALL-0337', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_1_markets.monitoring_frequency', 'Daily', 'MEDIUM', 'validate_yaml_all_0337'),
+    ('YAML-ALL-0338', 'yaml_list', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_1_markets.sources', ['Official regulators', 'Legal databases', 'Industry publications'], 'CRITICAL', 'validate_yaml_all_0338'),
+    ('YAML-ALL-0339', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_1_markets.alert_threshold', 'Immediate for material changes', 'MEDIUM', 'validate_yaml_all_0339'),
+    ('YAML-ALL-0340', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_2_markets.monitoring_frequency', 'Weekly', 'MEDIUM', 'validate_yaml_all_0340'),
+    ('YAML-ALL-0341', 'yaml_list', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_2_markets.sources', ['Regulatory websites', 'Legal newsletters', 'Local partners'], 'CRITICAL', 'validate_yaml_all_0341'),
+    ('YAML-ALL-0342', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_2_markets.alert_threshold', 'Within 48 hours', 'MEDIUM', 'validate_yaml_all_0342'),
+    ('YAML-ALL-0343', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_3_markets.monitoring_frequency', 'Monthly', 'MEDIUM', 'validate_yaml_all_0343'),
+    ('YAML-ALL-0344', 'yaml_list', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_3_markets.sources', ['Industry reports', 'Legal summaries', 'Partner updates'], 'CRITICAL', 'validate_yaml_all_0344'),
+    ('YAML-ALL-0345', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'monitoring_scope.tier_3_markets.alert_threshold', 'Within 1 week', 'MEDIUM', 'validate_yaml_all_0345'),
+    ('YAML-ALL-0346', 'yaml_list', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'intelligence_sources.primary_sources', ['Regulatory agency websites and publications', 'Official government announcements', 'Legislative databases and parliamentary records', 'Court decisions and legal precedents'], 'CRITICAL', 'validate_yaml_all_0346'),
+    ('YAML-ALL-0347', 'yaml_list', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'intelligence_sources.secondary_sources', ['Legal and compliance industry publications', 'Professional services firm updates', 'Industry association communications', 'Academic research and analysis'], 'CRITICAL', 'validate_yaml_all_0347'),
+    ('YAML-ALL-0348', 'yaml_list', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'intelligence_sources.intelligence_partners', ['Thomson Reuters Regulatory Intelligence', 'Compliance.ai regulatory monitoring', 'Local legal counsel networks', 'Industry regulatory associations'], 'CRITICAL', 'validate_yaml_all_0348'),
+    ('YAML-ALL-0349', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.critical_alerts.criteria', 'Material impact on business operations or compliance', 'CRITICAL', 'validate_yaml_all_0349'),
+    ('YAML-ALL-0350', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.critical_alerts.response_time', 'Immediate (within 2 hours)', 'MEDIUM', 'validate_yaml_all_0350'),
+    ('YAML-ALL-0351', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.critical_alerts.escalation', 'C-suite and board notification', 'MEDIUM', 'validate_yaml_all_0351'),
+    ('YAML-ALL-0352', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.high_priority.criteria', 'Significant regulatory changes affecting compliance strategy', 'CRITICAL', 'validate_yaml_all_0352'),
+    ('YAML-ALL-0353', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.high_priority.response_time', 'Within 24 hours', 'MEDIUM', 'validate_yaml_all_0353'),
+    ('YAML-ALL-0354', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.high_priority.escalation', 'Compliance committee notification', 'CRITICAL', 'validate_yaml_all_0354'),
+    ('YAML-ALL-0355', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.medium_priority.criteria', 'Regulatory developments requiring monitoring', 'MEDIUM', 'validate_yaml_all_0355'),
+    ('YAML-ALL-0356', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.medium_priority.response_time', 'Within 1 week', 'MEDIUM', 'validate_yaml_all_0356'),
+    ('YAML-ALL-0357', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.medium_priority.escalation', 'Compliance team review', 'CRITICAL', 'validate_yaml_all_0357'),
+    ('YAML-ALL-0358', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.low_priority.criteria', 'General regulatory updates and trends', 'MEDIUM', 'validate_yaml_all_0358'),
+    ('YAML-ALL-0359', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.low_priority.response_time', 'Monthly review cycle', 'MEDIUM', 'validate_yaml_all_0359'),
+    ('YAML-ALL-0360', 'yaml_field', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'alert_framework.low_priority.escalation', 'Routine reporting', 'MEDIUM', 'validate_yaml_all_0360'),
+    ('YAML-ALL-0361', 'yaml_list', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'impact_assessment.assessment_criteria', ['Direct compliance obligations', 'Business model implications', 'Competitive impact', 'Implementation costs', 'Timeline requirements'], 'CRITICAL', 'validate_yaml_all_0361'),
+    ('YAML-ALL-0362', 'yaml_list', '23_compliance/regulatory_intelligence/monitoring_framework.yaml', 'impact_assessment.response_planning', ['Compliance gap analysis', 'Implementation roadmap', 'Resource requirements', 'Risk mitigation strategies', 'Stakeholder communications'], 'CRITICAL', 'validate_yaml_all_0362'),
+    ('YAML-ALL-0363', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0363'),
+    ('YAML-ALL-0364', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0364'),
+    ('YAML-ALL-0365', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0365'),
+    ('YAML-ALL-0366', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_compatible', True, 'CRITICAL', 'validate_yaml_all_0366'),
+    ('YAML-ALL-0367', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'llm_interpretable', True, 'CRITICAL', 'validate_yaml_all_0367'),
+    ('YAML-ALL-0368', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'classification', 'CONFIDENTIAL - Enterprise AI Integration', 'MEDIUM', 'validate_yaml_all_0368'),
+    ('YAML-ALL-0369', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.policy_bots.enabled', True, 'CRITICAL', 'validate_yaml_all_0369'),
+    ('YAML-ALL-0370', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.policy_bots.description', 'Automated policy validation and compliance checking', 'CRITICAL', 'validate_yaml_all_0370'),
+    ('YAML-ALL-0371', 'yaml_list', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.policy_bots.compatible_models', ['GPT-4+', 'Claude-3+', 'Gemini-Pro', 'Custom LLMs'], 'MEDIUM', 'validate_yaml_all_0371'),
+    ('YAML-ALL-0372', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.policy_bots.api_endpoints', '23_compliance/ai_ml_ready/api/policy_validation.json', 'CRITICAL', 'validate_yaml_all_0372'),
+    ('YAML-ALL-0373', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.policy_bots.enterprise_models', 'internal_llm_endpoints', 'MEDIUM', 'validate_yaml_all_0373'),
+    ('YAML-ALL-0374', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.realtime_checks.enabled', True, 'CRITICAL', 'validate_yaml_all_0374'),
+    ('YAML-ALL-0375', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.realtime_checks.description', 'Continuous compliance monitoring via AI agents', 'CRITICAL', 'validate_yaml_all_0375'),
+    ('YAML-ALL-0376', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.realtime_checks.check_frequency', 'commit-based', 'MEDIUM', 'validate_yaml_all_0376'),
+    ('YAML-ALL-0377', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.realtime_checks.alert_threshold', 'medium', 'MEDIUM', 'validate_yaml_all_0377'),
+    ('YAML-ALL-0378', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.realtime_checks.integration_path', '24_meta_orchestration/triggers/ci/ai_agents/', 'MEDIUM', 'validate_yaml_all_0378'),
+    ('YAML-ALL-0379', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.realtime_checks.business_escalation', 'auto_escalate_critical', 'CRITICAL', 'validate_yaml_all_0379'),
+    ('YAML-ALL-0380', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.natural_language_queries.enabled', True, 'CRITICAL', 'validate_yaml_all_0380'),
+    ('YAML-ALL-0381', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.natural_language_queries.description', 'Ask compliance questions in natural language', 'CRITICAL', 'validate_yaml_all_0381'),
+    ('YAML-ALL-0382', 'yaml_list', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.natural_language_queries.examples', ["What's our current GDPR compliance status?", 'Which modules need SOC2 updates?', 'Show me regulatory changes since v1.0', 'Analyze business impact of new EU regulations'], 'CRITICAL', 'validate_yaml_all_0382'),
+    ('YAML-ALL-0383', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.natural_language_queries.query_processor', '01_ai_layer/compliance_query_processor/', 'CRITICAL', 'validate_yaml_all_0383'),
+    ('YAML-ALL-0384', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.natural_language_queries.business_intelligence', 'competitive_analysis_enabled', 'MEDIUM', 'validate_yaml_all_0384'),
+    ('YAML-ALL-0385', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.machine_readable_comments.format', 'structured_yaml_comments', 'MEDIUM', 'validate_yaml_all_0385'),
+    ('YAML-ALL-0386', 'yaml_list', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.machine_readable_comments.ai_tags', ['#AI_INTERPRETABLE', '#LLM_FRIENDLY', '#BOT_READABLE', '#BUSINESS_CRITICAL'], 'CRITICAL', 'validate_yaml_all_0386'),
+    ('YAML-ALL-0387', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'ai_integration.machine_readable_comments.schema', '23_compliance/ai_ml_ready/schemas/comment_schema.json', 'CRITICAL', 'validate_yaml_all_0387'),
+    ('YAML-ALL-0388', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.auto_policy_updates.enabled', False, 'CRITICAL', 'validate_yaml_all_0388'),
+    ('YAML-ALL-0389', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.auto_policy_updates.description', 'AI-driven policy suggestions with business review', 'MEDIUM', 'validate_yaml_all_0389'),
+    ('YAML-ALL-0390', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.auto_policy_updates.human_approval_required', True, 'CRITICAL', 'validate_yaml_all_0390'),
+    ('YAML-ALL-0391', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.auto_policy_updates.business_review_required', True, 'CRITICAL', 'validate_yaml_all_0391'),
+    ('YAML-ALL-0392', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.auto_policy_updates.review_threshold', 'all_changes', 'MEDIUM', 'validate_yaml_all_0392'),
+    ('YAML-ALL-0393', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.compliance_chatbot.enabled', True, 'CRITICAL', 'validate_yaml_all_0393'),
+    ('YAML-ALL-0394', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.compliance_chatbot.description', 'AI assistant for compliance questions', 'CRITICAL', 'validate_yaml_all_0394'),
+    ('YAML-ALL-0395', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.compliance_chatbot.knowledge_base', '23_compliance/ai_ml_ready/knowledge_base/', 'CRITICAL', 'validate_yaml_all_0395'),
+    ('YAML-ALL-0396', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.compliance_chatbot.update_frequency', 'weekly', 'MEDIUM', 'validate_yaml_all_0396'),
+    ('YAML-ALL-0397', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.compliance_chatbot.business_context', 'competitive_intelligence_integrated', 'MEDIUM', 'validate_yaml_all_0397'),
+    ('YAML-ALL-0398', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.risk_assessment_ai.enabled', True, 'CRITICAL', 'validate_yaml_all_0398'),
+    ('YAML-ALL-0399', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.risk_assessment_ai.description', 'AI-powered risk assessment for policy changes', 'MEDIUM', 'validate_yaml_all_0399'),
+    ('YAML-ALL-0400', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.risk_assessment_ai.model_path', '07_governance_legal/ai_risk_models/', 'CRITICAL', 'validate_yaml_all_0400'),
+    ('YAML-ALL-0401', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.risk_assessment_ai.confidence_threshold', 0.85, 'MEDIUM', 'validate_yaml_all_0401'),
+    ('YAML-ALL-0402', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.risk_assessment_ai.human_review_required', True, 'CRITICAL', 'validate_yaml_all_0402'),
+    ('YAML-ALL-0403', 'yaml_field', '23_compliance/ai_ml_ready/compliance_ai_config.yaml', 'policy_automation.risk_assessment_ai.business_impact_analysis', True, 'CRITICAL', 'validate_yaml_all_0403'),
+    ('YAML-ALL-0404', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0404'),
+    ('YAML-ALL-0405', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0405'),
+    ('YAML-ALL-0406', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0406'),
+    ('YAML-ALL-0407', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'classification', 'CONFIDENTIAL - Enterprise Data Strategy', 'MEDIUM', 'validate_yaml_all_0407'),
+    ('YAML-ALL-0408', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.openapi.version', '3.0.3', 'HIGH', 'validate_yaml_all_0408'),
+    ('YAML-ALL-0409', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.openapi.endpoint', '/api/v1/compliance/export/openapi', 'CRITICAL', 'validate_yaml_all_0409'),
+    ('YAML-ALL-0410', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.openapi.schema_path', '10_interoperability/schemas/compliance_openapi.yaml', 'CRITICAL', 'validate_yaml_all_0410'),
+    ('YAML-ALL-0411', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.openapi.business_sensitive_fields', 'filtered', 'MEDIUM', 'validate_yaml_all_0411'),
+    ('YAML-ALL-0412', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.json_schema.version', 'draft-07', 'HIGH', 'validate_yaml_all_0412'),
+    ('YAML-ALL-0413', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.json_schema.endpoint', '/api/v1/compliance/export/json-schema', 'CRITICAL', 'validate_yaml_all_0413'),
+    ('YAML-ALL-0414', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.json_schema.schema_path', '10_interoperability/schemas/compliance_jsonschema.json', 'CRITICAL', 'validate_yaml_all_0414'),
+    ('YAML-ALL-0415', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.json_schema.enterprise_extensions', True, 'CRITICAL', 'validate_yaml_all_0415'),
+    ('YAML-ALL-0416', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.graphql.enabled', True, 'CRITICAL', 'validate_yaml_all_0416'),
+    ('YAML-ALL-0417', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.graphql.endpoint', '/api/v1/compliance/graphql', 'CRITICAL', 'validate_yaml_all_0417'),
+    ('YAML-ALL-0418', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.graphql.schema_path', '10_interoperability/schemas/compliance.graphql', 'CRITICAL', 'validate_yaml_all_0418'),
+    ('YAML-ALL-0419', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.graphql.introspection_enabled', True, 'CRITICAL', 'validate_yaml_all_0419'),
+    ('YAML-ALL-0420', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.graphql.business_rules_layer', 'integrated', 'MEDIUM', 'validate_yaml_all_0420'),
+    ('YAML-ALL-0421', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.rdf_turtle.enabled', True, 'CRITICAL', 'validate_yaml_all_0421'),
+    ('YAML-ALL-0422', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.rdf_turtle.namespace', 'https://ssid.org/compliance/vocab#', 'CRITICAL', 'validate_yaml_all_0422'),
+    ('YAML-ALL-0423', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.rdf_turtle.endpoint', '/api/v1/compliance/export/rdf', 'CRITICAL', 'validate_yaml_all_0423'),
+    ('YAML-ALL-0424', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'export_formats.rdf_turtle.ontology_path', '10_interoperability/ontologies/ssid_compliance.ttl', 'CRITICAL', 'validate_yaml_all_0424'),
+    ('YAML-ALL-0425', 'yaml_list', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.frameworks_supported', ['ISO 27001 (XML/JSON)', 'SOC2 (YAML/JSON)', 'NIST (XML/RDF)', 'GDPR Compliance (JSON-LD)', 'PCI-DSS (XML)', 'MiCA (EU Custom Format)', 'Custom Enterprise Formats'], 'CRITICAL', 'validate_yaml_all_0425'),
+    ('YAML-ALL-0426', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.mapping_engine.path', '10_interoperability/mapping_engine/', 'MEDIUM', 'validate_yaml_all_0426'),
+    ('YAML-ALL-0427', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.mapping_engine.ai_assisted', True, 'CRITICAL', 'validate_yaml_all_0427'),
+    ('YAML-ALL-0428', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.mapping_engine.confidence_scoring', True, 'CRITICAL', 'validate_yaml_all_0428'),
+    ('YAML-ALL-0429', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.mapping_engine.human_validation_required', True, 'CRITICAL', 'validate_yaml_all_0429'),
+    ('YAML-ALL-0430', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.mapping_engine.business_rule_validation', True, 'CRITICAL', 'validate_yaml_all_0430'),
+    ('YAML-ALL-0431', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.bulk_import.enabled', True, 'CRITICAL', 'validate_yaml_all_0431'),
+    ('YAML-ALL-0432', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.bulk_import.max_file_size', '100MB', 'MEDIUM', 'validate_yaml_all_0432'),
+    ('YAML-ALL-0433', 'yaml_list', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.bulk_import.supported_formats', ['JSON', 'YAML', 'XML', 'CSV', 'RDF'], 'MEDIUM', 'validate_yaml_all_0433'),
+    ('YAML-ALL-0434', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.bulk_import.validation_required', True, 'CRITICAL', 'validate_yaml_all_0434'),
+    ('YAML-ALL-0435', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'import_capabilities.bulk_import.enterprise_audit_trail', True, 'CRITICAL', 'validate_yaml_all_0435'),
+    ('YAML-ALL-0436', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'portability_guarantees.no_vendor_lockin', True, 'CRITICAL', 'validate_yaml_all_0436'),
+    ('YAML-ALL-0437', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'portability_guarantees.full_data_export', True, 'CRITICAL', 'validate_yaml_all_0437'),
+    ('YAML-ALL-0438', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'portability_guarantees.schema_versioning', True, 'CRITICAL', 'validate_yaml_all_0438'),
+    ('YAML-ALL-0439', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'portability_guarantees.migration_assistance', True, 'CRITICAL', 'validate_yaml_all_0439'),
+    ('YAML-ALL-0440', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'portability_guarantees.api_stability_promise', '2_years_minimum', 'MEDIUM', 'validate_yaml_all_0440'),
+    ('YAML-ALL-0441', 'yaml_field', '10_interoperability/api_portability/export_import_config.yaml', 'portability_guarantees.enterprise_support', '5_years_guaranteed', 'MEDIUM', 'validate_yaml_all_0441'),
+    ('YAML-ALL-0442', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0442'),
+    ('YAML-ALL-0443', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0443'),
+    ('YAML-ALL-0444', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0444'),
+    ('YAML-ALL-0445', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'experimental', True, 'CRITICAL', 'validate_yaml_all_0445'),
+    ('YAML-ALL-0446', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'classification', 'CONFIDENTIAL - Enterprise Audit Innovation', 'MEDIUM', 'validate_yaml_all_0446'),
+    ('YAML-ALL-0447', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'blockchain_anchoring.enabled', True, 'CRITICAL', 'validate_yaml_all_0447'),
+    ('YAML-ALL-0448', 'yaml_list', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'blockchain_anchoring.supported_networks', [{'name': 'OpenTimestamps', 'type': 'bitcoin_anchoring', 'cost': 'minimal', 'verification': 'public', 'enterprise_priority': 'low'}, {'name': 'Ethereum', 'type': 'smart_contract', 'cost': 'moderate', 'verification': 'public', 'enterprise_priority': 'medium'}, {'name': 'Private Blockchain', 'type': 'enterprise_consortium', 'cost': 'high', 'verification': 'consortium', 'enterprise_priority': 'high'}], 'HIGH', 'validate_yaml_all_0448'),
+    ('YAML-ALL-0449', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'blockchain_anchoring.anchor_frequency', 'daily', 'MEDIUM', 'validate_yaml_all_0449'),
+    ('YAML-ALL-0450', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'blockchain_anchoring.critical_events_immediate', True, 'CRITICAL', 'validate_yaml_all_0450'),
+    ('YAML-ALL-0451', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'blockchain_anchoring.business_critical_immediate', True, 'CRITICAL', 'validate_yaml_all_0451'),
+    ('YAML-ALL-0452', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'decentralized_identity.did_support', True, 'CRITICAL', 'validate_yaml_all_0452'),
+    ('YAML-ALL-0453', 'yaml_list', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'decentralized_identity.supported_methods', ['did:web', 'did:key', 'did:ethr', 'did:ion', 'did:enterprise'], 'MEDIUM', 'validate_yaml_all_0453'),
+    ('YAML-ALL-0454', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'decentralized_identity.verifiable_credentials', True, 'CRITICAL', 'validate_yaml_all_0454'),
+    ('YAML-ALL-0455', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'decentralized_identity.credential_schemas', '02_audit_logging/next_gen_audit/vc_schemas/', 'MEDIUM', 'validate_yaml_all_0455'),
+    ('YAML-ALL-0456', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'decentralized_identity.business_credentials', 'executive_attestations', 'MEDIUM', 'validate_yaml_all_0456'),
+    ('YAML-ALL-0457', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'zero_knowledge_proofs.enabled', True, 'CRITICAL', 'validate_yaml_all_0457'),
+    ('YAML-ALL-0458', 'yaml_list', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'zero_knowledge_proofs.use_cases', ['Compliance without data disclosure', 'Audit trail verification', 'Privacy-preserving attestations', 'Business sensitive data protection'], 'CRITICAL', 'validate_yaml_all_0458'),
+    ('YAML-ALL-0459', 'yaml_list', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'zero_knowledge_proofs.supported_schemes', ['zk-SNARKs', 'zk-STARKs', 'Bulletproofs'], 'MEDIUM', 'validate_yaml_all_0459'),
+    ('YAML-ALL-0460', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'zero_knowledge_proofs.business_applications', 'competitive_advantage_protection', 'MEDIUM', 'validate_yaml_all_0460'),
+    ('YAML-ALL-0461', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'quantum_resistant.enabled', True, 'CRITICAL', 'validate_yaml_all_0461'),
+    ('YAML-ALL-0462', 'yaml_list', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'quantum_resistant.algorithms_supported', ['CRYSTALS-Dilithium', 'FALCON', 'SPHINCS+'], 'MEDIUM', 'validate_yaml_all_0462'),
+    ('YAML-ALL-0463', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'quantum_resistant.migration_plan', '21_post_quantum_crypto/migration_roadmap.md', 'MEDIUM', 'validate_yaml_all_0463'),
+    ('YAML-ALL-0464', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'quantum_resistant.timeline', '2025-2027', 'MEDIUM', 'validate_yaml_all_0464'),
+    ('YAML-ALL-0465', 'yaml_field', '02_audit_logging/next_gen_audit/audit_chain_config.yaml', 'quantum_resistant.business_continuity', 'guaranteed', 'MEDIUM', 'validate_yaml_all_0465'),
+    ('STRUCT-PART1-0466', None, None, None, None, 'CRITICAL', 'validate_struct_part1_0466'),
+    ('YAML-ALL-0467', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0467'),
+    ('YAML-ALL-0468', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0468'),
+    ('YAML-ALL-0469', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0469'),
+    ('YAML-ALL-0470', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'classification', 'PUBLIC - CI Guard Enforcement', 'MEDIUM', 'validate_yaml_all_0470'),
+    ('YAML-ALL-0471', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'root_level_exceptions.description', 'EINMALIGE, autoritäre Liste aller erlaubten Root-Level Items außerhalb der 24 Module', 'MEDIUM', 'validate_yaml_all_0471'),
+    ('YAML-ALL-0472', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'root_level_exceptions.enforcement', 'CI-Guard mit Exit Code 24 bei Violation', 'MEDIUM', 'validate_yaml_all_0472'),
+    ('YAML-ALL-0473', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'root_level_exceptions.modification_policy', 'Nur durch Compliance Committee + Technical Lead Approval', 'CRITICAL', 'validate_yaml_all_0473'),
+    ('YAML-ALL-0474', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'allowed_directories.git_infrastructure', ['.git', '.github', '.githooks'], 'MEDIUM', 'validate_yaml_all_0474'),
+    ('YAML-ALL-0475', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'allowed_directories.development_environment', ['.venv', '.continue'], 'MEDIUM', 'validate_yaml_all_0475'),
+    ('YAML-ALL-0476', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'allowed_directories.testing_artifacts', ['.pytest_cache'], 'MEDIUM', 'validate_yaml_all_0476'),
+    ('YAML-ALL-0477', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'allowed_directories.excluded_directories', [], 'MEDIUM', 'validate_yaml_all_0477'),
+    ('YAML-ALL-0478', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'allowed_files.version_control', ['.gitattributes', '.gitignore', '.gitmodules'], 'HIGH', 'validate_yaml_all_0478'),
+    ('YAML-ALL-0479', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'allowed_files.project_metadata', ['LICENSE', 'README.md'], 'MEDIUM', 'validate_yaml_all_0479'),
+    ('YAML-ALL-0480', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'allowed_files.testing_configuration', ['pytest.ini'], 'MEDIUM', 'validate_yaml_all_0480'),
+    ('YAML-ALL-0481', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'allowed_files.excluded_files', [], 'MEDIUM', 'validate_yaml_all_0481'),
+    ('YAML-ALL-0482', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_enforcement.ci_script', '12_tooling/scripts/structure_guard.sh', 'MEDIUM', 'validate_yaml_all_0482'),
+    ('YAML-ALL-0483', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_enforcement.validation_function', 'validate_root_exceptions', 'MEDIUM', 'validate_yaml_all_0483'),
+    ('YAML-ALL-0484', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_enforcement.enforcement_level', 'STRICT - Zero tolerance for unlisted items', 'MEDIUM', 'validate_yaml_all_0484'),
+    ('YAML-ALL-0485', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_enforcement.bypass_mechanism', 'NONE - No override capability', 'MEDIUM', 'validate_yaml_all_0485'),
+    ('YAML-ALL-0486', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_enforcement.violation_handling.immediate_failure', True, 'CRITICAL', 'validate_yaml_all_0486'),
+    ('YAML-ALL-0487', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_enforcement.violation_handling.exit_code', 24, 'MEDIUM', 'validate_yaml_all_0487'),
+    ('YAML-ALL-0488', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_enforcement.violation_handling.quarantine_trigger', True, 'CRITICAL', 'validate_yaml_all_0488'),
+    ('YAML-ALL-0489', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_enforcement.violation_handling.escalation', 'Compliance Committee notification', 'CRITICAL', 'validate_yaml_all_0489'),
+    ('YAML-ALL-0490', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_algorithm.step_1', 'Scan root directory for all items', 'MEDIUM', 'validate_yaml_all_0490'),
+    ('YAML-ALL-0491', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_algorithm.step_2', 'Compare against allowed_directories + allowed_files', 'MEDIUM', 'validate_yaml_all_0491'),
+    ('YAML-ALL-0492', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_algorithm.step_3', 'Verify 24 module directories present', 'MEDIUM', 'validate_yaml_all_0492'),
+    ('YAML-ALL-0493', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_algorithm.step_4', 'FAIL if any unlisted item found', 'MEDIUM', 'validate_yaml_all_0493'),
+    ('YAML-ALL-0494', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'guard_algorithm.step_5', 'Generate violation report for quarantine system', 'MEDIUM', 'validate_yaml_all_0494'),
+    ('YAML-ALL-0495', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'modification_process.approval_required', ['Senior Compliance Officer', 'Technical Lead', 'Legal Review (for licensing implications)'], 'CRITICAL', 'validate_yaml_all_0495'),
+    ('YAML-ALL-0496', 'yaml_list', '23_compliance/exceptions/root_level_exceptions.yaml', 'modification_process.documentation_required', ['Business justification', 'Security impact assessment', 'CI/CD impact analysis', 'Audit trail documentation'], 'CRITICAL', 'validate_yaml_all_0496'),
+    ('YAML-ALL-0497', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'modification_process.change_procedure.step_1', 'RFC (Request for Change) submission', 'MEDIUM', 'validate_yaml_all_0497'),
+    ('YAML-ALL-0498', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'modification_process.change_procedure.step_2', 'Multi-stakeholder review (5 business days)', 'MEDIUM', 'validate_yaml_all_0498'),
+    ('YAML-ALL-0499', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'modification_process.change_procedure.step_3', 'Approval/rejection decision', 'MEDIUM', 'validate_yaml_all_0499'),
+    ('YAML-ALL-0500', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'modification_process.change_procedure.step_4', 'If approved: Update YAML + CI tests', 'MEDIUM', 'validate_yaml_all_0500'),
+    ('YAML-ALL-0501', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'modification_process.change_procedure.step_5', 'Evidence logging in audit trail', 'MEDIUM', 'validate_yaml_all_0501'),
+    ('YAML-ALL-0502', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'anti_gaming_measures.no_wildcards', 'No wildcard patterns allowed', 'MEDIUM', 'validate_yaml_all_0502'),
+    ('YAML-ALL-0503', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'anti_gaming_measures.no_regex', 'No regex patterns allowed', 'MEDIUM', 'validate_yaml_all_0503'),
+    ('YAML-ALL-0504', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'anti_gaming_measures.explicit_enumeration', 'Every allowed item must be explicitly listed', 'CRITICAL', 'validate_yaml_all_0504'),
+    ('YAML-ALL-0505', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'anti_gaming_measures.case_sensitive', 'Exact case matching required', 'MEDIUM', 'validate_yaml_all_0505'),
+    ('YAML-ALL-0506', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'anti_gaming_measures.no_symlinks', 'Symbolic links not allowed', 'MEDIUM', 'validate_yaml_all_0506'),
+    ('YAML-ALL-0507', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'anti_gaming_measures.no_hidden_directories', 'Only explicitly listed hidden directories allowed', 'MEDIUM', 'validate_yaml_all_0507'),
+    ('YAML-ALL-0508', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'integration_points.structure_guard', '12_tooling/scripts/structure_guard.sh', 'MEDIUM', 'validate_yaml_all_0508'),
+    ('YAML-ALL-0509', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'integration_points.ci_gates', '24_meta_orchestration/triggers/ci/gates/structure_lock_l3.py', 'MEDIUM', 'validate_yaml_all_0509'),
+    ('YAML-ALL-0510', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'integration_points.quarantine_system', '02_audit_logging/quarantine/singleton/quarantine_store/', 'MEDIUM', 'validate_yaml_all_0510'),
+    ('YAML-ALL-0511', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'integration_points.compliance_policies', '23_compliance/policies/structure_policy.yaml', 'CRITICAL', 'validate_yaml_all_0511'),
+    ('YAML-ALL-0512', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'audit_requirements.change_log', 'All modifications logged in 02_audit_logging/storage/worm/immutable_store/', 'MEDIUM', 'validate_yaml_all_0512'),
+    ('YAML-ALL-0513', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'audit_requirements.review_cycle', 'Quarterly review of exceptions list', 'MEDIUM', 'validate_yaml_all_0513'),
+    ('YAML-ALL-0514', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'audit_requirements.justification_retention', '7 years minimum', 'MEDIUM', 'validate_yaml_all_0514'),
+    ('YAML-ALL-0515', 'yaml_field', '23_compliance/exceptions/root_level_exceptions.yaml', 'audit_requirements.approval_trail', 'Immutable approval documentation required', 'MEDIUM', 'validate_yaml_all_0515'),
+    ('YAML-ALL-0516', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0516'),
+    ('YAML-ALL-0517', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0517'),
+    ('YAML-ALL-0518', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0518'),
+    ('YAML-ALL-0519', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'classification', 'CONFIDENTIAL - Internal Use Only', 'MEDIUM', 'validate_yaml_all_0519'),
+    ('YAML-ALL-0520', 'yaml_list', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.primary_maintainers', [{'name': 'Hans Müller', 'role': 'Lead Compliance Officer', 'email': 'hans.mueller@ssid.company', 'backup': 'Maria Schmidt', 'areas': ['compliance_matrices', 'regulatory_updates', 'eu_mappings'], 'clearance_level': 'CONFIDENTIAL'}, {'name': 'Anna Weber', 'role': 'Technical Lead', 'email': 'anna.weber@ssid.company', 'backup': 'Thomas Klein', 'areas': ['badge_logic', 'anti_gaming_controls', 'internal_audits'], 'clearance_level': 'CONFIDENTIAL'}], 'CRITICAL', 'validate_yaml_all_0520'),
+    ('YAML-ALL-0521', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.backup_escalation.level_1', 'Security Team Lead', 'CRITICAL', 'validate_yaml_all_0521'),
+    ('YAML-ALL-0522', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.backup_escalation.level_2', 'CTO', 'MEDIUM', 'validate_yaml_all_0522'),
+    ('YAML-ALL-0523', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.backup_escalation.level_3', 'CEO', 'MEDIUM', 'validate_yaml_all_0523'),
+    ('YAML-ALL-0524', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.backup_escalation.level_4', 'Board Compliance Committee', 'CRITICAL', 'validate_yaml_all_0524'),
+    ('YAML-ALL-0525', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.backup_escalation.emergency_contact', 'legal@ssid.company', 'CRITICAL', 'validate_yaml_all_0525'),
+    ('YAML-ALL-0526', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.backup_escalation.external_counsel', 'compliance-emergency@lawfirm.com', 'CRITICAL', 'validate_yaml_all_0526'),
+    ('YAML-ALL-0527', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.internal_review_maintainers.monthly_reviewer', 'Compliance Team Lead', 'CRITICAL', 'validate_yaml_all_0527'),
+    ('YAML-ALL-0528', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.internal_review_maintainers.quarterly_reviewer', 'Senior Compliance Officer + Legal', 'CRITICAL', 'validate_yaml_all_0528'),
+    ('YAML-ALL-0529', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.internal_review_maintainers.semi_annual_reviewer', 'Executive Compliance Committee', 'CRITICAL', 'validate_yaml_all_0529'),
+    ('YAML-ALL-0530', 'yaml_list', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.external_reviewer_pool', ['Dr. Sarah Miller, Compliance Consulting LLC', 'Michael Brown, CPA, Audit Partners', 'Prof. Dr. Klaus Weber, Regulatory Consulting GmbH'], 'CRITICAL', 'validate_yaml_all_0530'),
+    ('YAML-ALL-0531', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.review_coordinator', 'Maria Schmidt', 'MEDIUM', 'validate_yaml_all_0531'),
+    ('YAML-ALL-0532', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.backup_coordinator', 'Thomas Klein', 'MEDIUM', 'validate_yaml_all_0532'),
+    ('YAML-ALL-0533', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.vacation_coverage.minimum_coverage', 2, 'MEDIUM', 'validate_yaml_all_0533'),
+    ('YAML-ALL-0534', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.vacation_coverage.notification_period', '2 weeks', 'MEDIUM', 'validate_yaml_all_0534'),
+    ('YAML-ALL-0535', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.vacation_coverage.handover_required', True, 'CRITICAL', 'validate_yaml_all_0535'),
+    ('YAML-ALL-0536', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.vacation_coverage.documentation', '23_compliance/governance/handover_template.md', 'CRITICAL', 'validate_yaml_all_0536'),
+    ('YAML-ALL-0537', 'yaml_field', '23_compliance/governance/maintainers_enterprise.yaml', 'maintainer_structure.vacation_coverage.business_continuity', 'Critical for regulatory deadlines', 'CRITICAL', 'validate_yaml_all_0537'),
+    ('YAML-ALL-0538', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0538'),
+    ('YAML-ALL-0539', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0539'),
+    ('YAML-ALL-0540', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0540'),
+    ('YAML-ALL-0541', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'classification', 'CONFIDENTIAL - Enterprise Social Responsibility', 'MEDIUM', 'validate_yaml_all_0541'),
+    ('YAML-ALL-0542', 'yaml_list', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'international_standards.geographic_coverage', [{'region': 'European Union', 'standards': ['GDPR', 'AI Act', 'eIDAS 2.0', 'MiCA', 'DORA'], 'localization': '23_compliance/regional/eu/', 'business_priority': 'CRITICAL'}, {'region': 'United States', 'standards': ['SOC2', 'CCPA', 'FTC Guidelines', 'SEC Regulations'], 'localization': '23_compliance/regional/us/', 'business_priority': 'HIGH'}, {'region': 'Asia Pacific', 'standards': ['Singapore MAS', 'Japan JVCEA', 'Hong Kong SFC', 'Australia ASIC'], 'localization': '23_compliance/regional/apac/', 'business_priority': 'HIGH'}, {'region': 'Switzerland', 'standards': ['FINMA', 'DLT Act', 'Swiss Data Protection Act'], 'localization': '23_compliance/regional/ch/', 'business_priority': 'MEDIUM'}, {'region': 'United Kingdom', 'standards': ['FCA Rules', 'UK GDPR', 'PCI DSS'], 'localization': '23_compliance/regional/uk/', 'business_priority': 'HIGH'}], 'CRITICAL', 'validate_yaml_all_0542'),
+    ('YAML-ALL-0543', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.wcag_version', '2.1', 'HIGH', 'validate_yaml_all_0543'),
+    ('YAML-ALL-0544', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.baseline', 'AA', 'MEDIUM', 'validate_yaml_all_0544'),
+    ('YAML-ALL-0545', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.aaa_scope', 'critical_flows_only', 'CRITICAL', 'validate_yaml_all_0545'),
+    ('YAML-ALL-0546', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.screen_reader_compatible', True, 'CRITICAL', 'validate_yaml_all_0546'),
+    ('YAML-ALL-0547', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.keyboard_navigation', True, 'CRITICAL', 'validate_yaml_all_0547'),
+    ('YAML-ALL-0548', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.color_contrast_ratio', '4.5:1', 'MEDIUM', 'validate_yaml_all_0548'),
+    ('YAML-ALL-0549', 'yaml_list', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.language_support', ['en', 'de', 'fr', 'es', 'it', 'ja', 'ko', 'zh'], 'MEDIUM', 'validate_yaml_all_0549'),
+    ('YAML-ALL-0550', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.rtl_language_support', True, 'CRITICAL', 'validate_yaml_all_0550'),
+    ('YAML-ALL-0551', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.business_localization', 'market_specific_requirements', 'MEDIUM', 'validate_yaml_all_0551'),
+    ('YAML-ALL-0552', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'accessibility_compliance.wcag_aaa_note', 'AAA compliance on selected critical flows only', 'CRITICAL', 'validate_yaml_all_0552'),
+    ('YAML-ALL-0553', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.open_contribution', True, 'CRITICAL', 'validate_yaml_all_0553'),
+    ('YAML-ALL-0554', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.translation_program', True, 'CRITICAL', 'validate_yaml_all_0554'),
+    ('YAML-ALL-0555', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.accessibility_review', 'required', 'MEDIUM', 'validate_yaml_all_0555'),
+    ('YAML-ALL-0556', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.diverse_reviewer_pool', True, 'CRITICAL', 'validate_yaml_all_0556'),
+    ('YAML-ALL-0557', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.enterprise_participation', 'strategic_partnerships', 'MEDIUM', 'validate_yaml_all_0557'),
+    ('YAML-ALL-0558', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.marginalized_communities.support', True, 'CRITICAL', 'validate_yaml_all_0558'),
+    ('YAML-ALL-0559', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.marginalized_communities.accessibility_fund', 'enterprise_funded', 'MEDIUM', 'validate_yaml_all_0559'),
+    ('YAML-ALL-0560', 'yaml_list', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.marginalized_communities.translation_priority', ['indigenous_languages', 'sign_languages'], 'MEDIUM', 'validate_yaml_all_0560'),
+    ('YAML-ALL-0561', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.marginalized_communities.outreach_programs', '23_compliance/social_ecosystem/outreach/', 'CRITICAL', 'validate_yaml_all_0561'),
+    ('YAML-ALL-0562', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.marginalized_communities.business_impact', 'market_expansion_opportunities', 'MEDIUM', 'validate_yaml_all_0562'),
+    ('YAML-ALL-0563', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.economic_inclusion.low_income_access', True, 'CRITICAL', 'validate_yaml_all_0563'),
+    ('YAML-ALL-0564', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.economic_inclusion.educational_discounts', True, 'CRITICAL', 'validate_yaml_all_0564'),
+    ('YAML-ALL-0565', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.economic_inclusion.developing_nation_support', True, 'CRITICAL', 'validate_yaml_all_0565'),
+    ('YAML-ALL-0566', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.economic_inclusion.internet_connectivity_alternatives', True, 'CRITICAL', 'validate_yaml_all_0566'),
+    ('YAML-ALL-0567', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'community_participation.economic_inclusion.enterprise_social_programs', 'community_investment', 'MEDIUM', 'validate_yaml_all_0567'),
+    ('YAML-ALL-0568', 'yaml_list', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'dao_governance_compatibility.governance_models', ['Traditional Corporate', 'DAO (Decentralized Autonomous Organization)', 'Hybrid (Corporate + DAO)', 'NGO/Non-Profit', 'Government/Public Sector', 'Academic Institution', 'Community Cooperative', 'Enterprise Consortium'], 'HIGH', 'validate_yaml_all_0568'),
+    ('YAML-ALL-0569', 'yaml_list', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'dao_governance_compatibility.voting_mechanisms', ['Token-based voting', 'Stake-weighted voting', 'Quadratic voting', 'Conviction voting', 'Reputation-based voting', 'Traditional board voting', 'Enterprise stakeholder voting'], 'HIGH', 'validate_yaml_all_0569'),
+    ('YAML-ALL-0570', 'yaml_list', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'dao_governance_compatibility.decision_frameworks.consensus_mechanisms', ['majority', 'supermajority', 'consensus', 'rough_consensus'], 'MEDIUM', 'validate_yaml_all_0570'),
+    ('YAML-ALL-0571', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'dao_governance_compatibility.decision_frameworks.quorum_requirements', 'configurable', 'MEDIUM', 'validate_yaml_all_0571'),
+    ('YAML-ALL-0572', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'dao_governance_compatibility.decision_frameworks.proposal_processes', '23_compliance/social_ecosystem/dao_proposals/', 'CRITICAL', 'validate_yaml_all_0572'),
+    ('YAML-ALL-0573', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'dao_governance_compatibility.decision_frameworks.veto_rights', 'configurable', 'MEDIUM', 'validate_yaml_all_0573'),
+    ('YAML-ALL-0574', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'dao_governance_compatibility.decision_frameworks.business_stakeholder_rights', 'protected', 'MEDIUM', 'validate_yaml_all_0574'),
+    ('YAML-ALL-0575', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'unbanked_community_support.no_bank_account_required', True, 'CRITICAL', 'validate_yaml_all_0575'),
+    ('YAML-ALL-0576', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'unbanked_community_support.alternative_identity_verification', True, 'CRITICAL', 'validate_yaml_all_0576'),
+    ('YAML-ALL-0577', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'unbanked_community_support.offline_capability', 'limited', 'MEDIUM', 'validate_yaml_all_0577'),
+    ('YAML-ALL-0578', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'unbanked_community_support.sms_notifications', True, 'CRITICAL', 'validate_yaml_all_0578'),
+    ('YAML-ALL-0579', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'unbanked_community_support.ussd_support', 'planned', 'MEDIUM', 'validate_yaml_all_0579'),
+    ('YAML-ALL-0580', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'unbanked_community_support.agent_network_compatible', True, 'CRITICAL', 'validate_yaml_all_0580'),
+    ('YAML-ALL-0581', 'yaml_field', '23_compliance/social_ecosystem/diversity_inclusion_config.yaml', 'unbanked_community_support.enterprise_financial_inclusion', 'market_expansion_strategy', 'MEDIUM', 'validate_yaml_all_0581'),
+    ('YAML-ALL-0582', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0582'),
+    ('YAML-ALL-0583', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0583'),
+    ('YAML-ALL-0584', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0584'),
+    ('YAML-ALL-0585', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'classification', 'CONFIDENTIAL - Enterprise ESG Strategy', 'MEDIUM', 'validate_yaml_all_0585'),
+    ('YAML-ALL-0586', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.carbon_footprint.tracking_enabled', True, 'CRITICAL', 'validate_yaml_all_0586'),
+    ('YAML-ALL-0587', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.carbon_footprint.reporting_standard', 'GHG Protocol', 'HIGH', 'validate_yaml_all_0587'),
+    ('YAML-ALL-0588', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.carbon_footprint.target', 'carbon_neutral_2027', 'MEDIUM', 'validate_yaml_all_0588'),
+    ('YAML-ALL-0589', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.carbon_footprint.offset_program', 'enterprise_verified', 'MEDIUM', 'validate_yaml_all_0589'),
+    ('YAML-ALL-0590', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.carbon_footprint.business_reporting', 'annual_sustainability_report', 'MEDIUM', 'validate_yaml_all_0590'),
+    ('YAML-ALL-0591', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.energy_efficiency.green_hosting_preferred', True, 'CRITICAL', 'validate_yaml_all_0591'),
+    ('YAML-ALL-0592', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.energy_efficiency.renewable_energy_target', '100%_by_2026', 'MEDIUM', 'validate_yaml_all_0592'),
+    ('YAML-ALL-0593', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.energy_efficiency.energy_monitoring', '24_meta_orchestration/monitoring/energy/', 'MEDIUM', 'validate_yaml_all_0593'),
+    ('YAML-ALL-0594', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.energy_efficiency.cost_optimization', 'efficiency_roi_tracking', 'MEDIUM', 'validate_yaml_all_0594'),
+    ('YAML-ALL-0595', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.circular_economy.code_reusability_score', 'track', 'MEDIUM', 'validate_yaml_all_0595'),
+    ('YAML-ALL-0596', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.circular_economy.resource_optimization', 'continuous', 'MEDIUM', 'validate_yaml_all_0596'),
+    ('YAML-ALL-0597', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.circular_economy.waste_reduction', 'digital_first', 'MEDIUM', 'validate_yaml_all_0597'),
+    ('YAML-ALL-0598', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'environmental_standards.circular_economy.business_efficiency', 'operational_cost_reduction', 'MEDIUM', 'validate_yaml_all_0598'),
+    ('YAML-ALL-0599', 'yaml_list', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'social_responsibility.un_sdg_mapping', [{'sdg_1': 'No Poverty - Financial inclusion features'}, {'sdg_4': 'Quality Education - Open educational resources'}, {'sdg_5': 'Gender Equality - Inclusive design principles'}, {'sdg_8': 'Decent Work - Fair contributor compensation'}, {'sdg_10': 'Reduced Inequalities - Accessibility compliance'}, {'sdg_16': 'Peace, Justice, Strong Institutions - Transparent governance'}, {'sdg_17': 'Partnerships - Multi-stakeholder collaboration'}], 'CRITICAL', 'validate_yaml_all_0599'),
+    ('YAML-ALL-0600', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'social_responsibility.social_impact_metrics.accessibility_score', 'track', 'MEDIUM', 'validate_yaml_all_0600'),
+    ('YAML-ALL-0601', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'social_responsibility.social_impact_metrics.inclusion_index', 'track', 'MEDIUM', 'validate_yaml_all_0601'),
+    ('YAML-ALL-0602', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'social_responsibility.social_impact_metrics.community_satisfaction', 'survey_quarterly', 'MEDIUM', 'validate_yaml_all_0602'),
+    ('YAML-ALL-0603', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'social_responsibility.social_impact_metrics.contributor_diversity', 'measure_report', 'MEDIUM', 'validate_yaml_all_0603'),
+    ('YAML-ALL-0604', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'social_responsibility.social_impact_metrics.business_value_creation', 'community_driven_innovation', 'MEDIUM', 'validate_yaml_all_0604'),
+    ('YAML-ALL-0605', 'yaml_list', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.transparency_requirements', ['All governance decisions public (non-confidential)', 'Financial transparency (where legally required)', 'Stakeholder engagement records', 'Impact assessment reports', 'Enterprise accountability framework'], 'CRITICAL', 'validate_yaml_all_0605'),
+    ('YAML-ALL-0606', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.ethics_framework.code_of_conduct', '23_compliance/social_ecosystem/ethics/code_of_conduct.md', 'CRITICAL', 'validate_yaml_all_0606'),
+    ('YAML-ALL-0607', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.ethics_framework.conflict_of_interest', '23_compliance/social_ecosystem/ethics/conflict_policy.md', 'CRITICAL', 'validate_yaml_all_0607'),
+    ('YAML-ALL-0608', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.ethics_framework.whistleblower_protection', '23_compliance/social_ecosystem/ethics/whistleblower.md', 'CRITICAL', 'validate_yaml_all_0608'),
+    ('YAML-ALL-0609', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.ethics_framework.business_ethics', 'enterprise_compliance_integration', 'CRITICAL', 'validate_yaml_all_0609'),
+    ('YAML-ALL-0610', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.stakeholder_engagement.user_council', 'planned', 'MEDIUM', 'validate_yaml_all_0610'),
+    ('YAML-ALL-0611', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.stakeholder_engagement.developer_advisory', 'active', 'MEDIUM', 'validate_yaml_all_0611'),
+    ('YAML-ALL-0612', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.stakeholder_engagement.regulatory_liaison', 'active', 'MEDIUM', 'validate_yaml_all_0612'),
+    ('YAML-ALL-0613', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.stakeholder_engagement.community_feedback', 'continuous', 'MEDIUM', 'validate_yaml_all_0613'),
+    ('YAML-ALL-0614', 'yaml_field', '23_compliance/social_ecosystem/esg_sustainability_config.yaml', 'governance_excellence.stakeholder_engagement.enterprise_advisory_board', 'strategic_direction', 'MEDIUM', 'validate_yaml_all_0614'),
+    ('YAML-ALL-0615', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0615'),
+    ('YAML-ALL-0616', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0616'),
+    ('YAML-ALL-0617', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0617'),
+    ('YAML-ALL-0618', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'classification', 'CONFIDENTIAL - Enterprise Market Analysis', 'MEDIUM', 'validate_yaml_all_0618'),
+    ('YAML-ALL-0619', 'yaml_list', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.financial_services.regulations', ['MiCA', 'PSD2', 'Basel III', 'SOX', 'FINMA', 'BaFin'], 'MEDIUM', 'validate_yaml_all_0619'),
+    ('YAML-ALL-0620', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.financial_services.risk_level', 'high', 'MEDIUM', 'validate_yaml_all_0620'),
+    ('YAML-ALL-0621', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.financial_services.audit_frequency', 'annual', 'MEDIUM', 'validate_yaml_all_0621'),
+    ('YAML-ALL-0622', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.financial_services.specialized_controls', '21_post_quantum_crypto/financial/', 'MEDIUM', 'validate_yaml_all_0622'),
+    ('YAML-ALL-0623', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.financial_services.business_opportunity', 'high_value_market', 'MEDIUM', 'validate_yaml_all_0623'),
+    ('YAML-ALL-0624', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.financial_services.revenue_potential', 'significant', 'MEDIUM', 'validate_yaml_all_0624'),
+    ('YAML-ALL-0625', 'yaml_list', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.healthcare.regulations', ['HIPAA', 'GDPR', 'FDA 21 CFR Part 11', 'ISO 13485', 'MDR'], 'MEDIUM', 'validate_yaml_all_0625'),
+    ('YAML-ALL-0626', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.healthcare.risk_level', 'critical', 'CRITICAL', 'validate_yaml_all_0626'),
+    ('YAML-ALL-0627', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.healthcare.audit_frequency', 'biannual', 'MEDIUM', 'validate_yaml_all_0627'),
+    ('YAML-ALL-0628', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.healthcare.specialized_controls', '20_foundation/security/healthcare/', 'CRITICAL', 'validate_yaml_all_0628'),
+    ('YAML-ALL-0629', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.healthcare.business_opportunity', 'emerging_market', 'MEDIUM', 'validate_yaml_all_0629'),
+    ('YAML-ALL-0630', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.healthcare.revenue_potential', 'moderate', 'MEDIUM', 'validate_yaml_all_0630'),
+    ('YAML-ALL-0631', 'yaml_list', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.government_public_sector.regulations', ['FedRAMP', 'Authority to Operate', 'NIST 800-53', 'ISO 27001'], 'MEDIUM', 'validate_yaml_all_0631'),
+    ('YAML-ALL-0632', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.government_public_sector.risk_level', 'critical', 'CRITICAL', 'validate_yaml_all_0632'),
+    ('YAML-ALL-0633', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.government_public_sector.audit_frequency', 'annual', 'MEDIUM', 'validate_yaml_all_0633'),
+    ('YAML-ALL-0634', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.government_public_sector.specialized_controls', '15_infra/security/government/', 'CRITICAL', 'validate_yaml_all_0634'),
+    ('YAML-ALL-0635', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.government_public_sector.business_opportunity', 'stable_contracts', 'MEDIUM', 'validate_yaml_all_0635'),
+    ('YAML-ALL-0636', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.government_public_sector.revenue_potential', 'high', 'MEDIUM', 'validate_yaml_all_0636'),
+    ('YAML-ALL-0637', 'yaml_list', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.education.regulations', ['FERPA', 'COPPA', 'GDPR', 'Accessibility Standards'], 'HIGH', 'validate_yaml_all_0637'),
+    ('YAML-ALL-0638', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.education.risk_level', 'medium', 'MEDIUM', 'validate_yaml_all_0638'),
+    ('YAML-ALL-0639', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.education.audit_frequency', 'annual', 'MEDIUM', 'validate_yaml_all_0639'),
+    ('YAML-ALL-0640', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.education.specialized_controls', '13_ui_layer/accessibility/', 'MEDIUM', 'validate_yaml_all_0640'),
+    ('YAML-ALL-0641', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.education.business_opportunity', 'social_impact', 'MEDIUM', 'validate_yaml_all_0641'),
+    ('YAML-ALL-0642', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.education.revenue_potential', 'moderate', 'MEDIUM', 'validate_yaml_all_0642'),
+    ('YAML-ALL-0643', 'yaml_list', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.gaming_entertainment.regulations', ['ESRB', 'Age Rating', 'Gambling Regulations', 'Consumer Protection'], 'MEDIUM', 'validate_yaml_all_0643'),
+    ('YAML-ALL-0644', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.gaming_entertainment.risk_level', 'medium', 'MEDIUM', 'validate_yaml_all_0644'),
+    ('YAML-ALL-0645', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.gaming_entertainment.audit_frequency', 'annual', 'MEDIUM', 'validate_yaml_all_0645'),
+    ('YAML-ALL-0646', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.gaming_entertainment.specialized_controls', '01_ai_layer/content_moderation/', 'MEDIUM', 'validate_yaml_all_0646'),
+    ('YAML-ALL-0647', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.gaming_entertainment.business_opportunity', 'growth_market', 'MEDIUM', 'validate_yaml_all_0647'),
+    ('YAML-ALL-0648', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.gaming_entertainment.revenue_potential', 'high', 'MEDIUM', 'validate_yaml_all_0648'),
+    ('YAML-ALL-0649', 'yaml_list', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.iot_manufacturing.regulations', ['CE Marking', 'FCC', 'Cybersecurity Act', 'Product Safety'], 'CRITICAL', 'validate_yaml_all_0649'),
+    ('YAML-ALL-0650', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.iot_manufacturing.risk_level', 'high', 'MEDIUM', 'validate_yaml_all_0650'),
+    ('YAML-ALL-0651', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.iot_manufacturing.audit_frequency', 'per_product', 'MEDIUM', 'validate_yaml_all_0651'),
+    ('YAML-ALL-0652', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.iot_manufacturing.specialized_controls', '19_adapters/iot_security/', 'CRITICAL', 'validate_yaml_all_0652'),
+    ('YAML-ALL-0653', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.iot_manufacturing.business_opportunity', 'emerging_IoT', 'MEDIUM', 'validate_yaml_all_0653'),
+    ('YAML-ALL-0654', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'sector_support.iot_manufacturing.revenue_potential', 'significant', 'MEDIUM', 'validate_yaml_all_0654'),
+    ('YAML-ALL-0655', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'cross_sector_features.regulatory_change_notification', True, 'CRITICAL', 'validate_yaml_all_0655'),
+    ('YAML-ALL-0656', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'cross_sector_features.sector_specific_templates', True, 'CRITICAL', 'validate_yaml_all_0656'),
+    ('YAML-ALL-0657', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'cross_sector_features.compliance_gap_analysis', 'automated', 'CRITICAL', 'validate_yaml_all_0657'),
+    ('YAML-ALL-0658', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'cross_sector_features.risk_assessment_tools', '07_governance_legal/risk_tools/', 'CRITICAL', 'validate_yaml_all_0658'),
+    ('YAML-ALL-0659', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'cross_sector_features.audit_preparation', '23_compliance/sector_audits/', 'CRITICAL', 'validate_yaml_all_0659'),
+    ('YAML-ALL-0660', 'yaml_field', '23_compliance/social_ecosystem/sector_compatibility.yaml', 'cross_sector_features.business_development', 'sector_specific_strategies', 'MEDIUM', 'validate_yaml_all_0660'),
+    ('YAML-ALL-0661', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'version', '1.1', 'HIGH', 'validate_yaml_all_0661'),
+    ('YAML-ALL-0662', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0662'),
+    ('YAML-ALL-0663', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0663'),
+    ('YAML-ALL-0664', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'classification', 'CONFIDENTIAL - Internal Standards', 'HIGH', 'validate_yaml_all_0664'),
+    ('YAML-ALL-0665', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'last_review', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0665'),
+    ('YAML-ALL-0666', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'next_review', '2026-03-15', 'MEDIUM', 'validate_yaml_all_0666'),
+    ('YAML-ALL-0667', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.structure_compliance.threshold', '>= 95%', 'MEDIUM', 'validate_yaml_all_0667'),
+    ('YAML-ALL-0668', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.structure_compliance.rationale', 'Enterprise-Grade mit 5% Toleranz für Edge Cases und Transitionen', 'MEDIUM', 'validate_yaml_all_0668'),
+    ('YAML-ALL-0669', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.structure_compliance.business_impact', 'Kritisch für interne Audits und externe Compliance', 'CRITICAL', 'validate_yaml_all_0669'),
+    ('YAML-ALL-0670', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.structure_compliance.internal_note', 'Höhere Standards als Public-Version für interne Qualität', 'HIGH', 'validate_yaml_all_0670'),
+    ('YAML-ALL-0671', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.structure_compliance.deprecated', False, 'CRITICAL', 'validate_yaml_all_0671'),
+    ('YAML-ALL-0672', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.structure_compliance.benchmark_source', 'Internal enterprise compliance framework', 'CRITICAL', 'validate_yaml_all_0672'),
+    ('YAML-ALL-0673', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.test_coverage.threshold', '>= 90%', 'MEDIUM', 'validate_yaml_all_0673'),
+    ('YAML-ALL-0674', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.test_coverage.rationale', 'Production-Standard mit 10% Toleranz für Legacy und Integration', 'HIGH', 'validate_yaml_all_0674'),
+    ('YAML-ALL-0675', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.test_coverage.business_impact', 'Essential für Reliability und Enterprise-Einsatz', 'MEDIUM', 'validate_yaml_all_0675'),
+    ('YAML-ALL-0676', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.test_coverage.deprecated', False, 'CRITICAL', 'validate_yaml_all_0676'),
+    ('YAML-ALL-0677', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.test_coverage.tiered_requirements.business_critical', '>= 95%', 'CRITICAL', 'validate_yaml_all_0677'),
+    ('YAML-ALL-0678', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.test_coverage.tiered_requirements.security_modules', '>= 98%', 'CRITICAL', 'validate_yaml_all_0678'),
+    ('YAML-ALL-0679', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.test_coverage.tiered_requirements.compliance_modules', '>= 99%', 'CRITICAL', 'validate_yaml_all_0679'),
+    ('YAML-ALL-0680', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.test_coverage.internal_exception', 'Business-kritische Module: >= 95%', 'MEDIUM', 'validate_yaml_all_0680'),
+    ('YAML-ALL-0681', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.threshold', '>= 98%', 'MEDIUM', 'validate_yaml_all_0681'),
+    ('YAML-ALL-0682', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.rationale', 'Höchste Standards für regulatorische Vollabdeckung', 'HIGH', 'validate_yaml_all_0682'),
+    ('YAML-ALL-0683', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.business_impact', 'Kritisch für Marktzulassungen und Audits', 'MEDIUM', 'validate_yaml_all_0683'),
+    ('YAML-ALL-0684', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.deprecated', False, 'CRITICAL', 'validate_yaml_all_0684'),
+    ('YAML-ALL-0685', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.jurisdictional_requirements.eu_markets', '>= 99%', 'MEDIUM', 'validate_yaml_all_0685'),
+    ('YAML-ALL-0686', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.jurisdictional_requirements.apac_markets', '>= 97%', 'MEDIUM', 'validate_yaml_all_0686'),
+    ('YAML-ALL-0687', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.jurisdictional_requirements.americas_markets', '>= 96%', 'MEDIUM', 'validate_yaml_all_0687'),
+    ('YAML-ALL-0688', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.jurisdictional_requirements.emerging_markets', '>= 95%', 'MEDIUM', 'validate_yaml_all_0688'),
+    ('YAML-ALL-0689', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.compliance_coverage.jurisdictions', 'Alle definierten Märkte müssen >= 95% erreichen', 'MEDIUM', 'validate_yaml_all_0689'),
+    ('YAML-ALL-0690', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.review_cycle.requirement', 'Internal 3 months + External 6 months', 'MEDIUM', 'validate_yaml_all_0690'),
+    ('YAML-ALL-0691', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.review_cycle.rationale', 'Höhere Review-Frequenz für Enterprise-Risiko-Management', 'MEDIUM', 'validate_yaml_all_0691'),
+    ('YAML-ALL-0692', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.review_cycle.cost_benefit', 'Höherer Aufwand aber maximaler Compliance-Schutz', 'CRITICAL', 'validate_yaml_all_0692'),
+    ('YAML-ALL-0693', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.review_cycle.deprecated', False, 'CRITICAL', 'validate_yaml_all_0693'),
+    ('YAML-ALL-0694', 'yaml_field', '23_compliance/metrics/threshold_rationale_internal.yaml', 'thresholds.review_cycle.escalation_trigger', 'Review overdue by 15 days (stricter than public)', 'MEDIUM', 'validate_yaml_all_0694'),
+    ('YAML-ALL-0695', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0695'),
+    ('YAML-ALL-0696', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0696'),
+    ('YAML-ALL-0697', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0697'),
+    ('YAML-ALL-0698', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'classification', 'CONFIDENTIAL - Enterprise Controls', 'MEDIUM', 'validate_yaml_all_0698'),
+    ('YAML-ALL-0699', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.circular_dependency_check.description', 'Enterprise-Grade Validation gegen zirkuläre Referenzen', 'MEDIUM', 'validate_yaml_all_0699'),
+    ('YAML-ALL-0700', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.circular_dependency_check.script', '23_compliance/anti_gaming/circular_dependency_validator.py', 'CRITICAL', 'validate_yaml_all_0700'),
+    ('YAML-ALL-0701', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.circular_dependency_check.script_deprecated', False, 'CRITICAL', 'validate_yaml_all_0701'),
+    ('YAML-ALL-0702', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.circular_dependency_check.frequency', 'Every commit + Daily full scan', 'MEDIUM', 'validate_yaml_all_0702'),
+    ('YAML-ALL-0703', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.circular_dependency_check.threshold', 'Zero circular dependencies allowed', 'MEDIUM', 'validate_yaml_all_0703'),
+    ('YAML-ALL-0704', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.circular_dependency_check.escalation', 'Block deployment on violation', 'MEDIUM', 'validate_yaml_all_0704'),
+    ('YAML-ALL-0705', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.circular_dependency_check.dependency_map_export', '23_compliance/anti_gaming/dependency_maps/', 'CRITICAL', 'validate_yaml_all_0705'),
+    ('YAML-ALL-0706', 'yaml_list', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.circular_dependency_check.export_formats', ['dot', 'json', 'svg', 'enterprise_dashboard'], 'MEDIUM', 'validate_yaml_all_0706'),
+    ('YAML-ALL-0707', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.business_logic_overfitting.description', 'Validierung gegen Business-Gaming und Metric-Optimierung', 'MEDIUM', 'validate_yaml_all_0707'),
+    ('YAML-ALL-0708', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.business_logic_overfitting.method', 'Random sampling + Quarterly manual review', 'MEDIUM', 'validate_yaml_all_0708'),
+    ('YAML-ALL-0709', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.business_logic_overfitting.script', '23_compliance/anti_gaming/overfitting_detector.py', 'CRITICAL', 'validate_yaml_all_0709'),
+    ('YAML-ALL-0710', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.business_logic_overfitting.script_deprecated', False, 'CRITICAL', 'validate_yaml_all_0710'),
+    ('YAML-ALL-0711', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.business_logic_overfitting.frequency', 'Weekly automated + Monthly manual', 'MEDIUM', 'validate_yaml_all_0711'),
+    ('YAML-ALL-0712', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.business_logic_overfitting.sample_size', '20%', 'MEDIUM', 'validate_yaml_all_0712'),
+    ('YAML-ALL-0713', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.business_logic_overfitting.reviewer_required', True, 'CRITICAL', 'validate_yaml_all_0713'),
+    ('YAML-ALL-0714', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.business_logic_overfitting.internal_audit', 'Quarterly by compliance team', 'CRITICAL', 'validate_yaml_all_0714'),
+    ('YAML-ALL-0715', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.enterprise_badge_validation.description', 'Enterprise Badge-Berechnungen gegen dokumentierte Formeln', 'MEDIUM', 'validate_yaml_all_0715'),
+    ('YAML-ALL-0716', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.enterprise_badge_validation.script', '23_compliance/anti_gaming/badge_integrity_checker.sh', 'CRITICAL', 'validate_yaml_all_0716'),
+    ('YAML-ALL-0717', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.enterprise_badge_validation.script_deprecated', False, 'CRITICAL', 'validate_yaml_all_0717'),
+    ('YAML-ALL-0718', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.enterprise_badge_validation.frequency', 'Every PR + Pre-release', 'MEDIUM', 'validate_yaml_all_0718'),
+    ('YAML-ALL-0719', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.enterprise_badge_validation.documentation_required', True, 'CRITICAL', 'validate_yaml_all_0719'),
+    ('YAML-ALL-0720', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.enterprise_badge_validation.business_review', 'Quarterly threshold review', 'MEDIUM', 'validate_yaml_all_0720'),
+    ('YAML-ALL-0721', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.enterprise_badge_validation.source_validation', True, 'CRITICAL', 'validate_yaml_all_0721'),
+    ('YAML-ALL-0722', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'controls.enterprise_badge_validation.formula_verification', True, 'CRITICAL', 'validate_yaml_all_0722'),
+    ('YAML-ALL-0723', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.enabled', True, 'CRITICAL', 'validate_yaml_all_0723'),
+    ('YAML-ALL-0724', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.script', '23_compliance/anti_gaming/dependency_graph_generator.py', 'CRITICAL', 'validate_yaml_all_0724'),
+    ('YAML-ALL-0725', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.output_directory', '23_compliance/anti_gaming/dependency_maps/', 'CRITICAL', 'validate_yaml_all_0725'),
+    ('YAML-ALL-0726', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.formats.dot', True, 'CRITICAL', 'validate_yaml_all_0726'),
+    ('YAML-ALL-0727', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.formats.json', True, 'CRITICAL', 'validate_yaml_all_0727'),
+    ('YAML-ALL-0728', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.formats.svg', True, 'CRITICAL', 'validate_yaml_all_0728'),
+    ('YAML-ALL-0729', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.formats.enterprise_dashboard', True, 'CRITICAL', 'validate_yaml_all_0729'),
+    ('YAML-ALL-0730', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.formats.confidential_mapping', True, 'CRITICAL', 'validate_yaml_all_0730'),
+    ('YAML-ALL-0731', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.update_frequency', 'Daily', 'MEDIUM', 'validate_yaml_all_0731'),
+    ('YAML-ALL-0732', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.ci_integration', True, 'CRITICAL', 'validate_yaml_all_0732'),
+    ('YAML-ALL-0733', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'dependency_graph_generation.classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0733'),
+    ('YAML-ALL-0734', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'external_review_cycle.frequency', 'Every 6 months', 'MEDIUM', 'validate_yaml_all_0734'),
+    ('YAML-ALL-0735', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'external_review_cycle.last_review', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0735'),
+    ('YAML-ALL-0736', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'external_review_cycle.next_review', '2026-03-15', 'MEDIUM', 'validate_yaml_all_0736'),
+    ('YAML-ALL-0737', 'yaml_field', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'external_review_cycle.internal_review', 'Every 3 months (zusätzlich)', 'MEDIUM', 'validate_yaml_all_0737'),
+    ('YAML-ALL-0738', 'yaml_list', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'external_review_cycle.reviewer_requirements', ['External: Independent third party (nicht Projekt-Maintainer)', 'Internal: Senior Compliance Officer + Legal Review', 'Credentials: Compliance/Audit background erforderlich', 'Clearance: Access to confidential compliance mappings', 'Documentation: 23_compliance/reviews/ + internal audit trail'], 'CRITICAL', 'validate_yaml_all_0738'),
+    ('YAML-ALL-0739', 'yaml_list', '23_compliance/anti_gaming/badge_integrity_enterprise.yaml', 'external_review_cycle.review_scope', ['Badge calculation logic verification', 'Circular dependency analysis', 'Business compliance matrix accuracy check', 'Anti-gaming control effectiveness', 'Internal audit trail validation', 'Regulatory mapping completeness', 'Dependency graph validation (confidential)', 'Business logic gaming assessment'], 'CRITICAL', 'validate_yaml_all_0739'),
+    ('YAML-ALL-0740', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'version', '2.2', 'HIGH', 'validate_yaml_all_0740'),
+    ('YAML-ALL-0741', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0741'),
+    ('YAML-ALL-0742', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0742'),
+    ('YAML-ALL-0743', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'regulatory_basis', 'Global Privacy Landscape 2025 + Emerging Markets', 'MEDIUM', 'validate_yaml_all_0743'),
+    ('YAML-ALL-0744', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0744'),
+    ('YAML-ALL-0745', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'ccpa_cpra/.name', 'Kalifornien CCPA/CPRA', 'MEDIUM', 'validate_yaml_all_0745'),
+    ('YAML-ALL-0746', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'ccpa_cpra/.path', '23_compliance/privacy/ccpa_cpra/', 'CRITICAL', 'validate_yaml_all_0746'),
+    ('YAML-ALL-0747', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'ccpa_cpra/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0747'),
+    ('YAML-ALL-0748', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'ccpa_cpra/.business_priority', 'HIGH', 'MEDIUM', 'validate_yaml_all_0748'),
+    ('YAML-ALL-0749', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'lgpd_br/.name', 'Brasilien LGPD', 'MEDIUM', 'validate_yaml_all_0749'),
+    ('YAML-ALL-0750', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'lgpd_br/.path', '23_compliance/privacy/lgpd_br/', 'CRITICAL', 'validate_yaml_all_0750'),
+    ('YAML-ALL-0751', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'lgpd_br/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0751'),
+    ('YAML-ALL-0752', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'lgpd_br/.business_priority', 'MEDIUM', 'MEDIUM', 'validate_yaml_all_0752'),
+    ('YAML-ALL-0753', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pdpa_sg/.name', 'Singapur PDPA', 'MEDIUM', 'validate_yaml_all_0753'),
+    ('YAML-ALL-0754', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pdpa_sg/.path', '23_compliance/privacy/pdpa_sg/', 'CRITICAL', 'validate_yaml_all_0754'),
+    ('YAML-ALL-0755', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pdpa_sg/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0755'),
+    ('YAML-ALL-0756', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pdpa_sg/.business_priority', 'HIGH', 'MEDIUM', 'validate_yaml_all_0756'),
+    ('YAML-ALL-0757', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'appi_jp/.name', 'Japan APPI', 'MEDIUM', 'validate_yaml_all_0757'),
+    ('YAML-ALL-0758', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'appi_jp/.path', '23_compliance/privacy/appi_jp/', 'CRITICAL', 'validate_yaml_all_0758'),
+    ('YAML-ALL-0759', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'appi_jp/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0759'),
+    ('YAML-ALL-0760', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'appi_jp/.business_priority', 'MEDIUM', 'MEDIUM', 'validate_yaml_all_0760'),
+    ('YAML-ALL-0761', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pipl_cn/.name', 'China PIPL', 'MEDIUM', 'validate_yaml_all_0761'),
+    ('YAML-ALL-0762', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pipl_cn/.path', '23_compliance/privacy/pipl_cn/', 'CRITICAL', 'validate_yaml_all_0762'),
+    ('YAML-ALL-0763', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pipl_cn/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0763'),
+    ('YAML-ALL-0764', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pipl_cn/.business_priority', 'LOW', 'MEDIUM', 'validate_yaml_all_0764'),
+    ('YAML-ALL-0765', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'popia_za/.name', 'Südafrika POPIA', 'MEDIUM', 'validate_yaml_all_0765'),
+    ('YAML-ALL-0766', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'popia_za/.path', '23_compliance/privacy/popia_za/', 'CRITICAL', 'validate_yaml_all_0766'),
+    ('YAML-ALL-0767', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'popia_za/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0767'),
+    ('YAML-ALL-0768', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'popia_za/.business_priority', 'LOW', 'MEDIUM', 'validate_yaml_all_0768'),
+    ('YAML-ALL-0769', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pipeda_ca/.name', 'Kanada PIPEDA + Provinzrecht-Notizen', 'MEDIUM', 'validate_yaml_all_0769'),
+    ('YAML-ALL-0770', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pipeda_ca/.path', '23_compliance/privacy/pipeda_ca/', 'CRITICAL', 'validate_yaml_all_0770'),
+    ('YAML-ALL-0771', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pipeda_ca/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0771'),
+    ('YAML-ALL-0772', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'pipeda_ca/.business_priority', 'MEDIUM', 'MEDIUM', 'validate_yaml_all_0772'),
+    ('YAML-ALL-0773', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'dpdp_in/.name', 'Indien DPDP Act 2023', 'MEDIUM', 'validate_yaml_all_0773'),
+    ('YAML-ALL-0774', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'dpdp_in/.path', '23_compliance/privacy/dpdp_in/', 'CRITICAL', 'validate_yaml_all_0774'),
+    ('YAML-ALL-0775', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'dpdp_in/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0775'),
+    ('YAML-ALL-0776', 'yaml_field', '23_compliance/privacy/global_privacy_v2.2.yaml', 'dpdp_in/.business_priority', 'MEDIUM', 'MEDIUM', 'validate_yaml_all_0776'),
+    ('YAML-ALL-0777', 'yaml_list', '23_compliance/privacy/global_privacy_v2.2.yaml', 'deprecated_privacy', [{'id': 'ccpa_original', 'status': 'deprecated', 'deprecated': True, 'replaced_by': 'ccpa_cpra', 'deprecation_date': '2023-01-01', 'notes': 'CPRA-Updates 2023/2024 integriert'}], 'CRITICAL', 'validate_yaml_all_0777'),
+    ('YAML-ALL-0778', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'version', '1.1', 'HIGH', 'validate_yaml_all_0778'),
+    ('YAML-ALL-0779', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0779'),
+    ('YAML-ALL-0780', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0780'),
+    ('YAML-ALL-0781', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0781'),
+    ('YAML-ALL-0782', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'nist_csf_20/.name', 'NIST CSF 2.0 (Govern/Identify/Protect/Detect/Respond/Recover) - Mapping auf DORA/NIS2', 'MEDIUM', 'validate_yaml_all_0782'),
+    ('YAML-ALL-0783', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'nist_csf_20/.path', '23_compliance/security/nist_csf_20/', 'CRITICAL', 'validate_yaml_all_0783'),
+    ('YAML-ALL-0784', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'nist_csf_20/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0784'),
+    ('YAML-ALL-0785', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'nist_csf_20/.business_priority', 'HIGH', 'MEDIUM', 'validate_yaml_all_0785'),
+    ('YAML-ALL-0786', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'pqc/.name', 'FIPS 203/204/205: ML-KEM, ML-DSA, SLH-DSA - Krypto-Agilität & Migrationsplan', 'MEDIUM', 'validate_yaml_all_0786'),
+    ('YAML-ALL-0787', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'pqc/.path', '23_compliance/security/pqc/', 'CRITICAL', 'validate_yaml_all_0787'),
+    ('YAML-ALL-0788', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'pqc/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0788'),
+    ('YAML-ALL-0789', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'pqc/.business_priority', 'HIGH', 'MEDIUM', 'validate_yaml_all_0789'),
+    ('YAML-ALL-0790', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'etsi_trust/.name', 'eIDAS/Signaturen: EN 319 401/411/421 (Policy/CA/TSL)', 'MEDIUM', 'validate_yaml_all_0790'),
+    ('YAML-ALL-0791', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'etsi_trust/.path', '23_compliance/security/etsi_trust/', 'CRITICAL', 'validate_yaml_all_0791'),
+    ('YAML-ALL-0792', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'etsi_trust/.deprecated', False, 'CRITICAL', 'validate_yaml_all_0792'),
+    ('YAML-ALL-0793', 'yaml_field', '23_compliance/security/financial_security_v1.1.yaml', 'etsi_trust/.business_priority', 'MEDIUM', 'MEDIUM', 'validate_yaml_all_0793'),
+    ('YAML-ALL-0794', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0794'),
+    ('YAML-ALL-0795', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0795'),
+    ('YAML-ALL-0796', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'classification', 'CONFIDENTIAL - Enterprise Evidence Management', 'MEDIUM', 'validate_yaml_all_0796'),
+    ('YAML-ALL-0797', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.immutable_store.path', '02_audit_logging/storage/worm/immutable_store/', 'MEDIUM', 'validate_yaml_all_0797'),
+    ('YAML-ALL-0798', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.immutable_store.retention', 'permanent', 'MEDIUM', 'validate_yaml_all_0798'),
+    ('YAML-ALL-0799', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.immutable_store.integrity', 'sha256_hash', 'MEDIUM', 'validate_yaml_all_0799'),
+    ('YAML-ALL-0800', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.immutable_store.encryption', 'aes256_enterprise', 'MEDIUM', 'validate_yaml_all_0800'),
+    ('YAML-ALL-0801', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.blockchain_anchors.enabled', True, 'CRITICAL', 'validate_yaml_all_0801'),
+    ('YAML-ALL-0802', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.blockchain_anchors.path', '02_audit_logging/storage/blockchain_anchors/', 'HIGH', 'validate_yaml_all_0802'),
+    ('YAML-ALL-0803', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.blockchain_anchors.service', 'opentimestamp', 'MEDIUM', 'validate_yaml_all_0803'),
+    ('YAML-ALL-0804', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.blockchain_anchors.frequency', 'weekly', 'MEDIUM', 'validate_yaml_all_0804'),
+    ('YAML-ALL-0805', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.blockchain_anchors.classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0805'),
+    ('YAML-ALL-0806', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.evidence_chain.path', '23_compliance/evidence/ci_runs/', 'CRITICAL', 'validate_yaml_all_0806'),
+    ('YAML-ALL-0807', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.evidence_chain.retention', '10_years', 'MEDIUM', 'validate_yaml_all_0807'),
+    ('YAML-ALL-0808', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.evidence_chain.encryption', 'aes256', 'MEDIUM', 'validate_yaml_all_0808'),
+    ('YAML-ALL-0809', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.evidence_chain.backup', 'encrypted_offsite', 'MEDIUM', 'validate_yaml_all_0809'),
+    ('YAML-ALL-0810', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.internal_review_documentation.path', '23_compliance/reviews/internal/', 'CRITICAL', 'validate_yaml_all_0810'),
+    ('YAML-ALL-0811', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.internal_review_documentation.retention', '15_years', 'MEDIUM', 'validate_yaml_all_0811'),
+    ('YAML-ALL-0812', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.internal_review_documentation.encryption', 'aes256', 'MEDIUM', 'validate_yaml_all_0812'),
+    ('YAML-ALL-0813', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.internal_review_documentation.classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0813'),
+    ('YAML-ALL-0814', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.business_evidence.path', '23_compliance/evidence/business_assessments/', 'CRITICAL', 'validate_yaml_all_0814'),
+    ('YAML-ALL-0815', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.business_evidence.retention', 'permanent', 'MEDIUM', 'validate_yaml_all_0815'),
+    ('YAML-ALL-0816', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.business_evidence.encryption', 'aes256', 'MEDIUM', 'validate_yaml_all_0816'),
+    ('YAML-ALL-0817', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'storage_tiers.business_evidence.classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0817'),
+    ('YAML-ALL-0818', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'audit_enhancement.blockchain_anchoring', 'enabled', 'HIGH', 'validate_yaml_all_0818'),
+    ('YAML-ALL-0819', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'audit_enhancement.opentimestamp_enabled', True, 'CRITICAL', 'validate_yaml_all_0819'),
+    ('YAML-ALL-0820', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'audit_enhancement.evidence_timestamping', 'full_blockchain', 'HIGH', 'validate_yaml_all_0820'),
+    ('YAML-ALL-0821', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'audit_enhancement.proof_of_existence', 'sha256+blockchain+timestamp', 'HIGH', 'validate_yaml_all_0821'),
+    ('YAML-ALL-0822', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'audit_enhancement.verification_method', 'hash_chain+blockchain', 'HIGH', 'validate_yaml_all_0822'),
+    ('YAML-ALL-0823', 'yaml_field', '02_audit_logging/storage/evidence_config_enterprise.yaml', 'audit_enhancement.enterprise_controls', 'full_audit_trail', 'MEDIUM', 'validate_yaml_all_0823'),
+    ('YAML-ALL-0824', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0824'),
+    ('YAML-ALL-0825', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0825'),
+    ('YAML-ALL-0826', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0826'),
+    ('YAML-ALL-0827', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'classification', 'CONFIDENTIAL - Enterprise Quarantine Management', 'MEDIUM', 'validate_yaml_all_0827'),
+    ('YAML-ALL-0828', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_singleton.canonical_path', '02_audit_logging/quarantine/singleton/quarantine_store/', 'MEDIUM', 'validate_yaml_all_0828'),
+    ('YAML-ALL-0829', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_singleton.principle', 'Single source of truth for all quarantined items', 'MEDIUM', 'validate_yaml_all_0829'),
+    ('YAML-ALL-0830', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_singleton.access_control', 'Restricted to compliance officers and senior management', 'CRITICAL', 'validate_yaml_all_0830'),
+    ('YAML-ALL-0831', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_singleton.encryption', 'AES-256 with enterprise key management', 'MEDIUM', 'validate_yaml_all_0831'),
+    ('YAML-ALL-0832', 'yaml_list', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_triggers.compliance_violations', ['Failed structure validation (score < 70)', 'Circular dependency detection', 'Badge integrity violations', 'Review deadline overdue (>30 days)', 'Business logic gaming detection', 'Confidentiality breach attempts'], 'CRITICAL', 'validate_yaml_all_0832'),
+    ('YAML-ALL-0833', 'yaml_list', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_triggers.regulatory_flags', ['Sanctioned entity interaction', 'Jurisdiction exclusion violations', 'AML/KYC failure patterns', 'Regulatory mapping inconsistencies', 'Audit trail tampering attempts'], 'CRITICAL', 'validate_yaml_all_0833'),
+    ('YAML-ALL-0834', 'yaml_list', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_triggers.technical_violations', ['Version compatibility failures', 'Anti-gaming control bypasses', 'Unauthorized access patterns', 'Data integrity hash mismatches', 'Enterprise boundary violations'], 'HIGH', 'validate_yaml_all_0834'),
+    ('YAML-ALL-0835', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_processing.intake_processor', '02_audit_logging/quarantine/processing/quarantine_processor.py', 'MEDIUM', 'validate_yaml_all_0835'),
+    ('YAML-ALL-0836', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_processing.auto_quarantine', True, 'CRITICAL', 'validate_yaml_all_0836'),
+    ('YAML-ALL-0837', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_processing.manual_override_required', 'Compliance Officer + Legal approval', 'CRITICAL', 'validate_yaml_all_0837'),
+    ('YAML-ALL-0838', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_processing.escalation_timeline', '24 hours for critical, 72 hours for high priority', 'CRITICAL', 'validate_yaml_all_0838'),
+    ('YAML-ALL-0839', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.policies_file', '02_audit_logging/quarantine/retention/quarantine_policies.yaml', 'MEDIUM', 'validate_yaml_all_0839'),
+    ('YAML-ALL-0840', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.retention_periods.compliance_violations', '7 years minimum', 'CRITICAL', 'validate_yaml_all_0840'),
+    ('YAML-ALL-0841', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.retention_periods.regulatory_flags', '10 years minimum', 'MEDIUM', 'validate_yaml_all_0841'),
+    ('YAML-ALL-0842', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.retention_periods.technical_violations', '5 years minimum', 'MEDIUM', 'validate_yaml_all_0842'),
+    ('YAML-ALL-0843', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.retention_periods.business_critical', 'Permanent retention', 'CRITICAL', 'validate_yaml_all_0843'),
+    ('YAML-ALL-0844', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.retention_periods.legal_hold', 'Until litigation resolution', 'CRITICAL', 'validate_yaml_all_0844'),
+    ('YAML-ALL-0845', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.purge_automation', False, 'CRITICAL', 'validate_yaml_all_0845'),
+    ('YAML-ALL-0846', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.archive_to_cold_storage', 'After 2 years active retention', 'MEDIUM', 'validate_yaml_all_0846'),
+    ('YAML-ALL-0847', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_retention.enterprise_backup', 'Encrypted offsite + blockchain anchoring', 'HIGH', 'validate_yaml_all_0847'),
+    ('YAML-ALL-0848', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_file', '02_audit_logging/quarantine/hash_ledger/quarantine_chain.json', 'MEDIUM', 'validate_yaml_all_0848'),
+    ('YAML-ALL-0849', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.hash_algorithm', 'SHA-256', 'MEDIUM', 'validate_yaml_all_0849'),
+    ('YAML-ALL-0850', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.chain_integrity', 'Each entry includes previous hash', 'MEDIUM', 'validate_yaml_all_0850'),
+    ('YAML-ALL-0851', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.immutable_properties', True, 'CRITICAL', 'validate_yaml_all_0851'),
+    ('YAML-ALL-0852', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.blockchain_anchoring', 'Daily commitment to private enterprise blockchain', 'HIGH', 'validate_yaml_all_0852'),
+    ('YAML-ALL-0853', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_structure.entry_id', 'UUID v4', 'MEDIUM', 'validate_yaml_all_0853'),
+    ('YAML-ALL-0854', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_structure.timestamp', 'ISO 8601 UTC', 'MEDIUM', 'validate_yaml_all_0854'),
+    ('YAML-ALL-0855', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_structure.item_hash', 'SHA-256 of quarantined item', 'MEDIUM', 'validate_yaml_all_0855'),
+    ('YAML-ALL-0856', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_structure.trigger_reason', 'Classification and details', 'MEDIUM', 'validate_yaml_all_0856'),
+    ('YAML-ALL-0857', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_structure.quarantine_officer', 'Person responsible for quarantine action', 'MEDIUM', 'validate_yaml_all_0857'),
+    ('YAML-ALL-0858', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_structure.business_impact', 'Revenue/compliance risk assessment', 'CRITICAL', 'validate_yaml_all_0858'),
+    ('YAML-ALL-0859', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_structure.previous_hash', 'Chain integrity verification', 'MEDIUM', 'validate_yaml_all_0859'),
+    ('YAML-ALL-0860', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'hash_ledger_system.ledger_structure.blockchain_anchor', 'Enterprise blockchain transaction ID', 'HIGH', 'validate_yaml_all_0860'),
+    ('YAML-ALL-0861', 'yaml_list', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.review_committee', ['Senior Compliance Officer (Chair)', 'Legal Counsel', 'Technical Security Lead', 'Business Risk Manager', 'External Auditor (quarterly reviews)'], 'CRITICAL', 'validate_yaml_all_0861'),
+    ('YAML-ALL-0862', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.review_schedule.daily', 'New quarantine items assessment', 'MEDIUM', 'validate_yaml_all_0862'),
+    ('YAML-ALL-0863', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.review_schedule.weekly', 'Pending release evaluations', 'MEDIUM', 'validate_yaml_all_0863'),
+    ('YAML-ALL-0864', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.review_schedule.monthly', 'Quarantine policy effectiveness review', 'MEDIUM', 'validate_yaml_all_0864'),
+    ('YAML-ALL-0865', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.review_schedule.quarterly', 'Full quarantine audit with external validation', 'MEDIUM', 'validate_yaml_all_0865'),
+    ('YAML-ALL-0866', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.release_criteria.compliance_remediation', 'All compliance violations addressed', 'CRITICAL', 'validate_yaml_all_0866'),
+    ('YAML-ALL-0867', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.release_criteria.legal_clearance', 'Legal team sign-off required', 'CRITICAL', 'validate_yaml_all_0867'),
+    ('YAML-ALL-0868', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.release_criteria.business_approval', 'Business impact assessment completed', 'MEDIUM', 'validate_yaml_all_0868'),
+    ('YAML-ALL-0869', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.release_criteria.technical_validation', 'Technical security clearance', 'CRITICAL', 'validate_yaml_all_0869'),
+    ('YAML-ALL-0870', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_governance.release_criteria.documentation_complete', 'Full audit trail and lessons learned', 'MEDIUM', 'validate_yaml_all_0870'),
+    ('YAML-ALL-0871', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_monitoring.dashboard_integration', 'Real-time quarantine status monitoring', 'MEDIUM', 'validate_yaml_all_0871'),
+    ('YAML-ALL-0872', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_monitoring.alert_system', 'Immediate notification for high-risk quarantines', 'MEDIUM', 'validate_yaml_all_0872'),
+    ('YAML-ALL-0873', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_monitoring.reporting_integration', 'Quarterly board reporting inclusion', 'MEDIUM', 'validate_yaml_all_0873'),
+    ('YAML-ALL-0874', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_monitoring.competitive_intelligence', 'Market impact assessment for quarantined items', 'MEDIUM', 'validate_yaml_all_0874'),
+    ('YAML-ALL-0875', 'yaml_list', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'quarantine_monitoring.quarantine_metrics', ['Average quarantine duration by category', 'Release success rate', 'Repeat quarantine patterns', 'Business impact of quarantined items', 'Compliance effectiveness scores', 'Cost of quarantine operations'], 'CRITICAL', 'validate_yaml_all_0875'),
+    ('YAML-ALL-0876', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'anti_gaming_quarantine.quarantine_gaming_detection', 'Monitor attempts to game quarantine system', 'MEDIUM', 'validate_yaml_all_0876'),
+    ('YAML-ALL-0877', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'anti_gaming_quarantine.bypass_attempt_logging', 'Log all quarantine bypass attempts', 'MEDIUM', 'validate_yaml_all_0877'),
+    ('YAML-ALL-0878', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'anti_gaming_quarantine.false_quarantine_prevention', 'Prevent malicious quarantine triggers', 'CRITICAL', 'validate_yaml_all_0878'),
+    ('YAML-ALL-0879', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'anti_gaming_quarantine.quarantine_integrity_verification', 'Regular integrity checks', 'MEDIUM', 'validate_yaml_all_0879'),
+    ('YAML-ALL-0880', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'anti_gaming_quarantine.insider_threat_monitoring', 'Monitor internal quarantine manipulations', 'MEDIUM', 'validate_yaml_all_0880'),
+    ('YAML-ALL-0881', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'integration_points.compliance_system', '23_compliance/policies/ → quarantine triggers', 'CRITICAL', 'validate_yaml_all_0881'),
+    ('YAML-ALL-0882', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'integration_points.audit_logging', '02_audit_logging/storage/ → quarantine evidence', 'MEDIUM', 'validate_yaml_all_0882'),
+    ('YAML-ALL-0883', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'integration_points.governance_legal', '07_governance_legal/risk/ → quarantine risk assessment', 'CRITICAL', 'validate_yaml_all_0883'),
+    ('YAML-ALL-0884', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'integration_points.business_intelligence', 'Competitive impact analysis for quarantined items', 'MEDIUM', 'validate_yaml_all_0884'),
+    ('YAML-ALL-0885', 'yaml_field', '02_audit_logging/quarantine/quarantine_config_enterprise.yaml', 'integration_points.enterprise_dashboard', 'Real-time quarantine visibility for executives', 'MEDIUM', 'validate_yaml_all_0885'),
+    ('YAML-ALL-0886', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'version', '1.5', 'HIGH', 'validate_yaml_all_0886'),
+    ('YAML-ALL-0887', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'date', '2025-09-15', 'MEDIUM', 'validate_yaml_all_0887'),
+    ('YAML-ALL-0888', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0888'),
+    ('YAML-ALL-0889', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0889'),
+    ('YAML-ALL-0890', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.W3C_VC_20.name', 'W3C Verifiable Credentials 2.0', 'MEDIUM', 'validate_yaml_all_0890'),
+    ('YAML-ALL-0891', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.W3C_VC_20.path', '10_interoperability/standards/w3c_vc2/', 'HIGH', 'validate_yaml_all_0891'),
+    ('YAML-ALL-0892', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.W3C_VC_20.deprecated', False, 'CRITICAL', 'validate_yaml_all_0892'),
+    ('YAML-ALL-0893', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.W3C_VC_20.business_priority', 'HIGH', 'MEDIUM', 'validate_yaml_all_0893'),
+    ('YAML-ALL-0894', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.OpenID_Connect_4_VC.name', 'OpenID Connect 4 Verifiable Credentials', 'MEDIUM', 'validate_yaml_all_0894'),
+    ('YAML-ALL-0895', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.OpenID_Connect_4_VC.path', '14_zero_time_auth/sso/protocols/oidc4vc/', 'MEDIUM', 'validate_yaml_all_0895'),
+    ('YAML-ALL-0896', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.OpenID_Connect_4_VC.deprecated', False, 'CRITICAL', 'validate_yaml_all_0896'),
+    ('YAML-ALL-0897', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.OpenID_Connect_4_VC.business_priority', 'HIGH', 'MEDIUM', 'validate_yaml_all_0897'),
+    ('YAML-ALL-0898', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.ISO_IEC_27001_2022.name', 'ISO/IEC 27001:2022', 'MEDIUM', 'validate_yaml_all_0898'),
+    ('YAML-ALL-0899', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.ISO_IEC_27001_2022.path', '23_compliance/mappings/iso27001/', 'CRITICAL', 'validate_yaml_all_0899'),
+    ('YAML-ALL-0900', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.ISO_IEC_27001_2022.deprecated', False, 'CRITICAL', 'validate_yaml_all_0900'),
+    ('YAML-ALL-0901', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.ISO_IEC_27001_2022.business_priority', 'CRITICAL', 'CRITICAL', 'validate_yaml_all_0901'),
+    ('YAML-ALL-0902', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.NIST_SSDF.name', 'NIST Secure Software Development Framework', 'MEDIUM', 'validate_yaml_all_0902'),
+    ('YAML-ALL-0903', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.NIST_SSDF.path', '23_compliance/mappings/nist_ssdf/', 'CRITICAL', 'validate_yaml_all_0903'),
+    ('YAML-ALL-0904', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.NIST_SSDF.deprecated', False, 'CRITICAL', 'validate_yaml_all_0904'),
+    ('YAML-ALL-0905', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.NIST_SSDF.business_priority', 'HIGH', 'MEDIUM', 'validate_yaml_all_0905'),
+    ('YAML-ALL-0906', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.SLSA.name', 'Supply Chain Levels for Software Artifacts', 'MEDIUM', 'validate_yaml_all_0906'),
+    ('YAML-ALL-0907', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.SLSA.path', '23_compliance/mappings/slsa/', 'CRITICAL', 'validate_yaml_all_0907'),
+    ('YAML-ALL-0908', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.SLSA.deprecated', False, 'CRITICAL', 'validate_yaml_all_0908'),
+    ('YAML-ALL-0909', 'yaml_field', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'active_standards.SLSA.business_priority', 'MEDIUM', 'MEDIUM', 'validate_yaml_all_0909'),
+    ('YAML-ALL-0910', 'yaml_list', '23_compliance/standards/implementation_enterprise_v1.5.yaml', 'deprecated_standards', [{'id': 'ISO27001_2013', 'status': 'deprecated', 'deprecated': True, 'replaced_by': 'ISO_IEC_27001_2022', 'migration_deadline': '2025-12-31', 'business_impact': 'Migration required for enterprise compliance'}], 'CRITICAL', 'validate_yaml_all_0910'),
+    ('YAML-ALL-0911', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0911'),
+    ('YAML-ALL-0912', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0912'),
+    ('YAML-ALL-0913', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0913'),
+    ('YAML-ALL-0914', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.monthly.scope', 'Badge metrics validation, compliance updates, business impact', 'CRITICAL', 'validate_yaml_all_0914'),
+    ('YAML-ALL-0915', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.monthly.owner', 'Compliance Team Lead', 'CRITICAL', 'validate_yaml_all_0915'),
+    ('YAML-ALL-0916', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.monthly.deliverable', 'internal_monthly_YYYY-MM.md', 'MEDIUM', 'validate_yaml_all_0916'),
+    ('YAML-ALL-0917', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.monthly.classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0917'),
+    ('YAML-ALL-0918', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.monthly.business_review', True, 'CRITICAL', 'validate_yaml_all_0918'),
+    ('YAML-ALL-0919', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.quarterly.scope', 'Full compliance matrix review, threshold validation, competitive analysis', 'CRITICAL', 'validate_yaml_all_0919'),
+    ('YAML-ALL-0920', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.quarterly.owner', 'Senior Compliance Officer + Legal', 'CRITICAL', 'validate_yaml_all_0920'),
+    ('YAML-ALL-0921', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.quarterly.deliverable', 'internal_quarterly_YYYY-QX.md', 'MEDIUM', 'validate_yaml_all_0921'),
+    ('YAML-ALL-0922', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.quarterly.classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0922'),
+    ('YAML-ALL-0923', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.quarterly.external_validation', 'Optional external consultant', 'MEDIUM', 'validate_yaml_all_0923'),
+    ('YAML-ALL-0924', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.quarterly.board_reporting', True, 'CRITICAL', 'validate_yaml_all_0924'),
+    ('YAML-ALL-0925', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.semi_annual.scope', 'Strategic compliance roadmap, regulatory horizon scan, market expansion', 'CRITICAL', 'validate_yaml_all_0925'),
+    ('YAML-ALL-0926', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.semi_annual.owner', 'Executive Compliance Committee', 'CRITICAL', 'validate_yaml_all_0926'),
+    ('YAML-ALL-0927', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.semi_annual.deliverable', 'strategic_compliance_YYYY-H1H2.md', 'CRITICAL', 'validate_yaml_all_0927'),
+    ('YAML-ALL-0928', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.semi_annual.classification', 'CONFIDENTIAL', 'MEDIUM', 'validate_yaml_all_0928'),
+    ('YAML-ALL-0929', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'internal_reviews.semi_annual.c_suite_presentation', True, 'CRITICAL', 'validate_yaml_all_0929'),
+    ('YAML-ALL-0930', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'external_reviews.frequency', 'Every 6 months', 'MEDIUM', 'validate_yaml_all_0930'),
+    ('YAML-ALL-0931', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'external_reviews.mandatory', True, 'CRITICAL', 'validate_yaml_all_0931'),
+    ('YAML-ALL-0932', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'external_reviews.scope', 'Badge logic, anti-gaming controls, regulatory accuracy', 'MEDIUM', 'validate_yaml_all_0932'),
+    ('YAML-ALL-0933', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'external_reviews.deliverable', 'external_review_YYYY-MM.md', 'MEDIUM', 'validate_yaml_all_0933'),
+    ('YAML-ALL-0934', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'external_reviews.confidentiality_agreement', 'required', 'MEDIUM', 'validate_yaml_all_0934'),
+    ('YAML-ALL-0935', 'yaml_field', '23_compliance/reviews/internal_review_schedule.yaml', 'external_reviews.clearance_verification', True, 'CRITICAL', 'validate_yaml_all_0935'),
+    ('YAML-ALL-0936', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'version', '1.0', 'HIGH', 'validate_yaml_all_0936'),
+    ('YAML-ALL-0937', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'date', '2025-09-21', 'MEDIUM', 'validate_yaml_all_0937'),
+    ('YAML-ALL-0938', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'deprecated', False, 'CRITICAL', 'validate_yaml_all_0938'),
+    ('YAML-ALL-0939', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'classification', 'CONFIDENTIAL - Security Operations', 'CRITICAL', 'validate_yaml_all_0939'),
+    ('YAML-ALL-0940', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.canonical_path', '02_audit_logging/quarantine/singleton/quarantine_store/', 'MEDIUM', 'validate_yaml_all_0940'),
+    ('YAML-ALL-0941', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.subfolders.staging', '02_audit_logging/quarantine/singleton/quarantine_store/staging/', 'MEDIUM', 'validate_yaml_all_0941'),
+    ('YAML-ALL-0942', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.subfolders.triage', '02_audit_logging/quarantine/singleton/quarantine_store/triage/', 'MEDIUM', 'validate_yaml_all_0942'),
+    ('YAML-ALL-0943', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.subfolders.hash_buckets', '02_audit_logging/quarantine/singleton/quarantine_store/hash_buckets/', 'MEDIUM', 'validate_yaml_all_0943'),
+    ('YAML-ALL-0944', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.subfolders.quarantined', '02_audit_logging/quarantine/singleton/quarantine_store/quarantined/', 'MEDIUM', 'validate_yaml_all_0944'),
+    ('YAML-ALL-0945', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.processing', '02_audit_logging/quarantine/processing/', 'MEDIUM', 'validate_yaml_all_0945'),
+    ('YAML-ALL-0946', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.retention', '02_audit_logging/quarantine/retention/', 'MEDIUM', 'validate_yaml_all_0946'),
+    ('YAML-ALL-0947', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.hash_ledger', '02_audit_logging/quarantine/hash_ledger/', 'MEDIUM', 'validate_yaml_all_0947'),
+    ('YAML-ALL-0948', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.evidence_path', '23_compliance/evidence/malware_quarantine_hashes/', 'CRITICAL', 'validate_yaml_all_0948'),
+    ('YAML-ALL-0949', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.hash_ledger_export', '23_compliance/evidence/malware_quarantine_hashes/quarantine_hash_ledger.json', 'CRITICAL', 'validate_yaml_all_0949'),
+    ('YAML-ALL-0950', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'quarantine_structure.evidence_path_note', 'Primary hash-ledger is stored under 02_audit_logging/quarantine/hash_ledger/; a signed, immutable export is mirrored under 23_compliance/evidence/malware_quarantine_hashes/.', 'CRITICAL', 'validate_yaml_all_0950'),
+    ('YAML-ALL-0951', 'yaml_list', '02_audit_logging/quarantine/quarantine_policy.yaml', 'forbidden_locations', ['Verboten: jeder andere */quarantine/**-Pfad (inkl. 12_tooling/**, 15_infra/**)', 'Nur der kanonische Pfad unter 02_audit_logging/quarantine/ ist zulässig', 'Evidence nur als Hash-Checksums unter 23_compliance/evidence/', 'Tooling nur Client-Skripte unter 12_tooling/scripts/security/ (kein Storage)'], 'CRITICAL', 'validate_yaml_all_0951'),
+    ('YAML-ALL-0952', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'retention_policy.staging_retention', '24 hours', 'MEDIUM', 'validate_yaml_all_0952'),
+    ('YAML-ALL-0953', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'retention_policy.triage_retention', '7 days', 'MEDIUM', 'validate_yaml_all_0953'),
+    ('YAML-ALL-0954', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'retention_policy.quarantined_retention', '30 days', 'MEDIUM', 'validate_yaml_all_0954'),
+    ('YAML-ALL-0955', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'retention_policy.hash_evidence_retention', 'permanent', 'MEDIUM', 'validate_yaml_all_0955'),
+    ('YAML-ALL-0956', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'security_controls.read_only_quarantine', True, 'CRITICAL', 'validate_yaml_all_0956'),
+    ('YAML-ALL-0957', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'security_controls.hash_verification', 'SHA256 + Blake3', 'MEDIUM', 'validate_yaml_all_0957'),
+    ('YAML-ALL-0958', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'security_controls.evidence_immutable', True, 'CRITICAL', 'validate_yaml_all_0958'),
+    ('YAML-ALL-0959', 'yaml_field', '02_audit_logging/quarantine/quarantine_policy.yaml', 'security_controls.worm_compliance', True, 'CRITICAL', 'validate_yaml_all_0959'),
+    ('YAML-ALL-0960', 'yaml_field', '23_compliance/evidence/sanctions/sources.yaml', 'version', '1.0.0', 'HIGH', 'validate_yaml_all_0960'),
+    ('YAML-ALL-0961', 'yaml_field', '23_compliance/evidence/sanctions/sources.yaml', 'last_updated', '<ISO8601>', 'MEDIUM', 'validate_yaml_all_0961'),
+    ('YAML-ALL-0962', 'yaml_field', '23_compliance/evidence/sanctions/sources.yaml', 'sources.ofac_sdn.url', 'https://www.treasury.gov/ofac', 'MEDIUM', 'validate_yaml_all_0962'),
+    ('YAML-ALL-0963', 'yaml_field', '23_compliance/evidence/sanctions/sources.yaml', 'sources.ofac_sdn.sha256', '<hash>', 'MEDIUM', 'validate_yaml_all_0963'),
+    ('YAML-ALL-0964', 'yaml_field', '23_compliance/evidence/sanctions/sources.yaml', 'sources.eu_consolidated.url', 'https://data.europa.eu/', 'MEDIUM', 'validate_yaml_all_0964'),
+    ('YAML-ALL-0965', 'yaml_field', '23_compliance/evidence/sanctions/sources.yaml', 'sources.eu_consolidated.sha256', '<hash>', 'MEDIUM', 'validate_yaml_all_0965'),
+    ('YAML-ALL-0966', 'yaml_field', '23_compliance/evidence/sanctions/sources.yaml', 'freshness_policy.max_age_hours', 24, 'MEDIUM', 'validate_yaml_all_0966'),
+)
+
 
 def main():
     """Test execution"""
@@ -13,17 +13,169 @@ Features:
 - Alert thresholds for degradation
 - Federation-ready (node_id tagging)
 
+Performance:
+- Latency percentiles from a log-bucketed quantile sketch (DDSketch
+  style, ~1% relative error): O(1) update, no per-event sort
+- Rolling window approximated by two rotating sketch segments
+- Statistics and alerts recomputed every stats_interval_events events
+  or stats_interval_sec seconds, not per event, and written as their own
+  "stats" record; per-event "event" records carry no statistics
+- Buffered JSONL writer: file handle kept open, flushed on size/time
+  thresholds (call flush()/close() on shutdown)
+
 Status: Phase 2 (Observability Hook)
 Version: 1.0.0
 """
 
 import json
+import math
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, List
-from collections import deque
 from datetime import datetime
 
+
+class LatencySketch:
+    """
+    Streaming quantile sketch with relative-error guarantee (DDSketch style).
+
+    Values are counted in logarithmic buckets: bucket i covers
+    (gamma^(i-1), gamma^i] with gamma = (1 + alpha) / (1 - alpha), so any
+    reported quantile is within alpha relative error of the true value.
+    add() is O(1); quantile() is O(buckets), which stays in the hundreds
+    for latencies spanning microseconds to minutes.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-3):
+        """
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            min_value: Values at or below this are counted in a zero bucket
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Count one value."""
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if value <= self.min_value:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        buckets = self.buckets
+        buckets[key] = buckets.get(key, 0) + 1
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Add the counts of another sketch with the same accuracy."""
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (0 <= q <= 1); 0.0 if empty."""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """Approximate quantiles for ascending qs in one pass over the buckets."""
+        if self.count == 0:
+            return [0.0] * len(qs)
+
+        results = []
+        ranks = iter([int(q * (self.count - 1)) for q in qs])
+        rank = next(ranks, None)
+        seen = self.zero_count
+        while rank is not None and rank < seen:
+            results.append(0.0)
+            rank = next(ranks, None)
+
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            while rank is not None and rank < seen:
+                # Bucket midpoint (in relative terms); the top rank is the max
+                if rank == self.count - 1:
+                    results.append(self.max)
+                else:
+                    results.append(min(2 * self.gamma ** key / (self.gamma + 1), self.max))
+                rank = next(ranks, None)
+            if rank is None:
+                break
+
+        while len(results) < len(qs):
+            results.append(self.max)
+        return results
+
+
+class BufferedTelemetryWriter:
+    """
+    Append-only JSONL writer with a persistent file handle.
+
+    Lines are buffered in memory and written in one call when flush_lines
+    lines are pending or flush_interval_sec has passed since the last
+    write. Thread-safe.
+    """
+
+    def __init__(self, path: Path, flush_lines: int = 512, flush_interval_sec: float = 1.0):
+        """
+        Args:
+            path: JSONL file to append to
+            flush_lines: Pending line count that triggers a write
+            flush_interval_sec: Maximum age of buffered lines
+        """
+        self.path = Path(path)
+        self.flush_lines = max(1, flush_lines)
+        self.flush_interval_sec = flush_interval_sec
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._handle = None
+        self._last_flush = time.time()
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Buffer one JSON entry, writing out if a threshold is reached."""
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if (len(self._buffer) >= self.flush_lines
+                    or time.time() - self._last_flush >= self.flush_interval_sec):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write out all buffered lines."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush and close the file handle."""
+        with self._lock:
+            self._flush_locked()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.time()
+        if not self._buffer:
+            return
+        if self._handle is None:
+            self._handle = self.path.open("a", encoding="utf-8")
+        self._handle.write("".join(self._buffer))
+        self._handle.flush()
+        self._buffer = []
+
+
 class AuditTelemetrySink:
     """
     Telemetry sink for audit event bus metrics.
@@ -36,7 +188,11 @@ class AuditTelemetrySink:
         telemetry_path: str = "17_observability/audit_metrics.jsonl",
         window_size: int = 1000,
         alert_threshold_queue_depth: int = 8000,
-        alert_threshold_latency_ms: float = 100.0
+        alert_threshold_latency_ms: float = 100.0,
+        stats_interval_events: int = 100,
+        stats_interval_sec: float = 1.0,
+        flush_lines: int = 512,
+        flush_interval_sec: float = 1.0
     ):
         """
         Initialize telemetry sink.
@@ -46,6 +202,10 @@ class AuditTelemetrySink:
             window_size: Rolling window size for statistics
             alert_threshold_queue_depth: Alert if queue exceeds this depth
             alert_threshold_latency_ms: Alert if P95 latency exceeds this
+            stats_interval_events: Recompute statistics every N events
+            stats_interval_sec: ... or at least this often (seconds)
+            flush_lines: Buffered telemetry lines that trigger a write
+            flush_interval_sec: Maximum age of buffered telemetry lines
         """
         self.telemetry_path = Path(telemetry_path)
         self.telemetry_path.parent.mkdir(parents=True, exist_ok=True)
@@ -54,9 +214,25 @@ class AuditTelemetrySink:
         self.alert_threshold_queue_depth = alert_threshold_queue_depth
         self.alert_threshold_latency_ms = alert_threshold_latency_ms
 
-        # Rolling window for statistics
-        self.latency_window: deque = deque(maxlen=window_size)
-        self.queue_depth_window: deque = deque(maxlen=window_size)
+        self.stats_interval_events = max(1, stats_interval_events)
+        self.stats_interval_sec = stats_interval_sec
+
+        # Rolling window for statistics: the current segment plus the
+        # previous one, each covering up to window_size events
+        self._segment_size = max(1, window_size)
+        self._latency_segments = [LatencySketch(), LatencySketch()]
+        self._queue_segments = [[0, 0, 0], [0, 0, 0]]  # [count, sum, max]
+
+        # Periodic statistics
+        self._events_since_stats = 0
+        self._last_stats_time = 0.0
+        self._lock = threading.Lock()
+
+        self.writer = BufferedTelemetryWriter(
+            self.telemetry_path,
+            flush_lines=flush_lines,
+            flush_interval_sec=flush_interval_sec
+        )
 
         # Counters
         self.total_events = 0
@@ -78,77 +254,99 @@ class AuditTelemetrySink:
             event: AuditEvent that was processed
             metrics: Metrics snapshot from worker loop
         """
-        # Update counters
-        self.total_events += 1
-        if metrics.get("status") == "failed":
-            self.failed_events += 1
-
-        # Update rolling windows
         processing_time = metrics.get("processing_time_ms", 0)
         queue_depth = metrics.get("queue_depth", 0)
-
-        self.latency_window.append(processing_time)
-        self.queue_depth_window.append(queue_depth)
-
-        # Track federation metrics (Phase 1.5+)
+        failed = metrics.get("status") == "failed"
         federation_node = event.federation_context.get("node_id", "local")
-        if federation_node not in self.federation_metrics:
-            self.federation_metrics[federation_node] = {
-                "events_processed": 0,
-                "total_latency_ms": 0.0,
-                "failures": 0,
-                "last_seen": time.time()
-            }
-
-        node_metrics = self.federation_metrics[federation_node]
-        node_metrics["events_processed"] += 1
-        node_metrics["total_latency_ms"] += processing_time
-        node_metrics["last_seen"] = time.time()
-
-        if metrics.get("status") == "failed":
-            node_metrics["failures"] += 1
-
-        # Compute statistics
-        stats = self._compute_statistics()
-
-        # Check alerts
-        alerts = self._check_alerts(stats)
+        now = time.time()
+
+        with self._lock:
+            # Update counters
+            self.total_events += 1
+            if failed:
+                self.failed_events += 1
+
+            # Update rolling window
+            if self._latency_segments[0].count >= self._segment_size:
+                self._latency_segments = [LatencySketch(), self._latency_segments[0]]
+                self._queue_segments = [[0, 0, 0], self._queue_segments[0]]
+            self._latency_segments[0].add(processing_time)
+            queue_segment = self._queue_segments[0]
+            queue_segment[0] += 1
+            queue_segment[1] += queue_depth
+            if queue_depth > queue_segment[2]:
+                queue_segment[2] = queue_depth
+
+            # Track federation metrics (Phase 1.5+)
+            node_metrics = self.federation_metrics.get(federation_node)
+            if node_metrics is None:
+                node_metrics = self.federation_metrics[federation_node] = {
+                    "events_processed": 0,
+                    "total_latency_ms": 0.0,
+                    "failures": 0,
+                    "last_seen": now
+                }
+
+            node_metrics["events_processed"] += 1
+            node_metrics["total_latency_ms"] += processing_time
+            node_metrics["last_seen"] = now
+
+            if failed:
+                node_metrics["failures"] += 1
+
+            # Recompute statistics and check alerts periodically
+            self._events_since_stats += 1
+            timestamp = datetime.utcnow().isoformat() + "Z"
+            stats_entry = None
+            if (self._events_since_stats >= self.stats_interval_events
+                    or now - self._last_stats_time >= self.stats_interval_sec):
+                stats = self._compute_statistics()
+                self._events_since_stats = 0
+                self._last_stats_time = now
+                stats_entry = {
+                    "record": "stats",
+                    "timestamp": timestamp,
+                    "total_events": self.total_events,
+                    # Rolling statistics
+                    "stats": stats,
+                    # Alerts fired by this snapshot
+                    "alerts": self._check_alerts(stats)
+                }
 
         # Publish telemetry
         telemetry_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "record": "event",
+            "timestamp": timestamp,
             "event_id": metrics.get("event_id"),
             "processing_time_ms": processing_time,
             "queue_depth": queue_depth,
             "handler_count": metrics.get("handler_count"),
             "status": metrics.get("status"),
             # Federation context (if available)
-            "federation_node": event.federation_context.get("node_id", "local"),
-            "federation_region": event.federation_context.get("region", "default"),
-            # Rolling statistics
-            "stats": stats,
-            # Alerts
-            "alerts": alerts
+            "federation_node": federation_node,
+            "federation_region": event.federation_context.get("region", "default")
         }
 
-        # Write to JSONL
-        with self.telemetry_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(telemetry_entry) + "\n")
+        # Buffered write to JSONL
+        self.writer.write(telemetry_entry)
+        if stats_entry is not None:
+            self.writer.write(stats_entry)
 
     def _compute_statistics(self) -> Dict[str, Any]:
         """Compute rolling window statistics."""
-        if len(self.latency_window) == 0:
+        if self.total_events == 0:
             return {}
 
         # Latency percentiles
-        sorted_latencies = sorted(self.latency_window)
-        p50_idx = int(len(sorted_latencies) * 0.50)
-        p95_idx = int(len(sorted_latencies) * 0.95)
-        p99_idx = int(len(sorted_latencies) * 0.99)
+        latency = LatencySketch()
+        for segment in self._latency_segments:
+            latency.merge(segment)
+        p50, p95, p99 = latency.quantiles([0.50, 0.95, 0.99])
 
         # Queue depth statistics
-        avg_queue_depth = sum(self.queue_depth_window) / len(self.queue_depth_window)
-        max_queue_depth = max(self.queue_depth_window)
+        queue_count = sum(segment[0] for segment in self._queue_segments)
+        avg_queue_depth = sum(segment[1] for segment in self._queue_segments) / queue_count
+        max_queue_depth = max(segment[2] for segment in self._queue_segments)
 
         # Throughput
         uptime = time.time() - self.start_time
@@ -159,9 +357,9 @@ class AuditTelemetrySink:
         proof_rate_per_sec = self.total_events / proof_stream_duration if proof_stream_duration > 0 else 0
 
         return {
-            "latency_p50_ms": round(sorted_latencies[p50_idx], 2),
-            "latency_p95_ms": round(sorted_latencies[p95_idx], 2),
-            "latency_p99_ms": round(sorted_latencies[p99_idx], 2),
+            "latency_p50_ms": round(p50, 2),
+            "latency_p95_ms": round(p95, 2),
+            "latency_p99_ms": round(p99, 2),
             "avg_queue_depth": round(avg_queue_depth, 2),
             "max_queue_depth": max_queue_depth,
             "throughput_events_per_sec": round(throughput, 2),
@@ -198,7 +396,8 @@ class AuditTelemetrySink:
 
     def get_summary(self) -> Dict[str, Any]:
         """Get telemetry summary."""
-        stats = self._compute_statistics()
+        with self._lock:
+            stats = self._compute_statistics()
 
         return {
             "total_events": self.total_events,
@@ -208,6 +407,14 @@ class AuditTelemetrySink:
             "alerts_fired": self.alerts_fired
         }
 
+    def flush(self) -> None:
+        """Write out buffered telemetry lines."""
+        self.writer.flush()
+
+    def close(self) -> None:
+        """Flush buffered telemetry lines and close the telemetry file."""
+        self.writer.close()
+
 
 # Example usage
 if __name__ == "__main__":
@@ -274,3 +481,4 @@ if __name__ == "__main__":
 
     # Shutdown
     bus.shutdown(timeout_ms=5000)
+    telemetry.close()
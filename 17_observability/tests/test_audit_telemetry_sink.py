@@ -0,0 +1,133 @@
+"""Tests for streaming audit telemetry sink."""
+import json
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add module to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from audit_telemetry_sink import AuditTelemetrySink, BufferedTelemetryWriter, LatencySketch
+
+
+def _event(node_id="node_001"):
+    return SimpleNamespace(federation_context={"node_id": node_id, "region": "eu-west-1"})
+
+
+def _metrics(i, latency, status="processed", queue_depth=0):
+    return {
+        "event_id": f"evt_{i}",
+        "processing_time_ms": latency,
+        "queue_depth": queue_depth,
+        "handler_count": 1,
+        "status": status,
+    }
+
+
+def test_sketch_quantiles_within_relative_error():
+    """Test sketch quantiles against exact sorted percentiles."""
+    rng = random.Random(7)
+    values = [rng.lognormvariate(1.0, 1.5) for _ in range(20000)]
+    sketch = LatencySketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    exact = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        expected = exact[int(q * (len(exact) - 1))]
+        assert abs(sketch.quantile(q) - expected) <= 0.011 * expected
+
+    assert sketch.quantile(1.0) == max(values)
+    assert LatencySketch().quantile(0.5) == 0.0
+
+
+def test_sketch_merge_and_zero_bucket():
+    """Test merging sketches and counting zero latencies."""
+    a, b = LatencySketch(), LatencySketch()
+    for _ in range(90):
+        a.add(0.0)
+    for _ in range(10):
+        b.add(50.0)
+    a.merge(b)
+
+    assert a.count == 100
+    assert a.quantile(0.5) == 0.0
+    assert abs(a.quantile(0.99) - 50.0) <= 0.5
+
+
+def test_writer_buffers_until_threshold(tmp_path):
+    """Test size threshold and explicit close of the buffered writer."""
+    path = tmp_path / "metrics.jsonl"
+    writer = BufferedTelemetryWriter(path, flush_lines=10, flush_interval_sec=3600)
+
+    for i in range(9):
+        writer.write({"i": i})
+    assert not path.exists()
+
+    writer.write({"i": 9})
+    assert len(path.read_text().splitlines()) == 10
+
+    writer.write({"i": 10})
+    writer.close()
+    assert [json.loads(line)["i"] for line in path.read_text().splitlines()] == list(range(11))
+
+
+def test_sink_periodic_statistics(tmp_path):
+    """Test that statistics are recomputed every stats_interval_events events."""
+    path = tmp_path / "audit_metrics.jsonl"
+    sink = AuditTelemetrySink(
+        telemetry_path=str(path),
+        stats_interval_events=50,
+        stats_interval_sec=3600,
+        flush_lines=1000,
+    )
+
+    for i in range(120):
+        sink.on_event_processed(_event(), _metrics(i, latency=float(i % 10), queue_depth=i))
+    sink.close()
+
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    events = [e for e in entries if e["record"] == "event"]
+    snapshots = [e for e in entries if e["record"] == "stats"]
+    assert len(events) == 120
+    assert all("stats" not in e and "alerts" not in e for e in events)
+
+    # First event triggers the initial snapshot, then one every 50 events,
+    # each written right after the event that triggered it
+    assert [s["total_events"] for s in snapshots] == [1, 51, 101]
+    assert [s["stats"]["max_queue_depth"] for s in snapshots] == [0, 50, 100]
+    assert entries[1] == snapshots[0]
+    assert entries[0]["event_id"] == "evt_0"
+
+    summary = sink.get_summary()
+    assert summary["total_events"] == 120
+    assert summary["statistics"]["max_queue_depth"] == 119
+    assert summary["statistics"]["latency_p99_ms"] <= 9.1
+
+
+def test_sink_rolling_window_and_alerts(tmp_path):
+    """Test that old latencies age out of the rolling window."""
+    sink = AuditTelemetrySink(
+        telemetry_path=str(tmp_path / "audit_metrics.jsonl"),
+        window_size=100,
+        alert_threshold_latency_ms=100.0,
+        stats_interval_events=1,
+    )
+
+    for i in range(100):
+        sink.on_event_processed(_event(), _metrics(i, latency=500.0))
+    assert any(a.startswith("HIGH_LATENCY_P95") for a in sink.alerts_fired)
+    sink.flush()
+    alerts = [a for line in sink.telemetry_path.read_text().splitlines()
+              for a in json.loads(line).get("alerts", [])]
+    assert any(a.startswith("HIGH_LATENCY_P95") for a in alerts)
+
+    # Two full segments of fast events push the slow ones out of the window
+    for i in range(200):
+        sink.on_event_processed(_event(), _metrics(100 + i, latency=1.0))
+    sink.close()
+
+    stats = sink.get_summary()["statistics"]
+    assert stats["latency_p99_ms"] <= 1.1
+    assert sink.federation_metrics["node_001"]["events_processed"] == 300
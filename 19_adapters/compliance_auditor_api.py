@@ -12,14 +12,21 @@ Classification: PUBLIC - External Auditor Interface
 
 import hashlib
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Sequence
 
 import yaml
 from flask import Flask, jsonify, request, Response
 from flask_cors import CORS
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from http_cache import CachedDocument, DocumentCache, etag_matches, ndjson_lines
+from http_cache import make_etag as _make_etag
+from jsonl_event_log import JsonlEventLog, read_tail
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for external auditors
 
@@ -32,6 +39,73 @@ BLOCKCHAIN_EVENTS_PATH = REPO_ROOT / "02_audit_logging/evidence/blockchain/compl
 UNIFIED_INDEX_PATH = REPO_ROOT / "23_compliance/mappings/compliance_unified_index.yaml"
 MAPPINGS_DIR = REPO_ROOT / "23_compliance/mappings"
 DASHBOARD_OUTPUT_PATH = REPO_ROOT / "13_ui_layer/compliance_dashboard_output.json"
+EVENTS_INDEX_PATH = REPO_ROOT / ".ssid_cache/jsonl_index/compliance_events.idx"
+
+# ============================================================================
+# Document Cache & Conditional GET
+# ============================================================================
+
+document_cache = DocumentCache()
+# Offset index over the blockchain events log (record number / status -> byte offset)
+events_log = JsonlEventLog(BLOCKCHAIN_EVENTS_PATH, EVENTS_INDEX_PATH)
+
+
+def _parse_yaml(raw: bytes) -> Any:
+    return yaml.safe_load(raw.decode('utf-8'))
+
+
+def _parse_json(raw: bytes) -> Any:
+    return json.loads(raw.decode('utf-8'))
+
+
+def _index_anchors(data: Any) -> Dict[str, Any]:
+    """anchor_id -> anchor (first occurrence wins, as with a linear search)."""
+    by_id: Dict[str, Any] = {}
+    for anchor in (data or {}).get("anchors", []):
+        anchor_id = anchor.get("anchor_id")
+        if anchor_id is not None:
+            by_id.setdefault(anchor_id, anchor)
+    return {"anchors_by_id": by_id}
+
+
+def load_yaml_document(path: Path) -> CachedDocument:
+    return document_cache.get(path, _parse_yaml)
+
+
+def load_anchor_registry() -> CachedDocument:
+    return document_cache.get(REGISTRY_ANCHOR_PATH, _parse_json, _index_anchors)
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Weak entity tag for a response built from the given validator parts.
+
+    Responses carry a per-request retrieved_at timestamp, so bodies are only
+    semantically equivalent between hits, hence W/ tags. Query arguments are
+    part of the tag since they select the representation.
+    """
+    return _make_etag(parts, request.args.items(multi=True))
+
+
+def conditional_response(etag: str, build: Callable[[], Any], vary: Sequence[str] = ()) -> Response:
+    """
+    304 Not Modified if If-None-Match matches etag, else the built response.
+
+    build() returns a JSON payload or a Response; it is only called (and the
+    payload serialized) when the client's copy is stale. vary names request
+    headers (besides the URL) that select the representation.
+    """
+    if etag_matches(request.headers.get('If-None-Match'), etag):
+        response = Response(status=304)
+    else:
+        response = build()
+        if not isinstance(response, Response):
+            response = jsonify(response)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    for header in vary:
+        response.vary.add(header)
+    return response
 
 # ============================================================================
 # Health & Info Endpoints
@@ -84,17 +158,12 @@ def get_unified_index():
         return jsonify({"error": "Unified index not found"}), 404
 
     try:
-        with open(UNIFIED_INDEX_PATH, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-
-        # Calculate file hash for verification
-        with open(UNIFIED_INDEX_PATH, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+        document = load_yaml_document(UNIFIED_INDEX_PATH)
 
-        return jsonify({
-            "data": data,
+        return conditional_response(make_etag(document.sha256), lambda: {
+            "data": document.data,
             "metadata": {
-                "file_hash": f"sha256:{file_hash}",
+                "file_hash": f"sha256:{document.sha256}",
                 "file_path": "23_compliance/mappings/compliance_unified_index.yaml",
                 "retrieved_at": datetime.utcnow().isoformat() + "Z"
             }
@@ -114,11 +183,10 @@ def get_dashboard():
         return jsonify({"error": "Dashboard output not found. Run compliance_dashboard.py first."}), 404
 
     try:
-        with open(DASHBOARD_OUTPUT_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        document = document_cache.get(DASHBOARD_OUTPUT_PATH, _parse_json)
 
-        return jsonify({
-            "data": data,
+        return conditional_response(make_etag(document.sha256), lambda: {
+            "data": document.data,
             "metadata": {
                 "retrieved_at": datetime.utcnow().isoformat() + "Z",
                 "source": "13_ui_layer/compliance_dashboard_output.json"
@@ -141,23 +209,23 @@ def get_anchors():
         return jsonify({"error": "Registry anchors not found"}), 404
 
     try:
-        with open(REGISTRY_ANCHOR_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        anchors = data.get("anchors", [])
+        document = load_anchor_registry()
+        all_anchors = document.data.get("anchors", [])
 
         # Pagination
         limit = request.args.get('limit', type=int)
         offset = request.args.get('offset', default=0, type=int)
 
         if limit:
-            anchors = anchors[offset:offset + limit]
+            anchors = all_anchors[offset:offset + limit]
         elif offset:
-            anchors = anchors[offset:]
+            anchors = all_anchors[offset:]
+        else:
+            anchors = all_anchors
 
-        return jsonify({
+        return conditional_response(make_etag(document.sha256), lambda: {
             "anchors": anchors,
-            "total_count": len(data.get("anchors", [])),
+            "total_count": len(all_anchors),
             "returned_count": len(anchors),
             "metadata": {
                 "retrieved_at": datetime.utcnow().isoformat() + "Z",
@@ -175,16 +243,13 @@ def get_anchor_by_id(anchor_id: str):
         return jsonify({"error": "Registry anchors not found"}), 404
 
     try:
-        with open(REGISTRY_ANCHOR_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        anchors = data.get("anchors", [])
-        anchor = next((a for a in anchors if a.get("anchor_id") == anchor_id), None)
+        document = load_anchor_registry()
+        anchor = document.index["anchors_by_id"].get(anchor_id)
 
         if not anchor:
             return jsonify({"error": f"Anchor {anchor_id} not found"}), 404
 
-        return jsonify({
+        return conditional_response(make_etag(document.sha256, anchor_id), lambda: {
             "anchor": anchor,
             "metadata": {
                 "retrieved_at": datetime.utcnow().isoformat() + "Z"
@@ -201,36 +266,61 @@ def get_blockchain_events():
 
     Query parameters:
     - limit: Number of events to return (default: 100)
+    - offset: Position of the first event (default: most recent events)
     - status: Filter by confirmation_status (pending|confirmed|finalized)
+    - format: json (default) or ndjson (also selected by Accept: application/x-ndjson)
+
+    Events are located through the offset index, so a request reads only the
+    returned lines. total_count is the number of events matching the filter.
     """
     if not BLOCKCHAIN_EVENTS_PATH.exists():
         return jsonify({"error": "Blockchain events not found"}), 404
 
-    try:
-        events = []
-        with open(BLOCKCHAIN_EVENTS_PATH, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    events.append(json.loads(line))
-
-        # Filter by status if provided
-        status_filter = request.args.get('status')
-        if status_filter:
-            events = [e for e in events if e.get('blockchain', {}).get('confirmation_status') == status_filter]
-
-        # Limit results
-        limit = request.args.get('limit', default=100, type=int)
-        events = events[-limit:]  # Return most recent
+    limit = request.args.get('limit', default=100, type=int)
+    offset = request.args.get('offset', type=int)
+    status_filter = request.args.get('status') or None
+    if limit <= 0 or (offset is not None and offset < 0):
+        return jsonify({"error": "limit must be positive and offset non-negative"}), 400
 
-        return jsonify({
-            "events": events,
-            "total_count": len(events),
+    ndjson = request.args.get('format') == 'ndjson' or (
+        request.accept_mimetypes.best == 'application/x-ndjson')
+
+    try:
+        # One view per request: counts, ETag and offsets agree even if
+        # another request refreshes the index meanwhile
+        view = events_log.refresh()
+        total_count = view.count(status_filter)
+        etag = make_etag(view.indexed_size, view.mtime_ns, ndjson)
+
+        if offset is not None:
+            numbers = view.page(offset, limit, status_filter)
+        else:
+            numbers = view.tail(limit, status_filter)
+
+        def lines():
+            if offset is None and status_filter is None:
+                # Most recent events: read backwards from the indexed end
+                return read_tail(BLOCKCHAIN_EVENTS_PATH, len(numbers), end=view.indexed_size)
+            return view.iter_lines(numbers)
+
+        if ndjson:
+            def stream():
+                response = Response(ndjson_lines(lines()), mimetype='application/x-ndjson')
+                response.headers['X-Total-Count'] = str(total_count)
+                response.headers['X-Returned-Count'] = str(len(numbers))
+                return response
+
+            return conditional_response(etag, stream, vary=('Accept',))
+
+        return conditional_response(etag, lambda: {
+            "events": [json.loads(line) for line in lines()],
+            "total_count": total_count,
+            "returned_count": len(numbers),
             "metadata": {
                 "retrieved_at": datetime.utcnow().isoformat() + "Z",
                 "source": "02_audit_logging/evidence/blockchain/compliance_events.jsonl"
             }
-        })
+        }, vary=('Accept',))
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -253,18 +343,13 @@ def get_framework(framework_name: str):
         return jsonify({"error": f"Mapping for {framework_name} not found"}), 404
 
     try:
-        with open(mapping_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-
-        # Calculate file hash
-        with open(mapping_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+        document = load_yaml_document(mapping_path)
 
-        return jsonify({
+        return conditional_response(make_etag(document.sha256, framework_name), lambda: {
             "framework": framework_name,
-            "data": data,
+            "data": document.data,
             "metadata": {
-                "file_hash": f"sha256:{file_hash}",
+                "file_hash": f"sha256:{document.sha256}",
                 "file_path": f"23_compliance/mappings/{framework_name.lower()}_mapping.yaml",
                 "retrieved_at": datetime.utcnow().isoformat() + "Z"
             }
@@ -309,7 +394,8 @@ def verify_hash(file_type: str, expected_hash: str):
         return jsonify({"error": f"File not found: {file_type}"}), 404
 
     try:
-        # Calculate actual hash
+        # Calculate actual hash from the current bytes (never cached: this is
+        # the tamper check, and mtime/size validation can be forged)
         with open(file_path, 'rb') as f:
             actual_hash = hashlib.sha256(f.read()).hexdigest()
 
@@ -339,10 +425,7 @@ def verify_anchor(anchor_id: str):
 
     try:
         # Load anchor
-        with open(REGISTRY_ANCHOR_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        anchor = next((a for a in data.get("anchors", []) if a.get("anchor_id") == anchor_id), None)
+        anchor = load_anchor_registry().index["anchors_by_id"].get(anchor_id)
 
         if not anchor:
             return jsonify({"error": f"Anchor {anchor_id} not found"}), 404
@@ -393,25 +476,18 @@ def get_statistics():
 
     # Count anchors
     if REGISTRY_ANCHOR_PATH.exists():
-        with open(REGISTRY_ANCHOR_PATH, 'r', encoding='utf-8') as f:
-            anchor_data = json.load(f)
-            anchors = anchor_data.get("anchors", [])
-            stats["anchors"]["total"] = len(anchors)
-            if anchors:
-                stats["anchors"]["latest"] = anchors[-1].get("timestamp")
+        anchors = load_anchor_registry().data.get("anchors", [])
+        stats["anchors"]["total"] = len(anchors)
+        if anchors:
+            stats["anchors"]["latest"] = anchors[-1].get("timestamp")
 
     # Count blockchain events
     if BLOCKCHAIN_EVENTS_PATH.exists():
-        with open(BLOCKCHAIN_EVENTS_PATH, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    stats["blockchain_events"]["total"] += 1
-                    event = json.loads(line)
-                    status = event.get("blockchain", {}).get("confirmation_status")
-                    if status == "pending":
-                        stats["blockchain_events"]["pending"] += 1
-                    elif status in ["confirmed", "finalized"]:
-                        stats["blockchain_events"]["confirmed"] += 1
+        view = events_log.refresh()
+        stats["blockchain_events"]["total"] = view.count()
+        stats["blockchain_events"]["pending"] = view.count("pending")
+        stats["blockchain_events"]["confirmed"] = (
+            view.count("confirmed") + view.count("finalized"))
 
     return jsonify({
         "statistics": stats,
@@ -0,0 +1,106 @@
+"""
+HTTP Caching Helpers
+
+Framework-independent parts of the compliance auditor API's caching layer:
+
+- DocumentCache: parsed evidence documents validated by mtime and size
+- make_etag(): entity tag over validator parts and query arguments
+- etag_matches(): If-None-Match evaluation (weak comparison)
+- ndjson_lines(): newline-delimited body from raw JSONL lines
+
+Version: 2025-Q4
+Maintainer: edubrainboost
+Classification: PUBLIC - External Auditor Interface
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+
+@dataclass
+class CachedDocument:
+    """Parsed document plus the SHA-256 digest of the bytes it was parsed from."""
+    data: Any
+    sha256: str
+    mtime_ns: int
+    size: int
+    index: Dict[str, Any] = field(default_factory=dict)
+
+
+class DocumentCache:
+    """
+    In-process cache of parsed evidence documents.
+
+    Entries are validated against the file's mtime and size on every lookup,
+    so a stat() replaces the read/parse/hash of an unchanged file. A changed
+    file is read once; digest and parsed data come from the same bytes.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, CachedDocument] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, parser: Callable[[bytes], Any],
+            indexer: Optional[Callable[[Any], Dict[str, Any]]] = None) -> CachedDocument:
+        """Return the cached document for path, (re)loading it if the file changed."""
+        stat = path.stat()
+        entry = self._entries.get(path)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+
+        with self._lock:
+            raw = path.read_bytes()
+            data = parser(raw)
+            entry = CachedDocument(
+                data=data,
+                sha256=hashlib.sha256(raw).hexdigest(),
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                index=indexer(data) if indexer else {},
+            )
+            self._entries[path] = entry
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def make_etag(parts: Sequence[Any], query_items: Iterable[Tuple[str, str]] = ()) -> str:
+    """
+    Entity tag (opaque part, without quotes) for a response built from parts.
+
+    Query arguments select the representation, so they are part of the tag;
+    their order does not matter.
+    """
+    variant = json.dumps([list(parts), sorted(query_items)], default=str)
+    return hashlib.sha256(variant.encode('utf-8')).hexdigest()[:32]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header value matches etag (weak comparison).
+
+    Accepts "*", and lists of strong or weak (W/) quoted tags.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == f'"{etag}"':
+            return True
+    return False
+
+
+def ndjson_lines(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """Newline-delimited JSON body chunks from stripped JSONL lines."""
+    for line in lines:
+        yield line + b'\n'
@@ -0,0 +1,385 @@
+"""
+JSONL Event Log Access
+
+Random access to append-only JSONL evidence logs (e.g. the blockchain
+compliance events) for the compliance auditor API:
+
+- read_tail(): last N records, read backwards from EOF in blocks
+- JsonlEventLog: sidecar offset index (record number -> byte offset, and
+  record numbers per status) for offset/limit pagination and counts
+- EventLogView: consistent read view of the index, taken under its lock
+
+The sidecar is a small JSON header plus an entries file of fixed-width
+(offset, status code) records. On append only the new entries are written
+and the header is replaced, so persisting costs O(new records).
+
+Only newline-terminated lines are records; a trailing fragment without a
+newline is a write in progress and is ignored until completed. Blank lines
+are skipped.
+
+The index is extended incrementally when the log grows. It is rebuilt when
+the log shrinks, is rewritten in place at the same size, or the last indexed
+record changed.
+
+Version: 2025-Q4
+Maintainer: edubrainboost
+Classification: PUBLIC - External Auditor Interface
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+INDEX_VERSION = 2
+INDEX_MAGIC = "ssid-jsonl-index"
+BLOCK_SIZE = 64 * 1024
+
+# Sidecar entry: byte offset (int64) and status code (uint16), little-endian
+ENTRY = struct.Struct('<qH')
+
+
+def read_tail(path: Path, limit: int, end: Optional[int] = None,
+              block_size: int = BLOCK_SIZE) -> List[bytes]:
+    """
+    Last `limit` records of a JSONL file (oldest first), as raw stripped lines.
+
+    Reads blocks backwards from EOF (or from byte position `end`), so the cost
+    depends on `limit` and the record size, not on the length of the log.
+    """
+    if limit <= 0:
+        return []
+
+    lines: List[bytes] = []
+    with open(path, 'rb') as f:
+        pos = f.seek(0, 2) if end is None else end
+        buf = b''
+        fragment = True  # text after the last newline is not a record yet
+        while pos > 0 and len(lines) < limit:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            buf = f.read(size) + buf
+            parts = buf.split(b'\n')
+            if fragment:
+                if len(parts) == 1:
+                    continue
+                parts.pop()
+                fragment = False
+            # parts[0] may continue in the previous block
+            buf = parts[0]
+            for part in reversed(parts[1:]):
+                line = part.strip()
+                if line:
+                    lines.append(line)
+                    if len(lines) == limit:
+                        break
+        if pos == 0 and not fragment and len(lines) < limit:
+            line = buf.strip()
+            if line:
+                lines.append(line)
+
+    lines.reverse()
+    return lines
+
+
+def _status_of(record: Any, status_path: Sequence[str]) -> Optional[str]:
+    value = record
+    for key in status_path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value if isinstance(value, str) else None
+
+
+class EventLogView:
+    """
+    Read view of a JsonlEventLog at one index state.
+
+    Holds the index arrays and the record counts at the time it was taken.
+    refresh() only appends to these arrays or replaces them, so a view stays
+    consistent while another thread refreshes the log.
+    """
+
+    def __init__(self, path: Path, offsets: array, by_status: Dict[Optional[str], array],
+                 indexed_size: int, mtime_ns: int):
+        self.path = path
+        self.offsets = offsets
+        self.record_count = len(offsets)
+        self.by_status = {status: (numbers, len(numbers)) for status, numbers in by_status.items()}
+        self.indexed_size = indexed_size
+        self.mtime_ns = mtime_ns
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Number of records, or of records with the given status."""
+        if status is None:
+            return self.record_count
+        return self.by_status.get(status, ((), 0))[1]
+
+    def status_counts(self) -> Dict[Optional[str], int]:
+        return {status: count for status, (_, count) in self.by_status.items()}
+
+    def page(self, offset: int, limit: int, status: Optional[str] = None) -> Sequence[int]:
+        """Record numbers [offset:offset+limit] of all records or of one status."""
+        start = max(offset, 0)
+        end = min(start + max(limit, 0), self.count(status))
+        if status is None:
+            return range(start, max(end, start))
+        numbers = self.by_status.get(status, ((), 0))[0]
+        return numbers[start:max(end, start)]
+
+    def tail(self, limit: int, status: Optional[str] = None) -> Sequence[int]:
+        """Record numbers of the last `limit` records (of one status)."""
+        return self.page(max(self.count(status) - limit, 0), limit, status)
+
+    def iter_lines(self, numbers: Sequence[int]) -> Iterator[bytes]:
+        """
+        Raw stripped lines of the given records, one seek per record.
+
+        Offsets are resolved immediately, so the lines can be streamed after
+        a later refresh() replaced the index.
+        """
+        positions = [self.offsets[number] for number in numbers]
+
+        def lines():
+            with open(self.path, 'rb') as f:
+                for position in positions:
+                    f.seek(position)
+                    yield f.readline().strip()
+
+        return lines()
+
+    def read(self, numbers: Sequence[int]) -> List[Dict[str, Any]]:
+        """Parsed records for the given record numbers."""
+        return [json.loads(line) for line in self.iter_lines(numbers)]
+
+
+class JsonlEventLog:
+    """
+    Offset index over an append-only JSONL log.
+
+    Usage:
+        log = JsonlEventLog(EVENTS_PATH, REPO_ROOT / ".ssid_cache/jsonl_index/events.idx")
+        view = log.refresh()
+        view.count("pending")
+        for line in view.iter_lines(view.page(0, 50, status="pending")):
+            ...
+
+    Record numbers are 0-based positions among the log's records. Queries
+    on the log itself take a fresh view per call; use one view per request
+    when several queries must agree.
+    """
+
+    def __init__(self, path: Path, index_path: Optional[Path] = None,
+                 status_path: Sequence[str] = ("blockchain", "confirmation_status")):
+        """
+        Args:
+            path: JSONL log file
+            index_path: Sidecar header file the index is persisted to; entries
+                go to index_path + '.entries' (None = in-memory)
+            status_path: Keys leading to the status value of a record
+        """
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else None
+        self.entries_path = (
+            self.index_path.with_name(self.index_path.name + '.entries') if self.index_path else None
+        )
+        self.status_path = tuple(status_path)
+        self._lock = threading.Lock()
+        self._reset()
+        self._load_index()
+
+    def _reset(self) -> None:
+        self.offsets = array('q')          # record number -> byte offset
+        self.status_codes = array('H')     # record number -> index into statuses
+        self.statuses: List[Optional[str]] = [None]
+        self.by_status: Dict[Optional[str], array] = {}
+        self.indexed_size = 0
+        self.mtime_ns = 0
+        self.tail_sha256 = ''
+        self._saved_count = 0              # entries persisted in the sidecar
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> EventLogView:
+        """
+        Bring the index up to date with the log (incremental on append).
+
+        Returns:
+            Read view of the refreshed index
+        """
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                if self.offsets:
+                    self._reset()
+                return self._view()
+
+            if stat.st_size == self.indexed_size and stat.st_mtime_ns == self.mtime_ns:
+                return self._view()
+
+            if not self._is_append(stat.st_size):
+                self._reset()
+            self._scan()
+            self.mtime_ns = stat.st_mtime_ns
+            self._save_index()
+            return self._view()
+
+    def view(self) -> EventLogView:
+        """Read view of the current index (without refreshing)."""
+        with self._lock:
+            return self._view()
+
+    def _view(self) -> EventLogView:
+        return EventLogView(self.path, self.offsets, self.by_status,
+                            self.indexed_size, self.mtime_ns)
+
+    def _is_append(self, size: int) -> bool:
+        """Whether the log only grew since it was indexed."""
+        if size < self.indexed_size:
+            return False
+        if size == self.indexed_size:
+            # Same size, new mtime: rewritten in place
+            return self.indexed_size == 0
+        return not self.offsets or self._last_record_sha256() == self.tail_sha256
+
+    def _last_record_sha256(self) -> str:
+        with open(self.path, 'rb') as f:
+            f.seek(self.offsets[-1])
+            data = f.read(self.indexed_size - self.offsets[-1])
+        return hashlib.sha256(data).hexdigest()
+
+    def _scan(self) -> None:
+        """Index the newline-terminated records after indexed_size."""
+        status_codes = {status: code for code, status in enumerate(self.statuses)}
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.indexed_size)
+            offset = self.indexed_size
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break
+                line = raw.strip()
+                if line:
+                    try:
+                        status = _status_of(json.loads(line), self.status_path)
+                    except ValueError:
+                        # Indexed without status; reading it fails like a full parse would
+                        status = None
+                    code = status_codes.get(status)
+                    if code is None:
+                        code = status_codes[status] = len(self.statuses)
+                        self.statuses.append(status)
+                    self.by_status.setdefault(status, array('q')).append(len(self.offsets))
+                    self.offsets.append(offset)
+                    self.status_codes.append(code)
+                offset += len(raw)
+
+        self.indexed_size = offset
+        self.tail_sha256 = self._last_record_sha256() if self.offsets else ''
+
+    def _load_index(self) -> None:
+        if not self.index_path or not self.index_path.exists():
+            return
+        try:
+            header = json.loads(self.index_path.read_bytes())
+            if header.get('magic') != INDEX_MAGIC or header.get('version') != INDEX_VERSION:
+                return
+            count = header['count']
+            with open(self.entries_path, 'rb') as f:
+                data = f.read(count * ENTRY.size)
+        except (OSError, ValueError, KeyError):
+            return
+        if len(data) != count * ENTRY.size:
+            return
+
+        offsets = array('q')
+        status_codes = array('H')
+        statuses = header['statuses']
+        by_status: Dict[Optional[str], array] = {}
+        for number, (offset, code) in enumerate(ENTRY.iter_unpack(data)):
+            offsets.append(offset)
+            status_codes.append(code)
+            by_status.setdefault(statuses[code], array('q')).append(number)
+
+        self.offsets = offsets
+        self.status_codes = status_codes
+        self.statuses = statuses
+        self.by_status = by_status
+        self.indexed_size = header['size']
+        self.mtime_ns = header['mtime_ns']
+        self.tail_sha256 = header['tail_sha256']
+        self._saved_count = count
+
+    def _save_index(self) -> None:
+        """Append new entries to the sidecar, then replace its header."""
+        if not self.index_path:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        saved = self._saved_count
+        if saved == 0 and self.entries_path.exists():
+            # Rebuild: invalidate the header before rewriting the entries
+            self._write_header(0)
+
+        mode = 'r+b' if self.entries_path.exists() else 'wb'
+        with open(self.entries_path, mode) as f:
+            # Drop entries written after the last header (interrupted save)
+            f.truncate(saved * ENTRY.size)
+            f.seek(saved * ENTRY.size)
+            f.write(b''.join(
+                ENTRY.pack(self.offsets[number], self.status_codes[number])
+                for number in range(saved, len(self.offsets))
+            ))
+
+        self._write_header(len(self.offsets))
+        self._saved_count = len(self.offsets)
+
+    def _write_header(self, count: int) -> None:
+        header = {
+            'magic': INDEX_MAGIC,
+            'version': INDEX_VERSION,
+            'count': count,
+            'size': self.indexed_size if count else 0,
+            'mtime_ns': self.mtime_ns if count else 0,
+            'tail_sha256': self.tail_sha256 if count else '',
+            'statuses': self.statuses,
+        }
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+        os.replace(tmp_path, self.index_path)
+
+    # ------------------------------------------------------------------
+    # Queries (call refresh() first; each call reads one locked view)
+    # ------------------------------------------------------------------
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Number of records, or of records with the given status."""
+        return self.view().count(status)
+
+    def status_counts(self) -> Dict[Optional[str], int]:
+        return self.view().status_counts()
+
+    def page(self, offset: int, limit: int, status: Optional[str] = None) -> Sequence[int]:
+        """Record numbers [offset:offset+limit] of all records or of one status."""
+        return self.view().page(offset, limit, status)
+
+    def tail(self, limit: int, status: Optional[str] = None) -> Sequence[int]:
+        """Record numbers of the last `limit` records (of one status)."""
+        return self.view().tail(limit, status)
+
+    def iter_lines(self, numbers: Sequence[int]) -> Iterator[bytes]:
+        """Raw stripped lines of the given records (offsets resolved now)."""
+        return self.view().iter_lines(numbers)
+
+    def read(self, numbers: Sequence[int]) -> List[Dict[str, Any]]:
+        """Parsed records for the given record numbers."""
+        return self.view().read(numbers)
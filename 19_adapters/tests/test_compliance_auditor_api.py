@@ -0,0 +1,132 @@
+"""
+Compliance Auditor API Test Suite
+
+Tests the route wiring of the auditor API's conditional GET layer:
+cache invalidation on file changes, If-None-Match -> 304, query arguments
+in the ETag, Vary on content negotiation, anchor lookup by id and uncached
+integrity verification. The caching helpers themselves are covered without
+flask in test_http_cache.py and test_jsonl_event_log.py.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import compliance_auditor_api as api
+from jsonl_event_log import JsonlEventLog
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    mappings = tmp_path / "mappings"
+    mappings.mkdir()
+    (mappings / "compliance_unified_index.yaml").write_text("version: 1\n", encoding="utf-8")
+    (mappings / "gdpr_mapping.yaml").write_text("articles: [5, 6]\n", encoding="utf-8")
+    anchors = tmp_path / "registry_anchor.json"
+    anchors.write_text(json.dumps({"anchors": [
+        {"anchor_id": "a-1", "registry_lock_hash": "sha256:first"},
+        {"anchor_id": "a-2", "registry_lock_hash": "sha256:second"},
+        {"anchor_id": "a-1", "registry_lock_hash": "sha256:duplicate"},
+    ]}), encoding="utf-8")
+
+    monkeypatch.setattr(api, "MAPPINGS_DIR", mappings)
+    monkeypatch.setattr(api, "UNIFIED_INDEX_PATH", mappings / "compliance_unified_index.yaml")
+    monkeypatch.setattr(api, "REGISTRY_ANCHOR_PATH", anchors)
+    events = tmp_path / "compliance_events.jsonl"
+    events.write_text("".join(
+        json.dumps({"event_id": f"evt-{n}", "blockchain": {"confirmation_status": "pending"}}) + "\n"
+        for n in range(3)), encoding="utf-8")
+    monkeypatch.setattr(api, "BLOCKCHAIN_EVENTS_PATH", events)
+    monkeypatch.setattr(api, "events_log", JsonlEventLog(events))
+    api.document_cache.clear()
+    api.app.config["TESTING"] = True
+    with api.app.test_client() as test_client:
+        yield test_client
+    api.document_cache.clear()
+
+
+def test_document_cache_reloads_changed_file(client):
+    path = api.UNIFIED_INDEX_PATH
+    first = client.get("/api/v1/unified-index").get_json()
+    assert first["data"] == {"version": 1}
+
+    path.write_text("version: 22\n", encoding="utf-8")
+    second = client.get("/api/v1/unified-index").get_json()
+    assert second["data"] == {"version": 22}
+    assert second["metadata"]["file_hash"] == "sha256:" + hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_if_none_match_returns_304_until_file_changes(client):
+    response = client.get("/api/v1/framework/gdpr")
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+    assert etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    cached = client.get("/api/v1/framework/gdpr", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert cached.headers["ETag"] == etag
+
+    (api.MAPPINGS_DIR / "gdpr_mapping.yaml").write_text("articles: [5, 6, 17]\n", encoding="utf-8")
+    changed = client.get("/api/v1/framework/gdpr", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.get_json()["data"] == {"articles": [5, 6, 17]}
+
+
+def test_query_arguments_change_etag(client):
+    all_anchors = client.get("/api/v1/anchors")
+    first_page = client.get("/api/v1/anchors?limit=1")
+    assert all_anchors.headers["ETag"] != first_page.headers["ETag"]
+    assert first_page.get_json()["returned_count"] == 1
+
+    other_page = client.get("/api/v1/anchors?limit=1&offset=1",
+                            headers={"If-None-Match": first_page.headers["ETag"]})
+    assert other_page.status_code == 200
+    assert other_page.get_json()["anchors"][0]["anchor_id"] == "a-2"
+
+
+def test_events_vary_on_accept(client):
+    response = client.get("/api/v1/blockchain/events")
+    assert response.get_json()["total_count"] == 3
+    assert "Accept" in response.headers["Vary"]
+
+    ndjson = client.get("/api/v1/blockchain/events", headers={"Accept": "application/x-ndjson"})
+    assert ndjson.mimetype == "application/x-ndjson"
+    assert ndjson.data.count(b"\n") == 3
+    assert ndjson.headers["ETag"] != response.headers["ETag"]
+
+    cached = client.get("/api/v1/blockchain/events", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+    assert "Accept" in cached.headers["Vary"]
+
+
+def test_anchor_lookup_keeps_first_occurrence(client):
+    anchor = client.get("/api/v1/anchors/a-1").get_json()["anchor"]
+    assert anchor["registry_lock_hash"] == "sha256:first"
+    assert client.get("/api/v1/anchors/missing").status_code == 404
+
+
+def test_verify_hash_reads_current_bytes(client):
+    path = api.MAPPINGS_DIR / "gdpr_mapping.yaml"
+    original = hashlib.sha256(path.read_bytes()).hexdigest()
+    assert client.get(f"/api/v1/verify/gdpr/sha256:{original}").get_json()["verified"]
+
+    # Same size, mtime restored: invisible to mtime/size validation
+    stat = path.stat()
+    path.write_text("articles: [5, 9]\n", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+
+    result = client.get(f"/api/v1/verify/gdpr/{original}").get_json()
+    assert not result["verified"]
+    assert result["actual_hash"] == "sha256:" + hashlib.sha256(path.read_bytes()).hexdigest()
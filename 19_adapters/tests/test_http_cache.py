@@ -0,0 +1,65 @@
+"""
+HTTP Caching Helpers Test Suite
+
+Tests the framework-independent caching layer of the auditor API without
+flask: document cache invalidation, ETag construction, If-None-Match
+evaluation and NDJSON bodies.
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from http_cache import DocumentCache, etag_matches, make_etag, ndjson_lines
+
+
+def test_document_cache_reloads_changed_file(tmp_path):
+    path = tmp_path / "index.json"
+    path.write_text('{"version": 1}', encoding="utf-8")
+    cache = DocumentCache()
+    parses = []
+
+    def parse(raw):
+        parses.append(raw)
+        return json.loads(raw)
+
+    first = cache.get(path, parse)
+    assert cache.get(path, parse) is first
+    assert len(parses) == 1
+
+    path.write_text('{"version": 22}', encoding="utf-8")
+    second = cache.get(path, parse, indexer=lambda data: {"v": data["version"]})
+    assert second.data == {"version": 22}
+    assert second.index == {"v": 22}
+    assert second.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert len(parses) == 2
+
+
+def test_make_etag_covers_parts_and_query():
+    base = make_etag((100, 7, False))
+    assert base == make_etag((100, 7, False))
+    assert base != make_etag((101, 7, False))
+    assert base != make_etag((100, 7, True))
+    assert base != make_etag((100, 7, False), [("limit", "1")])
+    assert (make_etag((1,), [("limit", "1"), ("offset", "2")])
+            == make_etag((1,), [("offset", "2"), ("limit", "1")]))
+
+
+def test_etag_matches_weak_comparison():
+    etag = make_etag(("x",))
+    assert etag_matches(f'W/"{etag}"', etag)
+    assert etag_matches(f'"{etag}"', etag)
+    assert etag_matches(f'"other", W/"{etag}"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+    assert not etag_matches(etag, etag)  # unquoted
+    assert not etag_matches('W/"other"', etag)
+
+
+def test_ndjson_lines_terminates_each_record():
+    assert b"".join(ndjson_lines([b'{"a": 1}', b'{"b": 2}'])) == b'{"a": 1}\n{"b": 2}\n'
+    assert list(ndjson_lines([])) == []
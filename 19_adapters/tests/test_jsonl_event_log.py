@@ -0,0 +1,140 @@
+"""
+JSONL Event Log Test Suite
+
+Tests the access layer behind /api/v1/blockchain/events: reverse tail
+reads, offset/status index pagination and incremental index maintenance.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from jsonl_event_log import ENTRY, JsonlEventLog, read_tail
+
+STATUSES = ["pending", "confirmed", "finalized"]
+
+
+def event(number):
+    return {"event_id": f"evt-{number}",
+            "blockchain": {"confirmation_status": STATUSES[number % 3]}}
+
+
+def append(path, numbers):
+    with open(path, "a", encoding="utf-8") as f:
+        for number in numbers:
+            f.write(json.dumps(event(number)) + "\n")
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "events.jsonl"
+    append(path, range(10))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n   \n")
+    append(path, range(10, 20))
+    return path
+
+
+def ids(lines):
+    return [json.loads(line)["event_id"] for line in lines]
+
+
+def test_read_tail_matches_full_read(log_path):
+    for block_size in (7, 64, 65536):
+        assert ids(read_tail(log_path, 3, block_size=block_size)) == ["evt-17", "evt-18", "evt-19"]
+        assert len(read_tail(log_path, 100, block_size=block_size)) == 20
+    assert read_tail(log_path, 0) == []
+
+
+def test_read_tail_ignores_unterminated_fragment(log_path):
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write('{"event_id": "evt-partial"')
+    assert ids(read_tail(log_path, 2, block_size=16)) == ["evt-18", "evt-19"]
+
+
+def test_pagination_and_status_counts(log_path, tmp_path):
+    log = JsonlEventLog(log_path, tmp_path / "index" / "events.idx")
+    log.refresh()
+
+    assert log.count() == 20
+    assert log.count("pending") == 7
+    assert log.status_counts() == {"pending": 7, "confirmed": 7, "finalized": 6}
+    assert ids(log.iter_lines(log.page(9, 3))) == ["evt-9", "evt-10", "evt-11"]
+    assert ids(log.iter_lines(log.page(1, 2, "finalized"))) == ["evt-5", "evt-8"]
+    assert ids(log.iter_lines(log.tail(2, "pending"))) == ["evt-15", "evt-18"]
+    assert list(log.page(30, 5)) == []
+
+
+def test_index_is_extended_on_append_and_rebuilt_on_rewrite(log_path, tmp_path):
+    index_path = tmp_path / "index" / "events.idx"
+    log = JsonlEventLog(log_path, index_path)
+    log.refresh()
+
+    append(log_path, [20, 21])
+    reloaded = JsonlEventLog(log_path, index_path)
+    assert reloaded.count() == 20  # persisted state before refresh
+    reloaded.refresh()
+    assert reloaded.count() == 22
+    assert ids(reloaded.iter_lines(reloaded.tail(1, "finalized"))) == ["evt-20"]
+
+    # Rewrite: statuses of the first events change, log shrinks
+    log_path.write_text("".join(json.dumps(event(n)) + "\n" for n in (1, 2)), encoding="utf-8")
+    reloaded.refresh()
+    assert reloaded.count() == 2
+    assert reloaded.status_counts() == {"confirmed": 1, "finalized": 1}
+
+
+def test_sidecar_appends_only_new_entries(log_path, tmp_path):
+    index_path = tmp_path / "index" / "events.idx"
+    log = JsonlEventLog(log_path, index_path)
+    log.refresh()
+    entries = log.entries_path.read_bytes()
+    assert len(entries) == 20 * ENTRY.size
+
+    append(log_path, [20, 21])
+    log.refresh()
+    grown = log.entries_path.read_bytes()
+    assert grown[:len(entries)] == entries
+    assert len(grown) == 22 * ENTRY.size
+    assert json.loads(index_path.read_bytes())["count"] == 22
+
+
+def test_interrupted_save_is_recovered(log_path, tmp_path):
+    index_path = tmp_path / "index" / "events.idx"
+    JsonlEventLog(log_path, index_path).refresh()
+
+    # Entries appended but header not replaced: the header count wins
+    with open(str(index_path) + ".entries", "ab") as f:
+        f.write(ENTRY.pack(12345, 0) * 3)
+    append(log_path, [20])
+
+    log = JsonlEventLog(log_path, index_path)
+    assert log.count() == 20
+    log.refresh()
+    assert log.count() == 21
+    assert log.entries_path.stat().st_size == 21 * ENTRY.size
+    assert ids(log.iter_lines(log.tail(1))) == ["evt-20"]
+
+
+def test_view_is_stable_across_refresh(log_path, tmp_path):
+    log = JsonlEventLog(log_path, tmp_path / "events.idx")
+    view = log.refresh()
+    numbers = view.tail(2, "finalized")
+
+    append(log_path, range(20, 26))
+    log.refresh()
+    assert view.count() == 20
+    assert view.count("finalized") == 6
+    assert list(view.tail(2, "finalized")) == list(numbers)
+    assert list(view.page(18, 10)) == [18, 19]
+
+    # Rewrite resets the index; the old view keeps its own arrays
+    log_path.write_text(json.dumps(event(0)) + "\n", encoding="utf-8")
+    log.refresh()
+    assert log.count() == 1
+    assert view.count() == 20
+    assert view.indexed_size > log.view().indexed_size
@@ -0,0 +1,72 @@
+"""
+Keyword Index Test Suite
+
+Tests the shared keyword index used by sot_policy_test_mapper.py and
+sot_superset_shard_verifier.py: Aho-Corasick matching, substring keyword
+line counts, hex id mentions and incremental reindexing via file hashes.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools"))
+
+from keyword_index import AhoCorasickMatcher, KeywordIndex
+
+
+def test_aho_corasick_overlapping_patterns():
+    matcher = AhoCorasickMatcher(["he", "she", "hers", "his", "xyz"])
+    assert matcher.find("ushers") == {"he", "she", "hers"}
+    assert matcher.find("") == set()
+    assert matcher.find_cached("this") == {"his"}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    (tmp_path / "a.rego").write_text(
+        "package sot\n# Audit_Trail required\ndeny[msg] { not input.audit }\n", encoding="utf-8"
+    )
+    (tmp_path / "b.rego").write_text(
+        "package other\n# see rule 0123456789abcdef\nallow { true }\n", encoding="utf-8"
+    )
+    return tmp_path
+
+
+def test_keyword_line_counts_use_substring_semantics(corpus):
+    index = KeywordIndex(corpus, sorted(corpus.glob("*.rego")))
+    matcher = AhoCorasickMatcher(["audit", "trail", "package", "missing"])
+
+    # Same as counting lines where `keyword in line.lower()`
+    assert index.keyword_line_counts("a.rego", matcher) == {"audit": 2, "trail": 1, "package": 1}
+    assert index.keyword_lines("b.rego", matcher) == {"package": [1]}
+
+
+def test_token_postings_and_mentions(corpus):
+    index = KeywordIndex(corpus, sorted(corpus.glob("*.rego")))
+
+    postings = index.token_postings()
+    assert postings["package"] == ["a.rego", "b.rego"]
+    assert postings["audit_trail"] == ["a.rego"]
+    assert index.files_mentioning(["456789abcdef", "ffffffffffff"]) == {"456789abcdef": ["b.rego"]}
+
+
+def test_only_changed_files_reindexed(corpus, tmp_path):
+    cache_path = tmp_path / "cache" / "index.json"
+    files = sorted(corpus.glob("*.rego"))
+    calls = []
+
+    def metadata(path):
+        calls.append(path.name)
+        return {"name": path.name}
+
+    first = KeywordIndex(corpus, files, cache_path, metadata=metadata)
+    assert (first.reindexed, first.reused) == (2, 0)
+
+    (corpus / "b.rego").write_text("package changed\n", encoding="utf-8")
+    second = KeywordIndex(corpus, files, cache_path, metadata=metadata)
+    assert (second.reindexed, second.reused) == (1, 1)
+    assert calls == ["a.rego", "b.rego", "b.rego"]
+    assert second.meta("a.rego") == {"name": "a.rego"}
+    assert second.tokens("b.rego") == ["changed", "package"]
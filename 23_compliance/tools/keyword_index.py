@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+SSID Compliance - Shared keyword index for policy/test corpora
+Used by sot_policy_test_mapper.py and sot_superset_shard_verifier.py.
+
+Each corpus file is tokenized once and the result is persisted with the
+file's SHA-256, so later runs only reindex files that changed. Per file
+the index keeps:
+- tokens:   distinct word tokens (for token-overlap matching)
+- lines:    distinct [a-z0-9_] runs per lowercased line (for substring
+            keyword matching; a keyword made of [a-z0-9_] occurs in a line
+            exactly when it occurs inside one of the line's runs)
+- hex_runs: runs of >= 12 hex characters (for rule_id mentions)
+- meta:     caller-defined metadata (package name, test functions, ...)
+
+Multi-keyword lookups run an Aho-Corasick automaton over the distinct
+runs, memoized per run, instead of testing every keyword against every
+line.
+"""
+import hashlib
+import json
+import re
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+INDEX_VERSION = 1
+
+# Same token definition as the mappers' extract_keywords/extract_tokens
+TOKEN_PATTERN = re.compile(r'\b[a-z0-9_]{3,}\b')
+WORD_RUN_PATTERN = re.compile(r'[a-z0-9_]+')
+HEX_RUN_PATTERN = re.compile(r'[0-9a-f]{12,}')
+
+
+class AhoCorasickMatcher:
+    """
+    Multi-pattern substring matcher (Aho-Corasick automaton).
+
+    find() reports the distinct patterns occurring in a text in one pass
+    over the text, independent of the number of patterns.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[tuple] = [()]
+        self._memo: Dict[str, Set[str]] = {}
+
+        for pattern in set(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = (pattern,)
+
+        # Breadth-first: failure links and inherited outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[nxt] = fail
+                if self._out[fail]:
+                    self._out[nxt] = self._out[nxt] + self._out[fail]
+
+    def find(self, text: str) -> Set[str]:
+        """Distinct patterns occurring in text."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def find_cached(self, text: str) -> Set[str]:
+        """find() memoized per text (for short, frequently repeated texts)."""
+        found = self._memo.get(text)
+        if found is None:
+            found = self._memo[text] = self.find(text)
+        return found
+
+
+def file_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class KeywordIndex:
+    """
+    Persistent token/keyword index over a corpus of files.
+
+    Usage:
+        index = KeywordIndex(REPO_ROOT, POLICY_DIR.rglob("*.rego"),
+                             cache_path=REPO_ROOT / ".ssid_cache/keyword_index_policies.json")
+        counts = index.keyword_line_counts(path, AhoCorasickMatcher(keywords))
+        candidates = index.token_postings()
+    """
+
+    def __init__(self, repo_root: Path, files: Iterable[Path],
+                 cache_path: Optional[Path] = None,
+                 metadata: Optional[Callable[[Path], Dict]] = None):
+        """
+        Args:
+            repo_root: Root for the relative paths used as index keys
+            files: Corpus files (index order = iteration order)
+            cache_path: JSON file the index is persisted to (None = in-memory)
+            metadata: Function computing per-file metadata (stored in 'meta')
+        """
+        self.repo_root = Path(repo_root)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.metadata = metadata
+        self.paths: List[str] = []
+        self.entries: Dict[str, Dict] = {}
+        self.reindexed = 0
+        self.reused = 0
+        self._postings: Optional[Dict[str, List[str]]] = None
+
+        cached = self._load_cache()
+        for file_path in files:
+            rel_path = str(Path(file_path).relative_to(self.repo_root)).replace('\\', '/')
+            try:
+                data = Path(file_path).read_bytes()
+            except OSError:
+                continue
+            digest = file_sha256(data)
+            entry = cached.get(rel_path)
+            if entry is not None and entry.get('sha256') == digest:
+                self.reused += 1
+            else:
+                entry = self._index_file(Path(file_path), data, digest)
+                self.reindexed += 1
+            self.paths.append(rel_path)
+            self.entries[rel_path] = entry
+
+        if self.cache_path and (self.reindexed or len(cached) != len(self.entries)):
+            self.save()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != INDEX_VERSION:
+            return {}
+        return data.get('files', {})
+
+    def _index_file(self, file_path: Path, data: bytes, digest: str) -> Dict:
+        # Decode like open(..., 'r', encoding='utf-8', errors='ignore')
+        content = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+        lowered = content.lower()
+
+        lines = []
+        for line_no, line in enumerate(lowered.split('\n'), 1):
+            runs = sorted(set(WORD_RUN_PATTERN.findall(line)))
+            if runs:
+                lines.append([line_no] + runs)
+
+        return {
+            'sha256': digest,
+            'tokens': sorted(set(TOKEN_PATTERN.findall(lowered))),
+            'lines': lines,
+            'hex_runs': sorted(set(HEX_RUN_PATTERN.findall(content))),
+            'meta': self.metadata(file_path) if self.metadata else {},
+        }
+
+    def save(self) -> None:
+        """Persist the index (entries of files no longer in the corpus are dropped)."""
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'files': self.entries}, f, ensure_ascii=False)
+        tmp_path.replace(self.cache_path)
+
+    def meta(self, rel_path: str) -> Dict:
+        return self.entries[rel_path]['meta']
+
+    def tokens(self, rel_path: str) -> List[str]:
+        return self.entries[rel_path]['tokens']
+
+    def token_postings(self) -> Dict[str, List[str]]:
+        """token -> files containing it (in corpus order)"""
+        if self._postings is None:
+            postings = defaultdict(list)
+            for rel_path in self.paths:
+                for token in self.entries[rel_path]['tokens']:
+                    postings[token].append(rel_path)
+            self._postings = dict(postings)
+        return self._postings
+
+    def keyword_lines(self, rel_path: str, matcher: AhoCorasickMatcher) -> Dict[str, List[int]]:
+        """keyword -> line numbers (1-based) whose lowercased text contains it"""
+        result = defaultdict(list)
+        for line in self.entries[rel_path]['lines']:
+            found = set()
+            for run in line[1:]:
+                found |= matcher.find_cached(run)
+            for keyword in found:
+                result[keyword].append(line[0])
+        return result
+
+    def keyword_line_counts(self, rel_path: str, matcher: AhoCorasickMatcher) -> Counter:
+        """keyword -> number of lines containing it"""
+        return Counter({k: len(v) for k, v in self.keyword_lines(rel_path, matcher).items()})
+
+    def files_mentioning(self, ids: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Hex ids (>= 12 chars) -> files whose text contains them
+
+        Only the hex runs of each file are searched.
+        """
+        matcher = AhoCorasickMatcher(ids)
+        mentions = defaultdict(list)
+        for rel_path in self.paths:
+            found = set()
+            for run in self.entries[rel_path]['hex_runs']:
+                found |= matcher.find(run)
+            for rule_id in found:
+                mentions[rule_id].append(rel_path)
+        return mentions
@@ -6,11 +6,15 @@ Deterministic 1:1 mapping analysis without heuristics.
 import json
 import hashlib
 import re
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 from datetime import datetime
 import sys
 
+sys.path.insert(0, str(Path(__file__).parent))
+from keyword_index import AhoCorasickMatcher, KeywordIndex
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
 # Input SoT files (exact paths as specified)
@@ -29,6 +33,9 @@ TEST_DIR = REPO_ROOT / "11_test_simulation/tests"
 OUTPUT_DIR = REPO_ROOT / "23_compliance/mappings"
 REPORT_DIR = REPO_ROOT / "23_compliance/reports"
 
+# Persisted keyword index (only changed files are reindexed)
+INDEX_DIR = REPO_ROOT / ".ssid_cache/keyword_index"
+
 def is_content_line(line: str) -> bool:
     """
     Check if line is actual content (not empty, code fence, or comment).
@@ -95,6 +102,48 @@ def extract_keywords(text: str) -> List[str]:
     keywords = [w for w in words if w not in stopwords]
     return list(set(keywords))[:20]  # Limit to 20 keywords
 
+def match_corpus(rules: List[Dict], index: KeywordIndex) -> List[Tuple[str, List[Tuple[int, int, List[str]]]]]:
+    """
+    Match rule keywords against an indexed corpus.
+
+    A keyword matches a file line when it occurs in the lowercased line.
+    All rule keywords are searched in one Aho-Corasick pass per distinct
+    word run; rules are then looked up per matched keyword instead of
+    testing every rule against every file.
+
+    Returns:
+        [(file, [(rule_index, match_count, matched_keywords), ...]), ...]
+        in corpus order, rules in input order
+    """
+    rules_by_keyword = defaultdict(list)
+    for rule_index, rule in enumerate(rules):
+        for keyword in rule['keywords']:
+            rules_by_keyword[keyword].append(rule_index)
+    matcher = AhoCorasickMatcher(rules_by_keyword)
+
+    results = []
+    for rel_path in index.paths:
+        line_counts = index.keyword_line_counts(rel_path, matcher)
+        touched = set()
+        for keyword in line_counts:
+            touched.update(rules_by_keyword[keyword])
+
+        file_matches = []
+        for rule_index in sorted(touched):
+            keywords = [k for k in rules[rule_index]['keywords'] if k in line_counts]
+            file_matches.append((rule_index, sum(line_counts[k] for k in keywords), keywords))
+        results.append((rel_path, file_matches))
+    return results
+
+def rego_metadata(policy_file: Path) -> Dict:
+    return {
+        "package": extract_package_name(policy_file),
+        "rules": extract_rule_names(policy_file),
+    }
+
+def python_test_metadata(test_file: Path) -> Dict:
+    return {"functions": extract_test_functions(test_file)}
+
 def search_policies(rules: List[Dict]) -> Dict[str, List[Dict]]:
     """
     Search all .rego files for rule keywords.
@@ -107,41 +156,20 @@ def search_policies(rules: List[Dict]) -> Dict[str, List[Dict]]:
 
     policy_files = list(POLICY_DIR.rglob("*.rego"))
     print(f"[*] Scanning {len(policy_files)} policy files...")
-
-    for policy_file in policy_files:
-        try:
-            with open(policy_file, 'r', encoding='utf-8', errors='ignore') as f:
-                policy_content = f.read().lower()
-                policy_lines = policy_content.split('\n')
-        except:
-            continue
-
-        for rule in rules:
-            matches = []
-            for keyword in rule['keywords']:
-                for line_num, line in enumerate(policy_lines, 1):
-                    if keyword in line:
-                        matches.append({
-                            "keyword": keyword,
-                            "line": line_num
-                        })
-
-            if matches:
-                rule_id = rule['rule_id']
-                if rule_id not in policy_matches:
-                    policy_matches[rule_id] = []
-
-                # Extract package and rule names
-                package_name = extract_package_name(policy_file)
-                rule_names = extract_rule_names(policy_file)
-
-                policy_matches[rule_id].append({
-                    "file": str(policy_file.relative_to(REPO_ROOT)).replace('\\', '/'),
-                    "package": package_name,
-                    "rules": rule_names,
-                    "matches": len(matches),
-                    "matched_keywords": list(set([m['keyword'] for m in matches]))
-                })
+    index = KeywordIndex(REPO_ROOT, policy_files, INDEX_DIR / "policy_test_mapper_policies.json",
+                         metadata=rego_metadata)
+    print(f"[*] Keyword index: {index.reindexed} reindexed, {index.reused} unchanged")
+
+    for rel_path, file_matches in match_corpus(rules, index):
+        meta = index.meta(rel_path)
+        for rule_index, match_count, matched_keywords in file_matches:
+            policy_matches.setdefault(rules[rule_index]['rule_id'], []).append({
+                "file": rel_path,
+                "package": meta["package"],
+                "rules": meta["rules"],
+                "matches": match_count,
+                "matched_keywords": matched_keywords
+            })
 
     return policy_matches
 
@@ -157,39 +185,19 @@ def search_tests(rules: List[Dict]) -> Dict[str, List[Dict]]:
 
     test_files = list(TEST_DIR.rglob("*.py"))
     print(f"[*] Scanning {len(test_files)} test files...")
-
-    for test_file in test_files:
-        try:
-            with open(test_file, 'r', encoding='utf-8', errors='ignore') as f:
-                test_content = f.read().lower()
-                test_lines = test_content.split('\n')
-        except:
-            continue
-
-        for rule in rules:
-            matches = []
-            for keyword in rule['keywords']:
-                for line_num, line in enumerate(test_lines, 1):
-                    if keyword in line:
-                        matches.append({
-                            "keyword": keyword,
-                            "line": line_num
-                        })
-
-            if matches:
-                rule_id = rule['rule_id']
-                if rule_id not in test_matches:
-                    test_matches[rule_id] = []
-
-                # Extract test functions
-                test_functions = extract_test_functions(test_file)
-
-                test_matches[rule_id].append({
-                    "file": str(test_file.relative_to(REPO_ROOT)).replace('\\', '/'),
-                    "functions": test_functions,
-                    "matches": len(matches),
-                    "matched_keywords": list(set([m['keyword'] for m in matches]))
-                })
+    index = KeywordIndex(REPO_ROOT, test_files, INDEX_DIR / "policy_test_mapper_tests.json",
+                         metadata=python_test_metadata)
+    print(f"[*] Keyword index: {index.reindexed} reindexed, {index.reused} unchanged")
+
+    for rel_path, file_matches in match_corpus(rules, index):
+        functions = index.meta(rel_path)["functions"]
+        for rule_index, match_count, matched_keywords in file_matches:
+            test_matches.setdefault(rules[rule_index]['rule_id'], []).append({
+                "file": rel_path,
+                "functions": functions,
+                "matches": match_count,
+                "matched_keywords": matched_keywords
+            })
 
     return test_matches
 
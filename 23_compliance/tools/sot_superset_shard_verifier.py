@@ -7,11 +7,15 @@ import json
 import hashlib
 import csv
 import re
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 from datetime import datetime
 import sys
 
+sys.path.insert(0, str(Path(__file__).parent))
+from keyword_index import AhoCorasickMatcher, KeywordIndex
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
 # SoT Master Sources
@@ -32,6 +36,9 @@ TEST_DIR = REPO_ROOT / "11_test_simulation/tests"
 # Output
 REPORT_DIR = REPO_ROOT / "02_audit_logging/reports"
 
+# Persisted keyword index (only changed files are reindexed)
+INDEX_DIR = REPO_ROOT / ".ssid_cache/keyword_index"
+
 # Stopwords for token matching
 STOPWORDS = {
     'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
@@ -162,105 +169,87 @@ def discover_shard_files() -> List[Path]:
     ]
     return shard_files
 
+def map_to_corpus(rules: List[Dict], files: List[Path], cache_name: str) -> Dict[str, List[Dict]]:
+    """
+    Map rules to corpus files using the persisted keyword index.
+
+    Match criteria: >=2 token overlap OR rule_id mentioned. Candidate files
+    come from the token postings of each rule's tokens (tokenized once per
+    rule); rule_id mentions from an Aho-Corasick search over the files'
+    hex runs. Matches are reported in file order, then rule order.
+    """
+    index = KeywordIndex(REPO_ROOT, files, INDEX_DIR / cache_name)
+    print(f"[*] Keyword index: {index.reindexed} reindexed, {index.reused} unchanged")
+
+    postings = index.token_postings()
+    file_order = {rel_path: i for i, rel_path in enumerate(index.paths)}
+    mentions = index.files_mentioning(rule['rule_id'] for rule in rules)
+
+    found = []
+    vocabulary = set()
+    for rule_index, rule in enumerate(rules):
+        overlaps = defaultdict(list)
+        rule_tokens = set(extract_tokens(rule['rule_text']))
+        vocabulary |= rule_tokens
+        for token in rule_tokens:
+            for rel_path in postings.get(token, ()):
+                overlaps[rel_path].append(token)
+
+        candidates = {rel_path for rel_path, tokens in overlaps.items() if len(tokens) >= 2}
+        candidates.update(mentions.get(rule['rule_id'], ()))
+        for rel_path in candidates:
+            found.append((file_order[rel_path], rule_index, sorted(overlaps.get(rel_path, ()))))
+    found.sort(key=lambda match: match[:2])
+
+    # Context: first lines containing any of the first 3 overlap tokens
+    matcher = AhoCorasickMatcher(vocabulary)
+    token_lines = {}
+    raw_lines = {}
+
+    matches = {}
+    for file_pos, rule_index, overlap in found:
+        rel_path = index.paths[file_pos]
+
+        # Find context lines
+        context_lines = []
+        if overlap:
+            if rel_path not in token_lines:
+                token_lines[rel_path] = index.keyword_lines(rel_path, matcher)
+                with open(REPO_ROOT / rel_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    raw_lines[rel_path] = f.read().split('\n')
+            line_nos = sorted({n for token in overlap[:3] for n in token_lines[rel_path].get(token, [])[:2]})
+            context_lines = [
+                {"line_no": n, "text": raw_lines[rel_path][n - 1].strip()[:80]}
+                for n in line_nos[:2]
+            ]
+
+        matches.setdefault(rules[rule_index]['rule_id'], []).append({
+            "path": rel_path,
+            "overlap_count": len(overlap),
+            "context": context_lines
+        })
+
+    return matches
+
 def map_to_policies(rules: List[Dict]) -> Dict[str, List[Dict]]:
     """Map rules to policy files (.rego) using deterministic token matching."""
-    policy_matches = {}
-
     if not POLICY_DIR.exists():
         print(f"[!] Policy directory not found: {POLICY_DIR}")
-        return policy_matches
+        return {}
 
     policy_files = list(POLICY_DIR.rglob("*.rego"))
     print(f"[*] Scanning {len(policy_files)} policy files...")
-
-    for policy_file in policy_files:
-        try:
-            with open(policy_file, 'r', encoding='utf-8', errors='ignore') as f:
-                policy_content = f.read()
-                policy_lines = policy_content.split('\n')
-                policy_tokens = set(extract_tokens(policy_content))
-        except:
-            continue
-
-        rel_path = str(policy_file.relative_to(REPO_ROOT)).replace('\\', '/')
-
-        for rule in rules:
-            rule_id = rule['rule_id']
-            rule_tokens = set(extract_tokens(rule['rule_text']))
-
-            # Match criteria: >=2 token overlap OR rule_id mentioned
-            overlap = rule_tokens & policy_tokens
-            rule_id_mentioned = rule_id in policy_content
-
-            if len(overlap) >= 2 or rule_id_mentioned:
-                if rule_id not in policy_matches:
-                    policy_matches[rule_id] = []
-
-                # Find context lines
-                context_lines = []
-                for i, line in enumerate(policy_lines, 1):
-                    if any(token in line.lower() for token in list(overlap)[:3]):
-                        context_lines.append({"line_no": i, "text": line.strip()[:80]})
-                        if len(context_lines) >= 2:
-                            break
-
-                policy_matches[rule_id].append({
-                    "path": rel_path,
-                    "overlap_count": len(overlap),
-                    "context": context_lines[:2]
-                })
-
-    return policy_matches
+    return map_to_corpus(rules, policy_files, "superset_verifier_policies.json")
 
 def map_to_tests(rules: List[Dict]) -> Dict[str, List[Dict]]:
     """Map rules to test files (.py) using deterministic token matching."""
-    test_matches = {}
-
     if not TEST_DIR.exists():
         print(f"[!] Test directory not found: {TEST_DIR}")
-        return test_matches
+        return {}
 
     test_files = list(TEST_DIR.rglob("*.py"))
     print(f"[*] Scanning {len(test_files)} test files...")
-
-    for test_file in test_files:
-        try:
-            with open(test_file, 'r', encoding='utf-8', errors='ignore') as f:
-                test_content = f.read()
-                test_lines = test_content.split('\n')
-                test_tokens = set(extract_tokens(test_content))
-        except:
-            continue
-
-        rel_path = str(test_file.relative_to(REPO_ROOT)).replace('\\', '/')
-
-        for rule in rules:
-            rule_id = rule['rule_id']
-            rule_tokens = set(extract_tokens(rule['rule_text']))
-
-            # Match criteria: >=2 token overlap OR rule_id mentioned
-            overlap = rule_tokens & test_tokens
-            rule_id_mentioned = rule_id in test_content
-
-            if len(overlap) >= 2 or rule_id_mentioned:
-                if rule_id not in test_matches:
-                    test_matches[rule_id] = []
-
-                # Find context lines
-                context_lines = []
-                for i, line in enumerate(test_lines, 1):
-                    if any(token in line.lower() for token in list(overlap)[:3]):
-                        context_lines.append({"line_no": i, "text": line.strip()[:80]})
-                        if len(context_lines) >= 2:
-                            break
-
-                test_matches[rule_id].append({
-                    "path": rel_path,
-                    "overlap_count": len(overlap),
-                    "context": context_lines[:2]
-                })
-
-    return test_matches
+    return map_to_corpus(rules, test_files, "superset_verifier_tests.json")
 
 def calculate_diff(sot_rules: List[Dict], shard_rules: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
     """Calculate Superset<->Shard diff."""
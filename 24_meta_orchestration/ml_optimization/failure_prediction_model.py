@@ -9,10 +9,14 @@ Features:
 - Random Forest (better accuracy for complex patterns)
 - Feature engineering from file changes and rule history
 - Confidence scores for prioritization
+- Batch feature extraction: per-rule history statistics in a few bulk
+  queries, one feature matrix (cached per commit) and one predict_proba
+  call per batch
 """
 
 import numpy as np
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
@@ -46,6 +50,9 @@ class FeatureExtractor:
     - Author-based: developer failure patterns
     """
 
+    # Feature matrices kept (most recently used commit contexts)
+    MATRIX_CACHE_SIZE = 8
+
     def __init__(self, db):
         """
         Initialize feature extractor.
@@ -55,6 +62,7 @@ class FeatureExtractor:
         """
         self.db = db
         self.feature_names = []
+        self._matrix_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
         self._initialize_feature_names()
 
     def _initialize_feature_names(self):
@@ -111,8 +119,60 @@ class FeatureExtractor:
         Returns:
             Feature vector as numpy array
         """
-        features = []
+        return self._build_feature_matrix(changed_files, [rule_id], timestamp)[0]
+
+    def extract_features_batch(
+        self,
+        changed_files: List[Path],
+        rule_ids: List[str],
+        author: str = "unknown",
+        timestamp: Optional[datetime] = None,
+        use_cache: bool = True
+    ) -> np.ndarray:
+        """
+        Extract features for multiple rules at once.
+
+        The matrix is cached per commit context (changed files, rules, hour and
+        weekday) and validation history version, so repeated predictions for
+        the same commit skip the database.
+
+        Args:
+            changed_files: List of changed file paths
+            rule_ids: List of rules to extract features for
+            author: Commit author
+            timestamp: Validation timestamp
+            use_cache: Reuse/store the matrix in the per-commit cache
+
+        Returns:
+            2D array of features (n_rules x n_features)
+        """
         timestamp = timestamp or datetime.now()
+        if not use_cache:
+            return self._build_feature_matrix(changed_files, rule_ids, timestamp)
+
+        cache_key = (
+            tuple(str(f) for f in changed_files),
+            tuple(rule_ids),
+            timestamp.hour,
+            timestamp.weekday(),
+            self.db.get_data_version()
+        )
+        matrix = self._matrix_cache.get(cache_key)
+        if matrix is None:
+            matrix = self._build_feature_matrix(changed_files, rule_ids, timestamp)
+            self._matrix_cache[cache_key] = matrix
+            if len(self._matrix_cache) > self.MATRIX_CACHE_SIZE:
+                self._matrix_cache.popitem(last=False)
+        else:
+            self._matrix_cache.move_to_end(cache_key)
+
+        return matrix.copy()
+
+    def _context_features(self, changed_files: List[Path], timestamp: datetime) -> Tuple[List[float], List[float]]:
+        """
+        Rule-independent features: (file-based features, temporal features).
+        """
+        features = []
 
         # File-based features
         features.append(len(changed_files))  # num_changed_files
@@ -145,67 +205,54 @@ class FeatureExtractor:
         features.append(len(yaml_files) / total_files)  # yaml_file_ratio
         features.append(len(py_files) / total_files)  # py_file_ratio
 
-        # Rule-based features (from historical data)
-        failure_rate, avg_time = self.db.get_rule_failure_rate(rule_id, limit=100)
-        features.append(failure_rate)  # rule_failure_rate
-        features.append(avg_time)  # rule_avg_time_ms
-
-        # Rule severity (would come from rule metadata)
-        # For now, infer from rule_id naming patterns
-        is_critical = 'critical' in rule_id.lower() or 'root' in rule_id.lower()
-        is_high = 'high' in rule_id.lower() or 'guard' in rule_id.lower()
-        features.append(1.0 if is_critical else 0.0)  # rule_severity_critical
-        features.append(1.0 if is_high else 0.0)  # rule_severity_high
-
-        # Recent failure trend (last 10 executions)
-        recent_rate, _ = self.db.get_rule_failure_rate(rule_id, limit=10)
-        features.append(recent_rate)  # rule_recent_failures
-
         # Temporal features
-        features.append(timestamp.hour)  # hour_of_day (0-23)
-        features.append(timestamp.weekday())  # day_of_week (0=Monday, 6=Sunday)
-        features.append(1.0 if timestamp.weekday() >= 5 else 0.0)  # is_weekend
-
-        # Pattern-based features
-        file_extensions = list(set(f.suffix for f in changed_files if f.suffix))
-        pattern_corr = self.db.get_file_pattern_failure_correlation(file_extensions, rule_id)
-        features.append(pattern_corr)  # file_pattern_correlation
-
-        # Co-occurrence risk (are related rules likely to fail?)
-        co_occurring = self.db.get_co_occurring_failures(rule_id, limit=5)
-        co_risk = sum(count for _, count in co_occurring) / 100.0 if co_occurring else 0.0
-        features.append(min(co_risk, 1.0))  # co_occurrence_risk
-
-        # Similar change failure rate (simplified - use file pattern correlation)
-        features.append(pattern_corr)  # similar_change_failure_rate
+        temporal = [
+            timestamp.hour,  # hour_of_day (0-23)
+            timestamp.weekday(),  # day_of_week (0=Monday, 6=Sunday)
+            1.0 if timestamp.weekday() >= 5 else 0.0  # is_weekend
+        ]
 
-        return np.array(features, dtype=np.float32)
+        return features, temporal
 
-    def extract_features_batch(
+    def _build_feature_matrix(
         self,
         changed_files: List[Path],
         rule_ids: List[str],
-        author: str = "unknown",
         timestamp: Optional[datetime] = None
     ) -> np.ndarray:
-        """
-        Extract features for multiple rules at once.
+        """Feature matrix (n_rules x n_features), column order as feature_names."""
+        timestamp = timestamp or datetime.now()
+        file_features, temporal_features = self._context_features(changed_files, timestamp)
 
-        Args:
-            changed_files: List of changed file paths
-            rule_ids: List of rules to extract features for
-            author: Commit author
-            timestamp: Validation timestamp
+        # Rule-based and pattern features (from historical data, all rules at once)
+        file_extensions = list(set(f.suffix for f in changed_files if f.suffix))
+        stats = self.db.get_rule_feature_stats(
+            rule_ids, file_extensions, limit=100, recent_limit=10, co_occurrence_limit=5
+        )
 
-        Returns:
-            2D array of features (n_rules x n_features)
-        """
-        features_list = []
-        for rule_id in rule_ids:
-            features = self.extract_features(changed_files, rule_id, author, timestamp)
-            features_list.append(features)
+        # Rule severity (would come from rule metadata)
+        # For now, infer from rule_id naming patterns
+        lowered = [rule_id.lower() for rule_id in rule_ids]
+        is_critical = [('critical' in r or 'root' in r) for r in lowered]
+        is_high = [('high' in r or 'guard' in r) for r in lowered]
+
+        pattern_corr = np.asarray(stats['file_pattern_correlation'], dtype=np.float32)
+
+        matrix = np.empty((len(rule_ids), len(self.feature_names)), dtype=np.float32)
+        matrix[:, 0:12] = file_features
+        matrix[:, 12] = stats['failure_rate']  # rule_failure_rate
+        matrix[:, 13] = stats['avg_time_ms']  # rule_avg_time_ms
+        matrix[:, 14] = is_critical  # rule_severity_critical
+        matrix[:, 15] = is_high  # rule_severity_high
+        matrix[:, 16] = stats['recent_failure_rate']  # rule_recent_failures
+        matrix[:, 17:20] = temporal_features  # hour_of_day, day_of_week, is_weekend
+        matrix[:, 20] = pattern_corr  # file_pattern_correlation
+        # Co-occurrence risk (are related rules likely to fail?)
+        matrix[:, 21] = np.minimum(np.asarray(stats['co_occurrence_sum']) / 100.0, 1.0)
+        # Similar change failure rate (simplified - use file pattern correlation)
+        matrix[:, 22] = pattern_corr
 
-        return np.vstack(features_list)
+        return matrix
 
 
 class FailurePredictionModel:
@@ -270,19 +317,18 @@ class FailurePredictionModel:
             changed_files = [Path(f) for f in validation['changed_files']]
             timestamp = datetime.fromisoformat(validation['timestamp'])
             author = validation['author']
+            rule_ids = [rule['rule_id'] for rule in validation['rules']]
+            if not rule_ids:
+                continue
+            rule_ids_seen.update(rule_ids)
 
-            for rule in validation['rules']:
-                rule_id = rule['rule_id']
-                rule_ids_seen.add(rule_id)
-
-                # Extract features
-                features = self.feature_extractor.extract_features(
-                    changed_files, rule_id, author, timestamp
-                )
-                X_list.append(features)
+            # Extract features (one batch per validation run)
+            X_list.append(self.feature_extractor.extract_features_batch(
+                changed_files, rule_ids, author, timestamp, use_cache=False
+            ))
 
-                # Label: 1 = failure, 0 = pass
-                y_list.append(0 if rule['passed'] else 1)
+            # Label: 1 = failure, 0 = pass
+            y_list.extend(0 if rule['passed'] else 1 for rule in validation['rules'])
 
         X = np.vstack(X_list)
         y = np.array(y_list)
@@ -439,8 +485,8 @@ class FailurePredictionModel:
         if not self.is_trained:
             # Return historical rates as fallback
             return {
-                rule_id: self.db.get_rule_failure_rate(rule_id)[0]
-                for rule_id in rule_ids
+                rule_id: rates[0]
+                for rule_id, rates in self.db.get_rule_failure_rates(rule_ids).items()
             }
 
         # Extract features for all rules
@@ -448,7 +494,7 @@ class FailurePredictionModel:
             changed_files, rule_ids, author, timestamp
         )
 
-        # Scale and predict
+        # Scale and predict (one predict_proba call for the whole batch)
         features_scaled = self.scaler.transform(features)
         probs = self.model.predict_proba(features_scaled)[:, 1]
 
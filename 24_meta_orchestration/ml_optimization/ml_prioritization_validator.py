@@ -357,8 +357,10 @@ class MLPrioritizedValidator:
         # Get all rules
         rules = self.define_rules()
 
-        # Predict failure probabilities
-        ml_overhead_start = time.time()
+        # Predict failure probabilities. Timing starts here: prioritization
+        # is part of the ML run, so total_time and time_to_first_failure
+        # include ml_overhead and compare fairly with the fixed order.
+        start_time = time.time()
 
         if self.ml_enabled and self.predictor and self.predictor.is_trained:
             predictions = self.predictor.predict_batch(
@@ -368,13 +370,15 @@ class MLPrioritizedValidator:
                 timestamp
             )
         else:
-            # Fallback: use historical failure rates
+            # Fallback: use historical failure rates (one query for all rules)
             predictions = {
-                r['rule_id']: self.db.get_rule_failure_rate(r['rule_id'])[0]
-                for r in rules
+                rule_id: rates[0]
+                for rule_id, rates in self.db.get_rule_failure_rates(
+                    [r['rule_id'] for r in rules]
+                ).items()
             }
 
-        ml_overhead = time.time() - ml_overhead_start
+        ml_overhead = time.time() - start_time
 
         # Sort rules by failure probability (descending)
         rule_priorities = [
@@ -390,7 +394,6 @@ class MLPrioritizedValidator:
             print()
 
         # Execute in priority order
-        start_time = time.time()
         results = []
         time_to_first_failure = None
         stopped_early = False
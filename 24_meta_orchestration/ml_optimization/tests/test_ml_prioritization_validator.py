@@ -0,0 +1,81 @@
+"""
+ML Prioritized Validator Test Suite
+
+Trains the failure prediction model on a small fixture history and checks
+that validate_ml_prioritized() executes likely failures first (exercising
+feature matrix construction and predict_batch) and that its timings
+include the prediction overhead.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ml_prioritization_validator import MLPrioritizedValidator
+from validation_database import ValidationResult, ValidationRun
+
+ALWAYS_FAILS = "AR004_worm_integrity"
+SOMETIMES_FAILS = "CP001_circular_dependency"
+
+
+def outcome(rule_id, run_number):
+    if rule_id == ALWAYS_FAILS:
+        return False
+    if rule_id == SOMETIMES_FAILS:
+        return run_number % 2 == 0
+    return True
+
+
+@pytest.fixture
+def validator(tmp_path, monkeypatch):
+    validator = MLPrioritizedValidator(tmp_path, db_path=tmp_path / "history.db", fail_fast=False)
+    rule_ids = [rule["rule_id"] for rule in validator.define_rules()]
+
+    started = datetime(2025, 10, 1, 9, 0)
+    for run_number in range(40):
+        validator.db.store_validation(ValidationRun(
+            f"{run_number:040x}", ["02_audit_logging/storage/worm_storage_engine.py"], "dev",
+            started + timedelta(hours=run_number),
+            [ValidationResult(rule_id, outcome(rule_id, run_number), 0.01, "HIGH",
+                              failure_message=None if outcome(rule_id, run_number) else "failed")
+             for rule_id in rule_ids],
+        ))
+
+    monkeypatch.setattr(validator, "get_changed_files_git",
+                        lambda: [tmp_path / "02_audit_logging/storage/worm_storage_engine.py"])
+    monkeypatch.setattr(validator, "get_commit_author", lambda: "dev")
+    monkeypatch.setattr(validator, "execute_rule", lambda rule: ValidationResult(
+        rule["rule_id"], outcome(rule["rule_id"], 1), 0.0, rule["severity"]))
+    yield validator
+    validator.db.close()
+
+
+def test_trained_model_orders_likely_failures_first(validator):
+    metrics = validator.predictor.train(min_samples=20)
+    assert metrics["success"]
+
+    results, run_metrics = validator.validate_ml_prioritized()
+
+    assert run_metrics["ml_enabled"]
+    predictions = run_metrics["predictions"]
+    assert set(predictions) == {rule["rule_id"] for rule in validator.define_rules()}
+    assert list(predictions.values()) == sorted(predictions.values(), reverse=True)
+    assert results[0].rule_id == ALWAYS_FAILS
+    assert predictions[ALWAYS_FAILS] > max(
+        prob for rule_id, prob in predictions.items() if rule_id not in (ALWAYS_FAILS, SOMETIMES_FAILS))
+
+
+def test_time_to_first_failure_includes_ml_overhead(validator):
+    validator.predictor.train(min_samples=20)
+    _, run_metrics = validator.validate_ml_prioritized()
+
+    assert run_metrics["time_to_first_failure"] is not None
+    assert run_metrics["time_to_first_failure"] >= run_metrics["ml_overhead_ms"] / 1000
+    assert run_metrics["total_time"] >= run_metrics["time_to_first_failure"]
@@ -0,0 +1,115 @@
+"""
+Validation Database Test Suite
+
+Tests the SQLite validation history store: schema creation, batched run
+inserts, co-occurrence aggregation and the ML feature queries.
+"""
+
+import sys
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from validation_database import ValidationDatabase, ValidationResult, ValidationRun
+
+
+def make_run(outcomes, changed_files=("src/app.py", "config/settings.yaml")):
+    results = [
+        ValidationResult(rule_id, passed, 0.002, "HIGH",
+                         failure_message=None if passed else "failed",
+                         evidence={"rule": rule_id} if not passed else None)
+        for rule_id, passed in outcomes
+    ]
+    return ValidationRun("0123456789abcdef", list(changed_files), "dev",
+                         datetime(2025, 10, 1, 12, 0), results)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = ValidationDatabase(tmp_path / "validation_history.db")
+    yield database
+    database.close()
+
+
+def test_store_and_query(db):
+    validation_id = db.store_validation(make_run([("r1", True), ("r2", False), ("r3", True)]))
+    db.store_validation(make_run([("r1", False), ("r2", False)]))
+
+    assert validation_id == 1
+    assert db.get_rule_failure_rate("r1") == (0.5, 2.0)
+    assert db.get_rule_failure_rate("r1", limit=1)[0] == 1.0
+    assert db.get_rule_failure_rate("unknown") == (0.5, 10.0)
+    assert db.get_file_pattern_failure_correlation([".py"], "r2") == 1.0
+    assert db.get_file_pattern_failure_correlation([], "r2") == 0.5
+
+    stats = db.get_stats()
+    assert stats["total_validations"] == 2
+    assert stats["total_rule_executions"] == 5
+    assert stats["top_failing_rules"][0] == {"rule_id": "r2", "failures": 2}
+
+    training = db.get_training_data(min_samples=2)
+    first_run = next(v for v in training["validations"] if v["validation_id"] == validation_id)
+    assert [r["rule_id"] for r in first_run["rules"]] == ["r1", "r2", "r3"]
+    assert db.get_training_data(min_samples=3) is None
+
+
+def test_co_occurrence_counts_match_pairwise_updates(db):
+    failed = ["c", "a", "b", "a"]
+    db.store_validation(make_run([(rule_id, False) for rule_id in failed] + [("ok", True)]))
+    db.store_validation(make_run([("a", False), ("b", False)]))
+
+    expected = Counter()
+    for run_failed in (failed, ["a", "b"]):
+        for i, rule_1 in enumerate(run_failed):
+            for rule_2 in run_failed[i + 1:]:
+                expected[tuple(sorted((rule_1, rule_2)))] += 1
+
+    conn = db._connection()
+    stored = dict(((r1, r2), count) for r1, r2, count in conn.execute(
+        "SELECT rule_id_1, rule_id_2, co_occurrence_count FROM failure_patterns"))
+    assert stored == dict(expected)
+    assert db.get_co_occurring_failures("b", limit=1) == [("a", 3)]
+
+
+def test_connection_is_reused_in_wal_mode(db, tmp_path):
+    conn = db._connection()
+    db.get_stats()
+    assert db._connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    db.close()
+    reopened = ValidationDatabase(tmp_path / "validation_history.db")
+    assert reopened.get_stats()["total_validations"] == 0
+    reopened.close()
+
+
+def test_bulk_feature_stats_match_per_rule_queries(db):
+    rule_ids = [f"rule_{i}" for i in range(6)]
+    for run in range(12):
+        outcomes = [(rule_id, (run + i) % (i + 2) != 0) for i, rule_id in enumerate(rule_ids[:5])]
+        changed = ("src/app.py",) if run % 3 else ("config/settings.yaml",)
+        db.store_validation(make_run(outcomes, changed_files=changed))
+
+    requested = rule_ids + ["rule_2", "missing"]
+    stats = db.get_rule_feature_stats(requested, [".py"], limit=8, recent_limit=3, co_occurrence_limit=2)
+
+    for position, rule_id in enumerate(requested):
+        failure_rate, avg_time = db.get_rule_failure_rate(rule_id, limit=8)
+        recent_rate, _ = db.get_rule_failure_rate(rule_id, limit=3)
+        co_sum = sum(count for _, count in db.get_co_occurring_failures(rule_id, limit=2))
+        assert stats["failure_rate"][position] == pytest.approx(failure_rate)
+        assert stats["avg_time_ms"][position] == pytest.approx(avg_time)
+        assert stats["recent_failure_rate"][position] == pytest.approx(recent_rate)
+        assert stats["file_pattern_correlation"][position] == pytest.approx(
+            db.get_file_pattern_failure_correlation([".py"], rule_id))
+        assert stats["co_occurrence_sum"][position] == co_sum
+
+    assert db.get_rule_failure_rates(["rule_1", "missing"]) == {
+        "rule_1": db.get_rule_failure_rate("rule_1"),
+        "missing": (0.5, 10.0),
+    }
+    assert db.get_data_version() == 12
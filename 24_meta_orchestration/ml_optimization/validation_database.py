@@ -9,8 +9,15 @@ Storage:
 - Tracks which rules fail on each commit
 - Records co-occurring failures for pattern detection
 - Minimal overhead (<50ms per validation)
+
+Performance:
+- One persistent connection per process (WAL journal, synchronous=NORMAL)
+- Batched inserts (executemany) in a single transaction per run
+- Co-occurrence pairs aggregated in SQL (one upsert per distinct pair)
+- Covering indexes for the ML feature queries
 """
 
+import os
 import sqlite3
 import json
 import hashlib
@@ -20,6 +27,42 @@ from datetime import datetime, timezone
 from dataclasses import dataclass
 import threading
 
+# Connection pragmas (WAL: readers don't block the writer; NORMAL is durable in WAL mode
+# except for the last transactions on power loss)
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Indexes for the ML feature queries (covering: answered from the index alone)
+SCHEMA_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_validations_commit ON validations(commit_hash)",
+    "CREATE INDEX IF NOT EXISTS idx_validations_timestamp ON validations(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_validations_author ON validations(author)",
+    # get_rule_failure_rate: WHERE rule_id = ? ORDER BY id DESC LIMIT ?
+    "CREATE INDEX IF NOT EXISTS idx_rule_results_rule "
+    "ON rule_results(rule_id, id, passed, execution_time_ms)",
+    # get_file_pattern_failure_correlation / get_training_data: per-validation lookups
+    "CREATE INDEX IF NOT EXISTS idx_rule_results_validation "
+    "ON rule_results(validation_id, rule_id, passed, execution_time_ms, severity)",
+    # get_stats: top failing rules
+    "CREATE INDEX IF NOT EXISTS idx_rule_results_failed ON rule_results(rule_id) WHERE passed = 0",
+    "CREATE INDEX IF NOT EXISTS idx_file_patterns_ext ON file_patterns(file_extension, validation_id)",
+    "CREATE INDEX IF NOT EXISTS idx_file_patterns_validation "
+    "ON file_patterns(validation_id, file_extension, is_yaml, is_python, is_config)",
+    "CREATE INDEX IF NOT EXISTS idx_file_patterns_path ON file_patterns(file_path)",
+    # Co-occurrence lookups from either side of a pair, ordered by count
+    "CREATE INDEX IF NOT EXISTS idx_failure_patterns_rule1 "
+    "ON failure_patterns(rule_id_1, co_occurrence_count)",
+    "CREATE INDEX IF NOT EXISTS idx_failure_patterns_rule2 "
+    "ON failure_patterns(rule_id_2, co_occurrence_count)",
+    "CREATE INDEX IF NOT EXISTS idx_model_metrics_version ON model_metrics(model_version)",
+    "CREATE INDEX IF NOT EXISTS idx_model_metrics_accuracy ON model_metrics(accuracy)",
+)
+
 
 @dataclass
 class ValidationResult:
@@ -50,19 +93,54 @@ class ValidationDatabase:
     - Fast inserts (<50ms overhead)
     - Efficient queries for ML training
     - No write contention in CI
+
+    All calls share one connection, serialized by the instance lock. A
+    forked child process opens its own connection on first use.
     """
 
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
         self._create_tables()
 
+    def _connection(self) -> sqlite3.Connection:
+        """Persistent connection (call with self._lock held)."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            # Failed rule ids of the run being stored (sorted; rowid = position)
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS run_failures (rule_id TEXT NOT NULL)")
+            # Rule ids of a bulk feature query, with the start ids of their history windows
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS feature_rules "
+                "(rule_id TEXT PRIMARY KEY, history_from INTEGER, recent_from INTEGER)"
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def close(self):
+        """Close the connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def _create_tables(self):
         """Create database schema with indexes for ML queries."""
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._connection()
+            with conn:
                 # Main validations table
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS validations (
@@ -77,10 +155,7 @@ class ValidationDatabase:
                         total_rules INTEGER DEFAULT 0,
                         failed_rules INTEGER DEFAULT 0,
                         total_time_ms INTEGER DEFAULT 0,
-                        time_to_first_failure_ms INTEGER,
-                        INDEX idx_commit (commit_hash),
-                        INDEX idx_timestamp (timestamp),
-                        INDEX idx_author (author)
+                        time_to_first_failure_ms INTEGER
                     )
                 """)
 
@@ -96,10 +171,7 @@ class ValidationDatabase:
                         failure_message TEXT,
                         evidence_json TEXT,
                         execution_order INTEGER,
-                        FOREIGN KEY (validation_id) REFERENCES validations(id),
-                        INDEX idx_rule_id (rule_id),
-                        INDEX idx_passed (passed),
-                        INDEX idx_validation (validation_id)
+                        FOREIGN KEY (validation_id) REFERENCES validations(id)
                     )
                 """)
 
@@ -116,9 +188,7 @@ class ValidationDatabase:
                         is_yaml BOOLEAN DEFAULT 0,
                         is_python BOOLEAN DEFAULT 0,
                         is_config BOOLEAN DEFAULT 0,
-                        FOREIGN KEY (validation_id) REFERENCES validations(id),
-                        INDEX idx_file_path (file_path),
-                        INDEX idx_file_ext (file_extension)
+                        FOREIGN KEY (validation_id) REFERENCES validations(id)
                     )
                 """)
 
@@ -130,9 +200,7 @@ class ValidationDatabase:
                         rule_id_2 TEXT NOT NULL,
                         co_occurrence_count INTEGER DEFAULT 1,
                         last_seen DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(rule_id_1, rule_id_2),
-                        INDEX idx_rule1 (rule_id_1),
-                        INDEX idx_rule2 (rule_id_2)
+                        UNIQUE(rule_id_1, rule_id_2)
                     )
                 """)
 
@@ -150,15 +218,12 @@ class ValidationDatabase:
                         false_positive_rate FLOAT,
                         false_negative_rate FLOAT,
                         feature_count INTEGER,
-                        model_path TEXT,
-                        INDEX idx_model_version (model_version),
-                        INDEX idx_accuracy (accuracy)
+                        model_path TEXT
                     )
                 """)
 
-                conn.commit()
-            finally:
-                conn.close()
+                for statement in SCHEMA_INDEXES:
+                    conn.execute(statement)
 
     def store_validation(self, run: ValidationRun) -> int:
         """
@@ -171,8 +236,8 @@ class ValidationDatabase:
             validation_id for correlation
         """
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._connection()
+            with conn:
                 # Calculate metrics
                 total_rules = len(run.results)
                 failed_rules = sum(1 for r in run.results if not r.passed)
@@ -212,14 +277,14 @@ class ValidationDatabase:
                 validation_id = cursor.lastrowid
 
                 # Insert rule results
-                for order, result in enumerate(run.results):
-                    conn.execute(
-                        """
-                        INSERT INTO rule_results (
-                            validation_id, rule_id, passed, execution_time_ms,
-                            severity, failure_message, evidence_json, execution_order
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
+                conn.executemany(
+                    """
+                    INSERT INTO rule_results (
+                        validation_id, rule_id, passed, execution_time_ms,
+                        severity, failure_message, evidence_json, execution_order
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
                         (
                             validation_id,
                             result.rule_id,
@@ -230,53 +295,58 @@ class ValidationDatabase:
                             json.dumps(result.evidence) if result.evidence else None,
                             order
                         )
-                    )
+                        for order, result in enumerate(run.results)
+                    ]
+                )
 
                 # Track file patterns
-                for file_path in run.changed_files:
-                    file_path_obj = Path(file_path)
-                    ext = file_path_obj.suffix.lower()
-
-                    conn.execute(
-                        """
-                        INSERT INTO file_patterns (
-                            validation_id, file_path, file_extension,
-                            is_yaml, is_python, is_config
-                        ) VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            validation_id,
-                            file_path,
-                            ext,
-                            ext in ['.yaml', '.yml'],
-                            ext == '.py',
-                            'config' in file_path.lower() or ext in ['.yaml', '.yml', '.json', '.toml']
-                        )
-                    )
+                conn.executemany(
+                    """
+                    INSERT INTO file_patterns (
+                        validation_id, file_path, file_extension,
+                        is_yaml, is_python, is_config
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        self._file_pattern_row(validation_id, file_path)
+                        for file_path in run.changed_files
+                    ]
+                )
 
-                # Track failure co-occurrence patterns
-                failed_rule_ids = [r.rule_id for r in run.results if not r.passed]
-                for i, rule_id_1 in enumerate(failed_rule_ids):
-                    for rule_id_2 in failed_rule_ids[i+1:]:
-                        # Ensure consistent ordering
-                        r1, r2 = sorted([rule_id_1, rule_id_2])
-                        conn.execute(
-                            """
-                            INSERT INTO failure_patterns (rule_id_1, rule_id_2, co_occurrence_count, last_seen)
-                            VALUES (?, ?, 1, ?)
-                            ON CONFLICT(rule_id_1, rule_id_2)
-                            DO UPDATE SET
-                                co_occurrence_count = co_occurrence_count + 1,
-                                last_seen = excluded.last_seen
-                            """,
-                            (r1, r2, run.timestamp.isoformat())
-                        )
+                # Track failure co-occurrence patterns: pairs are generated and
+                # counted inside SQLite, one upsert per distinct pair
+                conn.execute("DELETE FROM temp.run_failures")
+                conn.executemany(
+                    "INSERT INTO temp.run_failures (rule_id) VALUES (?)",
+                    [(rule_id,) for rule_id in sorted(r.rule_id for r in run.results if not r.passed)]
+                )
+                conn.execute(
+                    """
+                    INSERT INTO failure_patterns (rule_id_1, rule_id_2, co_occurrence_count, last_seen)
+                    SELECT a.rule_id, b.rule_id, COUNT(*), ?
+                    FROM temp.run_failures a JOIN temp.run_failures b ON a.rowid < b.rowid
+                    GROUP BY a.rule_id, b.rule_id
+                    ON CONFLICT(rule_id_1, rule_id_2)
+                    DO UPDATE SET
+                        co_occurrence_count = co_occurrence_count + excluded.co_occurrence_count,
+                        last_seen = excluded.last_seen
+                    """,
+                    (run.timestamp.isoformat(),)
+                )
 
-                conn.commit()
                 return validation_id
 
-            finally:
-                conn.close()
+    @staticmethod
+    def _file_pattern_row(validation_id: int, file_path: str) -> Tuple:
+        ext = Path(file_path).suffix.lower()
+        return (
+            validation_id,
+            file_path,
+            ext,
+            ext in ['.yaml', '.yml'],
+            ext == '.py',
+            'config' in file_path.lower() or ext in ['.yaml', '.yml', '.json', '.toml']
+        )
 
     def get_rule_failure_rate(self, rule_id: str, limit: int = 100) -> Tuple[float, float]:
         """
@@ -290,8 +360,8 @@ class ValidationDatabase:
             (failure_rate, avg_execution_time_ms)
         """
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._connection()
+            with conn:
                 cursor = conn.execute(
                     """
                     SELECT passed, execution_time_ms
@@ -313,9 +383,6 @@ class ValidationDatabase:
 
                 return failure_rate, avg_time
 
-            finally:
-                conn.close()
-
     def get_file_pattern_failure_correlation(self, file_extensions: List[str], rule_id: str) -> float:
         """
         Get correlation between file pattern and rule failure.
@@ -327,22 +394,14 @@ class ValidationDatabase:
         Returns:
             Correlation score (0.0 to 1.0)
         """
+        if not file_extensions:
+            return 0.5
+
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._connection()
+            with conn:
                 # Find validations with similar file patterns
-                placeholders = ','.join('?' * len(file_extensions))
-                cursor = conn.execute(
-                    f"""
-                    SELECT DISTINCT fp.validation_id
-                    FROM file_patterns fp
-                    WHERE fp.file_extension IN ({placeholders})
-                    LIMIT 100
-                    """,
-                    file_extensions
-                )
-
-                validation_ids = [row[0] for row in cursor.fetchall()]
+                validation_ids = self._pattern_validation_ids(conn, file_extensions)
                 if not validation_ids:
                     return 0.5
 
@@ -364,9 +423,6 @@ class ValidationDatabase:
                 failures = sum(1 for (passed,) in results if not passed)
                 return failures / len(results)
 
-            finally:
-                conn.close()
-
     def get_co_occurring_failures(self, rule_id: str, limit: int = 10) -> List[Tuple[str, int]]:
         """
         Get rules that frequently fail together with given rule.
@@ -379,8 +435,8 @@ class ValidationDatabase:
             List of (rule_id, co_occurrence_count) tuples
         """
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._connection()
+            with conn:
                 cursor = conn.execute(
                     """
                     SELECT
@@ -399,8 +455,203 @@ class ValidationDatabase:
 
                 return cursor.fetchall()
 
-            finally:
-                conn.close()
+    # ------------------------------------------------------------------
+    # Bulk feature queries (all rules of a run in a few aggregate queries)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _pattern_validation_ids(conn: sqlite3.Connection, file_extensions: List[str]) -> List[int]:
+        """Validations (up to 100) that changed files with one of the extensions."""
+        placeholders = ','.join('?' * len(file_extensions))
+        cursor = conn.execute(
+            f"""
+            SELECT DISTINCT fp.validation_id
+            FROM file_patterns fp
+            WHERE fp.file_extension IN ({placeholders})
+            LIMIT 100
+            """,
+            file_extensions
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _load_feature_rules(conn: sqlite3.Connection, rule_ids: List[str]) -> None:
+        conn.execute("DELETE FROM temp.feature_rules")
+        conn.executemany(
+            "INSERT OR IGNORE INTO temp.feature_rules (rule_id) VALUES (?)",
+            [(rule_id,) for rule_id in rule_ids]
+        )
+
+    @staticmethod
+    def _history_stats(conn: sqlite3.Connection, limit: int, recent_limit: int) -> Dict[str, Tuple]:
+        """
+        rule_id -> (count, failures, total_time_ms, recent_count, recent_failures)
+        over the last `limit` / `recent_limit` results of each rule in temp.feature_rules.
+
+        The window start per rule is the id of its limit-th newest result, found
+        by an index seek, so only the rows inside the windows are read.
+        """
+        conn.execute(
+            """
+            UPDATE temp.feature_rules SET
+                history_from = COALESCE((SELECT id FROM rule_results WHERE rule_id = feature_rules.rule_id
+                                         ORDER BY id DESC LIMIT 1 OFFSET ?), 0),
+                recent_from = COALESCE((SELECT id FROM rule_results WHERE rule_id = feature_rules.rule_id
+                                        ORDER BY id DESC LIMIT 1 OFFSET ?), 0)
+            """,
+            (max(limit, 1) - 1, max(recent_limit, 1) - 1)
+        )
+        cursor = conn.execute(
+            """
+            SELECT f.rule_id,
+                   SUM(r.id >= f.history_from),
+                   SUM(r.id >= f.history_from AND r.passed = 0),
+                   SUM(CASE WHEN r.id >= f.history_from THEN r.execution_time_ms END),
+                   SUM(r.id >= f.recent_from),
+                   SUM(r.id >= f.recent_from AND r.passed = 0)
+            FROM temp.feature_rules f
+            JOIN rule_results r
+              ON r.rule_id = f.rule_id AND r.id >= MIN(f.history_from, f.recent_from)
+            GROUP BY f.rule_id
+            """
+        )
+        return {row[0]: row[1:] for row in cursor.fetchall()}
+
+    def get_rule_failure_rates(self, rule_ids: List[str], limit: int = 100) -> Dict[str, Tuple[float, float]]:
+        """
+        Bulk get_rule_failure_rate: one query for all rules.
+
+        Args:
+            rule_ids: Rule identifiers
+            limit: Number of recent results to consider per rule
+
+        Returns:
+            Dict of rule_id -> (failure_rate, avg_execution_time_ms)
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                self._load_feature_rules(conn, rule_ids)
+                history = self._history_stats(conn, limit, limit)
+
+        rates = {}
+        for rule_id in rule_ids:
+            stats = history.get(rule_id)
+            if stats and stats[0]:
+                count, failures, total_time = stats[:3]
+                rates[rule_id] = (failures / count, total_time / count)
+            else:
+                rates[rule_id] = (0.5, 10.0)  # Unknown: assume 50% failure rate, 10ms time
+        return rates
+
+    def get_rule_feature_stats(
+        self,
+        rule_ids: List[str],
+        file_extensions: List[str],
+        limit: int = 100,
+        recent_limit: int = 10,
+        co_occurrence_limit: int = 5
+    ) -> Dict[str, List[float]]:
+        """
+        Per-rule historical statistics for ML feature extraction, in bulk.
+
+        Same values as calling get_rule_failure_rate (limit and recent_limit),
+        get_file_pattern_failure_correlation and get_co_occurring_failures for
+        every rule, with one statement per statistic instead of one round trip
+        per rule and statistic.
+
+        Args:
+            rule_ids: Rules to compute statistics for
+            file_extensions: Extensions of the changed files
+            limit: Results considered for failure rate and average time
+            recent_limit: Results considered for the recent failure rate
+            co_occurrence_limit: Co-occurring rules summed per rule
+
+        Returns:
+            Dict of column name -> values aligned with rule_ids:
+            failure_rate, avg_time_ms, recent_failure_rate,
+            file_pattern_correlation, co_occurrence_sum
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                self._load_feature_rules(conn, rule_ids)
+                history = self._history_stats(conn, limit, recent_limit)
+
+                pattern = {}
+                validation_ids = self._pattern_validation_ids(conn, file_extensions) if file_extensions else []
+                if validation_ids:
+                    placeholders = ','.join('?' * len(validation_ids))
+                    cursor = conn.execute(
+                        f"""
+                        SELECT r.rule_id, COUNT(*), SUM(r.passed = 0)
+                        FROM rule_results r
+                        JOIN temp.feature_rules f ON r.rule_id = f.rule_id
+                        WHERE r.validation_id IN ({placeholders})
+                        GROUP BY r.rule_id
+                        """,
+                        validation_ids
+                    )
+                    pattern = {rule_id: failures / count for rule_id, count, failures in cursor.fetchall()}
+
+                # Sum of the top co-occurrence counts per rule: the top counts
+                # of each side of the pair, merged (a self-pair counts once)
+                cursor = conn.execute(
+                    """
+                    SELECT f.rule_id, (
+                        SELECT SUM(count) FROM (
+                            SELECT count FROM (
+                                SELECT * FROM (
+                                    SELECT co_occurrence_count AS count
+                                    FROM failure_patterns
+                                    WHERE rule_id_1 = f.rule_id
+                                    ORDER BY co_occurrence_count DESC LIMIT :limit
+                                )
+                                UNION ALL
+                                SELECT * FROM (
+                                    SELECT co_occurrence_count AS count
+                                    FROM failure_patterns
+                                    WHERE rule_id_2 = f.rule_id AND rule_id_1 != f.rule_id
+                                    ORDER BY co_occurrence_count DESC LIMIT :limit
+                                )
+                            )
+                            ORDER BY count DESC LIMIT :limit
+                        )
+                    )
+                    FROM temp.feature_rules f
+                    """,
+                    {'limit': co_occurrence_limit}
+                )
+                co_occurrence = dict(cursor.fetchall())
+
+        columns = {
+            'failure_rate': [],
+            'avg_time_ms': [],
+            'recent_failure_rate': [],
+            'file_pattern_correlation': [],
+            'co_occurrence_sum': [],
+        }
+        for rule_id in rule_ids:
+            stats = history.get(rule_id)
+            if stats and stats[0]:
+                count, failures, total_time, recent_count, recent_failures = stats
+                columns['failure_rate'].append(failures / count)
+                columns['avg_time_ms'].append(total_time / count)
+                columns['recent_failure_rate'].append(recent_failures / recent_count)
+            else:
+                columns['failure_rate'].append(0.5)
+                columns['avg_time_ms'].append(10.0)
+                columns['recent_failure_rate'].append(0.5)
+            columns['file_pattern_correlation'].append(pattern.get(rule_id, 0.5))
+            columns['co_occurrence_sum'].append(float(co_occurrence.get(rule_id) or 0))
+        return columns
+
+    def get_data_version(self) -> int:
+        """Id of the latest stored validation run (changes whenever history grows)."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return conn.execute("SELECT COALESCE(MAX(id), 0) FROM validations").fetchone()[0]
 
     def get_training_data(self, min_samples: int = 100) -> Optional[Dict]:
         """
@@ -413,8 +664,8 @@ class ValidationDatabase:
             Dict with training data or None if insufficient samples
         """
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._connection()
+            with conn:
                 # Check if we have enough data
                 cursor = conn.execute("SELECT COUNT(*) FROM validations")
                 count = cursor.fetchone()[0]
@@ -442,6 +693,7 @@ class ValidationDatabase:
                         SELECT rule_id, passed, execution_time_ms, severity
                         FROM rule_results
                         WHERE validation_id = ?
+                        ORDER BY id
                         """,
                         (val_id,)
                     )
@@ -461,6 +713,7 @@ class ValidationDatabase:
                         SELECT file_extension, is_yaml, is_python, is_config
                         FROM file_patterns
                         WHERE validation_id = ?
+                        ORDER BY id
                         """,
                         (val_id,)
                     )
@@ -491,9 +744,6 @@ class ValidationDatabase:
                     'samples_returned': len(validations)
                 }
 
-            finally:
-                conn.close()
-
     def store_model_metrics(self, model_version: str, metrics: Dict, model_path: str):
         """
         Store ML model performance metrics.
@@ -504,8 +754,8 @@ class ValidationDatabase:
             model_path: Path to saved model file
         """
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._connection()
+            with conn:
                 conn.execute(
                     """
                     INSERT INTO model_metrics (
@@ -527,15 +777,12 @@ class ValidationDatabase:
                         model_path
                     )
                 )
-                conn.commit()
-            finally:
-                conn.close()
 
     def get_stats(self) -> Dict:
         """Get database statistics for monitoring."""
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._connection()
+            with conn:
                 stats = {}
 
                 # Total validations
@@ -591,6 +838,3 @@ class ValidationDatabase:
                     }
 
                 return stats
-
-            finally:
-                conn.close()